@@ -0,0 +1,89 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { describe, expect, it, vi } from "vitest";
+import { handleWithBuffers, resolveBuffers } from "../buffers";
+
+function view(...bytes: number[]): DataView {
+  return new DataView(new Uint8Array(bytes).buffer);
+}
+
+function bytesOf(buffer: DataView): number[] {
+  return [...new Uint8Array(buffer.buffer)];
+}
+
+describe("resolveBuffers", () => {
+  it("should fetch out-of-band buffers in place", async () => {
+    const fetchBuffer = vi.fn().mockResolvedValue(view(7, 8, 9));
+    const message = { state: {}, buffer_paths: [["a"], ["b"]] };
+
+    const resolved = await resolveBuffers(
+      message,
+      [view(1), view()],
+      [null, "./@file/3-x.bin"],
+      fetchBuffer,
+    );
+
+    expect(fetchBuffer).toHaveBeenCalledExactlyOnceWith("./@file/3-x.bin");
+    expect(resolved.message).toBe(message);
+    expect(resolved.buffers.map(bytesOf)).toEqual([[1], [7, 8, 9]]);
+  });
+
+  it("should drop buffers that can't be fetched", async () => {
+    const fetchBuffer = vi.fn().mockRejectedValue(new Error("404"));
+
+    const resolved = await resolveBuffers(
+      { state: { c: 1 }, buffer_paths: [["a"], ["b"]] },
+      [view(1), view()],
+      [null, "./@file/3-x.bin"],
+      fetchBuffer,
+    );
+
+    expect(resolved.message).toEqual({
+      state: { c: 1 },
+      buffer_paths: [["a"]],
+    });
+    expect(resolved.buffers.map(bytesOf)).toEqual([[1]]);
+  });
+});
+
+describe("handleWithBuffers", () => {
+  it("should handle inline messages synchronously", () => {
+    const handle = vi.fn();
+    handleWithBuffers("inline", { method: "update" }, [view(1)], null, handle);
+    expect(handle).toHaveBeenCalledOnce();
+  });
+
+  it("should keep messages for a target in order", async () => {
+    let release: (buffer: DataView) => void = () => undefined;
+    const fetchBuffer = vi.fn(
+      () =>
+        new Promise<DataView>((resolve) => {
+          release = resolve;
+        }),
+    );
+    const handled: unknown[] = [];
+    const handle = (message: { n: number }) => {
+      handled.push(message.n);
+    };
+
+    handleWithBuffers(
+      "model",
+      { n: 1, buffer_paths: [["a"]] },
+      [view()],
+      ["./@file/1-x.bin"],
+      handle,
+      fetchBuffer,
+    );
+    handleWithBuffers("model", { n: 2 }, [], null, handle);
+    handleWithBuffers("other", { n: 3 }, [], null, handle);
+    expect(handled).toEqual([3]);
+
+    release(view(1));
+    await vi.waitFor(() => expect(handled).toEqual([3, 1, 2]));
+    await new Promise((resolve) => setTimeout(resolve, 0));
+
+    // Nothing pending anymore, so this is handled right away
+    handleWithBuffers("model", { n: 4 }, [], null, handle);
+    expect(handled).toEqual([3, 1, 2, 4]);
+  });
+});
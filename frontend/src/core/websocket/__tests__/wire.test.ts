@@ -0,0 +1,57 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { describe, expect, it, vi } from "vitest";
+import { createWireDecoder, withWireFormat } from "../wire";
+
+async function deflate(text: string): Promise<ArrayBuffer> {
+  const stream = new Blob([text])
+    .stream()
+    .pipeThrough(new CompressionStream("deflate"));
+  return new Response(stream).arrayBuffer();
+}
+
+describe("withWireFormat", () => {
+  it("should request the batched format", () => {
+    const url = withWireFormat(new URL("ws://localhost:2718/ws"));
+    expect(url.searchParams.get("wire_format")).toBe("batch");
+    expect(url.searchParams.get("wire_compression")).toBe("deflate");
+  });
+});
+
+describe("createWireDecoder", () => {
+  it("should dispatch a single message synchronously", () => {
+    const onMessage = vi.fn();
+    const decode = createWireDecoder(onMessage);
+
+    decode('{"op": "a", "data": {}}');
+    expect(onMessage).toHaveBeenCalledExactlyOnceWith(
+      '{"op": "a", "data": {}}',
+    );
+  });
+
+  it("should split batched frames", () => {
+    const onMessage = vi.fn();
+    const decode = createWireDecoder(onMessage);
+
+    decode('{"op": "a", "data": {}}\n{"op": "b", "data": {}}');
+    expect(onMessage.mock.calls).toEqual([
+      ['{"op": "a", "data": {}}'],
+      ['{"op": "b", "data": {}}'],
+    ]);
+  });
+
+  it("should keep order across compressed frames", async () => {
+    const received: string[] = [];
+    const decode = createWireDecoder((message) => received.push(message));
+
+    decode(await deflate('{"op": "a", "data": {}}\n{"op": "b", "data": {}}'));
+    decode('{"op": "c", "data": {}}');
+
+    await vi.waitFor(() => expect(received).toHaveLength(3));
+    expect(received).toEqual([
+      '{"op": "a", "data": {}}',
+      '{"op": "b", "data": {}}',
+      '{"op": "c", "data": {}}',
+    ]);
+  });
+});
@@ -0,0 +1,110 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { asRemoteURL } from "@/core/runtime/config";
+import { Logger } from "@/utils/Logger";
+
+type FetchBuffer = (url: string) => Promise<DataView>;
+
+/**
+ * Large widget buffers are sent out of band: the notification carries an
+ * empty placeholder plus a virtual file URL for each of them.
+ */
+async function fetchVirtualFile(url: string): Promise<DataView> {
+  const response = await fetch(asRemoteURL(url).href);
+  if (!response.ok) {
+    throw new Error(`${response.status} ${response.statusText}`);
+  }
+  return new DataView(await response.arrayBuffer());
+}
+
+/**
+ * Fetch a message's out-of-band buffers and put them in place of their
+ * placeholders.
+ *
+ * A buffer that can no longer be fetched was replaced by a later update of
+ * the same state key, so it is dropped along with its buffer path.
+ */
+export async function resolveBuffers<T extends Record<string, unknown>>(
+  message: T,
+  buffers: readonly DataView[],
+  bufferUrls: ReadonlyArray<string | null>,
+  fetchBuffer: FetchBuffer = fetchVirtualFile,
+): Promise<{ message: T; buffers: DataView[] }> {
+  const resolved = await Promise.all(
+    buffers.map(async (buffer, i) => {
+      const url = bufferUrls[i];
+      if (!url) {
+        return buffer;
+      }
+      try {
+        return await fetchBuffer(url);
+      } catch (error) {
+        Logger.warn("Failed to fetch out-of-band buffer", url, error);
+        return null;
+      }
+    }),
+  );
+
+  const kept = resolved.filter((buffer): buffer is DataView => buffer !== null);
+  if (kept.length === resolved.length || !Array.isArray(message.buffer_paths)) {
+    return { message, buffers: kept };
+  }
+  const bufferPaths: unknown[] = message.buffer_paths;
+  return {
+    message: {
+      ...message,
+      buffer_paths: bufferPaths.filter((_, i) => resolved[i] !== null),
+    },
+    buffers: kept,
+  };
+}
+
+// Messages still waiting on buffers, by target (model or UI element) id
+const pending = new Map<string, Promise<void>>();
+
+/**
+ * Handle a message once its out-of-band buffers have been fetched.
+ *
+ * Messages without out-of-band buffers are handled synchronously, unless
+ * an earlier message for the same target is still being fetched: messages
+ * for a target are always handled in the order they arrived.
+ */
+export function handleWithBuffers<T extends Record<string, unknown>>(
+  target: string,
+  message: T,
+  buffers: readonly DataView[],
+  bufferUrls: ReadonlyArray<string | null> | null | undefined,
+  handle: (message: T, buffers: readonly DataView[]) => void,
+  fetchBuffer: FetchBuffer = fetchVirtualFile,
+): void {
+  const outOfBand = bufferUrls?.some(Boolean) ?? false;
+  const previous = pending.get(target);
+  if (!outOfBand && !previous) {
+    handle(message, buffers);
+    return;
+  }
+
+  const next = (previous ?? Promise.resolve())
+    .then(async () => {
+      if (!outOfBand || !bufferUrls) {
+        handle(message, buffers);
+        return;
+      }
+      const resolved = await resolveBuffers(
+        message,
+        buffers,
+        bufferUrls,
+        fetchBuffer,
+      );
+      handle(resolved.message, resolved.buffers);
+    })
+    .catch((error) => {
+      Logger.error("Failed to handle message", target, error);
+    })
+    .finally(() => {
+      if (pending.get(target) === next) {
+        pending.delete(target);
+      }
+    });
+  pending.set(target, next);
+}
@@ -7,6 +7,7 @@ import { toast } from "@/components/ui/use-toast";
 import { getNotebook, useCellActions } from "@/core/cells/cells";
 import { AUTOCOMPLETER } from "@/core/codemirror/completion/Autocompleter";
 import type { NotificationPayload } from "@/core/kernel/messages";
+import { handleWithBuffers } from "@/core/websocket/buffers";
 import { useConnectionTransport } from "@/core/websocket/useWebSocket";
 import { renderHTML } from "@/plugins/core/RenderHTML";
 import {
@@ -61,6 +62,7 @@ import { useVariablesActions } from "../variables/state";
 import type { VariableName } from "../variables/types";
 import { isWasm } from "../wasm/utils";
 import { WebSocketClosedReason, WebSocketState } from "./types";
+import { createWireDecoder, withWireFormat } from "./wire";
 
 const SUPPORTS_LAZY_KERNELS = true;
 
@@ -107,8 +109,8 @@ export function useMarimoKernelConnection(opts: {
   const setCacheInfo = useSetAtom(cacheInfoAtom);
   const setKernelStartupError = useSetAtom(kernelStartupErrorAtom);
 
-  const handleMessage = (e: MessageEvent<JsonString<NotificationPayload>>) => {
-    const msg = jsonParseWithSpecialChar(e.data);
+  const handleMessage = (data: JsonString<NotificationPayload>) => {
+    const msg = jsonParseWithSpecialChar(data);
     switch (msg.data.op) {
       case "reload":
         reloadSafe();
@@ -143,26 +145,31 @@ export function useMarimoKernelConnection(opts: {
       case "send-ui-element-message": {
         const modelId = msg.data.model_id;
         const uiElement = msg.data.ui_element;
-        const message = msg.data.message;
-        const buffers = safeExtractSetUIElementMessageBuffers(msg.data);
-
-        if (modelId && isMessageWidgetState(message)) {
-          handleWidgetMessage({
-            modelId,
-            msg: message,
-            buffers,
-            modelManager: MODEL_MANAGER,
-          });
-        }
-
-        if (uiElement) {
-          UI_ELEMENT_REGISTRY.broadcastMessage(
-            uiElement as UIElementId,
-            msg.data.message,
-            buffers,
-          );
-        }
 
+        handleWithBuffers(
+          modelId ?? uiElement ?? "",
+          msg.data.message,
+          safeExtractSetUIElementMessageBuffers(msg.data),
+          msg.data.buffer_urls,
+          (message, buffers) => {
+            if (modelId && isMessageWidgetState(message)) {
+              handleWidgetMessage({
+                modelId,
+                msg: message,
+                buffers,
+                modelManager: MODEL_MANAGER,
+              });
+            }
+
+            if (uiElement) {
+              UI_ELEMENT_REGISTRY.broadcastMessage(
+                uiElement as UIElementId,
+                message,
+                buffers,
+              );
+            }
+          },
+        );
         return;
       }
 
@@ -316,6 +323,23 @@ export function useMarimoKernelConnection(opts: {
     }
   };
 
+  /**
+   * Decode a (possibly batched or compressed) frame sent by the kernel,
+   * handling each message in it.
+   */
+  const decodeFrame = createWireDecoder((data) => {
+    try {
+      handleMessage(data as JsonString<NotificationPayload>);
+    } catch (error) {
+      Logger.error("Failed to handle message", data, error);
+      toast({
+        title: "Failed to handle message",
+        description: prettyError(error),
+        variant: "danger",
+      });
+    }
+  });
+
   const tryReconnecting = (code?: number, reason?: string) => {
     // If not properly gated, we could try reconnecting forever if the
     // issue is not transient. So we want to try reconnecting only once after an
@@ -331,7 +355,7 @@ export function useMarimoKernelConnection(opts: {
     /**
      * Unique URL for this session.
      */
-    url: () => runtimeManager.getWsURL(sessionId).toString(),
+    url: () => withWireFormat(runtimeManager.getWsURL(sessionId)).toString(),
 
     /**
      * Open callback. Set the connection status to open.
@@ -367,18 +391,7 @@ export function useMarimoKernelConnection(opts: {
     /**
      * Handle messages sent by the kernel.
      */
-    onMessage: (e) => {
-      try {
-        handleMessage(e);
-      } catch (error) {
-        Logger.error("Failed to handle message", e.data, error);
-        toast({
-          title: "Failed to handle message",
-          description: prettyError(error),
-          variant: "danger",
-        });
-      }
-    },
+    onMessage: (e) => decodeFrame(e.data),
 
     /**
      * Handle a close event. We may want to reconnect.
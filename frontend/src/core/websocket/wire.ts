@@ -0,0 +1,93 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { Logger } from "@/utils/Logger";
+
+/**
+ * Query parameters used to negotiate the websocket wire format.
+ *
+ * With `wire_format=batch`, every text frame holds one or more messages
+ * separated by newlines. With `wire_compression=deflate`, large frames are
+ * sent as zlib-compressed binary frames.
+ */
+export const WIRE_FORMAT_PARAM = "wire_format";
+export const WIRE_COMPRESSION_PARAM = "wire_compression";
+
+function supportsDecompression(): boolean {
+  return typeof DecompressionStream !== "undefined";
+}
+
+/**
+ * Request the batched (and, if supported, compressed) wire format.
+ */
+export function withWireFormat(url: URL): URL {
+  url.searchParams.set(WIRE_FORMAT_PARAM, "batch");
+  if (supportsDecompression()) {
+    url.searchParams.set(WIRE_COMPRESSION_PARAM, "deflate");
+  }
+  return url;
+}
+
+async function inflate(data: Blob | ArrayBuffer): Promise<string> {
+  const blob = data instanceof Blob ? data : new Blob([data]);
+  const stream = blob
+    .stream()
+    .pipeThrough(new DecompressionStream("deflate"))
+    .pipeThrough(new TextDecoderStream());
+  let text = "";
+  for await (const chunk of stream) {
+    text += chunk;
+  }
+  return text;
+}
+
+/**
+ * Create a decoder for batched websocket frames.
+ *
+ * Each message in a frame is passed to `onMessage` separately, in the
+ * order they were sent. Text frames are handled synchronously unless a
+ * compressed frame is still being decompressed, in which case they are
+ * queued behind it.
+ */
+export function createWireDecoder(
+  onMessage: (message: string) => void,
+): (data: unknown) => void {
+  let pending: Promise<void> | null = null;
+
+  const dispatch = (frame: string) => {
+    for (const message of frame.split("\n")) {
+      if (message) {
+        onMessage(message);
+      }
+    }
+  };
+
+  const enqueue = (task: () => Promise<void> | void) => {
+    const next = (pending ?? Promise.resolve())
+      .then(task)
+      .catch((error) => {
+        Logger.error("Failed to decode websocket frame", error);
+      })
+      .finally(() => {
+        if (pending === next) {
+          pending = null;
+        }
+      });
+    pending = next;
+  };
+
+  return (data: unknown) => {
+    if (typeof data === "string") {
+      if (pending) {
+        enqueue(() => dispatch(data));
+      } else {
+        dispatch(data);
+      }
+      return;
+    }
+    if (data instanceof Blob || data instanceof ArrayBuffer) {
+      enqueue(async () => dispatch(await inflate(data)));
+      return;
+    }
+    Logger.warn("Unexpected websocket frame", data);
+  };
+}
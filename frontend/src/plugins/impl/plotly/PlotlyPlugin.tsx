@@ -34,6 +34,10 @@ type T =
         x?: number[];
         y?: number[];
       };
+      lasso?: {
+        x?: number[];
+        y?: number[];
+      };
       // These are kept in the state to persist selections across re-renders
       // on the frontend, but likely not used in the backend.
       selections?: unknown[];
@@ -181,6 +185,7 @@ export const PlotlyComponent = memo(
               points: Arrays.EMPTY,
               indices: Arrays.EMPTY,
               range: undefined,
+              lasso: undefined,
             };
           });
         })}
@@ -218,6 +223,7 @@ export const PlotlyComponent = memo(
             points: extractPoints(evt.points),
             indices: evt.points.map((point) => point.pointIndex),
             range: evt.range,
+            lasso: evt.lassoPoints,
           }));
         })}
         className="w-full"
@@ -89,66 +89,168 @@ __all__ = [
     "watch",
     "__version__",
 ]
-import marimo._ai as ai
-import marimo._islands as islands
-import marimo._runtime.watch as watch
-from marimo._ast.app import App
-from marimo._ast.cell import Cell
-from marimo._islands._island_generator import MarimoIslandGenerator
-from marimo._output.doc import doc
-from marimo._output.formatting import as_html, iframe, plain
-from marimo._output.hypertext import Html
-from marimo._output.justify import center, left, right
-from marimo._output.md import latex, md
-from marimo._output.outline import outline
-from marimo._output.show_code import show_code
-from marimo._plugins import ui
-from marimo._plugins.stateless import mpl, status
-from marimo._plugins.stateless.accordion import accordion
-from marimo._plugins.stateless.audio import audio
-from marimo._plugins.stateless.callout import callout
-from marimo._plugins.stateless.carousel import carousel
-from marimo._plugins.stateless.download import download
-from marimo._plugins.stateless.flex import hstack, vstack
-from marimo._plugins.stateless.icon import icon
-from marimo._plugins.stateless.image import image
-from marimo._plugins.stateless.image_compare import image_compare
-from marimo._plugins.stateless.inspect import inspect
-from marimo._plugins.stateless.json_component import json
-from marimo._plugins.stateless.lazy import lazy
-from marimo._plugins.stateless.mermaid import mermaid
-from marimo._plugins.stateless.nav_menu import nav_menu
-from marimo._plugins.stateless.pdf import pdf
-from marimo._plugins.stateless.plain_text import plain_text
-from marimo._plugins.stateless.routes import routes
-from marimo._plugins.stateless.sidebar import sidebar
-from marimo._plugins.stateless.stat import stat
-from marimo._plugins.stateless.style import style
-from marimo._plugins.stateless.tabs import tabs
-from marimo._plugins.stateless.tree import tree
-from marimo._plugins.stateless.video import video
-from marimo._runtime import output
-from marimo._runtime.app_meta import AppMeta
-from marimo._runtime.capture import (
-    capture_stderr,
-    capture_stdout,
-    redirect_stderr,
-    redirect_stdout,
-)
-from marimo._runtime.context.utils import running_in_notebook
-from marimo._runtime.control_flow import MarimoStopError, stop
-from marimo._runtime.runtime import (
-    app_meta,
-    cli_args,
-    defs,
-    notebook_dir,
-    notebook_location,
-    query_params,
-    refs,
-)
-from marimo._runtime.state import state
-from marimo._runtime.threads import Thread, current_thread
-from marimo._save.save import cache, lru_cache, persistent_cache
-from marimo._server.asgi import create_asgi_app
-from marimo._sql.sql import sql
+
+import typing as _typing
+
 from marimo._version import __version__
+
+if _typing.TYPE_CHECKING:
+    import marimo._ai as ai
+    import marimo._islands as islands
+    import marimo._runtime.watch as watch
+    from marimo._ast.app import App
+    from marimo._ast.cell import Cell
+    from marimo._islands._island_generator import MarimoIslandGenerator
+    from marimo._output.doc import doc
+    from marimo._output.formatting import as_html, iframe, plain
+    from marimo._output.hypertext import Html
+    from marimo._output.justify import center, left, right
+    from marimo._output.md import latex, md
+    from marimo._output.outline import outline
+    from marimo._output.show_code import show_code
+    from marimo._plugins import ui
+    from marimo._plugins.stateless import mpl, status
+    from marimo._plugins.stateless.accordion import accordion
+    from marimo._plugins.stateless.audio import audio
+    from marimo._plugins.stateless.callout import callout
+    from marimo._plugins.stateless.carousel import carousel
+    from marimo._plugins.stateless.download import download
+    from marimo._plugins.stateless.flex import hstack, vstack
+    from marimo._plugins.stateless.icon import icon
+    from marimo._plugins.stateless.image import image
+    from marimo._plugins.stateless.image_compare import image_compare
+    from marimo._plugins.stateless.inspect import inspect
+    from marimo._plugins.stateless.json_component import json
+    from marimo._plugins.stateless.lazy import lazy
+    from marimo._plugins.stateless.mermaid import mermaid
+    from marimo._plugins.stateless.nav_menu import nav_menu
+    from marimo._plugins.stateless.pdf import pdf
+    from marimo._plugins.stateless.plain_text import plain_text
+    from marimo._plugins.stateless.routes import routes
+    from marimo._plugins.stateless.sidebar import sidebar
+    from marimo._plugins.stateless.stat import stat
+    from marimo._plugins.stateless.style import style
+    from marimo._plugins.stateless.tabs import tabs
+    from marimo._plugins.stateless.tree import tree
+    from marimo._plugins.stateless.video import video
+    from marimo._runtime import output
+    from marimo._runtime.app_meta import AppMeta
+    from marimo._runtime.capture import (
+        capture_stderr,
+        capture_stdout,
+        redirect_stderr,
+        redirect_stdout,
+    )
+    from marimo._runtime.context.utils import running_in_notebook
+    from marimo._runtime.control_flow import MarimoStopError, stop
+    from marimo._runtime.runtime import (
+        app_meta,
+        cli_args,
+        defs,
+        notebook_dir,
+        notebook_location,
+        query_params,
+        refs,
+    )
+    from marimo._runtime.state import state
+    from marimo._runtime.threads import Thread, current_thread
+    from marimo._save.save import cache, lru_cache, persistent_cache
+    from marimo._server.asgi import create_asgi_app
+    from marimo._sql.sql import sql
+
+# The public API is imported on first access (PEP 562), so that `import
+# marimo` stays cheap: a script that only defines and runs an app doesn't
+# import the server, AI integrations or UI elements it doesn't use.
+#
+# Maps each attribute to the module it's defined in
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "App": "marimo._ast.app",
+    "Cell": "marimo._ast.cell",
+    "MarimoIslandGenerator": "marimo._islands._island_generator",
+    "doc": "marimo._output.doc",
+    "as_html": "marimo._output.formatting",
+    "iframe": "marimo._output.formatting",
+    "plain": "marimo._output.formatting",
+    "Html": "marimo._output.hypertext",
+    "center": "marimo._output.justify",
+    "left": "marimo._output.justify",
+    "right": "marimo._output.justify",
+    "latex": "marimo._output.md",
+    "md": "marimo._output.md",
+    "outline": "marimo._output.outline",
+    "show_code": "marimo._output.show_code",
+    "accordion": "marimo._plugins.stateless.accordion",
+    "audio": "marimo._plugins.stateless.audio",
+    "callout": "marimo._plugins.stateless.callout",
+    "carousel": "marimo._plugins.stateless.carousel",
+    "download": "marimo._plugins.stateless.download",
+    "hstack": "marimo._plugins.stateless.flex",
+    "vstack": "marimo._plugins.stateless.flex",
+    "icon": "marimo._plugins.stateless.icon",
+    "image": "marimo._plugins.stateless.image",
+    "image_compare": "marimo._plugins.stateless.image_compare",
+    "inspect": "marimo._plugins.stateless.inspect",
+    "json": "marimo._plugins.stateless.json_component",
+    "lazy": "marimo._plugins.stateless.lazy",
+    "mermaid": "marimo._plugins.stateless.mermaid",
+    "nav_menu": "marimo._plugins.stateless.nav_menu",
+    "pdf": "marimo._plugins.stateless.pdf",
+    "plain_text": "marimo._plugins.stateless.plain_text",
+    "routes": "marimo._plugins.stateless.routes",
+    "sidebar": "marimo._plugins.stateless.sidebar",
+    "stat": "marimo._plugins.stateless.stat",
+    "style": "marimo._plugins.stateless.style",
+    "tabs": "marimo._plugins.stateless.tabs",
+    "tree": "marimo._plugins.stateless.tree",
+    "video": "marimo._plugins.stateless.video",
+    "AppMeta": "marimo._runtime.app_meta",
+    "capture_stderr": "marimo._runtime.capture",
+    "capture_stdout": "marimo._runtime.capture",
+    "redirect_stderr": "marimo._runtime.capture",
+    "redirect_stdout": "marimo._runtime.capture",
+    "running_in_notebook": "marimo._runtime.context.utils",
+    "MarimoStopError": "marimo._runtime.control_flow",
+    "stop": "marimo._runtime.control_flow",
+    "app_meta": "marimo._runtime.runtime",
+    "cli_args": "marimo._runtime.runtime",
+    "defs": "marimo._runtime.runtime",
+    "notebook_dir": "marimo._runtime.runtime",
+    "notebook_location": "marimo._runtime.runtime",
+    "query_params": "marimo._runtime.runtime",
+    "refs": "marimo._runtime.runtime",
+    "state": "marimo._runtime.state",
+    "Thread": "marimo._runtime.threads",
+    "current_thread": "marimo._runtime.threads",
+    "cache": "marimo._save.save",
+    "lru_cache": "marimo._save.save",
+    "persistent_cache": "marimo._save.save",
+    "create_asgi_app": "marimo._server.asgi",
+    "sql": "marimo._sql.sql",
+}
+_LAZY_MODULES: dict[str, str] = {
+    "ai": "marimo._ai",
+    "islands": "marimo._islands",
+    "watch": "marimo._runtime.watch",
+    "ui": "marimo._plugins.ui",
+    "mpl": "marimo._plugins.stateless.mpl",
+    "status": "marimo._plugins.stateless.status",
+    "output": "marimo._runtime.output",
+}
+
+
+def __getattr__(name: str) -> _typing.Any:
+    import importlib
+
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
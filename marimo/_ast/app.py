@@ -306,7 +306,7 @@ class App:
                             cell_id=new_cell_id,
                             key=cell_impl.key,
                             code=cell_impl.code,
-                            mod=cell_impl.mod,
+                            _mod=cell_impl.mod,
                             defs=cell_impl.defs,
                             refs=cell_impl.refs,
                             sql_refs=cell_impl.sql_refs,
@@ -617,6 +617,8 @@ class App:
     def run(
         self,
         defs: dict[str, Any] | None = None,
+        *,
+        outputs: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> tuple[Sequence[Any], Mapping[str, Any]]:
         """
@@ -672,6 +674,9 @@ class App:
                 defs={batch_size: 64, learning_rate: 0.001}
             )
             # defs["batch_size"] == 64, defs["learning_rate"] == 0.001
+
+            # Only run the cells needed to compute `result`
+            outputs, defs = app.run(outputs=["result"])
             ```
 
         Definition Override Behavior:
@@ -688,6 +693,12 @@ class App:
                 arguments. marimo will use these values instead of executing
                 the cells that would normally define them. Cells that depend
                 on these variables will use your provided values.
+            outputs (Sequence[str], optional):
+                Names of the definitions you need. When given, only the
+                cells that define them and their ancestors are run, so
+                unrelated cells are skipped. Raises a `NameError` if a name
+                isn't defined by any enabled cell, or wasn't defined by the
+                time the run finished (e.g. because of `mo.stop`).
             **kwargs (Any):
                 For forward-compatibility with future arguments.
 
@@ -743,12 +754,21 @@ class App:
         if defs is not None:
             glbls.update(defs)
 
-        outputs, glbls = AppScriptRunner(
+        if isinstance(outputs, str):
+            raise TypeError(
+                "`outputs` must be a sequence of names, e.g. ['model']."
+            )
+
+        cell_outputs, glbls = AppScriptRunner(
             InternalApp(self),
             filename=self._filename,
             glbls=glbls,
+            targets=outputs,
         ).run()
-        return (self._flatten_outputs(outputs), self._globals_to_defs(glbls))
+        return (
+            self._flatten_outputs(cell_outputs),
+            self._globals_to_defs(glbls),
+        )
 
     async def _run_cell_async(
         self, cell: Cell, kwargs: dict[str, Any]
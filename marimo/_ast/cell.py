@@ -156,7 +156,9 @@ class CellImpl:
     # hash of code
     key: int
     code: str
-    mod: ast.Module
+    # parsed code; parsed on first access to `mod` if not given, which is
+    # the case for cells loaded from the compile cache
+    _mod: Optional[ast.Module]
     defs: set[Name]
     refs: set[Name]
     # metadata about refs, currently only tracks SQL refs
@@ -205,6 +207,15 @@ class CellImpl:
         self.config.configure(update)
         return self
 
+    @cached_property
+    def mod(self) -> ast.Module:
+        """The cell's code, parsed."""
+        if self._mod is not None:
+            return self._mod
+        from marimo._ast.compiler import module_compile
+
+        return module_compile(self.code)
+
     @property
     def runtime_state(self) -> Optional[RuntimeStateType]:
         """Gets the current runtime state of the cell.
@@ -0,0 +1,204 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Persistent cache of compiled cells.
+
+Like `__pycache__` for notebooks: a cell's bytecode and its def/ref
+analysis are stored on disk, keyed on its code and everything else that
+goes into compiling it, so loading an unchanged notebook in a new process
+skips parsing and visiting its cells. Each entry is stored in its own small
+file, written atomically, so concurrent processes can share the cache.
+Entries that go unused are evicted (see `marimo._utils.cache_eviction`).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Optional
+
+from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._utils.cache_eviction import (
+    DAY_SECONDS,
+    prune_cache_dir,
+    touch_entry,
+)
+from marimo._utils.platform import is_pyodide
+from marimo._utils.xdg import marimo_cache_dir
+from marimo._version import __version__
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import SourcePosition
+    from marimo._ast.sql_visitor import SQLRef
+    from marimo._ast.visitor import Language, Name, VariableData
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# Bump when the on-disk entry format changes.
+_CACHE_FORMAT_VERSION = 1
+
+# Modules whose changes invalidate the cache, for development installs
+# where the marimo version doesn't change with the code
+_ANALYSIS_MODULES = ("compiler.py", "visitor.py", "sql_visitor.py")
+
+_CODE_FIELDS = ("body", "last_expr")
+
+# Entries unused for longer than this are evicted
+_MAX_AGE = 30 * DAY_SECONDS
+# Least recently used entries are evicted beyond this many bytes
+_MAX_SIZE = 256 * 1024 * 1024
+
+
+def default_compile_cache_dir() -> Path:
+    return marimo_cache_dir() / "compiled"
+
+
+@dataclasses.dataclass
+class CompiledCell:
+    """Everything `compile_cell` derives from a cell's code."""
+
+    body: CodeType
+    last_expr: CodeType
+    defs: set[Name]
+    refs: set[Name]
+    sql_refs: dict[Name, SQLRef]
+    temporaries: set[Name]
+    variable_data: dict[Name, list[VariableData]]
+    deleted_refs: set[Name]
+    language: Language
+    markdown: Optional[str]
+    is_import_block: bool
+    is_test: bool
+
+
+class CompileCache:
+    """On-disk cache mapping cell code to compiled cells."""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.cache_dir = cache_dir or default_compile_cache_dir()
+        ast_dir = Path(__file__).parent
+        # Everything other than the cell itself that affects the result
+        self._salt = json.dumps(
+            [
+                _CACHE_FORMAT_VERSION,
+                __version__,
+                sys.version,
+                [_mtime(ast_dir / module) for module in _ANALYSIS_MODULES],
+            ]
+        ).encode("utf-8")
+
+    def key(
+        self,
+        code: str,
+        cell_id: CellId_t,
+        source_position: Optional[SourcePosition],
+    ) -> str:
+        """Compute the cache key for a cell."""
+        h = hashlib.sha256(self._salt)
+        position = (
+            None
+            if source_position is None
+            else [
+                source_position.filename,
+                source_position.lineno,
+                source_position.col_offset,
+            ]
+        )
+        # The cell id is part of the key because private names are mangled
+        # with it
+        h.update(json.dumps([cell_id, position]).encode("utf-8"))
+        h.update(b"\0")
+        h.update(code.encode("utf-8"))
+        return h.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[CompiledCell]:
+        path = self._entry_path(key)
+        try:
+            entry = pickle.loads(path.read_bytes())
+            for name in _CODE_FIELDS:
+                entry[name] = marshal.loads(entry[name])
+            compiled = CompiledCell(**entry)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOGGER.debug("Ignoring corrupt compile cache entry %s: %s", key, e)
+            return None
+        touch_entry(path)
+        return compiled
+
+    def put(self, key: str, compiled: CompiledCell) -> None:
+        entry: dict[str, Any] = {
+            field.name: getattr(compiled, field.name)
+            for field in dataclasses.fields(compiled)
+        }
+        for name in _CODE_FIELDS:
+            entry[name] = marshal.dumps(entry[name])
+        path = self._entry_path(key)
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            LOGGER.debug("Failed to write compile cache entry %s: %s", key, e)
+
+    def prune(self) -> int:
+        """Evict unused entries; returns the number removed."""
+        return prune_cache_dir(
+            self.cache_dir, max_age=_MAX_AGE, max_size=_MAX_SIZE
+        )
+
+
+def with_filename(code: CodeType, filename: str) -> CodeType:
+    """Point a code object, and the code objects nested in it, at a file."""
+    if code.co_filename == filename:
+        return code
+    consts = tuple(
+        with_filename(const, filename)
+        if isinstance(const, CodeType)
+        else const
+        for const in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+_COMPILE_CACHE: Optional[CompileCache] = None
+
+
+def get_compile_cache() -> Optional[CompileCache]:
+    """The shared compile cache, or None if it's disabled."""
+    global _COMPILE_CACHE
+    if not GLOBAL_SETTINGS.COMPILE_CACHE or is_pyodide():
+        return None
+    if _COMPILE_CACHE is None:
+        _COMPILE_CACHE = CompileCache()
+        # Off the notebook's load path; a no-op unless the cache hasn't
+        # been pruned for a day
+        threading.Thread(
+            target=_COMPILE_CACHE.prune,
+            name="marimo-compile-cache-prune",
+            daemon=True,
+        ).start()
+    return _COMPILE_CACHE
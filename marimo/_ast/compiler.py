@@ -23,6 +23,11 @@ from marimo._ast.cell import (
     ImportWorkspace,
     SourcePosition,
 )
+from marimo._ast.compile_cache import (
+    CompiledCell,
+    get_compile_cache,
+    with_filename,
+)
 from marimo._ast.names import SETUP_CELL_NAME, TOPLEVEL_CELL_PREFIX
 from marimo._ast.pytest import has_fixture_decorator
 from marimo._ast.transformers import ContainedExtractWithBlock
@@ -238,7 +243,16 @@ def compile_cell(
     carried_imports: list[ImportData] | None = None,
     test_rewrite: bool = False,
     filename: Optional[str] = None,
+    use_cache: bool = False,
 ) -> CellImpl:
+    """Compile a cell's code and analyze its definitions and references.
+
+    With `use_cache`, the result is looked up in (and stored to) the
+    persistent compile cache, so that loading an unchanged notebook in a
+    new process skips parsing and visiting its cells. Cells compiled with
+    `test_rewrite`, and test cells, are not cached, since their assertions
+    are rewritten with pytest.
+    """
     if filename is not None and source_position is None:
         source_position = solve_source_position(
             code,
@@ -253,6 +267,25 @@ def compile_cell(
     # See https://github.com/pyodide/pyodide/issues/3337,
     #     https://github.com/marimo-team/marimo/issues/1546
     code = code.replace("\u00a0", " ")
+
+    compile_cache = (
+        get_compile_cache() if use_cache and not test_rewrite else None
+    )
+    cache_key = None
+    if compile_cache is not None:
+        cache_key = compile_cache.key(code, cell_id, source_position)
+        compiled = compile_cache.get(cache_key)
+        if compiled is not None:
+            if source_position is None:
+                # The temporary filename is process-specific
+                filename = get_filename(cell_id)
+                cache(filename, code)
+                compiled.body = with_filename(compiled.body, filename)
+                compiled.last_expr = with_filename(
+                    compiled.last_expr, filename
+                )
+            return _cell_impl(code, cell_id, compiled, None, carried_imports)
+
     module = module_compile(code)
 
     if not module.body:
@@ -260,7 +293,7 @@ def compile_cell(
         return CellImpl(
             key=hash(""),
             code=code,
-            mod=module,
+            _mod=module,
             defs=set(),
             refs=set(),
             sql_refs={},
@@ -340,19 +373,52 @@ def compile_cell(
     )
 
     nonlocals = {name for name in v.defs if not is_local(name)}
-    temporaries = v.defs - nonlocals
-    variable_data = {
-        name: v.variable_data[name]
-        for name in nonlocals
-        if name in v.variable_data
-    }
+    compiled = CompiledCell(
+        body=body,
+        last_expr=last_expr,
+        defs=nonlocals,
+        refs=v.refs,
+        sql_refs=v.sql_refs,
+        temporaries=v.defs - nonlocals,
+        variable_data={
+            name: v.variable_data[name]
+            for name in nonlocals
+            if name in v.variable_data
+        },
+        deleted_refs=v.deleted_refs,
+        language=v.language,
+        markdown=_extract_markdown(original_module),
+        is_import_block=is_import_block,
+        is_test=is_test,
+    )
+    # SQL analysis depends on the installed duckdb and sqlglot, and
+    # assertion rewriting on pytest, so those cells aren't cached
+    if (
+        compile_cache is not None
+        and cache_key is not None
+        and v.language == "python"
+        and not is_test
+    ):
+        compile_cache.put(cache_key, compiled)
+
+    return _cell_impl(
+        code, cell_id, compiled, original_module, carried_imports
+    )
+
 
+def _cell_impl(
+    code: str,
+    cell_id: CellId_t,
+    compiled: CompiledCell,
+    mod: Optional[ast.Module],
+    carried_imports: list[ImportData] | None,
+) -> CellImpl:
     # If this cell is an import cell, we carry over any imports in
     # `carried_imports` that are also in this cell to the import workspace's
     # definitions.
     imported_defs: set[Name] = set()
-    if is_import_block and carried_imports is not None:
-        for data in variable_data.values():
+    if compiled.is_import_block and carried_imports is not None:
+        for data in compiled.variable_data.values():
             for datum in data:
                 import_data = datum.import_data
                 if import_data is None:
@@ -361,29 +427,27 @@ def compile_cell(
                     if previous_import_data == import_data:
                         imported_defs.add(import_data.definition)
 
-    maybe_md = _extract_markdown(original_module)
-
     return CellImpl(
         # keyed by original (user) code, for cache lookups
         key=code_key(code),
         code=code,
-        mod=original_module,
-        defs=nonlocals,
-        refs=v.refs,
-        sql_refs=v.sql_refs,
-        temporaries=temporaries,
-        variable_data=variable_data,
+        _mod=mod,
+        defs=compiled.defs,
+        refs=compiled.refs,
+        sql_refs=compiled.sql_refs,
+        temporaries=compiled.temporaries,
+        variable_data=compiled.variable_data,
         import_workspace=ImportWorkspace(
-            is_import_block=is_import_block,
+            is_import_block=compiled.is_import_block,
             imported_defs=imported_defs,
         ),
-        deleted_refs=v.deleted_refs,
-        language=v.language,
-        body=body,
-        last_expr=last_expr,
+        deleted_refs=compiled.deleted_refs,
+        language=compiled.language,
+        body=compiled.body,
+        last_expr=compiled.last_expr,
         cell_id=cell_id,
-        markdown=maybe_md,
-        _test=is_test,
+        markdown=compiled.markdown,
+        _test=compiled.is_test,
     )
 
 
@@ -490,6 +554,7 @@ def context_cell_factory(
             cell_id=cell_id,
             source_position=source_position,
             test_rewrite=False,
+            use_cache=True,
         ),
     )
 
@@ -536,6 +601,7 @@ def toplevel_cell_factory(
         cell_id=cell_id,
         source_position=source_position,
         test_rewrite=test_rewrite,
+        use_cache=True,
     )
     if isinstance(obj, Cls):
         is_test = obj.__name__.startswith("Test")
@@ -574,6 +640,7 @@ def ir_cell_factory(
             cell_def.code,
             cell_id=cell_id,
             source_position=source_position,
+            use_cache=True,
         ),
     )
 
@@ -609,6 +676,7 @@ def cell_factory(
         cell_id=cell_id,
         source_position=source_position,
         test_rewrite=test_rewrite,
+        use_cache=True,
     )
     return Cell(
         _name=f.__name__,
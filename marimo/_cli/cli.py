@@ -7,44 +7,23 @@ import os
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
 
 import marimo._cli.cli_validators as validators
 from marimo import _loggers
-from marimo._ast import codegen
-from marimo._cli.config.commands import config
-from marimo._cli.convert.commands import convert
-from marimo._cli.development.commands import development
-from marimo._cli.envinfo import get_system_info
-from marimo._cli.export.commands import export
-from marimo._cli.file_path import validate_name
-from marimo._cli.parse_args import parse_args
+from marimo._cli.lazy_group import LazyGroup, LazySubcommand
 from marimo._cli.print import red
-from marimo._cli.run_docker import (
-    prompt_run_in_docker_container,
-)
-from marimo._cli.upgrade import check_for_updates, print_latest_version
-from marimo._cli.utils import (
-    check_app_correctness,
-    check_app_correctness_or_convert,
-    resolve_token,
-)
 from marimo._config.settings import GLOBAL_SETTINGS
-from marimo._lint import run_check
-from marimo._server.file_router import AppFileRouter
-from marimo._server.start import start
-from marimo._session.model import SessionMode
-from marimo._tutorials import (
-    Tutorial,
-    create_temp_tutorial_file,
-    tutorial_order,
-)  # type: ignore
-from marimo._utils.marimo_path import MarimoPath, create_temp_notebook_file
+from marimo._tutorials import tutorial_order
 from marimo._utils.platform import is_windows
 from marimo._version import __version__
 
+if TYPE_CHECKING:
+    from marimo._server.file_router import AppFileRouter
+    from marimo._tutorials import Tutorial
+
 
 def helpful_usage_error(self: Any, file: Any = None) -> None:
     if file is None:
@@ -145,8 +124,33 @@ check_message = "Disable a static check of the notebook before running."
 
 
 @click.group(
+    cls=LazyGroup,
     help=main_help_msg,
     context_settings={"help_option_names": ["-h", "--help"]},
+    lazy_subcommands={
+        "config": LazySubcommand(
+            "marimo._cli.config.commands",
+            "config",
+            "Various commands for the marimo config.",
+        ),
+        "convert": LazySubcommand(
+            "marimo._cli.convert.commands",
+            "convert",
+            "Convert a Jupyter notebook, Markdown file, or Python script "
+            "to a marimo notebook.",
+        ),
+        "development": LazySubcommand(
+            "marimo._cli.development.commands",
+            "development",
+            "Various commands for the marimo development.",
+            hidden=True,
+        ),
+        "export": LazySubcommand(
+            "marimo._cli.export.commands",
+            "export",
+            "Export a notebook to various formats.",
+        ),
+    },
 )
 @click.version_option(version=__version__, message="%(version)s")
 @click.option(
@@ -404,6 +408,15 @@ edit_help_msg = "\n".join(
     type=int,
     help="Seconds to wait before closing a session on websocket disconnect. If None is provided, sessions are not automatically closed.",
 )
+@click.option(
+    "--warm-kernels",
+    default=None,
+    type=click.IntRange(min=1),
+    help="""Keep this many kernel processes started ahead of time, so that
+    new sessions start without waiting for a kernel to import marimo.
+    Only used with --sandbox, or where kernels aren't forked from the server
+    (macOS, Windows, and Python 3.14+). Requires pyzmq.""",
+)
 @click.argument(
     "name",
     required=False,
@@ -433,10 +446,24 @@ def edit(
     asset_url: Optional[str],
     timeout: Optional[float],
     session_ttl: Optional[int],
+    warm_kernels: Optional[int],
     name: Optional[str],
     args: tuple[str, ...],
 ) -> None:
+    from marimo._cli.file_path import validate_name
+    from marimo._cli.parse_args import parse_args
+    from marimo._cli.run_docker import prompt_run_in_docker_container
     from marimo._cli.sandbox import SandboxMode, resolve_sandbox_mode
+    from marimo._cli.upgrade import check_for_updates, print_latest_version
+    from marimo._cli.utils import (
+        check_app_correctness,
+        check_app_correctness_or_convert,
+        resolve_token,
+    )
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+    from marimo._session.model import SessionMode
+    from marimo._utils.marimo_path import create_temp_notebook_file
 
     pass_on_stdin = token_password_file == "-"
     # We support unix-style piping, e.g. cat notebook.py | marimo edit
@@ -525,6 +552,16 @@ def edit(
                 "Or: pip install pyzmq"
             )
 
+    # Warm kernels are IPC kernels too
+    if warm_kernels is not None:
+        from marimo._dependencies.dependencies import DependencyManager
+
+        if not DependencyManager.zmq.has():
+            raise click.UsageError(
+                "pyzmq is required for --warm-kernels.\n"
+                "Install it with: pip install pyzmq"
+            )
+
     # Check shared memory availability early (required for edit mode to
     # communicate between the server process and kernel subprocess)
     from marimo._utils.platform import check_shared_memory_available
@@ -571,6 +608,7 @@ def edit(
         asset_url=asset_url,
         timeout=timeout,
         sandbox_mode=sandbox_mode,
+        warm_kernels=warm_kernels,
     )
 
 
@@ -699,6 +737,11 @@ def new(
     timeout: Optional[float],
     prompt: Optional[str],
 ) -> None:
+    from marimo._cli.utils import resolve_token
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+    from marimo._session.model import SessionMode
+
     if sandbox:
         from marimo._cli.sandbox import run_in_sandbox
 
@@ -938,6 +981,37 @@ Example:
     hidden=True,
     help="Custom asset URL for loading static resources. Can include {version} placeholder.",
 )
+@click.option(
+    "--kernel-processes",
+    default=None,
+    type=click.IntRange(min=1),
+    help="""Run session kernels in a pool of up to this many worker
+    processes instead of as threads of the server, so that concurrent
+    sessions can use multiple CPU cores.""",
+)
+@click.option(
+    "--kernels-per-process",
+    default=None,
+    type=click.IntRange(min=1),
+    help="""Maximum number of kernels in one worker process; 1 gives each
+    session its own process. Requires --kernel-processes.""",
+)
+@click.option(
+    "--kernel-memory-limit",
+    default=None,
+    type=click.IntRange(min=1),
+    help="""Virtual address space limit of each kernel worker process, in
+    MB (POSIX only). The limit is shared by all kernels in a worker and
+    counts reserved, not just resident, memory. Requires
+    --kernel-processes.""",
+)
+@click.option(
+    "--kernel-cpus",
+    default=None,
+    type=click.IntRange(min=1),
+    help="""Number of CPUs each kernel worker process is pinned to.
+    Requires --kernel-processes.""",
+)
 @click.argument(
     "name",
     required=True,
@@ -964,14 +1038,46 @@ def run(
     trusted: Optional[bool],
     server_startup_command: Optional[str],
     asset_url: Optional[str],
+    kernel_processes: Optional[int],
+    kernels_per_process: Optional[int],
+    kernel_memory_limit: Optional[int],
+    kernel_cpus: Optional[int],
     name: str,
     args: tuple[str, ...],
 ) -> None:
+    from marimo._cli.file_path import validate_name
+    from marimo._cli.parse_args import parse_args
+    from marimo._cli.run_docker import prompt_run_in_docker_container
     from marimo._cli.sandbox import (
         SandboxMode,
         resolve_sandbox_mode,
         run_in_sandbox,
     )
+    from marimo._cli.utils import check_app_correctness, resolve_token
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+    from marimo._session.model import SessionMode
+    from marimo._utils.marimo_path import MarimoPath
+
+    kernel_pool = None
+    if kernel_processes is not None:
+        from marimo._session.managers.pool import KernelPoolConfig
+
+        kernel_pool = KernelPoolConfig(
+            processes=kernel_processes,
+            kernels_per_process=kernels_per_process,
+            memory_limit_mb=kernel_memory_limit,
+            cpus_per_process=kernel_cpus,
+        )
+    elif (
+        kernels_per_process is not None
+        or kernel_memory_limit is not None
+        or kernel_cpus is not None
+    ):
+        raise click.UsageError(
+            "--kernels-per-process, --kernel-memory-limit and --kernel-cpus "
+            "require --kernel-processes."
+        )
 
     if prompt_run_in_docker_container(name, trusted=trusted):
         from marimo._cli.run_docker import run_in_docker
@@ -1036,6 +1142,7 @@ def run(
         redirect_console_to_browser=redirect_console_to_browser,
         server_startup_command=server_startup_command,
         asset_url=asset_url,
+        kernel_pool=kernel_pool,
     )
 
 
@@ -1048,9 +1155,123 @@ def run(
     ),
 )
 def recover(name: Path) -> None:
+    from marimo._ast import codegen
+
     click.echo(codegen.recover(name))
 
 
+@main.command(
+    help="""Run a notebook once per set of parameters.
+
+Each line of the parameters file is a JSON object of definitions to
+override, as with `app.run(defs=...)`. Cells that don't depend on the
+parameters run once; the cells that do run for each line. With --jobs,
+the definitions of the cells that run once are pickled and sent to each
+worker process; a cell whose definitions can't be pickled runs again in
+each worker. Results are written as JSON lines, in the order of the
+parameters.
+
+Example:
+
+    \b
+    marimo run-batch notebook.py --params grid.jsonl --jobs 8 -o results.jsonl
+"""
+)
+@click.argument(
+    "name",
+    required=True,
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, path_type=Path
+    ),
+)
+@click.option(
+    "--params",
+    "params_file",
+    required=True,
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, path_type=Path
+    ),
+    help="JSON lines file with one object of definitions per run.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes.",
+)
+@click.option(
+    "--outputs",
+    multiple=True,
+    type=str,
+    help="""Definition to collect; can be repeated. Defaults to the
+    definitions of the cells that depend on the parameters.""",
+)
+@click.option(
+    "-o",
+    "--output",
+    default=None,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="File to write results to. Defaults to stdout.",
+)
+def run_batch(
+    name: Path,
+    params_file: Path,
+    jobs: int,
+    outputs: tuple[str, ...],
+    output: Optional[Path],
+) -> None:
+    from marimo._runtime.app.sweep import load_notebook, run_sweep
+
+    params: list[dict[str, Any]] = []
+    for lineno, line in enumerate(
+        params_file.read_text(encoding="utf-8").splitlines(), start=1
+    ):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise click.ClickException(
+                f"{params_file}:{lineno}: invalid JSON ({e})"
+            ) from None
+        if not isinstance(value, dict):
+            raise click.ClickException(
+                f"{params_file}:{lineno}: expected a JSON object"
+            )
+        params.append(value)
+
+    app = load_notebook(name)
+    results = run_sweep(app, params, jobs=jobs, outputs=outputs or None)
+
+    failed = 0
+    stream = output.open("w", encoding="utf-8") if output is not None else None
+    try:
+        for result in results:
+            if result.error is not None:
+                failed += 1
+            line = json.dumps(
+                {
+                    "index": result.index,
+                    "params": result.params,
+                    "defs": result.defs,
+                    "error": result.error,
+                },
+                default=repr,
+            )
+            if stream is not None:
+                stream.write(line + "\n")
+            else:
+                click.echo(line)
+    finally:
+        if stream is not None:
+            stream.close()
+
+    if failed:
+        raise click.ClickException(f"{failed} of {len(params)} runs failed.")
+
+
 @main.command(
     help="""Open a tutorial.
 
@@ -1141,6 +1362,12 @@ def tutorial(
     skew_protection: bool,
     name: Tutorial,
 ) -> None:
+    from marimo._cli.utils import resolve_token
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+    from marimo._session.model import SessionMode
+    from marimo._tutorials import create_temp_tutorial_file
+
     temp_dir = tempfile.TemporaryDirectory()
     path = create_temp_tutorial_file(name, temp_dir)
 
@@ -1171,6 +1398,8 @@ def tutorial(
 @main.command()
 def env() -> None:
     """Print out environment information for debugging purposes."""
+    from marimo._cli.envinfo import get_system_info
+
     click.echo(json.dumps(get_system_info(), indent=2))
 
 
@@ -1271,6 +1500,22 @@ def shell_completion() -> None:
     type=click.Choice(["full", "json"], case_sensitive=False),
     help="Output format for diagnostics.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Number of processes to check files with. Use 0 for one per CPU.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    type=bool,
+    help="Skip files that haven't changed since the last check. "
+    "Not used with --fix.",
+)
 @click.argument("files", nargs=-1, type=click.UNPROCESSED)
 def check(
     fix: bool,
@@ -1279,8 +1524,12 @@ def check(
     unsafe_fixes: bool,
     ignore_scripts: bool,
     formatter: str,
+    jobs: int,
+    cache: bool,
     files: tuple[str, ...],
 ) -> None:
+    from marimo._lint import run_check
+
     if not files:
         # If no files are provided, we lint the current directory
         files = ("**/*.py", "**/*.md", "**/*.qmd")
@@ -1294,6 +1543,8 @@ def check(
         unsafe_fixes=unsafe_fixes,
         ignore_scripts=ignore_scripts,
         formatter=formatter,
+        jobs=jobs,
+        cache=cache,
     )
 
     if formatter == "json":
@@ -1316,9 +1567,3 @@ def check(
 
     if linter.errored or (strict and (fixed > 0 or total_issues > 0)):
         sys.exit(1)
-
-
-main.command()(convert)
-main.add_command(export)
-main.add_command(config)
-main.add_command(development)
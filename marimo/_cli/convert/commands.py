@@ -13,6 +13,7 @@ from marimo._convert.converters import MarimoConvert
 from marimo._utils.paths import maybe_make_dirs
 
 
+@click.command()
 @click.argument("filename", required=True)
 @click.option(
     "-o",
@@ -0,0 +1,82 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import click
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A subcommand defined by `module.attribute`, imported on first use."""
+
+    module: str
+    attribute: str
+    # Shown by `--help`, which lists the subcommand without importing it
+    short_help: str
+    hidden: bool = False
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are only imported when invoked.
+
+    Subcommands like `export` pull in most of marimo (the server, the
+    runtime, the converters), which would otherwise be imported by every
+    invocation of the CLI, including `marimo --help`.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, LazySubcommand]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(
+            set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if lazy is not None and cmd_name not in self.commands:
+            module = importlib.import_module(lazy.module)
+            self.add_command(getattr(module, lazy.attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Same as click's, but lists lazy subcommands without importing them
+        commands: list[tuple[str, click.Command]] = []
+        for name in self.list_commands(ctx):
+            cmd = self._peek_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                commands.append((name, cmd))
+        if not commands:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = [
+            (name, cmd.get_short_help_str(limit)) for name, cmd in commands
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def _peek_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """The subcommand, or a stand-in for it if it isn't imported yet."""
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if lazy is not None and cmd_name not in self.commands:
+            # Only used for its help text
+            return click.Command(
+                cmd_name, help=lazy.short_help, hidden=lazy.hidden
+            )
+        return self.get_command(ctx, cmd_name)
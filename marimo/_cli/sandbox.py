@@ -17,6 +17,11 @@ import click
 
 from marimo import _loggers
 from marimo._cli.print import bold, echo, green, muted
+from marimo._cli.sandbox_cache import (
+    SandboxEnvCache,
+    SandboxEnvironment,
+    python_identifier,
+)
 from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._utils.inline_script_metadata import (
@@ -491,36 +496,29 @@ def get_sandbox_requirements(
     return normalized
 
 
-def build_sandbox_venv(
-    filename: str | None,
-    additional_deps: list[str] | None = None,
-) -> tuple[str, str]:
-    """Build sandbox venv and install dependencies.
-
-    Creates an ephemeral virtual environment using uv with the notebook's
-    dependencies installed. Used for "multi" sandbox mode where each notebook
-    gets its own sandboxed environment.
+def _create_sandbox_venv(
+    venv_path: str,
+    requirements: list[str],
+    *,
+    relocatable: bool = False,
+) -> str:
+    """Create a venv at `venv_path` and install `requirements` into it.
 
-    Args:
-        filename: Path to notebook file for reading dependencies.
-        additional_deps: Extra dependencies to add (e.g., get_ipc_kernel_deps()).
-
-    Returns:
-        Tuple of (sandbox_dir, venv_python_path).
+    Returns the path to the venv's Python interpreter.
 
     Raises:
         RuntimeError: If dependency installation fails.
     """
     uv_bin = find_uv_bin()
 
-    # Create temp directory for sandbox venv
-    sandbox_dir = tempfile.mkdtemp(prefix="marimo-sandbox-")
-    venv_path = os.path.join(sandbox_dir, "venv")
-
     # Phase 1: Create venv
     echo(f"Creating sandbox environment: {muted(venv_path)}", err=True)
+    venv_cmd = [uv_bin, "venv", "--seed"]
+    if relocatable:
+        # Cached venvs are built in a staging directory, then moved
+        venv_cmd.extend(["--relocatable", "--python", sys.executable])
     subprocess.run(
-        [uv_bin, "venv", "--seed", venv_path],
+        [*venv_cmd, venv_path],
         check=True,
         capture_output=True,
     )
@@ -532,7 +530,6 @@ def build_sandbox_venv(
         venv_python = os.path.join(venv_path, "bin", "python")
 
     # Phase 2: Install dependencies
-    requirements = get_sandbox_requirements(filename, additional_deps)
     echo("Installing sandbox dependencies...", err=True)
 
     # Separate editable installs from regular requirements
@@ -565,7 +562,7 @@ def build_sandbox_venv(
 
     # Install regular packages via requirements file
     if regular_reqs:
-        req_file = os.path.join(sandbox_dir, "requirements.txt")
+        req_file = os.path.join(os.path.dirname(venv_path), "requirements.txt")
         with open(req_file, "w", encoding="utf-8") as f:
             f.write("\n".join(regular_reqs))
 
@@ -583,15 +580,96 @@ def build_sandbox_venv(
             text=True,
         )
         if result.returncode != 0:
-            # Clean up on failure
-            cleanup_sandbox_dir(sandbox_dir)
             raise RuntimeError(
                 f"Failed to install sandbox dependencies: {result.stderr}"
             )
 
+    return venv_python
+
+
+def build_sandbox_venv(
+    filename: str | None,
+    additional_deps: list[str] | None = None,
+) -> tuple[str, str]:
+    """Build sandbox venv and install dependencies.
+
+    Creates an ephemeral virtual environment using uv with the notebook's
+    dependencies installed. Used for "multi" sandbox mode where each notebook
+    gets its own sandboxed environment.
+
+    Args:
+        filename: Path to notebook file for reading dependencies.
+        additional_deps: Extra dependencies to add (e.g., get_ipc_kernel_deps()).
+
+    Returns:
+        Tuple of (sandbox_dir, venv_python_path).
+
+    Raises:
+        RuntimeError: If dependency installation fails.
+    """
+    # Create temp directory for sandbox venv
+    sandbox_dir = tempfile.mkdtemp(prefix="marimo-sandbox-")
+    venv_path = os.path.join(sandbox_dir, "venv")
+    requirements = get_sandbox_requirements(filename, additional_deps)
+    try:
+        venv_python = _create_sandbox_venv(venv_path, requirements)
+    except RuntimeError:
+        # Clean up on failure
+        cleanup_sandbox_dir(sandbox_dir)
+        raise
     return sandbox_dir, venv_python
 
 
+def acquire_sandbox_venv(
+    filename: str | None,
+    additional_deps: list[str] | None = None,
+) -> SandboxEnvironment:
+    """Get a sandbox venv for a notebook, shared with identical notebooks.
+
+    Environments are cached on disk by their normalized requirements
+    and Python version, so notebooks with the same dependencies reuse one
+    environment. Falls back to an ephemeral venv (removed on release) if
+    the cache can't be used.
+
+    Args:
+        filename: Path to notebook file for reading dependencies.
+        additional_deps: Extra dependencies to add (e.g., get_ipc_kernel_deps()).
+
+    Raises:
+        RuntimeError: If dependency installation fails.
+    """
+    requirements = get_sandbox_requirements(filename, additional_deps)
+
+    def build(venv_path: Path) -> None:
+        _create_sandbox_venv(str(venv_path), requirements, relocatable=True)
+
+    try:
+        environment = SandboxEnvCache().acquire(
+            requirements, python_identifier(), build
+        )
+    except OSError as e:
+        LOGGER.warning("Sandbox environment cache unavailable: %s", e)
+        environment = None
+    if environment is not None:
+        echo(
+            f"Using cached sandbox environment: {muted(str(environment.path))}",
+            err=True,
+        )
+        return environment
+
+    sandbox_dir, venv_python = build_sandbox_venv(filename, additional_deps)
+    return _EphemeralSandboxEnvironment(
+        path=Path(sandbox_dir), venv_python=venv_python
+    )
+
+
+class _EphemeralSandboxEnvironment(SandboxEnvironment):
+    ephemeral = True
+
+    def release(self) -> None:
+        cleanup_sandbox_dir(str(self.path))
+
+
 def cleanup_sandbox_dir(sandbox_dir: str | None) -> None:
     """Clean up sandbox directory.
 
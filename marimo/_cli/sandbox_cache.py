@@ -0,0 +1,356 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""A persistent, content-addressed cache of sandbox environments.
+
+Sandboxed kernels whose notebooks declare the same dependencies, for the
+same Python, share one virtual environment on disk instead of each
+building (resolving, downloading, and linking) their own.
+
+Layout of the cache directory:
+
+    <key>/venv/         the virtual environment
+    <key>/meta.json     requirements and python used to build it
+    <key>/refs/<pid>-*  one file per kernel currently using it
+    <key>/modified      present once a kernel changed the environment
+
+Environments are built in a private directory and moved into place
+atomically, so concurrent builds of the same key are safe; the loser
+discards its copy. Unreferenced environments are evicted least recently
+used first.
+
+Kernels mark their environment as modified before installing or removing
+packages at runtime, so it is no longer handed out to new kernels; kernels
+already sharing it do see the change. Requirements on local paths (e.g.
+editable installs) aren't cached, since the code they point to can change
+without the requirement changing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional
+
+from marimo import _loggers
+from marimo._utils.xdg import marimo_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+LOGGER = _loggers.marimo_logger()
+
+MAX_CACHED_ENVIRONMENTS = 8
+MAX_UNUSED_SECONDS = 30 * 24 * 60 * 60
+# Builds that crashed leave their directory behind
+STALE_BUILD_SECONDS = 24 * 60 * 60
+
+_META_FILE = "meta.json"
+_MODIFIED_FILE = "modified"
+_REFS_DIR = "refs"
+_VENV_DIR = "venv"
+
+
+def sandbox_cache_dir() -> Path:
+    return marimo_cache_dir() / "sandbox-envs"
+
+
+def python_identifier() -> str:
+    """The interpreter that sandbox environments are built from."""
+    return "-".join(
+        (
+            sys.implementation.name,
+            platform.python_version(),
+            sys.platform,
+            platform.machine(),
+        )
+    )
+
+
+def normalize_requirements(requirements: Iterable[str]) -> list[str]:
+    """Requirements as a sorted, de-duplicated list without comments."""
+    normalized: set[str] = set()
+    for requirement in requirements:
+        line = requirement.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        normalized.add(" ".join(line.split()))
+    return sorted(normalized)
+
+
+def environment_key(requirements: Iterable[str], python: str) -> str:
+    payload = json.dumps(
+        {
+            "requirements": normalize_requirements(requirements),
+            "python": python,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def is_local_requirement(requirement: str) -> bool:
+    """Whether a requirement refers to a local path, possibly editable."""
+    requirement = requirement.strip()
+    if requirement.startswith(("-e ", "--editable")):
+        return True
+    if "file:" in requirement:
+        return True
+    # A bare path, e.g. ./packages/foo, /abs/foo, ~/foo, or C:/foo
+    return requirement.startswith((".", "/", "~", "\\")) or (
+        len(requirement) > 2
+        and requirement[1] == ":"
+        and requirement[2] in "/\\"
+    )
+
+
+def mark_modified(prefix: str) -> bool:
+    """Mark the cached environment at `prefix`, if any, as modified.
+
+    Called before changing the packages of a running kernel's environment
+    (`sys.prefix`), so that the environment isn't handed out again. Returns
+    whether `prefix` is a cached environment.
+    """
+    venv_path = Path(prefix)
+    entry = venv_path.parent
+    if venv_path.name != _VENV_DIR or not (entry / _META_FILE).is_file():
+        return False
+    try:
+        (entry / _MODIFIED_FILE).touch()
+    except OSError as e:
+        LOGGER.warning("Failed to mark sandbox %s as modified: %s", entry, e)
+    return True
+
+
+def venv_python_path(venv_path: Path) -> Path:
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def _packages_fingerprint(venv_path: Path) -> Optional[str]:
+    """A hash of the distributions installed in an environment.
+
+    Based on the names of the `.dist-info` directories, which include the
+    version, so installing, removing, or changing the version of a package
+    changes the fingerprint. The site-packages directory's mtime can't be
+    used, since importing a module writes to `__pycache__`.
+    """
+    candidates = [
+        *venv_path.glob("lib/python*/site-packages"),
+        venv_path / "Lib" / "site-packages",
+    ]
+    for candidate in candidates:
+        if not candidate.is_dir():
+            continue
+        try:
+            distributions = sorted(
+                path.name for path in candidate.glob("*.dist-info")
+            )
+        except OSError:
+            return None
+        return hashlib.sha256(
+            "\n".join(distributions).encode("utf-8")
+        ).hexdigest()
+    return None
+
+
+def _pid_exists(pid: int) -> bool:
+    import psutil
+
+    return bool(psutil.pid_exists(pid))
+
+
+@dataclass
+class SandboxEnvironment:
+    """A sandbox environment in use by a kernel.
+
+    Call `release()` when the kernel exits; the environment stays on
+    disk for reuse.
+    """
+
+    path: Path
+    venv_python: str
+    _ref: Optional[Path] = field(default=None, repr=False)
+
+    # Whether the environment is removed on release, rather than kept
+    ephemeral: ClassVar[bool] = False
+
+    def release(self) -> None:
+        ref, self._ref = self._ref, None
+        if ref is not None:
+            ref.unlink(missing_ok=True)
+
+
+class SandboxEnvCache:
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        max_environments: int = MAX_CACHED_ENVIRONMENTS,
+        max_unused_seconds: float = MAX_UNUSED_SECONDS,
+    ) -> None:
+        self.root = root or sandbox_cache_dir()
+        self.max_environments = max_environments
+        self.max_unused_seconds = max_unused_seconds
+
+    def acquire(
+        self,
+        requirements: list[str],
+        python: str,
+        build: Callable[[Path], None],
+    ) -> Optional[SandboxEnvironment]:
+        """Get an environment for the requirements, building it if needed.
+
+        `build` is called with the path of a virtual environment to
+        create. Returns None if the requirements include local paths, or
+        if the cached environment has been modified (e.g. packages were
+        installed into it at runtime) and is still in use; the caller
+        should then build a private environment.
+        """
+        if any(is_local_requirement(r) for r in requirements):
+            LOGGER.debug("Not caching a sandbox with local requirements")
+            return None
+
+        key = environment_key(requirements, python)
+        entry = self.root / key
+
+        if entry.is_dir() and self._is_modified(entry):
+            if self._live_refs(entry):
+                LOGGER.debug(
+                    "Cached sandbox %s was modified and is in use", key
+                )
+                return None
+            LOGGER.debug("Discarding modified sandbox %s", key)
+            self._remove(entry)
+
+        if not (entry / _META_FILE).exists():
+            self._build(entry, requirements, python, build)
+
+        ref = self._add_ref(entry)
+        # Mark as recently used
+        os.utime(entry / _META_FILE)
+        self.evict(keep=entry)
+        return SandboxEnvironment(
+            path=entry,
+            venv_python=str(venv_python_path(entry / _VENV_DIR)),
+            _ref=ref,
+        )
+
+    def _build(
+        self,
+        entry: Path,
+        requirements: list[str],
+        python: str,
+        build: Callable[[Path], None],
+    ) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".build-{uuid.uuid4().hex}"
+        staging.mkdir()
+        try:
+            venv_path = staging / _VENV_DIR
+            build(venv_path)
+            (staging / _REFS_DIR).mkdir()
+            (staging / _META_FILE).write_text(
+                json.dumps(
+                    {
+                        "requirements": normalize_requirements(requirements),
+                        "python": python,
+                        "created": time.time(),
+                        "packages": _packages_fingerprint(venv_path),
+                    }
+                ),
+                encoding="utf-8",
+            )
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another process built the same environment first
+                if not (entry / _META_FILE).exists():
+                    raise
+                LOGGER.debug("Using sandbox built concurrently: %s", entry)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _is_modified(self, entry: Path) -> bool:
+        if (entry / _MODIFIED_FILE).exists():
+            return True
+        try:
+            meta = json.loads((entry / _META_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Incomplete or corrupt; treat it as not usable
+            return True
+        expected = meta.get("packages")
+        return (
+            expected is not None
+            and _packages_fingerprint(entry / _VENV_DIR) != expected
+        )
+
+    def _add_ref(self, entry: Path) -> Path:
+        refs = entry / _REFS_DIR
+        refs.mkdir(exist_ok=True)
+        ref = refs / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        ref.touch()
+        return ref
+
+    def _live_refs(self, entry: Path) -> int:
+        live = 0
+        try:
+            refs = list((entry / _REFS_DIR).iterdir())
+        except OSError:
+            return 0
+        for ref in refs:
+            pid = ref.name.split("-", 1)[0]
+            if pid.isdigit() and _pid_exists(int(pid)):
+                live += 1
+            else:
+                # Left behind by a process that didn't exit cleanly
+                ref.unlink(missing_ok=True)
+        return live
+
+    def _remove(self, entry: Path) -> None:
+        # Move out of the way first so no new kernel picks it up
+        trash = self.root / f".trash-{uuid.uuid4().hex}"
+        try:
+            os.rename(entry, trash)
+        except OSError:
+            return
+        shutil.rmtree(trash, ignore_errors=True)
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Remove unreferenced environments, least recently used first."""
+        if not self.root.is_dir():
+            return
+
+        now = time.time()
+        entries: list[tuple[float, Path]] = []
+        for path in self.root.iterdir():
+            if path.name.startswith("."):
+                try:
+                    stale = now - path.stat().st_mtime > STALE_BUILD_SECONDS
+                except OSError:
+                    continue
+                if stale:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            try:
+                last_used = (path / _META_FILE).stat().st_mtime
+            except OSError:
+                last_used = 0.0
+            entries.append((last_used, path))
+
+        entries.sort(reverse=True)
+        for index, (last_used, path) in enumerate(entries):
+            if path == keep:
+                continue
+            over_limit = index >= self.max_environments
+            unused = now - last_used > self.max_unused_seconds
+            if (over_limit or unused) and not self._live_refs(path):
+                LOGGER.debug("Evicting sandbox environment %s", path.name)
+                self._remove(path)
@@ -555,7 +555,9 @@ class ExperimentalConfig(TypedDict, total=False):
 
     # Internal features
     cache: CacheConfig
+    cache_cells: bool
     execution_type: ExecutionType
+    mpl_virtual_files: bool
 
 
 # Prefer to accept any dict since feature flags can change frequently
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
+from typing import Literal
 
 
 @dataclass
@@ -13,6 +14,7 @@ class GlobalSettings:
     YES: bool = False
     CHECK_STATUS_UPDATE: bool = False
     TRACING: bool = os.getenv("MARIMO_TRACING", "false") in ("true", "1")
+    METRICS: bool = os.getenv("MARIMO_METRICS", "false") in ("true", "1")
     PROFILE_DIR: str | None = None
     LOG_LEVEL: int = logging.WARNING
     MANAGE_SCRIPT_METADATA: bool = os.getenv(
@@ -21,6 +23,13 @@ class GlobalSettings:
     IN_SECURE_ENVIRONMENT: bool = os.getenv(
         "MARIMO_IN_SECURE_ENVIRONMENT", "false"
     ) in ("true", "1")
+    COMPILE_CACHE: bool = os.getenv("MARIMO_COMPILE_CACHE", "true") in (
+        "true",
+        "1",
+    )
+    IPC_TRANSPORT: Literal["tcp", "ipc"] = (
+        "ipc" if os.getenv("MARIMO_IPC_TRANSPORT") == "ipc" else "tcp"
+    )
 
 
 GLOBAL_SETTINGS = GlobalSettings()
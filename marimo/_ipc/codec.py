@@ -0,0 +1,101 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Wire format for messages sent over ZeroMQ sockets.
+
+Each message starts with a byte for its kind:
+
+- `RAW`: bytes, sent as is. Kernel messages are notifications that are
+  already serialized, so they cross the socket without being re-encoded
+  into a pickle.
+- `MSGPACK`: commands (msgspec structs), on channels that carry a single
+  command type, encoded with msgspec and decoded as that type.
+- `PICKLE`: anything else, including commands that msgpack wouldn't round
+  trip exactly. A command's untyped fields (such as a request's `meta` and
+  `user`, set by auth middleware) can hold values msgspec can't encode, or
+  values it encodes as something else: tuples decode as lists, and
+  dataclasses as dicts.
+
+Small messages are sent as a single frame, the kind followed by the
+payload. Large payloads are sent in a second frame of a multipart message,
+which ZeroMQ sends without copying; the first frame then holds the kind in
+upper case.
+"""
+
+from __future__ import annotations
+
+import pickle
+import typing
+
+import msgspec.msgpack
+
+if typing.TYPE_CHECKING:
+    import zmq
+
+T = typing.TypeVar("T")
+
+RAW = b"r"
+MSGPACK = b"m"
+PICKLE = b"p"
+
+# Payloads from this size on are sent without copying. Below it, copying is
+# cheaper than the bookkeeping of a zero-copy frame (this is also pyzmq's
+# default `copy_threshold`).
+ZERO_COPY_THRESHOLD = 65536
+
+
+class Codec(typing.Generic[T]):
+    """Sends and receives the messages of a channel."""
+
+    def __init__(self, message_type: typing.Any = None) -> None:
+        """
+        Args:
+            message_type: The type of the channel's messages, if they are
+                msgspec structs
+        """
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder: msgspec.msgpack.Decoder[T] | None = (
+            msgspec.msgpack.Decoder(message_type)
+            if message_type is not None
+            else None
+        )
+
+    def encode(self, obj: T) -> tuple[bytes, bytes]:
+        """Encode a message as its kind and payload."""
+        if isinstance(obj, bytes):
+            return RAW, obj
+        if self._decoder is not None:
+            try:
+                payload = self._encoder.encode(obj)
+                # Commands are small, so checking the round trip is cheap
+                if self._decoder.decode(payload) == obj:
+                    return MSGPACK, payload
+            except (TypeError, msgspec.DecodeError):
+                pass
+        return PICKLE, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, kind: bytes, payload: bytes) -> T:
+        if kind == RAW:
+            return typing.cast(T, payload)
+        if kind == MSGPACK and self._decoder is not None:
+            return self._decoder.decode(payload)
+        if kind == PICKLE:
+            return typing.cast(T, pickle.loads(payload))
+        raise ValueError(f"Unknown message kind: {kind!r}")
+
+    def send(self, socket: zmq.Socket[bytes], obj: T) -> None:
+        import zmq
+
+        kind, payload = self.encode(obj)
+        if len(payload) < ZERO_COPY_THRESHOLD:
+            socket.send(kind + payload)
+        else:
+            socket.send(kind.upper(), zmq.SNDMORE)
+            socket.send(payload, copy=False)
+
+    def recv(self, socket: zmq.Socket[bytes], flags: int = 0) -> T:
+        """Receive a message; raises `zmq.Again` if none is ready."""
+        data = socket.recv(flags)
+        kind = data[:1]
+        if kind.isupper():
+            # The parts of a multipart message arrive together
+            return self.decode(kind.lower(), socket.recv())
+        return self.decode(kind, data[1:])
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import queue
+import shutil
 import sys
+import tempfile
 import typing
 
 from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._ipc.codec import Codec
 from marimo._ipc.queue_proxy import PushQueue, start_receiver_thread
-from marimo._ipc.types import ConnectionInfo
+from marimo._ipc.types import ADDR, ConnectionInfo
+from marimo._runtime import commands
 from marimo._session.queue import QueueType
 
 if typing.TYPE_CHECKING:
@@ -24,7 +30,8 @@ if typing.TYPE_CHECKING:
     )
 
 LOGGER = _loggers.marimo_logger()
-ADDR = "tcp://127.0.0.1"
+
+Transport = typing.Literal["tcp", "ipc"]
 
 T = typing.TypeVar("T")
 
@@ -41,10 +48,15 @@ class Channel(typing.Generic[T]):
     kind: typing.Literal["push", "pull"]
     socket: zmq.Socket[bytes]
     queue: QueueType[T]
+    codec: Codec[T] = dataclasses.field(default_factory=Codec)
 
     @classmethod
     def Push(
-        cls, context: zmq.Context[zmq.Socket[bytes]], *, maxsize: int = 0
+        cls,
+        context: zmq.Context[zmq.Socket[bytes]],
+        *,
+        maxsize: int = 0,
+        codec: Codec[T] | None = None,
     ) -> Channel[T]:
         """Create a push (send-only) channel.
 
@@ -52,22 +64,30 @@ class Channel(typing.Generic[T]):
         """
         import zmq
 
+        codec = codec or Codec()
         socket = context.socket(zmq.PUSH)
         return cls(
             kind="push",
             socket=socket,
-            queue=PushQueue(socket, maxsize=maxsize),
+            queue=PushQueue(socket, maxsize=maxsize, codec=codec),
+            codec=codec,
         )
 
     @classmethod
     def Pull(
-        cls, context: zmq.Context[zmq.Socket[bytes]], *, maxsize: int = 0
+        cls,
+        context: zmq.Context[zmq.Socket[bytes]],
+        *,
+        maxsize: int = 0,
+        codec: Codec[T] | None = None,
     ) -> Channel[T]:
         """Create a pull (receive-only) channel.
 
         Args:
             context: ZeroMQ context for creating sockets
             maxsize: Maximum queue size (0 = unlimited)
+            codec: Decodes received messages; commands must be decoded as
+                their type
         """
         import zmq
 
@@ -76,6 +96,7 @@ class Channel(typing.Generic[T]):
             kind="pull",
             socket=socket,
             queue=queue.Queue(maxsize=maxsize),
+            codec=codec or Codec(),
         )
 
 
@@ -93,58 +114,94 @@ class Connection:
     input: Channel[str]
     stream: Channel[KernelMessage]
 
+    # Directory of the Unix domain sockets, removed on close
+    ipc_dir: str | None = None
+
     def __post_init__(self) -> None:
         """Start receiver threads for all pull channels."""
-        receivers: dict[zmq.Socket[bytes], QueueType[typing.Any]] = {}
-        if self.control.kind == "pull":
-            receivers[self.control.socket] = self.control.queue
-        if self.ui_element.kind == "pull":
-            receivers[self.ui_element.socket] = self.ui_element.queue
-        if self.completion.kind == "pull":
-            receivers[self.completion.socket] = self.completion.queue
-        if self.win32_interrupt and self.win32_interrupt.kind == "pull":
-            receivers[self.win32_interrupt.socket] = self.win32_interrupt.queue
-        if self.input.kind == "pull":
-            receivers[self.input.socket] = self.input.queue
-        if self.stream.kind == "pull":
-            receivers[self.stream.socket] = self.stream.queue
+        channels: list[Channel[typing.Any]] = [
+            self.control,
+            self.ui_element,
+            self.completion,
+            self.input,
+            self.stream,
+        ]
+        if self.win32_interrupt:
+            channels.append(self.win32_interrupt)
+        receivers = {
+            channel.socket: (channel.queue, channel.codec)
+            for channel in channels
+            if channel.kind == "pull"
+        }
 
         self._stop_event, self._receiver_thread = start_receiver_thread(
             receivers
         )
 
     @classmethod
-    def create(cls) -> tuple[Connection, ConnectionInfo]:
-        """Create host-side connection with all sockets bound to random ports.
+    def create(
+        cls, transport: Transport | None = None
+    ) -> tuple[Connection, ConnectionInfo]:
+        """Create host-side connection with all sockets bound.
+
+        Args:
+            transport: "tcp" binds the sockets to random ports on localhost;
+                "ipc" binds them to Unix domain sockets in a new temporary
+                directory, which skips the TCP stack. Defaults to the
+                `MARIMO_IPC_TRANSPORT` environment variable, or "tcp".
 
         Returns:
             Tuple of (Connection instance, ConnectionInfo with port numbers)
         """
         import zmq
 
+        transport = transport or GLOBAL_SETTINGS.IPC_TRANSPORT
+        if transport == "ipc" and sys.platform == "win32":
+            LOGGER.warning("The ipc transport is not supported on Windows")
+            transport = "tcp"
+
         context = zmq.Context()
         conn = cls(
             context=context,
-            control=Channel.Push(context),
-            ui_element=Channel.Push(context),
-            completion=Channel.Push(context),
+            control=Channel.Push(context, codec=_COMMAND_CODEC),
+            ui_element=Channel.Push(context, codec=_UI_ELEMENT_CODEC),
+            completion=Channel.Push(context, codec=_COMPLETION_CODEC),
             win32_interrupt=(
                 Channel.Push(context) if sys.platform == "win32" else None
             ),
             input=Channel.Push(context, maxsize=1),
             stream=Channel.Pull(context),
+            ipc_dir=(
+                tempfile.mkdtemp(prefix="marimo-ipc-")
+                if transport == "ipc"
+                else None
+            ),
         )
+
+        if conn.ipc_dir is None:
+
+            def bind(channel: Channel[typing.Any]) -> int:
+                return channel.socket.bind_to_random_port(ADDR)
+
+        else:
+            # With Unix domain sockets, "ports" just number the sockets
+            ports = itertools.count(1)
+
+            def bind(channel: Channel[typing.Any]) -> int:
+                port = next(ports)
+                channel.socket.bind(f"ipc://{conn.ipc_dir}/{port}")
+                return port
+
         info = ConnectionInfo(
-            control=conn.control.socket.bind_to_random_port(ADDR),
-            ui_element=conn.ui_element.socket.bind_to_random_port(ADDR),
-            completion=conn.completion.socket.bind_to_random_port(ADDR),
-            input=conn.input.socket.bind_to_random_port(ADDR),
-            stream=conn.stream.socket.bind_to_random_port(ADDR),
-            win32_interrupt=conn.win32_interrupt.socket.bind_to_random_port(
-                ADDR
-            )
+            control=bind(conn.control),
+            ui_element=bind(conn.ui_element),
+            completion=bind(conn.completion),
+            input=bind(conn.input),
+            stream=bind(conn.stream),
+            win32_interrupt=bind(conn.win32_interrupt)
             if conn.win32_interrupt
             else None,
+            ipc_dir=conn.ipc_dir,
         )
         return conn, info
 
@@ -164,9 +221,9 @@ class Connection:
 
         conn = cls(
             context=context,
-            control=Channel.Pull(context),
-            ui_element=Channel.Pull(context),
-            completion=Channel.Pull(context),
+            control=Channel.Pull(context, codec=_COMMAND_CODEC),
+            ui_element=Channel.Pull(context, codec=_UI_ELEMENT_CODEC),
+            completion=Channel.Pull(context, codec=_COMPLETION_CODEC),
             win32_interrupt=Channel.Pull(context)
             if connection_info.win32_interrupt
             else None,
@@ -175,24 +232,45 @@ class Connection:
         )
 
         # Attach to existing ports
-        conn.control.socket.connect(f"{ADDR}:{connection_info.control}")
-        conn.ui_element.socket.connect(f"{ADDR}:{connection_info.ui_element}")
-        conn.completion.socket.connect(f"{ADDR}:{connection_info.completion}")
-        if conn.win32_interrupt:
+        address = connection_info.address
+        conn.control.socket.connect(address(connection_info.control))
+        conn.ui_element.socket.connect(address(connection_info.ui_element))
+        conn.completion.socket.connect(address(connection_info.completion))
+        if (
+            conn.win32_interrupt
+            and connection_info.win32_interrupt is not None
+        ):
             conn.win32_interrupt.socket.connect(
-                f"{ADDR}:{connection_info.win32_interrupt}"
+                address(connection_info.win32_interrupt)
             )
-        conn.input.socket.connect(f"{ADDR}:{connection_info.input}")
-        conn.stream.socket.connect(f"{ADDR}:{connection_info.stream}")
+        conn.input.socket.connect(address(connection_info.input))
+        conn.stream.socket.connect(address(connection_info.stream))
 
         return conn
 
-    def close(self) -> None:
-        """Close all sockets and cleanup resources."""
+    def close(self, linger: int | None = None) -> None:
+        """Close all sockets and cleanup resources.
+
+        Args:
+            linger: Milliseconds to wait for unsent messages to be
+                delivered; None waits indefinitely.
+        """
         # Stop receiver thread
         self._stop_event.set()
         if self._receiver_thread.is_alive():
             self._receiver_thread.join(timeout=1)
 
         # Close all associated sockets (and finally terminate)
-        self.context.destroy()
+        self.context.destroy(linger=linger)
+        if self.ipc_dir is not None:
+            shutil.rmtree(self.ipc_dir, ignore_errors=True)
+
+
+# Commands are msgspec structs, so they must be decoded as their type
+_COMMAND_CODEC: Codec[CommandMessage] = Codec(commands.CommandMessage)
+_UI_ELEMENT_CODEC: Codec[UpdateUIElementCommand] = Codec(
+    commands.UpdateUIElementCommand
+)
+_COMPLETION_CODEC: Codec[CodeCompletionCommand] = Codec(
+    commands.CodeCompletionCommand
+)
@@ -0,0 +1,133 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Entry point for a worker process that hosts run-mode kernels.
+
+The server starts a pool of these processes so that app viewers' kernels
+don't all share the server's GIL. Each kernel runs in a thread of the
+worker, as it would in the server, and talks to the server over ZeroMQ
+queues.
+
+Protocol: once started, the worker writes `KERNEL_HOST_READY` to stdout.
+Each line then read from stdin is the JSON-encoded `KernelArgs` of a
+kernel to start. The worker exits when stdin is closed.
+
+    python -m marimo._ipc.kernel_host [--memory-limit-mb N] [--cpus 0,1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+from typing import Optional
+
+from marimo import _loggers
+from marimo._ipc.queue_manager import QueueManager
+from marimo._ipc.types import KernelArgs
+
+LOGGER = _loggers.marimo_logger()
+
+READY = "KERNEL_HOST_READY"
+
+
+def apply_limits(
+    memory_limit_mb: Optional[int], cpus: Optional[list[int]]
+) -> None:
+    """Limit the memory and CPUs available to this process.
+
+    The memory limit caps the virtual address space (`RLIMIT_AS`) of the
+    whole process, so it is shared by all of its kernels; allocations
+    beyond it fail with a MemoryError in whichever kernel makes them.
+    """
+    if memory_limit_mb is not None:
+        try:
+            import resource
+
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            LOGGER.warning("Could not limit kernel memory: %s", e)
+
+    if cpus:
+        import psutil
+
+        try:
+            psutil.Process().cpu_affinity(cpus)
+        except (AttributeError, ValueError, psutil.Error) as e:
+            # cpu_affinity is not available on macOS
+            LOGGER.warning("Could not pin kernel process to CPUs: %s", e)
+
+
+def run_kernel(args: KernelArgs) -> None:
+    from marimo._runtime import runtime
+
+    queue_manager = QueueManager.connect(args.connection_info)
+    try:
+        # Same configuration as a run-mode kernel thread in the server
+        runtime.launch_kernel(
+            control_queue=queue_manager.control_queue,
+            set_ui_element_queue=queue_manager.set_ui_element_queue,
+            completion_queue=queue_manager.completion_queue,
+            input_queue=queue_manager.input_queue,
+            stream_queue=queue_manager.stream_queue,
+            socket_addr=None,
+            is_edit_mode=False,
+            configs=args.configs,
+            app_metadata=args.app_metadata,
+            user_config=args.user_config,
+            # The server can't serve files created in this process
+            virtual_files_supported=False,
+            redirect_console_to_browser=args.redirect_console_to_browser,
+            interrupt_queue=None,
+            profile_path=None,
+            log_level=args.log_level,
+        )
+    finally:
+        # The server has closed its end; don't wait to deliver the
+        # kernel's last messages.
+        queue_manager.close_queues(linger=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--memory-limit-mb", type=int, default=None)
+    parser.add_argument("--cpus", type=str, default=None)
+    options = parser.parse_args()
+
+    apply_limits(
+        options.memory_limit_mb,
+        [int(cpu) for cpu in options.cpus.split(",")]
+        if options.cpus
+        else None,
+    )
+
+    sys.stdout.write(f"{READY}\n")
+    sys.stdout.flush()
+    # Nothing else is read from stdout; send kernels' output to stderr
+    # so that a full pipe can't block them.
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    formatters_registered = False
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        args = KernelArgs.decode_json(line)
+        if not formatters_registered:
+            from marimo._output.formatters.formatters import (
+                register_formatters,
+            )
+
+            register_formatters(theme=args.user_config["display"]["theme"])
+            formatters_registered = True
+
+        # Daemon threads, so that the process exits with the server
+        threading.Thread(
+            target=run_kernel,
+            args=(args,),
+            name="marimo-kernel",
+            daemon=True,
+        ).start()
+
+
+if __name__ == "__main__":
+    main()
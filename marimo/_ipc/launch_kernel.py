@@ -10,6 +10,20 @@ from marimo._ipc.types import KernelArgs
 from marimo._runtime import runtime
 
 
+def _preload() -> None:
+    """Import what the kernel would otherwise import once started.
+
+    This runs before the kernel's arguments are read, so that a process
+    started ahead of time (see `KernelProcessPool`) has already done it by
+    the time it's given a kernel.
+    """
+    import zmq  # noqa: F401
+
+    import marimo._output.formatters.formatters  # noqa: F401
+    import marimo._runtime.complete  # noqa: F401
+    import marimo._save.stores  # noqa: F401
+
+
 def main() -> None:
     """Launch a marimo kernel using ZeroMQ for IPC.
 
@@ -25,6 +39,7 @@ def main() -> None:
     used by external consumers (e.g., marimo-lsp). Changing this path is a
     BREAKING CHANGE and should be done with care and proper deprecation.
     """
+    _preload()
     args = KernelArgs.decode_json(sys.stdin.buffer.read())
     queue_manager = QueueManager.connect(args.connection_info)
 
@@ -42,9 +57,12 @@ def main() -> None:
         user_config=args.user_config,
         configs=args.configs,
         profile_path=args.profile_path,
-        # Virtual files require a web server to serve file URLs. Since we're
-        # not running one, content must be embedded as data URLs instead.
-        virtual_files_supported=False,
+        # Virtual files require a web server to serve file URLs. Unless the
+        # host reads them from shared memory (as marimo's server does),
+        # content must be embedded as data URLs instead.
+        virtual_files_supported=(
+            args.virtual_files_supported and args.shared_virtual_files
+        ),
         # NB: Unique parameter combination required for ZeroMQ. The `stream_queue`
         # and `socket_addr` are mutually exclusive. Normally RUN mode doesn't
         # redirect console, while EDIT mode does. Our ZeroMQ proxy needs both
@@ -10,6 +10,7 @@ from marimo._ipc.connection import Connection
 from marimo._ipc.types import ConnectionInfo
 
 if typing.TYPE_CHECKING:
+    from marimo._ipc.connection import Transport
     from marimo._messaging.types import KernelMessage
     from marimo._runtime.commands import (
         CodeCompletionCommand,
@@ -71,20 +72,30 @@ class QueueManager:
         """Queue for kernel output messages."""
         return self.conn.stream.queue
 
-    def close_queues(self) -> None:
-        """Close all queues and cleanup resources."""
-        self.conn.close()
+    def close_queues(self, linger: typing.Optional[int] = None) -> None:
+        """Close all queues and cleanup resources.
+
+        Args:
+            linger: Milliseconds to wait for unsent messages to be
+                delivered; None waits indefinitely.
+        """
+        self.conn.close(linger=linger)
 
     @classmethod
     def create(
         cls,
+        transport: Transport | None = None,
     ) -> tuple[QueueManager, ConnectionInfo]:
         """Create host-side queue manager with all sockets bound.
 
+        Args:
+            transport: "tcp" or "ipc" (Unix domain sockets); see
+                `Connection.create`
+
         Returns:
             Tuple of (QueueManager instance, ConnectionInfo for kernel)
         """
-        conn, info = Connection.create()
+        conn, info = Connection.create(transport)
         return cls(conn=conn), info
 
     @classmethod
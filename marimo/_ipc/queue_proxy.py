@@ -3,17 +3,21 @@
 
 from __future__ import annotations
 
-import pickle
 import threading
 import typing
 
 from marimo import _loggers
+from marimo._ipc.codec import Codec
 from marimo._session.queue import QueueType
 
 LOGGER = _loggers.marimo_logger()
 
 T = typing.TypeVar("T")
 
+# Maximum number of messages read from one socket before polling again, so
+# that a busy socket (e.g., a kernel streaming outputs) can't starve others
+MAX_BATCH_SIZE = 256
+
 if typing.TYPE_CHECKING:
     import zmq
 
@@ -29,9 +33,11 @@ class PushQueue(QueueType[T]):
         socket: zmq.Socket[bytes],
         *,
         maxsize: int = 0,
+        codec: Codec[T] | None = None,
     ) -> None:
         self.socket = socket
         self.maxsize = maxsize
+        self.codec: Codec[T] = codec or Codec()
 
     def put(
         self,
@@ -40,7 +46,7 @@ class PushQueue(QueueType[T]):
         timeout: float | None = None,  # noqa: ARG002
     ) -> None:
         """Put an item into the queue."""
-        self.socket.send(pickle.dumps(obj))
+        self.codec.send(self.socket, obj)
 
     def put_nowait(self, obj: T) -> None:
         """Put an item into the queue without blocking."""
@@ -63,13 +69,22 @@ class PushQueue(QueueType[T]):
 
 
 def start_receiver_thread(
-    receivers: dict[zmq.Socket[bytes], QueueType[typing.Any]],
+    receivers: dict[
+        zmq.Socket[bytes], tuple[QueueType[typing.Any], Codec[typing.Any]]
+    ],
 ) -> tuple[threading.Event, threading.Thread]:
-    """Start receiver thread."""
+    """Start receiver thread.
+
+    Args:
+        receivers: The queue each socket's messages are put in, and the
+            codec to decode them with
+    """
     import zmq
 
     def receive_loop(
-        receivers: dict[zmq.Socket[bytes], QueueType[typing.Any]],
+        receivers: dict[
+            zmq.Socket[bytes], tuple[QueueType[typing.Any], Codec[typing.Any]]
+        ],
         stop_event: threading.Event,
     ) -> None:
         """Receive messages from sockets and put them in queues using polling."""
@@ -82,12 +97,16 @@ def start_receiver_thread(
                 # Poll with 100ms timeout
                 socks = dict(poller.poll(100))
                 for socket, event in socks.items():
-                    if event & zmq.POLLIN:
-                        msg = socket.recv(flags=zmq.NOBLOCK)
-                        obj = pickle.loads(msg)
-                        receivers[socket].put(obj)
-            except zmq.Again:
-                continue
+                    if not event & zmq.POLLIN:
+                        continue
+                    queue, codec = receivers[socket]
+                    # Drain what's ready instead of polling once per message
+                    for _ in range(MAX_BATCH_SIZE):
+                        try:
+                            obj = codec.recv(socket, flags=zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        queue.put(obj)
             except zmq.ZMQError as e:
                 LOGGER.debug(f"ZeroMQ socket error in receiver thread: {e}")
                 break
@@ -12,6 +12,8 @@ from marimo._messaging.msgspec_encoder import encode_json_bytes
 from marimo._runtime.commands import AppMetadata
 from marimo._types.ids import CellId_t
 
+ADDR = "tcp://127.0.0.1"
+
 
 class ConnectionInfo(msgspec.Struct):
     """ZeroMQ socket connection info."""
@@ -24,6 +26,16 @@ class ConnectionInfo(msgspec.Struct):
     input: int
     stream: int
 
+    # Set when the host bound Unix domain sockets (the "ipc" transport)
+    # instead of TCP ports; the ports above then number the sockets in it.
+    ipc_dir: typing.Union[str, None] = None
+
+    def address(self, port: int) -> str:
+        """The address of the socket with the given port."""
+        if self.ipc_dir is not None:
+            return f"ipc://{self.ipc_dir}/{port}"
+        return f"{ADDR}:{port}"
+
 
 class KernelArgs(msgspec.Struct):
     """Args to send to the kernel."""
@@ -37,6 +49,9 @@ class KernelArgs(msgspec.Struct):
     # Runtime behavior flags
     virtual_files_supported: bool = True
     redirect_console_to_browser: bool = True
+    # Whether the host reads virtual files from the kernel's shared memory,
+    # as marimo's server does; otherwise they're embedded as data URLs
+    shared_virtual_files: bool = False
 
     def encode_json(self) -> bytes:
         return encode_json_bytes(self)
@@ -28,6 +28,8 @@ def run_check(
     unsafe_fixes: bool = False,
     ignore_scripts: bool = False,
     formatter: str = "full",
+    jobs: int = 1,
+    cache: bool = False,
 ) -> Linter:
     """Run linting checks on files matching patterns (CLI entry point).
 
@@ -41,6 +43,9 @@ def run_check(
         unsafe_fixes: Whether to enable unsafe fixes that may change behavior
         ignore_scripts: Whether to ignore files not recognizable as marimo notebooks
         formatter: Output format for diagnostics ("full" or "json")
+        jobs: Number of worker processes to lint with (0 for one per CPU)
+        cache: Whether to reuse results for files that haven't changed
+            since the last run (ignored when fixing)
 
     Returns:
         Linter with per-file status and diagnostics
@@ -54,8 +59,18 @@ def run_check(
         unsafe_fixes=unsafe_fixes,
         ignore_scripts=ignore_scripts,
         formatter=formatter,
+        jobs=jobs,
     )
+    if cache and not fix:
+        from marimo._lint.cache import LintCache
+
+        linter.cache = LintCache(
+            [rule.code for rule in linter.rule_engine.rules],
+            ignore_scripts=ignore_scripts,
+        )
     linter.run_streaming(files_to_check)
+    if linter.cache is not None:
+        linter.cache.prune()
     return linter
 
 
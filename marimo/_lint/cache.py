@@ -0,0 +1,155 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Persistent cache of lint results.
+
+Results are keyed on the file's path and contents, the marimo version and
+the set of enabled rules, so unchanged notebooks can be skipped across
+`marimo check` invocations. Each entry is stored in its own small JSON
+file, which keeps concurrent writers (e.g. worker processes) from
+contending on a single index. Entries that haven't been used for a month
+are evicted, as are the least recently used ones once the cache outgrows
+its size budget.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Optional
+
+from marimo import _loggers
+from marimo._lint.diagnostic import Diagnostic, Severity
+from marimo._utils.cache_eviction import (
+    DAY_SECONDS,
+    prune_cache_dir,
+    touch_entry,
+)
+from marimo._utils.xdg import marimo_cache_dir
+from marimo._version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from marimo._lint.linter import FileStatus
+
+LOGGER = _loggers.marimo_logger()
+
+# Bump when the on-disk entry format changes.
+_CACHE_FORMAT_VERSION = 1
+
+# Entries unused for longer than this are evicted
+_MAX_AGE = 30 * DAY_SECONDS
+# Least recently used entries are evicted beyond this many bytes
+_MAX_SIZE = 64 * 1024 * 1024
+
+
+def default_lint_cache_dir() -> Path:
+    return marimo_cache_dir() / "lint"
+
+
+class LintCache:
+    """On-disk cache mapping notebook contents to lint results."""
+
+    def __init__(
+        self,
+        rule_codes: Sequence[str],
+        *,
+        ignore_scripts: bool = False,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self.cache_dir = cache_dir or default_lint_cache_dir()
+        # Everything other than the file itself that affects the result
+        self._salt = json.dumps(
+            [
+                _CACHE_FORMAT_VERSION,
+                __version__,
+                sorted(rule_codes),
+                ignore_scripts,
+            ]
+        ).encode("utf-8")
+
+    def key(self, file: Path) -> Optional[str]:
+        """Compute the cache key for a file, or None if it can't be read."""
+        try:
+            contents = file.read_bytes()
+        except OSError:
+            return None
+        h = hashlib.sha256(self._salt)
+        h.update(str(file).encode("utf-8"))
+        h.update(b"\0")
+        h.update(contents)
+        return h.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, file: Path) -> Optional[FileStatus]:
+        from marimo._lint.linter import FileStatus
+
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text("utf-8"))
+            status = FileStatus(
+                file=str(file),
+                diagnostics=[
+                    _diagnostic_from_dict(d) for d in entry["diagnostics"]
+                ],
+                skipped=entry["skipped"],
+                failed=entry["failed"],
+                message=entry["message"],
+                details=entry["details"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            LOGGER.debug("Ignoring corrupt lint cache entry %s: %s", key, e)
+            return None
+        touch_entry(path)
+        return status
+
+    def put(self, key: str, status: FileStatus) -> None:
+        entry = {
+            "diagnostics": [
+                _diagnostic_to_dict(d) for d in status.diagnostics
+            ],
+            "skipped": status.skipped,
+            "failed": status.failed,
+            "message": status.message,
+            "details": status.details,
+        }
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            LOGGER.debug("Failed to write lint cache entry %s: %s", key, e)
+
+    def prune(self) -> int:
+        """Evict unused entries; returns the number removed."""
+        return prune_cache_dir(
+            self.cache_dir, max_age=_MAX_AGE, max_size=_MAX_SIZE
+        )
+
+
+def _diagnostic_to_dict(diagnostic: Diagnostic) -> dict[str, Any]:
+    data = dataclasses.asdict(diagnostic)
+    if diagnostic.severity is not None:
+        data["severity"] = diagnostic.severity.value
+    return data
+
+
+def _diagnostic_from_dict(data: dict[str, Any]) -> Diagnostic:
+    severity = data.get("severity")
+    return Diagnostic(
+        **{
+            **data,
+            "severity": Severity(severity) if severity is not None else None,
+        }
+    )
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import re
+from collections import deque
 from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
@@ -22,6 +25,7 @@ from marimo._utils import async_path
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable, Iterator
 
+    from marimo._lint.cache import LintCache
     from marimo._lint.rules.base import LintRule
 
 
@@ -88,6 +92,8 @@ class Linter:
         rules: list[LintRule] | None = None,
         ignore_scripts: bool = False,
         formatter: str = "full",
+        jobs: int = 1,
+        cache: LintCache | None = None,
     ):
         if rules is not None:
             self.rule_engine = RuleEngine(rules, early_stopping)
@@ -98,6 +104,10 @@ class Linter:
         self.unsafe_fixes = unsafe_fixes
         self.ignore_scripts = ignore_scripts
         self.formatter = formatter
+        # Number of worker processes; 0 means one per CPU
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        # Cached results carry no notebook, so they can't be fixed
+        self.cache = None if fix_files else cache
         self.files: list[FileStatus] = []
 
         # Create rule lookup for unsafe fixes
@@ -110,6 +120,22 @@ class Linter:
         self.fixed_count: int = 0
         self.issues_count: int = 0
 
+    async def _process_file(self, file: Path) -> FileStatus:
+        """Process a file, consulting the result cache if there is one."""
+        if self.cache is None:
+            return await self._process_single_file(file)
+
+        key = self.cache.key(file)
+        if key is not None:
+            cached = self.cache.get(key, file)
+            if cached is not None:
+                return cached
+
+        file_status = await self._process_single_file(file)
+        if key is not None:
+            self.cache.put(key, file_status)
+        return file_status
+
     async def _process_single_file(self, file: Path) -> FileStatus:
         """Process a single file and return its status."""
         file_path = str(file)
@@ -291,9 +317,12 @@ class Linter:
         # Process files as they complete
         fixed_count = 0
 
-        # Convert to async iterator and process
-        async for file_path in _to_async_iterator(files_to_check):
-            file_status = await self._process_single_file(file_path)
+        if self.jobs > 1:
+            statuses = self._process_files_in_pool(files_to_check)
+        else:
+            statuses = self._process_files(files_to_check)
+
+        async for file_status in statuses:
             self.files.append(file_status)
 
             # Stream output via pipe if available
@@ -312,6 +341,46 @@ class Linter:
 
         self.fixed_count = fixed_count
 
+    async def _process_files(
+        self, files_to_check: Union[AsyncIterator[Path], Iterator[Path]]
+    ) -> AsyncIterator[FileStatus]:
+        """Process files one at a time, in order."""
+        async for file_path in _to_async_iterator(files_to_check):
+            yield await self._process_file(file_path)
+
+    async def _process_files_in_pool(
+        self, files_to_check: Union[AsyncIterator[Path], Iterator[Path]]
+    ) -> AsyncIterator[FileStatus]:
+        """Process files on a pool of worker processes.
+
+        Parsing and rule evaluation are CPU-bound, so this scales with the
+        number of workers. Results are yielded in input order, and only a
+        bounded number of files are in flight at a time.
+        """
+        loop = asyncio.get_running_loop()
+        max_in_flight = self.jobs * 4
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(
+                self.rule_engine.rules,
+                self.rule_engine.early_stopping,
+                self.ignore_scripts,
+                self.cache,
+            ),
+        ) as pool:
+            pending: deque[asyncio.Future[FileStatus]] = deque()
+            async for file_path in _to_async_iterator(files_to_check):
+                pending.append(
+                    loop.run_in_executor(
+                        pool, _process_file_in_worker, file_path
+                    )
+                )
+                if len(pending) >= max_in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+
     async def fix(self, file_status: FileStatus) -> bool:
         """Fix a single file and write to disk.
 
@@ -409,3 +478,27 @@ class Linter:
                 "errored": self.errored,
             },
         )
+
+
+# Per-process linter used by worker processes; see Linter._process_files_in_pool
+_WORKER_LINTER: Linter | None = None
+
+
+def _init_worker(
+    rules: list[LintRule],
+    early_stopping: EarlyStoppingConfig,
+    ignore_scripts: bool,
+    cache: LintCache | None,
+) -> None:
+    global _WORKER_LINTER
+    _WORKER_LINTER = Linter(
+        early_stopping=early_stopping,
+        rules=rules,
+        ignore_scripts=ignore_scripts,
+        cache=cache,
+    )
+
+
+def _process_file_in_worker(file: Path) -> FileStatus:
+    assert _WORKER_LINTER is not None
+    return asyncio.run(_WORKER_LINTER._process_file(file))
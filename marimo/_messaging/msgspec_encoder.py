@@ -1,5 +1,10 @@
 # Copyright 2026 Marimo. All rights reserved.
-"""Msgspec encoder with custom type support for marimo."""
+"""Msgspec encoder with custom type support for marimo.
+
+msgspec calls `enc_hook` for every object it can't encode natively. How an
+object is converted only depends on its type, so the conversion is looked up
+once per type and cached.
+"""
 
 from __future__ import annotations
 
@@ -7,10 +12,11 @@ import collections
 import datetime
 import decimal
 import fractions
+import sys
 import uuid
 from math import isnan
 from pathlib import PurePath
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import msgspec
 import msgspec.json
@@ -19,27 +25,104 @@ from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.core.media import io_to_data_url
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
 LOGGER = _loggers.marimo_logger()
 
 
+# Encoders for the types msgspec can't encode natively
+Encoder = Callable[[Any], Any]
+
+# Types that get a cached encoder, at most; past this, the cache starts over
+# (e.g., when classes are created on the fly)
+_MAX_CACHED_TYPES = 1024
+
+
+class _EncoderCache:
+    """Encoders by type, so each type walks the checks in `_resolve` once.
+
+    Which encoder a type resolves to depends on which optional libraries
+    are imported, so the cache starts over whenever a module is imported.
+    """
+
+    def __init__(self) -> None:
+        self._encoders: dict[type, Encoder] = {}
+        self._modules = len(sys.modules)
+
+    def get(self, cls: type) -> Optional[Encoder]:
+        if len(sys.modules) != self._modules:
+            self._encoders.clear()
+            self._modules = len(sys.modules)
+        return self._encoders.get(cls)
+
+    def set(self, cls: type, encoder: Encoder) -> None:
+        if len(self._encoders) >= _MAX_CACHED_TYPES:
+            self._encoders.clear()
+        self._encoders[cls] = encoder
+
+    def clear(self) -> None:
+        self._encoders.clear()
+
+
+_ENCODERS = _EncoderCache()
+_JSON_ENCODERS = _EncoderCache()
+
+
 def enc_hook(obj: Any) -> Any:
     """Custom encoding hook for marimo types."""
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        encoder, cacheable = _resolve(obj)
+        if cacheable:
+            _ENCODERS.set(type(obj), encoder)
+    return encoder(obj)
+
+
+def _json_enc_hook(obj: Any) -> Any:
+    """Encoding hook for JSON.
+
+    Like `enc_hook`, but may return already encoded JSON (`msgspec.Raw`)
+    for types that are faster to encode directly.
+    """
+    encoder = _JSON_ENCODERS.get(type(obj))
+    if encoder is None:
+        encoder, cacheable = _resolve(obj)
+        encoder = _JSON_VARIANTS.get(encoder, encoder)
+        if cacheable:
+            _JSON_ENCODERS.set(type(obj), encoder)
+    return encoder(obj)
+
+
+def _resolve(obj: Any) -> tuple[Encoder, bool]:
+    """Find the encoder for `obj`.
+
+    Returns the encoder and whether it applies to every object of the same
+    type, in which case it can be cached.
+    """
+    cls = type(obj)
+    # Objects that resolve these attributes dynamically (e.g., through
+    # `__getattr__`) are checked every time
+    cacheable = all(
+        hasattr(obj, name) == hasattr(cls, name)
+        for name in ("_marimo_serialize_", "_mime_")
+    )
 
     if hasattr(obj, "_marimo_serialize_"):
-        return obj._marimo_serialize_()
+        return _encode_marimo_serialize, cacheable
 
     if hasattr(obj, "_mime_"):
-        mimetype, data = obj._mime_()
-        return {"mimetype": mimetype, "data": data}
+        return _encode_mime, cacheable
 
     if isinstance(obj, range):
-        return list(obj)
+        return list, cacheable
 
     if isinstance(
         obj,
         (complex, fractions.Fraction, decimal.Decimal, PurePath, uuid.UUID),
     ):
-        return str(obj)
+        return str, cacheable
 
     if DependencyManager.numpy.imported():
         import numpy as np
@@ -47,38 +130,29 @@ def enc_hook(obj: Any) -> Any:
         if isinstance(
             obj, (np.datetime64, np.timedelta64, np.complexfloating)
         ):
-            return str(obj)
+            return str, cacheable
         if isinstance(obj, np.integer):
-            return int(obj)
+            return int, cacheable
         if isinstance(obj, np.floating):
-            return float(obj)
+            return float, cacheable
         if isinstance(obj, np.bool_):
-            return bool(obj)
+            return bool, cacheable
         if isinstance(obj, (np.bytes_, np.str_)):
-            return str(obj)
+            return str, cacheable
         if isinstance(obj, np.ndarray):
-            if any(
-                np.issubdtype(obj.dtype, dtype)
-                for dtype in (
-                    np.datetime64,
-                    np.timedelta64,
-                    np.complexfloating,
-                )
-            ):
-                return obj.astype(str).tolist()
-            return obj.tolist()
+            return _encode_ndarray, cacheable
         if isinstance(obj, np.dtype):
-            return str(obj)
+            return str, cacheable
 
     if DependencyManager.pandas.imported():
         import pandas as pd
 
         if isinstance(obj, pd.DataFrame):
-            return obj.to_dict("records")
+            return _encode_pandas_records, cacheable
         if isinstance(obj, pd.Series):
-            return obj.to_list()
+            return _encode_to_list, cacheable
         if isinstance(obj, pd.Categorical):
-            return obj.tolist()
+            return _encode_tolist, cacheable
         if isinstance(
             obj,
             (
@@ -89,9 +163,9 @@ def enc_hook(obj: Any) -> Any:
                 pd.Period,
             ),
         ):
-            return str(obj)
+            return str, cacheable
         if obj is pd.NaT:
-            return str(obj)
+            return str, cacheable
         if isinstance(
             obj,
             (
@@ -101,18 +175,16 @@ def enc_hook(obj: Any) -> Any:
                 pd.PeriodIndex,
             ),
         ):
-            return obj.astype(str).tolist()
+            return _encode_as_str_list, cacheable
         if isinstance(obj, pd.MultiIndex):
-            return obj.to_list()
+            return _encode_to_list, cacheable
         if isinstance(obj, pd.Index):
-            return obj.to_list()
+            return _encode_to_list, cacheable
 
         # Catch-all for other pandas objects
         try:
             if isinstance(obj, pd.core.base.PandasObject):  # type: ignore
-                import json
-
-                return json.loads(obj.to_json(date_format="iso"))
+                return _encode_pandas_json, cacheable
         except AttributeError:
             pass
 
@@ -125,7 +197,7 @@ def enc_hook(obj: Any) -> Any:
 
             if isinstance(obj, BaseGeometry):
                 # Convert to WKT (Well-Known Text) string representation
-                return str(obj)
+                return str, cacheable
         except (ImportError, AttributeError):
             pass
 
@@ -133,11 +205,11 @@ def enc_hook(obj: Any) -> Any:
         import polars as pl
 
         if isinstance(obj, pl.DataFrame):
-            return obj.to_dict()
+            return _encode_polars_columns, cacheable
         if isinstance(obj, pl.LazyFrame):
-            return obj.collect().to_dict()
+            return _encode_polars_lazy, cacheable
         if isinstance(obj, pl.Series):
-            return obj.to_list()
+            return _encode_to_list, cacheable
 
         # Handle Polars data types
         if hasattr(pl, "datatypes") and hasattr(obj, "__class__"):
@@ -145,7 +217,7 @@ def enc_hook(obj: Any) -> Any:
             if hasattr(pl.datatypes, "DataType") and isinstance(
                 obj, pl.datatypes.DataType
             ):
-                return str(obj)
+                return str, cacheable
 
     # Handle Pillow images
     if DependencyManager.pillow.imported():
@@ -153,9 +225,9 @@ def enc_hook(obj: Any) -> Any:
             from PIL import Image
 
             if isinstance(obj, Image.Image):
-                return io_to_data_url(obj, "image/png")
+                return _encode_image, cacheable
         except Exception:
-            LOGGER.debug("Unable to convert image to data URL", exc_info=True)
+            LOGGER.debug("Unable to check for Pillow images", exc_info=True)
 
     # Handle Matplotlib figures
     if DependencyManager.matplotlib.imported():
@@ -163,53 +235,36 @@ def enc_hook(obj: Any) -> Any:
             import matplotlib.figure
             from matplotlib.axes import Axes
 
-            from marimo._output.formatting import as_html
-            from marimo._plugins.stateless.flex import vstack
-
-            if isinstance(obj, matplotlib.figure.Figure):
-                html = as_html(vstack([str(obj), obj]))
-                mimetype, data = html._mime_()
-
-            if isinstance(obj, Axes):
-                html = as_html(vstack([str(obj), obj]))
-                mimetype, data = html._mime_()
-                return {"mimetype": mimetype, "data": data}
+            if isinstance(obj, (matplotlib.figure.Figure, Axes)):
+                return _encode_matplotlib, cacheable
         except Exception:
             LOGGER.debug(
-                "Error converting matplotlib figures to HTML",
-                exc_info=True,
+                "Unable to check for matplotlib figures", exc_info=True
             )
 
+    encoder = _resolve_fallback(obj)
+    return encoder, cacheable
+
+
+def _resolve_fallback(obj: Any) -> Encoder:
+    """Find the encoder for objects that aren't from a known library."""
     # Handle objects with __slots__
     slots = getattr(obj, "__slots__", None)
     if slots is not None:
         try:
-            slots = iter(slots)
+            iter(slots)
         except TypeError:
             pass  # Fall through to __dict__ handling
         else:
-            # Convert to dict using msgspec.to_builtins for proper handling
-            result = {}
-            for slot in slots:
-                if hasattr(obj, slot):
-                    attr_value = getattr(obj, slot)
-                    # Use msgspec.to_builtins which properly handles nested structures
-                    result[slot] = msgspec.to_builtins(
-                        attr_value, enc_hook=enc_hook
-                    )
-            return result
+            return _encode_slots
 
     # Handle custom objects with `__dict__`
     if hasattr(obj, "__dict__"):
-        # Convert the __dict__ using msgspec.to_builtins for proper handling
-        return msgspec.to_builtins(obj.__dict__, enc_hook=enc_hook)
+        return _encode_dict_attributes
 
     # Handle collections types
-    if isinstance(obj, (list, tuple, set, frozenset)):
-        return list([enc_hook(item) for item in obj])
-
-    if isinstance(obj, collections.deque):
-        return list([enc_hook(item) for item in obj])
+    if isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+        return _encode_items
 
     # Handle dict and dict-like types
     if isinstance(
@@ -221,48 +276,197 @@ def enc_hook(obj: Any) -> Any:
             collections.Counter,
         ),
     ):
-        return {enc_hook(k): enc_hook(v) for k, v in obj.items()}
+        return _encode_mapping
 
     # Handle float('inf'), float('nan'), float('-inf')
     if isinstance(obj, float):
-        if obj == float("inf"):
-            return "Infinity"
-        if obj == float("-inf"):
-            return "-Infinity"
-        if isnan(obj):
-            return "NaN"
-        return obj
+        return _encode_float
 
     # Handle bytes objects
-    if isinstance(obj, memoryview):
-        obj = obj.tobytes()
+    if isinstance(obj, (memoryview, bytes)):
+        return _encode_bytes
 
-    if isinstance(obj, bytes):
-        try:
-            return obj.decode("utf-8")
-        except UnicodeDecodeError:
-            # Fallback to latin1
-            return obj.decode("latin1")
-
-    # Handle primitive types
-    if isinstance(obj, (int, str, bool)):
-        return obj
+    # Handle primitive types and None
+    if isinstance(obj, (int, str, bool)) or obj is None:
+        return _identity
 
     # Handle datetime types
     if isinstance(
         obj,
         (datetime.datetime, datetime.timedelta, datetime.date, datetime.time),
     ):
-        return str(obj)
+        return str
+
+    return repr
+
+
+def _encode_marimo_serialize(obj: Any) -> Any:
+    return obj._marimo_serialize_()
+
+
+def _encode_mime(obj: Any) -> dict[str, Any]:
+    mimetype, data = obj._mime_()
+    return {"mimetype": mimetype, "data": data}
+
+
+def _encode_ndarray(obj: Any) -> Any:
+    if obj.dtype.kind in "mMc":  # datetime64, timedelta64, complex
+        return obj.astype(str).tolist()
+    return obj.tolist()
+
+
+def _encode_to_list(obj: Any) -> Any:
+    return obj.to_list()
+
+
+def _encode_tolist(obj: Any) -> Any:
+    return obj.tolist()
+
+
+def _encode_as_str_list(obj: Any) -> Any:
+    return obj.astype(str).tolist()
+
+
+def _encode_pandas_records(obj: pd.DataFrame) -> Any:
+    return obj.to_dict("records")
+
+
+def _encode_pandas_records_json(obj: pd.DataFrame) -> Any:
+    """Encode a pandas DataFrame as JSON records, column by column.
+
+    Produces the same JSON as encoding `obj.to_dict("records")`, without
+    building a dict per row: numeric and boolean columns are encoded as a
+    whole and split into cells, other columns cell by cell, and each row is
+    filled into a template of its keys.
+    """
+    import numpy as np
+
+    columns = obj.columns
+    if (
+        len(obj) == 0
+        or len(columns) == 0
+        or not columns.is_unique
+        or not all(isinstance(name, str) for name in columns)
+    ):
+        return _encode_pandas_records(obj)
+
+    cells: list[list[bytes]] = []
+    for i in range(len(columns)):
+        series = obj.iloc[:, i]
+        values = series.tolist()
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            # Numbers, booleans and nulls: no commas within a cell
+            cells.append(_encoder.encode(values)[1:-1].split(b","))
+        else:
+            cells.append([_encoder.encode(value) for value in values])
+
+    template = (
+        b"{"
+        + b",".join(
+            _encoder.encode(name).replace(b"%", b"%%") + b":%s"
+            for name in columns
+        )
+        + b"}"
+    )
+    rows = [template % row for row in zip(*cells)]
+    return msgspec.Raw(b"[" + b",".join(rows) + b"]")
+
+
+def _encode_pandas_json(obj: Any) -> Any:
+    import json
+
+    return json.loads(obj.to_json(date_format="iso"))
+
+
+def _encode_polars_columns(obj: pl.DataFrame) -> dict[str, list[Any]]:
+    return obj.to_dict(as_series=False)
+
+
+def _encode_polars_lazy(obj: pl.LazyFrame) -> dict[str, list[Any]]:
+    return obj.collect().to_dict(as_series=False)
+
+
+def _encode_image(obj: Any) -> Any:
+    try:
+        return io_to_data_url(obj, "image/png")
+    except Exception:
+        LOGGER.debug("Unable to convert image to data URL", exc_info=True)
+    return _resolve_fallback(obj)(obj)
+
+
+def _encode_matplotlib(obj: Any) -> Any:
+    try:
+        from marimo._output.formatting import as_html
+        from marimo._plugins.stateless.flex import vstack
+
+        html = as_html(vstack([str(obj), obj]))
+        mimetype, data = html._mime_()
+        return {"mimetype": mimetype, "data": data}
+    except Exception:
+        LOGGER.debug(
+            "Error converting matplotlib figures to HTML",
+            exc_info=True,
+        )
+    return _resolve_fallback(obj)(obj)
+
+
+def _encode_slots(obj: Any) -> dict[str, Any]:
+    # Convert to dict using msgspec.to_builtins for proper handling
+    result = {}
+    for slot in obj.__slots__:
+        if hasattr(obj, slot):
+            attr_value = getattr(obj, slot)
+            # Use msgspec.to_builtins which properly handles nested structures
+            result[slot] = msgspec.to_builtins(attr_value, enc_hook=enc_hook)
+    return result
+
+
+def _encode_dict_attributes(obj: Any) -> Any:
+    # Convert the __dict__ using msgspec.to_builtins for proper handling
+    return msgspec.to_builtins(obj.__dict__, enc_hook=enc_hook)
+
+
+def _encode_items(obj: Any) -> list[Any]:
+    return [enc_hook(item) for item in obj]
+
+
+def _encode_mapping(obj: Any) -> dict[Any, Any]:
+    return {enc_hook(k): enc_hook(v) for k, v in obj.items()}
+
+
+def _encode_float(obj: float) -> Any:
+    if obj == float("inf"):
+        return "Infinity"
+    if obj == float("-inf"):
+        return "-Infinity"
+    if isnan(obj):
+        return "NaN"
+    return obj
+
+
+def _encode_bytes(obj: Any) -> str:
+    if isinstance(obj, memoryview):
+        obj = obj.tobytes()
+    try:
+        return obj.decode("utf-8")  # type: ignore[no-any-return]
+    except UnicodeDecodeError:
+        # Fallback to latin1
+        return obj.decode("latin1")  # type: ignore[no-any-return]
+
+
+def _identity(obj: Any) -> Any:
+    return obj
 
-    # Handle None
-    if obj is None:
-        return None
 
-    return repr(obj)
+# Encoders that `_json_enc_hook` replaces with ones producing JSON directly
+_JSON_VARIANTS: dict[Encoder, Encoder] = {
+    _encode_pandas_records: _encode_pandas_records_json,
+}
 
 
-_encoder = msgspec.json.Encoder(enc_hook=enc_hook, decimal_format="number")
+_encoder = msgspec.json.Encoder(
+    enc_hook=_json_enc_hook, decimal_format="number"
+)
 
 
 def encode_json_bytes(obj: Any) -> bytes:
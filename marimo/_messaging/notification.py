@@ -148,6 +148,8 @@ class UIElementMessageNotification(
         model_id: Widget model ID (newer architecture).
         message: Message payload as dictionary.
         buffers: Optional binary buffers for large data.
+        buffer_urls: Optional URLs of buffers sent out of band, aligned
+            with `buffers`; a buffer with a URL is sent empty inline.
     """
 
     name: ClassVar[str] = "send-ui-element-message"
@@ -155,6 +157,7 @@ class UIElementMessageNotification(
     model_id: Optional[WidgetModelId]
     message: dict[str, Any]
     buffers: Optional[list[bytes]] = None
+    buffer_urls: Optional[list[Optional[str]]] = None
 
 
 class InterruptedNotification(Notification, tag="interrupted"):
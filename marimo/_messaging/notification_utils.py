@@ -7,6 +7,7 @@ CellNotificationUtils for cell-related broadcasts.
 from __future__ import annotations
 
 import sys
+import time
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
@@ -18,6 +19,7 @@ from marimo._messaging.errors import (
 )
 from marimo._messaging.serde import serialize_kernel_message
 from marimo._messaging.streams import output_max_bytes
+from marimo._metrics import NOTIFICATION_SERIALIZE_SECONDS, metrics_enabled
 from marimo._runtime.context import get_context
 from marimo._runtime.context.types import ContextNotInitializedError
 from marimo._runtime.context.utils import get_mode
@@ -51,7 +53,13 @@ def broadcast_notification(
             stream = ctx.stream
 
     try:
-        stream.write(serialize_kernel_message(notification))
+        if metrics_enabled():
+            start = time.perf_counter()
+            message = serialize_kernel_message(notification)
+            NOTIFICATION_SERIALIZE_SECONDS.observe(time.perf_counter() - start)
+        else:
+            message = serialize_kernel_message(notification)
+        stream.write(message)
     except Exception as e:
         LOGGER.exception(
             "Error serializing notification %s: %s",
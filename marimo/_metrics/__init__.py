@@ -0,0 +1,92 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Performance telemetry for the server and kernels.
+
+Enable with `MARIMO_METRICS=true`; metrics are then served in the
+Prometheus format at `/metrics` and mirrored as OpenTelemetry
+instruments when `opentelemetry` is installed.
+"""
+
+from __future__ import annotations
+
+from marimo._metrics.registry import (
+    REGISTRY,
+    SIZE_BUCKETS,
+    metrics_enabled,
+)
+
+# Kernel
+CELL_RUNS = REGISTRY.counter(
+    "marimo_cell_runs_total",
+    "Cells run by the kernel, by outcome.",
+    ("status",),
+)
+CELL_RUN_SECONDS = REGISTRY.histogram(
+    "marimo_cell_run_seconds",
+    "Time spent running a cell, excluding hooks.",
+)
+RUNNER_HOOK_SECONDS = REGISTRY.histogram(
+    "marimo_runner_hook_seconds",
+    "Time spent in runner hooks, by hook stage.",
+    ("stage",),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "marimo_cache_requests_total",
+    "Lookups in marimo's cell and function caches, by loader and result.",
+    ("loader", "result"),
+)
+CACHE_LOAD_SECONDS = REGISTRY.histogram(
+    "marimo_cache_load_seconds",
+    "Time spent looking up and loading cached values, by loader.",
+    ("loader",),
+)
+NOTIFICATION_SERIALIZE_SECONDS = REGISTRY.histogram(
+    "marimo_notification_serialize_seconds",
+    "Time spent serializing kernel notifications.",
+)
+
+# Server
+NOTIFICATIONS_SENT = REGISTRY.counter(
+    "marimo_notifications_sent_total",
+    "Notifications sent to frontends, by operation.",
+    ("op",),
+)
+NOTIFICATION_BYTES = REGISTRY.histogram(
+    "marimo_notification_bytes",
+    "Size of serialized notifications sent to frontends.",
+    ("op",),
+    buckets=SIZE_BUCKETS,
+)
+SESSIONS = REGISTRY.gauge(
+    "marimo_sessions",
+    "Open sessions.",
+)
+KERNELS = REGISTRY.gauge(
+    "marimo_kernels",
+    "Running kernels, by mode.",
+    ("mode",),
+)
+WEBSOCKET_CONNECTIONS = REGISTRY.gauge(
+    "marimo_websocket_connections",
+    "Connected websocket clients.",
+)
+WEBSOCKET_BACKLOG = REGISTRY.gauge(
+    "marimo_websocket_backlog",
+    "Notifications queued for websocket clients but not yet sent.",
+)
+
+__all__ = [
+    "CACHE_LOAD_SECONDS",
+    "CACHE_REQUESTS",
+    "CELL_RUNS",
+    "CELL_RUN_SECONDS",
+    "KERNELS",
+    "NOTIFICATIONS_SENT",
+    "NOTIFICATION_BYTES",
+    "NOTIFICATION_SERIALIZE_SECONDS",
+    "REGISTRY",
+    "RUNNER_HOOK_SECONDS",
+    "SESSIONS",
+    "WEBSOCKET_BACKLOG",
+    "WEBSOCKET_CONNECTIONS",
+    "metrics_enabled",
+]
@@ -0,0 +1,173 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Aggregate metrics recorded by kernel subprocesses.
+
+In edit mode each kernel runs in its own process. Kernels periodically
+write a snapshot of their metrics to a directory shared with the server
+(`MARIMO_METRICS_DIR`), and the server merges these snapshots with its
+own when metrics are scraped. A kernel removes its snapshot when it shuts
+down, and snapshots left behind by kernels that died are pruned on scrape.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from marimo import _loggers
+from marimo._metrics.registry import (
+    REGISTRY,
+    Snapshot,
+    merge_snapshots,
+)
+
+LOGGER = _loggers.marimo_logger()
+
+METRICS_DIR_ENV = "MARIMO_METRICS_DIR"
+FLUSH_INTERVAL_SECONDS = 5.0
+# Where liveness can't be checked, a snapshot that hasn't been rewritten
+# for this long is assumed to belong to a kernel that died
+STALE_AFTER_SECONDS = 12 * FLUSH_INTERVAL_SECONDS
+
+_writer: Optional[threading.Thread] = None
+_stop_writer: Optional[threading.Event] = None
+
+
+def get_metrics_dir() -> Optional[Path]:
+    path = os.environ.get(METRICS_DIR_ENV)
+    return Path(path) if path else None
+
+
+def initialize_metrics_dir() -> Path:
+    """Create the directory kernels report to; called by the server.
+
+    The directory is exported through the environment so that kernel
+    processes spawned by the server inherit it, and is removed when the
+    server exits.
+    """
+    existing = get_metrics_dir()
+    if existing is not None:
+        existing.mkdir(parents=True, exist_ok=True)
+        return existing
+
+    path = Path(tempfile.mkdtemp(prefix="marimo-metrics-"))
+    os.environ[METRICS_DIR_ENV] = str(path)
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _snapshot_path(directory: Path) -> Path:
+    return directory / f"{os.getpid()}.json"
+
+
+def write_snapshot(directory: Path) -> None:
+    target = _snapshot_path(directory)
+    tmp = target.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps(REGISTRY.snapshot()), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError as e:
+        LOGGER.debug("Failed to write metrics snapshot: %s", e)
+
+
+def start_snapshot_writer(
+    interval: float = FLUSH_INTERVAL_SECONDS,
+) -> None:
+    """Periodically write this process's metrics for the server to read.
+
+    A no-op if the process wasn't spawned by a server collecting metrics.
+    """
+    global _writer, _stop_writer
+    directory = get_metrics_dir()
+    if directory is None or _writer is not None:
+        return
+
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval):
+            write_snapshot(directory)
+
+    _stop_writer = stop
+    _writer = threading.Thread(
+        target=run, name="marimo-metrics-writer", daemon=True
+    )
+    _writer.start()
+    atexit.register(stop_snapshot_writer)
+
+
+def stop_snapshot_writer() -> None:
+    """Stop reporting metrics and remove this process's snapshot.
+
+    Called when a kernel shuts down, so that the server stops counting it.
+    """
+    global _writer, _stop_writer
+    writer, stop = _writer, _stop_writer
+    if writer is None or stop is None:
+        return
+    _writer = _stop_writer = None
+    stop.set()
+    # Don't let an in-flight write recreate the file
+    writer.join(timeout=FLUSH_INTERVAL_SECONDS)
+    directory = get_metrics_dir()
+    if directory is not None:
+        try:
+            _snapshot_path(directory).unlink(missing_ok=True)
+        except OSError as e:
+            LOGGER.debug("Failed to remove metrics snapshot: %s", e)
+
+
+def _is_orphaned(path: Path) -> bool:
+    """Whether a snapshot was written by a process that no longer exists."""
+    try:
+        pid = int(path.stem)
+    except ValueError:
+        return False
+    if sys.platform != "win32":
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # e.g. owned by another user
+            return False
+        return False
+    # On Windows, os.kill terminates the process; go by age instead
+    try:
+        return time.time() - path.stat().st_mtime > STALE_AFTER_SECONDS
+    except OSError:
+        return False
+
+
+def read_snapshots(directory: Path) -> list[Snapshot]:
+    snapshots: list[Snapshot] = []
+    own = f"{os.getpid()}.json"
+    for path in directory.glob("*.json"):
+        if path.name == own:
+            continue
+        if _is_orphaned(path):
+            # Left behind by a kernel that was killed
+            LOGGER.debug("Removing orphaned metrics snapshot %s", path)
+            path.unlink(missing_ok=True)
+            continue
+        try:
+            snapshots.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError) as e:
+            LOGGER.debug("Skipping metrics snapshot %s: %s", path, e)
+    return snapshots
+
+
+def collect() -> Snapshot:
+    """This process's metrics, merged with those reported by kernels."""
+    snapshots = [REGISTRY.snapshot()]
+    directory = get_metrics_dir()
+    if directory is not None and directory.is_dir():
+        snapshots.extend(read_snapshots(directory))
+    return merge_snapshots(snapshots)
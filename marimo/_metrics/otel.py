@@ -0,0 +1,59 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Mirror marimo's metrics as OpenTelemetry instruments.
+
+Instruments are created against the global meter provider, which is a
+no-op unless the application (or `opentelemetry-instrument`) configures
+one.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marimo._metrics.registry import _Metric
+
+LOGGER = _loggers.marimo_logger()
+
+
+def create_instrument(metric: _Metric) -> Optional[Any]:
+    if not DependencyManager.opentelemetry.has():
+        return None
+
+    try:
+        from opentelemetry import metrics
+
+        meter = metrics.get_meter("marimo")
+        if metric.type == "counter":
+            return meter.create_counter(
+                metric.name, description=metric.documentation
+            )
+        if metric.type == "histogram":
+            return meter.create_histogram(
+                metric.name, description=metric.documentation
+            )
+
+        from marimo._metrics.registry import Gauge
+
+        assert isinstance(metric, Gauge)
+        gauge = metric
+
+        def observe(_options: Any) -> Iterable[Any]:
+            return [
+                metrics.Observation(value, labels)
+                for labels, value in gauge.observations()
+            ]
+
+        return meter.create_observable_gauge(
+            metric.name,
+            callbacks=[observe],
+            description=metric.documentation,
+        )
+    except Exception as e:
+        LOGGER.debug("Failed to create OpenTelemetry instrument: %s", e)
+        return None
@@ -0,0 +1,71 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Render metrics in the Prometheus text exposition format (0.0.4)."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from marimo._metrics.registry import Snapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: list[str], values: list[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"'
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def render(snapshot: Snapshot) -> str:
+    lines: list[str] = []
+    for name in sorted(snapshot):
+        metric = snapshot[name]
+        lines.append(f"# HELP {name} {_escape_help(metric['help'])}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labelnames"]
+        for labels, value in sorted(metric["samples"], key=lambda s: s[0]):
+            if metric["type"] != "histogram":
+                lines.append(
+                    f"{name}{_format_labels(labelnames, labels)} "
+                    f"{_format_value(value)}"
+                )
+                continue
+
+            cumulative = 0
+            bounds = [*metric["buckets"], math.inf]
+            for bound, count in zip(bounds, value["counts"]):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    [*labelnames, "le"], [*labels, _format_value(bound)]
+                )
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            sample_labels = _format_labels(labelnames, labels)
+            lines.append(
+                f"{name}_sum{sample_labels} {_format_value(value['sum'])}"
+            )
+            lines.append(f"{name}_count{sample_labels} {value['count']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,388 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Counters, histograms, and gauges with no third-party dependencies.
+
+Recording is a no-op unless metrics are enabled (`MARIMO_METRICS=true`),
+so instrumented code paths pay for a single attribute lookup when
+metrics are off.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict
+
+from marimo._config.settings import GLOBAL_SETTINGS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MetricType = Literal["counter", "histogram", "gauge"]
+LabelValues = tuple[str, ...]
+
+# Suitable for durations in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Suitable for payload sizes in bytes
+SIZE_BUCKETS: tuple[float, ...] = tuple(
+    float(4**exponent) for exponent in range(4, 14)
+)
+
+
+class HistogramValue(TypedDict):
+    # Per-bucket (non-cumulative) counts; the last entry is +Inf
+    counts: list[int]
+    sum: float
+    count: int
+
+
+class MetricSnapshot(TypedDict):
+    type: MetricType
+    help: str
+    labelnames: list[str]
+    buckets: list[float]
+    # (label values, value) pairs
+    samples: list[tuple[list[str], Any]]
+
+
+Snapshot = dict[str, MetricSnapshot]
+
+
+def metrics_enabled() -> bool:
+    return GLOBAL_SETTINGS.METRICS
+
+
+class _Metric(ABC):
+    type: MetricType
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...]
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._otel: Any = None
+        self._otel_resolved = False
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _otel_instrument(self) -> Any:
+        if not self._otel_resolved:
+            from marimo._metrics.otel import create_instrument
+
+            self._otel = create_instrument(self)
+            self._otel_resolved = True
+        return self._otel
+
+    @abstractmethod
+    def snapshot(self) -> MetricSnapshot:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class Counter(_Metric):
+    """A monotonically increasing count."""
+
+    type: MetricType = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...]
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not GLOBAL_SETTINGS.METRICS:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        if (instrument := self._otel_instrument()) is not None:
+            instrument.add(amount, labels)
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def snapshot(self) -> MetricSnapshot:
+        with self._lock:
+            samples = [
+                (list(key), value) for key, value in self._values.items()
+            ]
+        return MetricSnapshot(
+            type=self.type,
+            help=self.documentation,
+            labelnames=list(self.labelnames),
+            buckets=[],
+            samples=samples,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """A distribution of observations, counted in fixed buckets."""
+
+    type: MetricType = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[LabelValues, HistogramValue] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not GLOBAL_SETTINGS.METRICS:
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            current = self._values.get(key)
+            if current is None:
+                current = HistogramValue(
+                    counts=[0] * (len(self.buckets) + 1), sum=0.0, count=0
+                )
+                self._values[key] = current
+            current["counts"][index] += 1
+            current["sum"] += value
+            current["count"] += 1
+        if (instrument := self._otel_instrument()) is not None:
+            instrument.record(value, labels)
+
+    @contextlib.contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the block, in seconds."""
+        if not GLOBAL_SETTINGS.METRICS:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get(self, **labels: str) -> Optional[HistogramValue]:
+        return self._values.get(self._key(labels))
+
+    def snapshot(self) -> MetricSnapshot:
+        with self._lock:
+            samples = [
+                (
+                    list(key),
+                    HistogramValue(
+                        counts=list(value["counts"]),
+                        sum=value["sum"],
+                        count=value["count"],
+                    ),
+                )
+                for key, value in self._values.items()
+            ]
+        return MetricSnapshot(
+            type=self.type,
+            help=self.documentation,
+            labelnames=list(self.labelnames),
+            buckets=list(self.buckets),
+            samples=samples,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """A value that can go up and down, set at the time of measurement."""
+
+    type: MetricType = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...]
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        if not GLOBAL_SETTINGS.METRICS:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+        # Observable gauges read the current values when collected
+        self._otel_instrument()
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def observations(self) -> list[tuple[dict[str, str], float]]:
+        with self._lock:
+            return [
+                (dict(zip(self.labelnames, key)), value)
+                for key, value in self._values.items()
+            ]
+
+    def snapshot(self) -> MetricSnapshot:
+        with self._lock:
+            samples = [
+                (list(key), value) for key, value in self._values.items()
+            ]
+        return MetricSnapshot(
+            type=self.type,
+            help=self.documentation,
+            labelnames=list(self.labelnames),
+            buckets=[],
+            samples=samples,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(
+                        f"Metric {metric.name} is already registered "
+                        f"as a {existing.type}"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ) -> Counter:
+        result: Counter = self._register(
+            Counter(name, documentation, labelnames)
+        )
+        return result
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        result: Histogram = self._register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+        return result
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ) -> Gauge:
+        result: Gauge = self._register(Gauge(name, documentation, labelnames))
+        return result
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def clear(self) -> None:
+        """Reset all recorded values; used by tests."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+def merge_snapshots(snapshots: list[Snapshot]) -> Snapshot:
+    """Combine snapshots from several processes.
+
+    Counters and histograms are summed; gauges are summed as well, since
+    each process reports only the resources it owns.
+    """
+    merged: Snapshot = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.get(name)
+            if target is None:
+                target = MetricSnapshot(
+                    type=metric["type"],
+                    help=metric["help"],
+                    labelnames=list(metric["labelnames"]),
+                    buckets=list(metric["buckets"]),
+                    samples=[],
+                )
+                merged[name] = target
+            elif (
+                target["type"] != metric["type"]
+                or target["buckets"] != metric["buckets"]
+            ):
+                # Incompatible definitions (e.g. from another version)
+                continue
+
+            index = {
+                tuple(labels): i
+                for i, (labels, _) in enumerate(target["samples"])
+            }
+            for labels, value in metric["samples"]:
+                i = index.get(tuple(labels))
+                if i is None:
+                    if metric["type"] == "histogram":
+                        value = HistogramValue(
+                            counts=list(value["counts"]),
+                            sum=value["sum"],
+                            count=value["count"],
+                        )
+                    index[tuple(labels)] = len(target["samples"])
+                    target["samples"].append((list(labels), value))
+                    continue
+                current = target["samples"][i][1]
+                if metric["type"] == "histogram":
+                    current["counts"] = [
+                        a + b
+                        for a, b in zip(current["counts"], value["counts"])
+                    ]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+                else:
+                    target["samples"][i] = (list(labels), current + value)
+    return merged
+
+
+REGISTRY = MetricsRegistry()
@@ -12,11 +12,10 @@ https://stackoverflow.com/questions/58153024/matplotlib-how-to-create-original-b
 
 from __future__ import annotations
 
-import base64
-import io
+import functools
 import json
 import struct
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import matplotlib.pyplot as plt
 from matplotlib._pylab_helpers import Gcf
@@ -26,15 +25,35 @@ from matplotlib.backend_bases import (
 )
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
+from marimo import _loggers
 from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.mimetypes import METADATA_KEY, KnownMimeType
 from marimo._messaging.notification_utils import CellNotificationUtils
-from marimo._utils.data_uri import build_data_url
+from marimo._output.mpl_render import (
+    png_url,
+    render_in_background,
+    render_png,
+    wait_for_background_renders,
+)
+from marimo._runtime.context import safe_get_context
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from matplotlib.figure import Figure
+
+    from marimo._messaging.types import Stream
+    from marimo._runtime.context.types import RuntimeContext
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
 
 FigureCanvas = FigureCanvasAgg
 
 
 def close_figures() -> None:
+    # Figures shown by the cell must be in its console before it finishes
+    wait_for_background_renders()
     if Gcf.get_all_fig_managers():
         plt.close("all")
 
@@ -67,27 +86,28 @@ def _render_figure_mimebundle(
 
     Returns:
         Tuple of (mimetype, json_data) where json_data is a mimebundle
-        containing the PNG data URL and display metadata
+        containing the PNG URL and display metadata
     """
-    buf = io.BytesIO()
+    # Double the current DPI for retina display (like Jupyter)
+    retina_dpi = fig.figure.dpi * 2  # type: ignore[attr-defined]
+    png_bytes = render_png(fig.figure, dpi=retina_dpi)  # type: ignore[arg-type]
+    return _png_mimebundle(png_bytes)
 
-    # Get current DPI and double it for retina display (like Jupyter)
-    original_dpi = fig.figure.dpi  # type: ignore[attr-defined]
-    retina_dpi = original_dpi * 2
-
-    fig.figure.savefig(buf, format="png", bbox_inches="tight", dpi=retina_dpi)  # type: ignore[attr-defined]
-
-    png_bytes = buf.getvalue()
-    plot_bytes = base64.b64encode(png_bytes)
 
+def _png_mimebundle(
+    png_bytes: bytes,
+    *,
+    context: Optional[RuntimeContext] = None,
+    cell_id: Optional[CellId_t] = None,
+) -> tuple[KnownMimeType, str]:
     image_mimetype: KnownMimeType = "image/png"
-    data_url = build_data_url(mimetype=image_mimetype, data=plot_bytes)
+    url = png_url(png_bytes, context=context, cell_id=cell_id)
 
     try:
         # Extract dimensions from the PNG
         width, height = _extract_png_dimensions(png_bytes)
         mimebundle = {
-            "image/png": data_url,
+            "image/png": url,
             METADATA_KEY: {
                 "image/png": {
                     "width": width // 2,
@@ -101,27 +121,82 @@ def _render_figure_mimebundle(
         )
     except (ValueError, struct.error, IndexError):
         # Fall back to plain image if dimension extraction fails
-        return (image_mimetype, data_url)
-
-
-def _internal_show(canvas: FigureCanvasBase) -> None:
-    mimetype, data = _render_figure_mimebundle(canvas)
-    plt.close(canvas.figure)
+        return (image_mimetype, url)
+
+
+def _show_figure(
+    figure: Figure,
+    dpi: float,
+    context: Optional[RuntimeContext],
+    cell_id: Optional[CellId_t],
+    stream: Optional[Stream],
+) -> None:
+    png_bytes = render_png(figure, dpi=dpi)
+    mimetype, data = _png_mimebundle(
+        png_bytes, context=context, cell_id=cell_id
+    )
     CellNotificationUtils.broadcast_console_output(
         channel=CellChannel.MEDIA,
         mimetype=mimetype,
         data=data,
-        cell_id=None,
+        cell_id=cell_id,
         status=None,
+        stream=stream,
     )
 
 
+def _show_figure_in_background(
+    figure: Figure,
+    dpi: float,
+    context: RuntimeContext,
+    cell_id: CellId_t,
+    stream: Stream,
+) -> None:
+    try:
+        _show_figure(figure, dpi, context, cell_id, stream)
+    except Exception as e:
+        # plt.show() has already returned, so report it in the console
+        LOGGER.debug("Failed to render figure", exc_info=True)
+        CellNotificationUtils.broadcast_console_output(
+            channel=CellChannel.STDERR,
+            mimetype="text/plain",
+            data=f"Failed to render figure: {e}\n",
+            cell_id=cell_id,
+            status=None,
+            stream=stream,
+        )
+
+
+def _internal_show(canvases: Sequence[FigureCanvasBase]) -> None:
+    ctx = safe_get_context()
+    cell_id = ctx.cell_id if ctx is not None else None
+    for canvas in canvases:
+        figure: Figure = canvas.figure  # type: ignore[assignment]
+        # Closed now, so the cell can go on to draw new figures while this
+        # one is rasterized on the render thread; the render keeps it alive.
+        plt.close(figure)
+        # Double the current DPI for retina display (like Jupyter)
+        dpi = figure.dpi * 2
+        if ctx is None or cell_id is None:
+            _show_figure(figure, dpi, None, None, None)
+            continue
+        render_in_background(
+            functools.partial(
+                _show_figure_in_background,
+                figure,
+                dpi,
+                ctx,
+                cell_id,
+                ctx.stream,
+            )
+        )
+
+
 class FigureManager(FigureManagerBase):
     def show(self) -> None:
-        _internal_show(self.canvas)
+        _internal_show([self.canvas])
 
 
 def show(*, block: Optional[bool] = None) -> None:
     del block
-    for manager in Gcf.get_all_fig_managers():
-        _internal_show(manager.canvas)
+    _internal_show([manager.canvas for manager in Gcf.get_all_fig_managers()])
@@ -0,0 +1,245 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Rasterization pipeline for matplotlib figures.
+
+Figures are rasterized to PNG on a dedicated render thread, and renders are
+cached per figure so that re-displaying an unchanged figure does not
+rasterize it again.
+
+There is a single render thread, so figures are rendered one at a time:
+matplotlib's `savefig` is not thread-safe (it mutates the figure and shared
+state such as the font cache while drawing). Synchronous renders wait for
+the render thread; figures shown with `plt.show()` are rendered in the
+background while the cell keeps running, and the cell waits for them before
+it finishes (see `wait_for_background_renders`). Shown figures are closed,
+so they must not be modified afterwards; rcParams changed after a figure is
+shown may apply to its render.
+
+A cached render is valid as long as the figure has not been marked stale.
+matplotlib propagates the `stale` flag from any modified artist up to its
+figure, so we clear the flag after rendering and treat a stale figure as a
+cache miss. (Mutating an artist's data arrays in place, without going
+through a setter, bypasses this tracking, just as it bypasses matplotlib's
+own redraw logic.)
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+
+from marimo import _loggers
+from marimo._runtime.context import safe_get_context
+from marimo._utils.data_uri import build_data_url
+from marimo._utils.platform import is_pyodide
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+    from marimo._runtime.context.types import RuntimeContext
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# (dpi, bbox_inches, width_inches, height_inches)
+_RenderKey = tuple[float, Optional[str], float, float]
+
+
+class FigureRenderCache:
+    """Cache of PNG renders, keyed on a figure and its render parameters.
+
+    Entries are held weakly, so closing and dropping a figure releases its
+    render.
+    """
+
+    def __init__(self) -> None:
+        self._renders: weakref.WeakKeyDictionary[
+            Figure, tuple[_RenderKey, bytes]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, figure: Figure, key: _RenderKey) -> Optional[bytes]:
+        with self._lock:
+            entry = self._renders.get(figure)
+            if entry is None or figure.stale or entry[0] != key:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, figure: Figure, key: _RenderKey, data: bytes) -> None:
+        with self._lock:
+            self._renders[figure] = (key, data)
+            # savefig leaves the figure stale (it temporarily swaps the dpi);
+            # any later change to an artist will mark it stale again.
+            figure.stale = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._renders.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CACHE = FigureRenderCache()
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+class _RenderThreadState(threading.local):
+    def __init__(self) -> None:
+        # Whether this is the render thread
+        self.is_render_thread = False
+        # Background renders submitted from this (kernel) thread
+        self.pending: list[Future[None]] = []
+
+
+_STATE = _RenderThreadState()
+
+
+def get_render_cache() -> FigureRenderCache:
+    return _CACHE
+
+
+def _mark_render_thread() -> None:
+    _STATE.is_render_thread = True
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            # One worker, so that renders never run concurrently
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="marimo-mpl-render",
+                initializer=_mark_render_thread,
+            )
+        return _EXECUTOR
+
+
+def _render_inline() -> bool:
+    # Pyodide has no threads
+    return _STATE.is_render_thread or is_pyodide()
+
+
+def _render_key(
+    figure: Figure, dpi: float, bbox_inches: Optional[str]
+) -> _RenderKey:
+    width, height = figure.get_size_inches()
+    return (float(dpi), bbox_inches, float(width), float(height))
+
+
+def _rasterize(
+    figure: Figure, key: _RenderKey, dpi: float, bbox_inches: Optional[str]
+) -> bytes:
+    buf = io.BytesIO()
+    figure.savefig(buf, format="png", bbox_inches=bbox_inches, dpi=dpi)
+    data = buf.getvalue()
+    _CACHE.put(figure, key, data)
+    return data
+
+
+def render_png(
+    figure: Figure,
+    *,
+    dpi: Optional[float] = None,
+    bbox_inches: Optional[str] = "tight",
+) -> bytes:
+    """Rasterize a figure to PNG bytes, reusing a cached render if possible.
+
+    Rasterizing happens on the render thread; this blocks until it's done.
+
+    Args:
+        figure: The matplotlib figure to render.
+        dpi: Resolution to render at; defaults to the figure's own dpi.
+        bbox_inches: Passed through to `savefig`.
+
+    Returns:
+        The raw (not base64-encoded) PNG bytes.
+    """
+    dpi = figure.dpi if dpi is None else dpi
+    key = _render_key(figure, dpi, bbox_inches)
+    cached = _CACHE.get(figure, key)
+    if cached is not None:
+        return cached
+
+    if _render_inline():
+        return _rasterize(figure, key, dpi, bbox_inches)
+    return (
+        _get_executor()
+        .submit(_rasterize, figure, key, dpi, bbox_inches)
+        .result()
+    )
+
+
+def render_in_background(render: Callable[[], None]) -> None:
+    """Run `render` on the render thread without waiting for it.
+
+    `render` should rasterize with `render_png`, which runs inline on the
+    render thread, and publish the result itself. Renders submitted from a
+    thread complete in order; `wait_for_background_renders` waits for them.
+    """
+    if _render_inline():
+        render()
+        return
+    _STATE.pending.append(_get_executor().submit(render))
+
+
+def wait_for_background_renders() -> None:
+    """Wait for the background renders submitted from this thread."""
+    pending, _STATE.pending = _STATE.pending, []
+    for future in pending:
+        exception = future.exception()
+        if exception is not None:
+            LOGGER.warning("Failed to render figure: %s", exception)
+
+
+def _virtual_files_enabled(ctx: RuntimeContext) -> bool:
+    if not ctx.virtual_files_supported:
+        return False
+    # On by default; can be turned off with the `mpl_virtual_files`
+    # experimental flag
+    return bool(
+        ctx.marimo_config.get("experimental", {}).get(
+            "mpl_virtual_files", True
+        )
+    )
+
+
+def png_url(
+    data: bytes,
+    *,
+    context: Optional[RuntimeContext] = None,
+    cell_id: Optional[CellId_t] = None,
+) -> str:
+    """Return a URL for PNG bytes.
+
+    When the runtime supports virtual files, the bytes are served as a
+    virtual file tied to the cell that displays them (by default, the
+    running cell of the current context), which avoids inflating the output
+    message by a third with base64. Otherwise, or when the
+    `mpl_virtual_files` experimental flag is off, a data URL is returned.
+    """
+    if context is None:
+        context = safe_get_context()
+        if context is not None:
+            cell_id = context.cell_id
+    if (
+        context is not None
+        and cell_id is not None
+        and _virtual_files_enabled(context)
+    ):
+        from marimo._runtime.virtual_file import VirtualFileLifecycleItem
+
+        item = VirtualFileLifecycleItem(ext="png", buffer=data)
+        item.create(context)
+        context.cell_lifecycle_registry.inject(cell_id, item)
+        return item.virtual_file.url
+
+    return build_data_url(mimetype="image/png", data=base64.b64encode(data))
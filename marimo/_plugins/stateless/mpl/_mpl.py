@@ -455,11 +455,12 @@ def png_bytes(figure: Union[Figure, SubFigure, Axes]) -> bytes:
 
     from matplotlib.figure import Figure
 
-    buf = io.BytesIO()
+    from marimo._output.mpl_render import render_png
+
     if isinstance(figure, Figure):
-        figure.savefig(buf, format="png", bbox_inches="tight")
-    else:
-        figure.figure.canvas.print_figure(buf, format="png")
+        return base64.b64encode(render_png(figure))
+    buf = io.BytesIO()
+    figure.figure.canvas.print_figure(buf, format="png")
     return base64.b64encode(buf.getvalue())
 
 
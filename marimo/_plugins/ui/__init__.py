@@ -42,44 +42,103 @@ __all__ = [
     "text",
 ]
 
-from marimo._plugins.ui._impl.altair_chart import altair_chart
-from marimo._plugins.ui._impl.array import array
-from marimo._plugins.ui._impl.batch import batch
-from marimo._plugins.ui._impl.chat.chat import chat
-from marimo._plugins.ui._impl.data_editor import (
-    data_editor,
-    experimental_data_editor,
-)
-from marimo._plugins.ui._impl.data_explorer import data_explorer
-from marimo._plugins.ui._impl.dataframes.dataframe import dataframe
-from marimo._plugins.ui._impl.dates import (
-    date,
-    date_range,
-    datetime,
-)
-from marimo._plugins.ui._impl.dictionary import dictionary
-from marimo._plugins.ui._impl.file_browser import file_browser
-from marimo._plugins.ui._impl.from_anywidget import anywidget
-from marimo._plugins.ui._impl.from_panel import panel
-from marimo._plugins.ui._impl.input import (
-    button,
-    checkbox,
-    code_editor,
-    dropdown,
-    file,
-    form,
-    multiselect,
-    number,
-    radio,
-    range_slider,
-    slider,
-    text,
-    text_area,
-)
-from marimo._plugins.ui._impl.microphone import microphone
-from marimo._plugins.ui._impl.plotly import plotly
-from marimo._plugins.ui._impl.refresh import refresh
-from marimo._plugins.ui._impl.run_button import run_button
-from marimo._plugins.ui._impl.switch import switch
-from marimo._plugins.ui._impl.table import table
-from marimo._plugins.ui._impl.tabs import tabs
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from marimo._plugins.ui._impl.altair_chart import altair_chart
+    from marimo._plugins.ui._impl.array import array
+    from marimo._plugins.ui._impl.batch import batch
+    from marimo._plugins.ui._impl.chat.chat import chat
+    from marimo._plugins.ui._impl.data_editor import (
+        data_editor,
+        experimental_data_editor,
+    )
+    from marimo._plugins.ui._impl.data_explorer import data_explorer
+    from marimo._plugins.ui._impl.dataframes.dataframe import dataframe
+    from marimo._plugins.ui._impl.dates import (
+        date,
+        date_range,
+        datetime,
+    )
+    from marimo._plugins.ui._impl.dictionary import dictionary
+    from marimo._plugins.ui._impl.file_browser import file_browser
+    from marimo._plugins.ui._impl.from_anywidget import anywidget
+    from marimo._plugins.ui._impl.from_panel import panel
+    from marimo._plugins.ui._impl.input import (
+        button,
+        checkbox,
+        code_editor,
+        dropdown,
+        file,
+        form,
+        multiselect,
+        number,
+        radio,
+        range_slider,
+        slider,
+        text,
+        text_area,
+    )
+    from marimo._plugins.ui._impl.microphone import microphone
+    from marimo._plugins.ui._impl.plotly import plotly
+    from marimo._plugins.ui._impl.refresh import refresh
+    from marimo._plugins.ui._impl.run_button import run_button
+    from marimo._plugins.ui._impl.switch import switch
+    from marimo._plugins.ui._impl.table import table
+    from marimo._plugins.ui._impl.tabs import tabs
+
+# UI elements are imported on first access (PEP 562), so that importing
+# marimo's runtime doesn't import every element and its dependencies.
+#
+# Maps each element to the module it's defined in
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "altair_chart": "marimo._plugins.ui._impl.altair_chart",
+    "array": "marimo._plugins.ui._impl.array",
+    "batch": "marimo._plugins.ui._impl.batch",
+    "chat": "marimo._plugins.ui._impl.chat.chat",
+    "data_editor": "marimo._plugins.ui._impl.data_editor",
+    "experimental_data_editor": "marimo._plugins.ui._impl.data_editor",
+    "data_explorer": "marimo._plugins.ui._impl.data_explorer",
+    "dataframe": "marimo._plugins.ui._impl.dataframes.dataframe",
+    "date": "marimo._plugins.ui._impl.dates",
+    "date_range": "marimo._plugins.ui._impl.dates",
+    "datetime": "marimo._plugins.ui._impl.dates",
+    "dictionary": "marimo._plugins.ui._impl.dictionary",
+    "file_browser": "marimo._plugins.ui._impl.file_browser",
+    "anywidget": "marimo._plugins.ui._impl.from_anywidget",
+    "panel": "marimo._plugins.ui._impl.from_panel",
+    "button": "marimo._plugins.ui._impl.input",
+    "checkbox": "marimo._plugins.ui._impl.input",
+    "code_editor": "marimo._plugins.ui._impl.input",
+    "dropdown": "marimo._plugins.ui._impl.input",
+    "file": "marimo._plugins.ui._impl.input",
+    "form": "marimo._plugins.ui._impl.input",
+    "multiselect": "marimo._plugins.ui._impl.input",
+    "number": "marimo._plugins.ui._impl.input",
+    "radio": "marimo._plugins.ui._impl.input",
+    "range_slider": "marimo._plugins.ui._impl.input",
+    "slider": "marimo._plugins.ui._impl.input",
+    "text": "marimo._plugins.ui._impl.input",
+    "text_area": "marimo._plugins.ui._impl.input",
+    "microphone": "marimo._plugins.ui._impl.microphone",
+    "plotly": "marimo._plugins.ui._impl.plotly",
+    "refresh": "marimo._plugins.ui._impl.refresh",
+    "run_button": "marimo._plugins.ui._impl.run_button",
+    "switch": "marimo._plugins.ui._impl.switch",
+    "table": "marimo._plugins.ui._impl.table",
+    "tabs": "marimo._plugins.ui._impl.tabs",
+}
+
+
+def __getattr__(name: str) -> _typing.Any:
+    import importlib
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
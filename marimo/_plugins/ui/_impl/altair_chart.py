@@ -25,6 +25,11 @@ from marimo._messaging.mimetypes import KnownMimeType
 from marimo._output.hypertext import is_non_interactive
 from marimo._output.rich_help import mddoc
 from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._plugins.ui._impl.charts.altair_reduction import (
+    DEFAULT_MAX_POINTS,
+    ReducedChart,
+    reduce_chart,
+)
 from marimo._plugins.ui._impl.charts.altair_transformer import (
     register_transformers,
     sanitize_nan_infs,
@@ -40,6 +45,10 @@ from marimo._utils.narwhals_utils import (
 
 LOGGER = _loggers.marimo_logger()
 
+# Whether the note about reduced chart data has been shown; it is shown
+# once per process.
+_REDUCTION_NOTICE_SHOWN = False
+
 if TYPE_CHECKING:
     import altair
     import altair.vegalite
@@ -120,6 +129,20 @@ def _using_vegafusion() -> bool:
     return altair.data_transformers.active.startswith("vegafusion")  # type: ignore
 
 
+def _show_reduction_notice(reduced: ReducedChart) -> None:
+    """Tell the user, once, that a chart's data was reduced."""
+    global _REDUCTION_NOTICE_SHOWN
+    if _REDUCTION_NOTICE_SHOWN:
+        return
+    _REDUCTION_NOTICE_SHOWN = True
+    sys.stderr.write(
+        f"Note: chart data was reduced from {reduced.rows:,} to "
+        f"{len(reduced.data):,} rows before being sent to the browser; "
+        "selections still apply to the full data. "
+        "Pass max_points=None to mo.ui.altair_chart to plot every row.\n"
+    )
+
+
 def _combine_conditions_with_and(
     conditions: list[nw.Expr],
 ) -> Optional[nw.Expr]:
@@ -371,6 +394,14 @@ def _filter_dataframe(
     return undo_df(df)
 
 
+def _selects_by_index(selection: ChartSelection) -> bool:
+    """Whether a selection refers to points by their `_vgsid_`."""
+    return any(
+        isinstance(fields, dict) and "_vgsid_" in fields
+        for fields in selection.values()
+    )
+
+
 def _coerce_value(value: Any, dtype: Any) -> Any:
     import zoneinfo
 
@@ -516,6 +547,12 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         label (str, optional): Markdown label for the element. Defaults to "".
         on_change (Optional[Callable[[ChartDataType], None]], optional): Optional
             callback to run when this element's value changes. Defaults to None.
+        max_points (Optional[int], optional): Line charts, scatter plots, and
+            histograms whose data has more rows than this are reduced before
+            being sent to the browser: lines are downsampled, overlapping
+            points are thinned, and histograms are binned in Python.
+            Selections still resolve against the full data. None to always
+            send the full data. Defaults to 50,000.
     """
 
     name: Final[str] = "marimo-vega"
@@ -528,6 +565,7 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         *,
         label: str = "",
         on_change: Optional[Callable[[ChartDataType], None]] = None,
+        max_points: Optional[int] = DEFAULT_MAX_POINTS,
     ) -> None:
         DependencyManager.altair.require(why="to use `mo.ui.altair_chart`")
 
@@ -548,6 +586,16 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
                 f"Invalid type for chart: {type(chart)}; expected altair.Chart"
             )
 
+        # Send a reduced dataset for very large charts; vegafusion already
+        # evaluates the chart on the server.
+        self._reduced: Optional[ReducedChart] = None
+        if max_points is not None and not _using_vegafusion():
+            self._reduced = reduce_chart(chart, max_points)
+        if self._reduced is not None:
+            _show_reduction_notice(self._reduced)
+            chart = self._reduced.chart
+            original_chart = chart
+
         # Make full-width if no width is specified
         chart = maybe_make_full_width(chart)
 
@@ -636,7 +684,7 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             )
 
         self.dataframe: Optional[ChartDataType] = (
-            self._get_dataframe_from_chart(chart)
+            self._get_dataframe_from_chart(self._chart)
         )
 
         self._spec = vega_spec
@@ -658,9 +706,14 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
     # Override _mime_ to return an Altair spec in non-JS environments
     def _mime_(self) -> tuple[KnownMimeType, str]:
         if is_non_interactive():
+            chart = (
+                self._reduced.chart
+                if self._reduced is not None
+                else self._chart
+            )
             return (
                 get_chart_mimetype(spec_format="vega"),
-                chart_to_json(self._chart, validate=False),
+                chart_to_json(chart, validate=False),
             )
         return ("text/html", self.text)
 
@@ -722,6 +775,8 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         if not can_narwhalify(self.dataframe):
             return self.dataframe  # type: ignore
 
+        value = self._to_original_selection(value)
+
         # If we have transforms, we need to filter the dataframe
         # with those transforms, before applying the selection
         if _has_transforms(self._spec):
@@ -786,9 +841,36 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         """
         assert assert_can_narwhalify(df)
         return _filter_dataframe(
-            df, selection=self.selections, binned_fields=self._binned_fields
+            df,
+            selection=self._to_original_selection(self.selections),
+            binned_fields=self._binned_fields,
         )
 
+    def _to_original_selection(
+        self, selection: ChartSelection
+    ) -> ChartSelection:
+        """Map points selected by their index in the reduced data that was
+        sent to the rows of the original data."""
+        if self._reduced is None or not _selects_by_index(selection):
+            return selection
+        mapped: ChartSelection = {}
+        for channel, fields in selection.items():
+            if isinstance(fields, dict) and "_vgsid_" in fields:
+                try:
+                    # Vega is 1-indexed
+                    rows = [int(i) - 1 for i in fields["_vgsid_"]]
+                except (TypeError, ValueError):
+                    mapped[channel] = fields
+                    continue
+                fields = {
+                    **fields,
+                    "_vgsid_": [
+                        i + 1 for i in self._reduced.original_rows(rows)
+                    ],
+                }
+            mapped[channel] = fields
+        return mapped
+
     # Proxy all of altair's attributes
     def __getattr__(self, name: str) -> Any:
         return getattr(self._chart, name)
@@ -0,0 +1,525 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Server-side reduction of large Altair charts.
+
+A chart whose data has millions of rows is slow to serialize, transfer,
+and render, although the browser can show only so many marks. For simple
+single-view charts, we send a reduced dataset instead:
+
+- line, area, and trail charts are decimated per series with
+  largest-triangle-three-buckets (LTTB), which keeps peaks and troughs;
+- histograms (a binned field counted with `count()`) are binned here, so
+  only the bins are sent;
+- scatter plots keep one point per occupied cell of a grid at about
+  screen resolution, which keeps the outline and outliers of the data.
+
+The reduced rows are rows of the original data (or, for histograms, its
+bins), so interval selections, which are ranges of field values, still
+resolve against the full data. Point selections that refer to marks by
+their index in the data that was sent are mapped back to the rows of the
+original data that each mark stands for.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast
+
+import narwhals.stable.v2 as nw
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._utils.narwhals_utils import can_narwhalify
+
+if TYPE_CHECKING:
+    import altair
+    import numpy as np
+    import numpy.typing as npt
+
+LOGGER = _loggers.marimo_logger()
+
+# Charts with more rows than this are reduced
+DEFAULT_MAX_POINTS = 50_000
+# Points kept for a line chart, over all of its series
+LINE_POINTS = 5_000
+# Maximum cells along each axis of the grid used to thin scatter plots
+SCATTER_GRID = 250
+
+COUNT_FIELD = "__count"
+
+_LINE_MARKS = {"line", "area", "trail"}
+_POINT_MARKS = {"point", "circle", "square"}
+# Channels that split the data into series or groups
+_GROUP_CHANNELS = {
+    "color",
+    "fill",
+    "stroke",
+    "detail",
+    "shape",
+    "strokeDash",
+    "row",
+    "column",
+    "facet",
+}
+_POSITION_CHANNELS = {"x", "y"}
+
+
+@dataclass
+class ReducedChart:
+    """A chart whose data was reduced.
+
+    Attributes:
+        chart: The chart to display.
+        data: The reduced data.
+        method: How the data was reduced.
+        rows: Number of rows in the original data.
+        sources: For each row of the original data, the row of the reduced
+            data that stands for it, or -1 if none does.
+    """
+
+    chart: altair.Chart
+    data: Any
+    method: Literal["lttb", "bin", "grid"]
+    rows: int
+    sources: npt.NDArray[np.int64]
+
+    def original_rows(self, rows: list[int]) -> list[int]:
+        """Rows of the original data that the given reduced rows stand
+        for, in order."""
+        import numpy as np
+
+        return [int(i) for i in np.flatnonzero(np.isin(self.sources, rows))]
+
+
+def reduce_chart(
+    chart: altair.TopLevelMixin, max_points: int
+) -> Optional[ReducedChart]:
+    """Reduce the data of `chart` if it has more than `max_points` rows.
+
+    Returns None if the chart is small enough, or is not a chart that we
+    know how to reduce; the chart is then displayed as is.
+    """
+    import altair as alt
+
+    if not DependencyManager.numpy.has():
+        return None
+    if not isinstance(chart, alt.Chart):
+        # Layered, concatenated, and faceted charts
+        return None
+    if chart.transform is not alt.Undefined:
+        # Transforms need the full data
+        return None
+    data = chart.data
+    if isinstance(data, str) or not can_narwhalify(data):
+        return None
+    try:
+        df = nw.from_native(cast(Any, data), eager_only=True)
+    except TypeError:
+        return None
+    if len(df) <= max_points:
+        return None
+
+    mark = chart.mark if isinstance(chart.mark, str) else chart.mark.type
+    try:
+        encoding = chart.encoding.to_dict(
+            validate=False, context={"data": data}
+        )
+    except Exception as e:
+        LOGGER.debug("Not reducing chart: %s", e)
+        return None
+
+    try:
+        if mark in _LINE_MARKS:
+            return _reduce_line(chart, df, encoding)
+        if mark in _POINT_MARKS:
+            return _reduce_scatter(chart, df, encoding, max_points)
+        if mark == "bar":
+            return _reduce_histogram(chart, df, encoding)
+    except Exception as e:
+        # e.g. unsupported dtypes; show the full data instead
+        LOGGER.debug("Failed to reduce chart: %s", e)
+    return None
+
+
+def _field(channel: Any) -> Optional[str]:
+    if isinstance(channel, dict):
+        field = channel.get("field")
+        if isinstance(field, str):
+            return field
+    return None
+
+
+def _is_plain_field(channel: Any) -> bool:
+    """Whether a channel shows the values of a field as is."""
+    return (
+        _field(channel) is not None
+        and not channel.get("aggregate")
+        and not channel.get("bin")
+        and not channel.get("timeUnit")
+    )
+
+
+def _group_fields(encoding: dict[str, Any]) -> Optional[list[str]]:
+    """Fields that split the data into groups; None if the encoding
+    can't be reduced."""
+    fields: list[str] = []
+    for name, channel in encoding.items():
+        if name in _POSITION_CHANNELS:
+            continue
+        channels = channel if isinstance(channel, list) else [channel]
+        for item in channels:
+            if not isinstance(item, dict) or "field" not in item:
+                # Constant values, or "condition"s on selections
+                continue
+            if not _is_plain_field(item):
+                return None
+            if name in _GROUP_CHANNELS and item.get("type") in (
+                "nominal",
+                "ordinal",
+            ):
+                fields.append(item["field"])
+    return sorted(set(fields))
+
+
+def _numeric(df: nw.DataFrame[Any], field: str) -> npt.NDArray[np.float64]:
+    """The values of a numeric or temporal column, as floats."""
+    import numpy as np
+
+    column = df[field]
+    if column.dtype.is_temporal():
+        if column.dtype == nw.Date:
+            column = column.cast(nw.Datetime("us"))
+        column = column.dt.timestamp("us")
+    elif not column.dtype.is_numeric():
+        raise TypeError(f"Column {field!r} is not numeric")
+    return np.asarray(column.to_numpy(), dtype=np.float64)
+
+
+def _group_codes(
+    df: nw.DataFrame[Any], fields: list[str]
+) -> npt.NDArray[np.int64]:
+    """An integer per row identifying its group."""
+    import numpy as np
+
+    if not fields:
+        return np.zeros(len(df), dtype=np.int64)
+    # Hash-based, unlike sorting with np.unique; rows whose key has a null
+    # are put in one group.
+    keys = df.select(fields).unique().with_row_index("__code")
+    codes = (
+        df.select(fields)
+        .with_row_index("__row")
+        .join(keys, on=fields, how="left")
+        .sort("__row")["__code"]
+        .fill_null(-1)
+    )
+    return np.asarray(codes.to_numpy(), dtype=np.int64)
+
+
+def lttb(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], threshold: int
+) -> npt.NDArray[np.int64]:
+    """Indices of the points to keep with largest-triangle-three-buckets.
+
+    Points are in the order the line is drawn, usually sorted by `x`. The
+    first and last points are always kept.
+    """
+    import numpy as np
+
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the area of the triangles formed with the previously
+        # selected point and the average of the next bucket
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+
+def _position_fields(encoding: dict[str, Any]) -> Optional[tuple[str, str]]:
+    """The x and y fields, if both are plain numeric or temporal fields."""
+    fields: list[str] = []
+    for name in ("x", "y"):
+        field = _numeric_field(encoding.get(name))
+        if field is None:
+            return None
+        fields.append(field)
+    return fields[0], fields[1]
+
+
+def _numeric_field(channel: Any) -> Optional[str]:
+    """The field of a channel that shows a numeric or temporal field as
+    is."""
+    if not isinstance(channel, dict) or not _is_plain_field(channel):
+        return None
+    if channel.get("type") not in ("quantitative", "temporal"):
+        return None
+    return cast(str, channel["field"])
+
+
+def _take(
+    df: nw.DataFrame[Any], indices: npt.NDArray[np.int64]
+) -> tuple[nw.DataFrame[Any], npt.NDArray[np.int64]]:
+    """The rows at `indices`, in their original order, and the sources of
+    the original rows."""
+    import numpy as np
+
+    indices = np.sort(indices)
+    sources = np.full(len(df), -1, dtype=np.int64)
+    sources[indices] = np.arange(len(indices))
+    taken: nw.DataFrame[Any] = df[indices.tolist()]
+    return taken, sources
+
+
+def _reduce_line(
+    chart: altair.Chart, df: nw.DataFrame[Any], encoding: dict[str, Any]
+) -> Optional[ReducedChart]:
+    import numpy as np
+
+    fields = _position_fields(encoding)
+    groups = _group_fields(encoding)
+    if fields is None or groups is None:
+        return None
+    x = _numeric(df, fields[0])
+    y = _numeric(df, fields[1])
+    codes = _group_codes(df, groups)
+
+    # Points are connected in the order of the `order` channel, if any,
+    # and otherwise by x
+    sort_key = x
+    order_channel = encoding.get("order")
+    if isinstance(order_channel, dict) and "field" in order_channel:
+        order_field = _numeric_field(order_channel)
+        if order_field is None:
+            return None
+        sort_key = _numeric(df, order_field)
+        if order_channel.get("sort") == "descending":
+            sort_key = -sort_key
+
+    valid = np.flatnonzero(
+        np.isfinite(x) & np.isfinite(y) & ~np.isnan(sort_key)
+    )
+    # Sort by series, then as the line is drawn
+    order = valid[np.lexsort((sort_key[valid], codes[valid]))]
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    series = np.split(order, boundaries)
+
+    total = max(len(order), 1)
+    kept: list[Any] = []
+    for rows in series:
+        budget = max(3, round(LINE_POINTS * len(rows) / total))
+        kept.append(rows[lttb(x[rows], y[rows], budget)])
+    indices = np.concatenate(kept) if kept else np.array([], dtype=np.int64)
+    return _with_data(chart, df, *_take(df, indices), "lttb")
+
+
+def _reduce_scatter(
+    chart: altair.Chart,
+    df: nw.DataFrame[Any],
+    encoding: dict[str, Any],
+    max_points: int,
+) -> Optional[ReducedChart]:
+    import numpy as np
+
+    fields = _position_fields(encoding)
+    groups = _group_fields(encoding)
+    if fields is None or groups is None:
+        return None
+    x = _numeric(df, fields[0])
+    y = _numeric(df, fields[1])
+    codes = _group_codes(df, groups)
+
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(valid) == 0:
+        return None
+
+    # Keep about max_points points, whatever the number of groups
+    n_groups = len(np.unique(codes))
+    grid = max(10, min(SCATTER_GRID, math.isqrt(max_points // n_groups)))
+
+    def cell(values: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+        low, high = values.min(), values.max()
+        scale = grid / (high - low) if high > low else 0.0
+        return np.minimum(((values - low) * scale).astype(np.int64), grid - 1)
+
+    keys = (codes[valid] * grid + cell(x[valid])) * grid + cell(y[valid])
+    _, first = np.unique(keys, return_index=True)
+    return _with_data(chart, df, *_take(df, valid[first]), "grid")
+
+
+def bin_params(
+    extent: tuple[float, float],
+    *,
+    maxbins: int = 10,
+    base: float = 10,
+    divide: tuple[float, ...] = (5, 2),
+    minstep: float = 0,
+    step: Optional[float] = None,
+    nice: bool = True,
+) -> tuple[float, float, float]:
+    """`(start, stop, step)` of bins, as chosen by Vega's `bin`."""
+    low, high = extent
+    span = (high - low) or abs(low) or 1
+    logb = math.log(base)
+    if step is None:
+        level = math.ceil(math.log(maxbins) / logb)
+        step = max(minstep, base ** (round(math.log(span) / logb) - level))
+        while math.ceil(span / step) > maxbins:
+            step *= base
+        for div in divide:
+            v = step / div
+            if v >= minstep and span / v <= maxbins:
+                step = v
+
+    v = math.log(step)
+    precision = 0 if v >= 0 else int(-v / logb) + 1
+    eps = base ** (-precision - 1)
+    if nice:
+        v = math.floor(low / step + eps) * step
+        low = v - step if low < v else v
+        high = math.ceil(high / step) * step
+    return low, (low + step if high == low else high), step
+
+
+def _reduce_histogram(
+    chart: altair.Chart, df: nw.DataFrame[Any], encoding: dict[str, Any]
+) -> Optional[ReducedChart]:
+    import altair as alt
+    import numpy as np
+
+    # One position channel bins a field, the other counts records
+    binned = [
+        name
+        for name in _POSITION_CHANNELS
+        if isinstance(encoding.get(name), dict) and encoding[name].get("bin")
+    ]
+    if len(binned) != 1:
+        return None
+    bin_channel = binned[0]
+    count_channel = "y" if bin_channel == "x" else "x"
+    bin_encoding = encoding[bin_channel]
+    count_encoding = encoding.get(count_channel)
+    field = _field(bin_encoding)
+    if (
+        field is None
+        or bin_encoding.get("type") != "quantitative"
+        or bin_encoding.get("timeUnit")
+        or not isinstance(count_encoding, dict)
+        or count_encoding.get("aggregate") != "count"
+        or "field" in count_encoding
+        or f"{bin_channel}2" in encoding
+    ):
+        return None
+    options = bin_encoding["bin"]
+    options = {} if options is True else dict(options)
+    if options.get("binned") or options.get("steps"):
+        return None
+
+    groups = _group_fields(
+        {k: v for k, v in encoding.items() if k not in _POSITION_CHANNELS}
+    )
+    if groups is None:
+        return None
+
+    values = _numeric(df, field)
+    valid = np.isfinite(values)
+    if not valid.any():
+        return None
+    extent = options.get("extent") or (
+        float(values[valid].min()),
+        float(values[valid].max()),
+    )
+    start, stop, step = bin_params(
+        (float(extent[0]), float(extent[1])),
+        maxbins=options.get("maxbins", 10),
+        base=options.get("base", 10),
+        divide=tuple(options.get("divide", (5, 2))),
+        minstep=options.get("minstep", 0),
+        step=options.get("step"),
+        nice=options.get("nice", True),
+    )
+    # Values outside an explicit extent are not counted
+    valid &= (values >= start) & (values <= stop)
+    n_bins = max(1, math.ceil((stop - start) / step - 1e-9))
+    bins = np.minimum(((values - start) / step).astype(np.int64), n_bins - 1)
+
+    # Count rows per (group, bin)
+    codes = _group_codes(df, groups)[valid]
+    keys = codes * n_bins + bins[valid]
+    unique_keys, first, counts = np.unique(
+        keys, return_index=True, return_counts=True
+    )
+    bin_index = unique_keys % n_bins
+    rows = np.flatnonzero(valid)[first]
+    # Each counted row is drawn as the bar of its bin
+    sources = np.full(len(df), -1, dtype=np.int64)
+    sources[valid] = np.searchsorted(unique_keys, keys)
+
+    end_field = f"{field}_end"
+    columns: dict[str, Any] = {
+        field: start + bin_index * float(step),
+        end_field: start + (bin_index + 1) * float(step),
+        COUNT_FIELD: counts,
+    }
+    if groups:
+        representatives = df[rows.tolist()]
+        for group in groups:
+            columns[group] = representatives[group].to_list()
+    binned_data = nw.from_dict(columns, backend=nw.get_native_namespace(df))
+
+    new_encoding = dict(encoding)
+    new_encoding[bin_channel] = {
+        **{k: v for k, v in bin_encoding.items() if k != "bin"},
+        "bin": {"binned": True, "step": step},
+        "title": bin_encoding.get("title", field),
+    }
+    new_encoding[f"{bin_channel}2"] = {"field": end_field}
+    new_encoding[count_channel] = {
+        **{k: v for k, v in count_encoding.items() if k != "aggregate"},
+        "field": COUNT_FIELD,
+        "type": "quantitative",
+        "title": count_encoding.get("title", "Count of Records"),
+    }
+
+    reduced = chart.copy()
+    reduced.encoding = alt.FacetedEncoding.from_dict(
+        new_encoding, validate=False
+    )
+    return _with_data(reduced, df, binned_data, sources, "bin")
+
+
+def _with_data(
+    chart: altair.Chart,
+    df: nw.DataFrame[Any],
+    reduced: nw.DataFrame[Any],
+    sources: npt.NDArray[np.int64],
+    method: Literal["lttb", "bin", "grid"],
+) -> ReducedChart:
+    data = reduced.to_native()
+    chart = chart.copy()
+    chart.data = data
+    LOGGER.debug(
+        "Reduced chart data from %d to %d rows (%s)",
+        len(df),
+        len(reduced),
+        method,
+    )
+    return ReducedChart(
+        chart=chart, data=data, method=method, rows=len(df), sources=sources
+    )
@@ -5,13 +5,17 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Optional, cast
 
 from marimo._loggers import marimo_logger
+from marimo._runtime.virtual_file import VirtualFile, random_filename
 from marimo._types.ids import WidgetModelId
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from marimo._plugins.ui._impl.anywidget.types import (
         TypedModelMessagePayload,
     )
     from marimo._runtime.commands import ModelMessage
+    from marimo._runtime.context.types import RuntimeContext
 
 LOGGER = marimo_logger()
 
@@ -63,6 +67,10 @@ COMM_MESSAGE_NAME = "marimo_comm_msg"
 COMM_OPEN_NAME = "marimo_comm_open"
 COMM_CLOSE_NAME = "marimo_comm_close"
 
+# State buffers at least this large are sent out of band, as virtual files
+# served over HTTP, instead of base64-encoded inside the notification.
+OUT_OF_BAND_BUFFER_BYTES = 64 * 1024
+
 
 @dataclass
 class MessageBufferData:
@@ -102,6 +110,11 @@ class MarimoComm:
         self.target_name = target_name
         self.ui_element_id: Optional[str] = None
         self._publish_message_buffer: list[MessageBufferData] = []
+        # Virtual files holding out-of-band buffers, by top-level state key.
+        # Files replaced by a newer value are kept for one more update, in
+        # case the frontend hasn't fetched them yet.
+        self._buffer_files: dict[str, list[str]] = {}
+        self._retired_buffer_files: dict[str, list[str]] = {}
         # Store open args for deferred open
         self._deferred_open_args: Optional[
             tuple[DataType, MetadataType, BufferType, dict[str, object]]
@@ -175,6 +188,7 @@ class MarimoComm:
             metadata=metadata,
             buffers=buffers,
         )
+        self._remove_buffer_files()
         if not deleting:
             # If deleting, the comm can't be unregistered
             self.comm_manager.unregister_comm(self)
@@ -242,6 +256,7 @@ class MarimoComm:
 
         while self._publish_message_buffer:
             item = self._publish_message_buffer.pop(0)
+            buffers, buffer_urls = self._send_buffers_out_of_band(item)
 
             broadcast_notification(
                 UIElementMessageNotification(
@@ -250,10 +265,82 @@ class MarimoComm:
                     ui_element=self.ui_element_id,
                     model_id=item.model_id,
                     message=item.data,
-                    buffers=item.buffers,
+                    buffers=buffers,
+                    buffer_urls=buffer_urls,
                 ),
             )
 
+    def _send_buffers_out_of_band(
+        self, item: MessageBufferData
+    ) -> tuple[list[bytes], Optional[list[Optional[str]]]]:
+        """Move the large buffers of a state message into virtual files.
+
+        Returns the inline buffers, with an empty placeholder for each
+        buffer that was moved, and the URLs of the moved buffers (or None if
+        every buffer is inline). Custom messages are always sent inline:
+        they are replayed as-is, so their buffers would have to live as
+        long as the session.
+        """
+        if item.data.get("method") not in ("open", "update"):
+            return item.buffers, None
+        ctx = _virtual_file_context()
+        if ctx is None:
+            return item.buffers, None
+
+        buffer_paths: list[list[Any]] = item.data.get("buffer_paths") or []
+        # The frontend drops the previous value of every key this message
+        # sets, so their files are no longer needed
+        self._retire_buffer_files(
+            ctx,
+            set(item.data.get("state") or {}).union(
+                path[0] for path in buffer_paths if path
+            ),
+        )
+
+        buffers: list[bytes] = []
+        buffer_urls: list[Optional[str]] = []
+        for i, buffer in enumerate(item.buffers):
+            path = buffer_paths[i] if i < len(buffer_paths) else None
+            if (
+                not path
+                or memoryview(buffer).nbytes < OUT_OF_BAND_BUFFER_BYTES
+            ):
+                buffers.append(buffer)
+                buffer_urls.append(None)
+                continue
+            virtual_file = VirtualFile(random_filename("bin"), bytes(buffer))
+            ctx.virtual_file_registry.add(virtual_file, ctx)
+            self._buffer_files.setdefault(str(path[0]), []).append(
+                virtual_file.filename
+            )
+            buffers.append(b"")
+            buffer_urls.append(virtual_file.url)
+
+        if not any(buffer_urls):
+            return item.buffers, None
+        return buffers, buffer_urls
+
+    def _retire_buffer_files(
+        self, ctx: RuntimeContext, keys: Iterable[str]
+    ) -> None:
+        for key in keys:
+            _remove_virtual_files(ctx, self._retired_buffer_files.pop(key, []))
+            if key in self._buffer_files:
+                self._retired_buffer_files[key] = self._buffer_files.pop(key)
+
+    def _remove_buffer_files(self) -> None:
+        if not self._buffer_files and not self._retired_buffer_files:
+            return
+        ctx = _virtual_file_context()
+        if ctx is not None:
+            for files in (
+                *self._buffer_files.values(),
+                *self._retired_buffer_files.values(),
+            ):
+                _remove_virtual_files(ctx, files)
+        self._buffer_files.clear()
+        self._retired_buffer_files.clear()
+
     # This is the method that ipywidgets.widgets.Widget uses to respond to
     # client-side changes
     def on_msg(self, callback: MsgCallback) -> None:
@@ -281,3 +368,23 @@ class MarimoComm:
                 self.comm_id,
                 msg,
             )
+
+
+def _virtual_file_context() -> Optional[RuntimeContext]:
+    """The runtime context, if it can serve virtual files."""
+    from marimo._runtime.context import (
+        ContextNotInitializedError,
+        get_context,
+    )
+
+    try:
+        ctx = get_context()
+    except ContextNotInitializedError:
+        return None
+    return ctx if ctx.virtual_files_supported else None
+
+
+def _remove_virtual_files(ctx: RuntimeContext, filenames: list[str]) -> None:
+    for filename in filenames:
+        # Removal only needs the filename
+        ctx.virtual_file_registry.remove(VirtualFile(filename, b""))
@@ -18,6 +18,10 @@ from marimo._output.hypertext import is_non_interactive
 from marimo._output.rich_help import mddoc
 from marimo._plugins.core.web_component import JSONType
 from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._plugins.ui._impl.plotly_index import (
+    SelectionIndex,
+    points_in_polygon,
+)
 
 LOGGER = _loggers.marimo_logger()
 
@@ -34,10 +38,17 @@ if TYPE_CHECKING:
 #     "field1": [min, max],
 #     "field2": [min, max],
 #   },
+#   "lasso": {
+#     "x": float[],
+#     "y": float[],
+#   },
 #  "indices": int[],
 # }
 PlotlySelection = dict[str, JSONType]
 
+# Trace types whose points are resolved from range and lasso selections
+_SCATTER_TYPES = ("scatter", "scattergl")
+
 
 def _is_orderable_value(value: Any) -> bool:
     """Check if a value is orderable (numeric or datetime-like).
@@ -205,6 +216,11 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
 
         # Store figure for later use in _convert_value
         self._figure: go.Figure = figure
+        # Sorted coordinates, built on the first selection and reused by
+        # every later one
+        self._index: Optional[SelectionIndex] = (
+            SelectionIndex(figure) if DependencyManager.numpy.has() else None
+        )
         # Initialize selection data storage
         self._selection_data: PlotlySelection = {}
 
@@ -364,7 +380,7 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
         )
 
         has_scatter = any(
-            getattr(trace, "type", None) == "scatter"
+            getattr(trace, "type", None) in _SCATTER_TYPES
             for trace in self._figure.data
         )
 
@@ -372,7 +388,7 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
         # (Plotly only sends corner/edge points, not all cells)
         if has_heatmap and value.get("range"):
             _append_heatmap_cells_to_selection(
-                self._figure, self._selection_data
+                self._figure, self._selection_data, self._index
             )
 
         has_bar = any(
@@ -382,14 +398,16 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
 
         # For bar charts with a range selection, extract all bars in range
         if has_bar and value.get("range"):
-            _append_bar_items_to_selection(self._figure, self._selection_data)
+            _append_bar_items_to_selection(
+                self._figure, self._selection_data, self._index
+            )
 
         # For line/scatter charts with a range selection, extract all points in x-range
         # This handles mode='lines', mode='lines+markers', and mode='markers'
         # Plotly may not send point data for pure line charts, so we extract manually
-        if has_scatter and value.get("range"):
+        if has_scatter and (value.get("range") or value.get("lasso")):
             _append_scatter_points_to_selection(
-                self._figure, self._selection_data
+                self._figure, self._selection_data, self._index
             )
 
         # Check for map-based scatter traces (scattermap, scattermapbox, scattergeo)
@@ -413,7 +431,9 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
 
 
 def _append_heatmap_cells_to_selection(
-    figure: go.Figure, selection_data: dict[str, Any]
+    figure: go.Figure,
+    selection_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> None:
     """Append heatmap cells within the selection range to the selection data.
 
@@ -425,7 +445,7 @@ def _append_heatmap_cells_to_selection(
         return
 
     heatmap_cells = _extract_heatmap_cells_from_range(
-        figure, cast(dict[str, Any], range_value)
+        figure, cast(dict[str, Any], range_value), index
     )
     if heatmap_cells:
         # Append heatmap cells to existing points (e.g., scatter)
@@ -442,7 +462,9 @@ def _append_heatmap_cells_to_selection(
 
 
 def _extract_heatmap_cells_from_range(
-    figure: go.Figure, range_data: dict[str, Any]
+    figure: go.Figure,
+    range_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract heatmap cells that fall within a selection range."""
 
@@ -456,7 +478,9 @@ def _extract_heatmap_cells_from_range(
 
     # Use numpy fast path if available for better performance on large heatmaps
     if DependencyManager.numpy.has():
-        return _extract_heatmap_cells_numpy(figure, x_min, x_max, y_min, y_max)
+        return _extract_heatmap_cells_numpy(
+            figure, x_min, x_max, y_min, y_max, index
+        )
 
     return _extract_heatmap_cells_fallback(figure, x_min, x_max, y_min, y_max)
 
@@ -467,6 +491,7 @@ def _extract_heatmap_cells_numpy(
     x_max: float,
     y_min: float,
     y_max: float,
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract heatmap cells using numpy for O(selected) complexity."""
     import numpy as np
@@ -485,9 +510,9 @@ def _extract_heatmap_cells_numpy(
             continue
 
         # Convert to numpy arrays for vectorized operations
-        x_arr = np.asarray(x_data)
-        y_arr = np.asarray(y_data)
-        z_arr = np.asarray(z_data)
+        x_arr = _trace_array(index, trace_idx, "x", x_data)
+        y_arr = _trace_array(index, trace_idx, "y", y_data)
+        z_arr = _trace_array(index, trace_idx, "z", z_data)
 
         # Determine if axes are orderable (numeric or datetime-like)
         x_is_orderable = _is_orderable_axis(x_arr, x_min)
@@ -507,26 +532,28 @@ def _extract_heatmap_cells_numpy(
             _parse_datetime_bound(y_max) if y_is_orderable else y_max
         )
 
-        # Compute masks for valid indices
+        # Compute valid indices
         if x_is_orderable:
-            x_mask = (x_arr >= x_min_parsed) & (x_arr <= x_max_parsed)
+            x_idx = _indices_in_range(
+                index, trace_idx, "x", x_arr, x_min_parsed, x_max_parsed
+            )
         else:
             # Categorical: cell spans (index - 0.5) to (index + 0.5)
             # Strict overlap: x_max > cell_x_min and x_min < cell_x_max
             x_indices = np.arange(len(x_arr))
             x_mask = (x_max > x_indices - 0.5) & (x_min < x_indices + 0.5)
+            x_idx = np.where(x_mask)[0]
 
         if y_is_orderable:
-            y_mask = (y_arr >= y_min_parsed) & (y_arr <= y_max_parsed)
+            y_idx = _indices_in_range(
+                index, trace_idx, "y", y_arr, y_min_parsed, y_max_parsed
+            )
         else:
             # Categorical: cell spans (index - 0.5) to (index + 0.5)
             # Strict overlap: y_max > cell_y_min and y_min < cell_y_max
             y_indices = np.arange(len(y_arr))
             y_mask = (y_max > y_indices - 0.5) & (y_min < y_indices + 0.5)
-
-        # Get indices where masks are True
-        y_idx = np.where(y_mask)[0]
-        x_idx = np.where(x_mask)[0]
+            y_idx = np.where(y_mask)[0]
 
         # Iterate only over selected indices (O(selected) instead of O(n*m))
         for i in y_idx:
@@ -549,24 +576,33 @@ def _extract_heatmap_cells_numpy(
 
 
 def _append_scatter_points_to_selection(
-    figure: go.Figure, selection_data: dict[str, Any]
+    figure: go.Figure,
+    selection_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> None:
-    """Append scatter/line points within the selection range to the selection data.
+    """Append scatter/line points within the selection to the selection data.
 
     This modifies selection_data in place, appending any scatter/line points
-    that fall within the x-range to the existing points and indices.
+    that fall within the x-range (or inside the lasso) to the existing points
+    and indices.
 
     For line charts, Plotly may not send point-level data in the selection event
     (especially for mode='lines'). We manually extract all points where x is
     within the selected range to match Altair's behavior.
     """
     range_value = selection_data.get("range")
-    if not isinstance(range_value, dict):
+    lasso_value = selection_data.get("lasso")
+    if isinstance(range_value, dict):
+        scatter_points = _extract_scatter_points_from_range(
+            figure, cast(dict[str, Any], range_value), index
+        )
+    elif isinstance(lasso_value, dict) and index is not None:
+        scatter_points = _extract_scatter_points_from_lasso(
+            figure, cast(dict[str, Any], lasso_value), index
+        )
+    else:
         return
 
-    scatter_points = _extract_scatter_points_from_range(
-        figure, cast(dict[str, Any], range_value)
-    )
     if scatter_points:
         # Get existing points and indices
         existing_points = selection_data.get("points", [])
@@ -613,7 +649,9 @@ def _append_scatter_points_to_selection(
 
 
 def _extract_scatter_points_from_range(
-    figure: go.Figure, range_data: dict[str, Any]
+    figure: go.Figure,
+    range_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract scatter/line points that fall within a selection range.
 
@@ -628,7 +666,7 @@ def _extract_scatter_points_from_range(
 
     # Use numpy fast path if available for better performance
     if DependencyManager.numpy.has():
-        return _extract_scatter_points_numpy(figure, x_min, x_max)
+        return _extract_scatter_points_numpy(figure, x_min, x_max, index)
 
     return _extract_scatter_points_fallback(figure, x_min, x_max)
 
@@ -637,27 +675,17 @@ def _extract_scatter_points_numpy(
     figure: go.Figure,
     x_min: float,
     x_max: float,
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract scatter/line points using numpy for better performance."""
     import numpy as np
 
     selected_points: list[dict[str, Any]] = []
-
-    # Get axis titles for field naming
-    x_axes: list[go.layout.XAxis] = []
-    figure.for_each_xaxis(x_axes.append)
-    x_axis = x_axes[0] if len(x_axes) == 1 else None
-
-    y_axes: list[go.layout.YAxis] = []
-    figure.for_each_yaxis(y_axes.append)
-    y_axis = y_axes[0] if len(y_axes) == 1 else None
-
-    x_field = x_axis.title.text if (x_axis and x_axis.title.text) else "x"
-    y_field = y_axis.title.text if (y_axis and y_axis.title.text) else "y"
+    x_field, y_field = _scatter_field_names(figure)
 
     for trace_idx, trace in enumerate(figure.data):
         # Only process scatter traces (which includes lines, markers, lines+markers)
-        if getattr(trace, "type", None) != "scatter":
+        if getattr(trace, "type", None) not in _SCATTER_TYPES:
             continue
 
         x_data = getattr(trace, "x", None)
@@ -667,8 +695,8 @@ def _extract_scatter_points_numpy(
             continue
 
         # Convert to numpy arrays for vectorized operations
-        x_arr = np.asarray(x_data)
-        y_arr = np.asarray(y_data)
+        x_arr = _trace_array(index, trace_idx, "x", x_data)
+        y_arr = _trace_array(index, trace_idx, "y", y_data)
 
         # Check if x is orderable (numeric or datetime-like)
         x_is_orderable = _is_orderable_axis(x_arr, x_min)
@@ -683,45 +711,183 @@ def _extract_scatter_points_numpy(
 
         # Filter by x-range (matching Altair behavior)
         if x_is_orderable:
-            x_mask = (x_arr >= x_min_parsed) & (x_arr <= x_max_parsed)
+            selected_indices = _indices_in_range(
+                index, trace_idx, "x", x_arr, x_min_parsed, x_max_parsed
+            )
         else:
             # Categorical: use index-based filtering
             x_indices = np.arange(len(x_arr))
             x_mask = (x_max > x_indices - 0.5) & (x_min < x_indices + 0.5)
+            selected_indices = np.where(x_mask)[0]
+
+        selected_points.extend(
+            _scatter_points(
+                trace,
+                trace_idx,
+                x_arr,
+                y_arr,
+                selected_indices,
+                x_field,
+                y_field,
+            )
+        )
 
-        # Get indices where mask is True
-        selected_indices = np.where(x_mask)[0]
+    return selected_points
 
-        # Build point dicts for selected indices
-        for idx in selected_indices:
-            # Use .item() to convert numpy types to Python types
-            x_val = (
-                x_arr[idx].item()
-                if hasattr(x_arr[idx], "item")
-                else x_arr[idx]
-            )
-            y_val = (
-                y_arr[idx].item()
-                if hasattr(y_arr[idx], "item")
-                else y_arr[idx]
-            )
 
-            point_dict = {
-                x_field: x_val,
-                y_field: y_val,
-                "curveNumber": trace_idx,
-                "pointIndex": int(idx),
-            }
+def _extract_scatter_points_from_lasso(
+    figure: go.Figure,
+    lasso_data: dict[str, Any],
+    index: SelectionIndex,
+) -> list[dict[str, Any]]:
+    """Extract scatter/line points inside a lasso selection.
+
+    Only points with numeric x and y are matched. The lasso's bounding box is
+    looked up in the x index first, so the polygon test only runs on the
+    points near the lasso.
+    """
+    import numpy as np
+
+    try:
+        polygon_x = np.asarray(lasso_data.get("x") or [], dtype=float)
+        polygon_y = np.asarray(lasso_data.get("y") or [], dtype=float)
+    except (TypeError, ValueError):
+        # Datetime or categorical axes
+        return []
+    if len(polygon_x) < 3 or len(polygon_x) != len(polygon_y):
+        return []
+
+    selected_points: list[dict[str, Any]] = []
+    x_field, y_field = _scatter_field_names(figure)
+
+    for trace_idx, trace in enumerate(figure.data):
+        if getattr(trace, "type", None) not in _SCATTER_TYPES:
+            continue
+        if (
+            getattr(trace, "x", None) is None
+            or getattr(trace, "y", None) is None
+        ):
+            continue
+
+        x_axis = index.axis(trace_idx, "x")
+        y_arr = index.array(trace_idx, "y")
+        if x_axis is None or not np.issubdtype(y_arr.dtype, np.number):
+            continue
+        x_arr = index.array(trace_idx, "x")
+        if not np.issubdtype(x_arr.dtype, np.number):
+            continue
 
-            # Add trace name if available
-            if hasattr(trace, "name") and trace.name:
-                point_dict["name"] = trace.name
+        candidates = x_axis.between(polygon_x.min(), polygon_x.max())
+        if candidates is None or len(candidates) == 0:
+            continue
+        y_candidates = y_arr[candidates]
+        candidates = candidates[
+            (y_candidates >= polygon_y.min())
+            & (y_candidates <= polygon_y.max())
+        ]
+        inside = points_in_polygon(
+            x_arr[candidates], y_arr[candidates], polygon_x, polygon_y
+        )
 
-            selected_points.append(point_dict)
+        selected_points.extend(
+            _scatter_points(
+                trace,
+                trace_idx,
+                x_arr,
+                y_arr,
+                candidates[inside],
+                x_field,
+                y_field,
+            )
+        )
 
     return selected_points
 
 
+def _scatter_field_names(figure: go.Figure) -> tuple[str, str]:
+    """Field names for scatter points, taken from the axis titles."""
+    x_axes: list[go.layout.XAxis] = []
+    figure.for_each_xaxis(x_axes.append)
+    x_axis = x_axes[0] if len(x_axes) == 1 else None
+
+    y_axes: list[go.layout.YAxis] = []
+    figure.for_each_yaxis(y_axes.append)
+    y_axis = y_axes[0] if len(y_axes) == 1 else None
+
+    x_field = x_axis.title.text if (x_axis and x_axis.title.text) else "x"
+    y_field = y_axis.title.text if (y_axis and y_axis.title.text) else "y"
+    return x_field, y_field
+
+
+def _scatter_points(
+    trace: Any,
+    trace_idx: int,
+    x_arr: Any,
+    y_arr: Any,
+    selected_indices: Any,
+    x_field: str,
+    y_field: str,
+) -> list[dict[str, Any]]:
+    """Build point dicts for the selected indices of a scatter trace."""
+    points: list[dict[str, Any]] = []
+    for idx in selected_indices:
+        # Use .item() to convert numpy types to Python types
+        x_val = (
+            x_arr[idx].item() if hasattr(x_arr[idx], "item") else x_arr[idx]
+        )
+        y_val = (
+            y_arr[idx].item() if hasattr(y_arr[idx], "item") else y_arr[idx]
+        )
+
+        point_dict = {
+            x_field: x_val,
+            y_field: y_val,
+            "curveNumber": trace_idx,
+            "pointIndex": int(idx),
+        }
+
+        # Add trace name if available
+        if hasattr(trace, "name") and trace.name:
+            point_dict["name"] = trace.name
+
+        points.append(point_dict)
+    return points
+
+
+def _trace_array(
+    index: Optional[SelectionIndex], trace_idx: int, attr: str, data: Any
+) -> Any:
+    """A trace attribute as a numpy array, cached on the index if given."""
+    import numpy as np
+
+    if index is None:
+        return np.asarray(data)
+    return index.array(trace_idx, attr)
+
+
+def _indices_in_range(
+    index: Optional[SelectionIndex],
+    trace_idx: int,
+    attr: str,
+    arr: Any,
+    lo: Any,
+    hi: Any,
+) -> Any:
+    """Ascending indices of the values of an orderable axis in `[lo, hi]`.
+
+    Uses a binary search on the sorted axis when an index is available, and
+    an elementwise comparison otherwise (e.g., for object arrays of datetimes).
+    """
+    import numpy as np
+
+    axis = index.axis(trace_idx, attr) if index is not None else None
+    if axis is not None:
+        found = axis.between(lo, hi)
+        if found is not None:
+            return found
+    return np.where((arr >= lo) & (arr <= hi))[0]
+
+
 def _extract_scatter_points_fallback(
     figure: go.Figure,
     x_min: float,
@@ -744,7 +910,7 @@ def _extract_scatter_points_fallback(
 
     for trace_idx, trace in enumerate(figure.data):
         # Only process scatter traces (which includes lines, markers, lines+markers)
-        if getattr(trace, "type", None) != "scatter":
+        if getattr(trace, "type", None) not in _SCATTER_TYPES:
             continue
 
         x_data = getattr(trace, "x", None)
@@ -861,7 +1027,9 @@ def _extract_heatmap_cells_fallback(
 
 
 def _append_bar_items_to_selection(
-    figure: go.Figure, selection_data: dict[str, Any]
+    figure: go.Figure,
+    selection_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> None:
     """Append bars within the selection range to the selection data.
 
@@ -873,7 +1041,7 @@ def _append_bar_items_to_selection(
         return
 
     bar_items = _extract_bars_from_range(
-        figure, cast(dict[str, Any], range_value)
+        figure, cast(dict[str, Any], range_value), index
     )
     if bar_items:
         # Append bar items to existing points (e.g., scatter)
@@ -890,7 +1058,9 @@ def _append_bar_items_to_selection(
 
 
 def _extract_bars_from_range(
-    figure: go.Figure, range_data: dict[str, Any]
+    figure: go.Figure,
+    range_data: dict[str, Any],
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract bars that fall within a selection range."""
 
@@ -904,7 +1074,7 @@ def _extract_bars_from_range(
 
     # Use numpy fast path if available for better performance on large datasets
     if DependencyManager.numpy.has():
-        return _extract_bars_numpy(figure, x_min, x_max, y_min, y_max)
+        return _extract_bars_numpy(figure, x_min, x_max, y_min, y_max, index)
 
     return _extract_bars_fallback(figure, x_min, x_max, y_min, y_max)
 
@@ -915,6 +1085,7 @@ def _extract_bars_numpy(
     x_max: float,
     y_min: float,
     y_max: float,
+    index: Optional[SelectionIndex] = None,
 ) -> list[dict[str, Any]]:
     """Extract bars using numpy for O(selected) complexity."""
     import numpy as np
@@ -937,8 +1108,8 @@ def _extract_bars_numpy(
             orientation = "v"
 
         # Convert to numpy arrays for vectorized operations
-        x_arr = np.asarray(x_data)
-        y_arr = np.asarray(y_data)
+        x_arr = _trace_array(index, trace_idx, "x", x_data)
+        y_arr = _trace_array(index, trace_idx, "y", y_data)
 
         # For vertical bars: filter by x-axis position
         # For horizontal bars: filter by y-axis position (swap roles)
@@ -946,12 +1117,14 @@ def _extract_bars_numpy(
             # Vertical bars: x-axis determines which bars are selected
             # y-axis is the value (we don't filter by it, similar to Altair)
             position_data = x_arr
+            position_attr = "x"
             value_data = y_arr
             pos_min, pos_max = x_min, x_max
         else:  # orientation == "h"
             # Horizontal bars: y-axis determines which bars are selected
             # x-axis is the value
             position_data = y_arr
+            position_attr = "y"
             value_data = x_arr
             pos_min, pos_max = y_min, y_max
 
@@ -966,13 +1139,18 @@ def _extract_bars_numpy(
             _parse_datetime_bound(pos_max) if pos_is_orderable else pos_max
         )
 
-        # Compute mask for valid indices
+        # Compute valid indices
         if pos_is_orderable:
             # Orderable axis: direct range comparison
             # TODO: Consider bar width in future implementations
             # Currently treating bars as points at their position value
-            pos_mask = (position_data >= pos_min_parsed) & (
-                position_data <= pos_max_parsed
+            selected_indices = _indices_in_range(
+                index,
+                trace_idx,
+                position_attr,
+                position_data,
+                pos_min_parsed,
+                pos_max_parsed,
             )
         else:
             # Categorical axis: each bar spans (index - 0.5) to (index + 0.5)
@@ -981,9 +1159,7 @@ def _extract_bars_numpy(
             pos_mask = (pos_max > pos_indices - 0.5) & (
                 pos_min < pos_indices + 0.5
             )
-
-        # Get indices where mask is True
-        selected_indices = np.where(pos_mask)[0]
+            selected_indices = np.where(pos_mask)[0]
 
         # Iterate only over selected indices
         for i in selected_indices:
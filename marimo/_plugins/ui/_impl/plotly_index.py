@@ -0,0 +1,100 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Cached lookups for resolving plotly selections.
+
+Brushing a large figure sends a new range (or lasso) on every gesture.
+Instead of comparing every point of every trace against the selection, the
+indexes here sort each trace's coordinates once and answer range queries
+with a binary search, so a selection costs time proportional to the number
+of points it contains.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import plotly.graph_objects as go  # type:ignore
+
+
+class AxisIndex:
+    """A sorted view of one numeric or datetime coordinate array."""
+
+    def __init__(self, values: np.ndarray) -> None:
+        import numpy as np
+
+        self._order = np.argsort(values, kind="stable")
+        self._sorted = values[self._order]
+
+    def between(self, lo: Any, hi: Any) -> Optional[np.ndarray]:
+        """Positions of the values in `[lo, hi]`, in ascending order.
+
+        Returns `None` if the bounds cannot be compared with the values, so
+        callers can fall back to an elementwise comparison.
+        """
+        import numpy as np
+
+        try:
+            start = np.searchsorted(self._sorted, lo, side="left")
+            stop = np.searchsorted(self._sorted, hi, side="right")
+        except (TypeError, ValueError):
+            return None
+        if stop <= start:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(self._order[start:stop])
+
+
+class SelectionIndex:
+    """Per-figure cache of trace coordinates and their axis indexes.
+
+    Arrays and indexes are built the first time a trace is queried, so
+    figures that are never selected from don't pay for sorting.
+    """
+
+    def __init__(self, figure: go.Figure) -> None:
+        self._figure = figure
+        self._arrays: dict[tuple[int, str], np.ndarray] = {}
+        self._axes: dict[tuple[int, str], Optional[AxisIndex]] = {}
+
+    def array(self, trace_idx: int, attr: str) -> np.ndarray:
+        """The coordinates `attr` of trace `trace_idx` as a numpy array."""
+        import numpy as np
+
+        key = (trace_idx, attr)
+        if key not in self._arrays:
+            trace = self._figure.data[trace_idx]
+            self._arrays[key] = np.asarray(getattr(trace, attr))
+        return self._arrays[key]
+
+    def axis(self, trace_idx: int, attr: str) -> Optional[AxisIndex]:
+        """A sorted index over `attr`, or `None` if it isn't numeric."""
+        import numpy as np
+
+        key = (trace_idx, attr)
+        if key not in self._axes:
+            values = self.array(trace_idx, attr)
+            orderable = values.ndim == 1 and (
+                np.issubdtype(values.dtype, np.number)
+                or np.issubdtype(values.dtype, np.datetime64)
+            )
+            self._axes[key] = AxisIndex(values) if orderable else None
+        return self._axes[key]
+
+
+def points_in_polygon(
+    x: np.ndarray, y: np.ndarray, polygon_x: np.ndarray, polygon_y: np.ndarray
+) -> np.ndarray:
+    """Mask of the points inside a polygon, by the even-odd rule."""
+    import numpy as np
+
+    inside = np.zeros(len(x), dtype=bool)
+    j = len(polygon_x) - 1
+    for i in range(len(polygon_x)):
+        xi, yi = polygon_x[i], polygon_y[i]
+        xj, yj = polygon_x[j], polygon_y[j]
+        crosses = (yi > y) != (yj > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = (xj - xi) * (y - yi) / (yj - yi) + xi
+        inside ^= crosses & (x < x_cross)
+        j = i
+    return inside
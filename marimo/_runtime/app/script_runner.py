@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from marimo._ast.names import SETUP_CELL_NAME
@@ -30,9 +31,20 @@ from marimo._runtime.patches import (
 from marimo._types.ids import CellId_t
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from marimo._ast.app import InternalApp
 
 
+def _close_matplotlib_figures() -> None:
+    # Figures only exist once pyplot is imported; don't import matplotlib
+    # for notebooks that don't use it
+    if "matplotlib.pyplot" in sys.modules:
+        from marimo._output.mpl import close_figures
+
+        close_figures()
+
+
 class AppScriptRunner:
     """Runs an app in a script context."""
 
@@ -41,11 +53,13 @@ class AppScriptRunner:
         app: InternalApp,
         filename: str | None,
         glbls: Optional[dict[str, Any]] = None,
+        targets: Optional[Collection[str]] = None,
     ) -> None:
         self.app = app
         self.filename = filename
         self.cells_cancelled: set[CellId_t] = set()
         self._glbls = glbls if glbls else {}
+        self._targets = list(targets) if targets is not None else None
 
         # Setup cell cannot be overridden, and it's possible that some
         # variables are not defined, so ignore it.
@@ -62,8 +76,48 @@ class AppScriptRunner:
             if app.cell_manager.cell_data_at(cid).cell is not None
             and not self.app.graph.is_disabled(cid)
         ]
+        if self._targets is not None:
+            required = self._required_cells(
+                self._targets, set(pruned_execution_order)
+            )
+            self.cells_to_run = [
+                cid for cid in self.cells_to_run if cid in required
+            ]
         self._executor = get_executor(ExecutionConfig())
 
+    def _required_cells(
+        self, targets: list[str], scheduled: set[CellId_t]
+    ) -> set[CellId_t]:
+        """The cells that must run to compute `targets`.
+
+        These are the cells defining the targets and their ancestors,
+        stopping at cells whose definitions are overridden.
+        """
+        graph = self.app.graph
+        roots: set[CellId_t] = set()
+        for name in targets:
+            if name in self._glbls:
+                continue
+            defining_cells = graph.get_defining_cells(name)
+            if not defining_cells:
+                raise NameError(
+                    f"name '{name}' is not defined by any cell in the app"
+                )
+            if any(graph.is_disabled(cid) for cid in defining_cells):
+                raise NameError(
+                    f"name '{name}' is defined by a disabled cell, "
+                    "or a cell that depends on one"
+                )
+            roots |= defining_cells
+
+        def parents(cell_id: CellId_t, children: bool) -> set[CellId_t]:
+            del children
+            return graph.parents[cell_id] & scheduled
+
+        return dataflow.transitive_closure(
+            graph, roots, children=False, relatives=parents
+        )
+
     def _cancel(self, cell_id: CellId_t) -> None:
         cancelled = set(
             cid
@@ -202,9 +256,7 @@ class AppScriptRunner:
 
             post_execute_hooks = []
             if DependencyManager.matplotlib.has():
-                from marimo._output.mpl import close_figures
-
-                post_execute_hooks.append(close_figures)
+                post_execute_hooks.append(_close_matplotlib_figures)
 
             if is_async:
                 outputs, defs = asyncio.run(
@@ -216,6 +268,15 @@ class AppScriptRunner:
                 outputs, defs = self._run_synchronous(
                     post_execute_hooks=post_execute_hooks,
                 )
+            if self._targets is not None:
+                # e.g. a cell that defines a target was stopped with
+                # mo.stop
+                missing = [name for name in self._targets if name not in defs]
+                if missing:
+                    raise NameError(
+                        "The app finished without defining "
+                        + ", ".join(f"'{name}'" for name in missing)
+                    )
             return outputs, defs
 
         # Cell runner manages the exception handling for kernel
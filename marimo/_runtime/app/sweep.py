@@ -0,0 +1,317 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Run a notebook over many sets of parameters.
+
+Parameters are definitions passed as overrides, as in
+`app.run(defs=...)`. Cells that don't depend on any parameter run once;
+each run starts from their definitions and executes only the cells
+downstream of the parameters.
+
+Runs can be spread over worker processes. The parameter-independent
+cells run once, in the calling process, and their definitions are
+pickled and sent to each worker when it starts. A cell whose definitions
+can't be pickled (or unpickled in a worker) is instead run again in each
+worker, from the definitions of the cells before it. Workers are started
+fresh (with `forkserver` where available, else `spawn`) rather than
+forked from a process that may be running threads. Objects created by
+parameter-independent cells are shared by the runs in a worker, so runs
+should not mutate them.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from marimo import _loggers
+from marimo._ast.app import App, InternalApp
+from marimo._runtime import dataflow
+from marimo._runtime.app.script_runner import AppScriptRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator, Sequence
+    from pathlib import Path
+
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+
+@dataclass
+class SweepResult:
+    """The outcome of running a notebook with one set of parameters.
+
+    Attributes:
+        index: Position of the parameters in the sweep.
+        params: The parameters.
+        defs: The collected definitions; empty if the run failed.
+        error: A description of the exception that failed the run.
+    """
+
+    index: int
+    params: dict[str, Any]
+    defs: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def load_notebook(path: str | Path) -> App:
+    """Import a notebook file, running its setup cell."""
+    from marimo._ast.load import _dynamic_load
+
+    app = _dynamic_load(path)
+    if app is None:
+        raise ValueError(f"{path} does not define a marimo app.")
+    return app
+
+
+def parameter_dependent_cells(
+    graph: dataflow.DirectedGraph, parameters: Collection[str]
+) -> set[CellId_t]:
+    """Cells that define or use a parameter, and their descendants."""
+    roots: set[CellId_t] = set()
+    for name in parameters:
+        roots |= graph.get_defining_cells(name)
+        roots |= graph.get_referring_cells(name, language="python")
+    return dataflow.transitive_closure(graph, roots)
+
+
+class _Sweep:
+    """A notebook whose parameter-independent cells have run."""
+
+    def __init__(
+        self,
+        app: App,
+        parameters: Collection[str],
+        outputs: Optional[Sequence[str]] = None,
+        prefix: Optional[dict[CellId_t, dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Args:
+            app: The notebook.
+            parameters: Names of the parameters.
+            outputs: Names of the definitions to collect.
+            prefix: Definitions of parameter-independent cells that have
+                already run elsewhere, by cell; these cells aren't run.
+        """
+        app._maybe_initialize()
+        self.app = app
+        self.outputs = list(outputs) if outputs is not None else None
+
+        graph = InternalApp(app).graph
+        self.dependent = parameter_dependent_cells(graph, parameters)
+        self.collected = self.outputs or sorted(
+            {name for cid in self.dependent for name in graph.cells[cid].defs}
+        )
+        # Definitions of each parameter-independent cell
+        self.cell_defs: dict[CellId_t, dict[str, Any]] = {}
+        self.prefix_defs = self._run_prefix(prefix or {})
+
+    def _setup_defs(self) -> dict[str, Any]:
+        if self.app._setup is None:
+            return {}
+        return {**self.app._setup._glbls}
+
+    def _run_prefix(
+        self, done: dict[CellId_t, dict[str, Any]]
+    ) -> dict[str, Any]:
+        internal = InternalApp(self.app)
+        runner = AppScriptRunner(
+            internal, filename=self.app._filename, glbls=self._setup_defs()
+        )
+        prefix = [
+            cid for cid in runner.cells_to_run if cid not in self.dependent
+        ]
+        if done:
+            glbls = self._setup_defs()
+            for defs in done.values():
+                glbls.update(defs)
+            # Cells that define these are pruned as overridden; the
+            # schedule is set below either way
+            runner = AppScriptRunner(
+                internal, filename=self.app._filename, glbls=glbls
+            )
+        runner.cells_to_run = [cid for cid in prefix if cid not in done]
+        _, glbls = runner.run()
+
+        defs = self._setup_defs()
+        for cid in prefix:
+            if cid in done:
+                self.cell_defs[cid] = done[cid]
+                defs.update(done[cid])
+                continue
+            names = internal.graph.cells[cid].defs
+            # A cell that was stopped or defines names conditionally is
+            # left out; cells that need its definitions will fail.
+            if all(name in glbls for name in names):
+                self.cell_defs[cid] = {name: glbls[name] for name in names}
+                defs.update(self.cell_defs[cid])
+        return defs
+
+    def pickle_prefix(self) -> dict[CellId_t, bytes]:
+        """The definitions of the parameter-independent cells that can be
+        pickled, by cell."""
+        pickled: dict[CellId_t, bytes] = {}
+        for cid, defs in self.cell_defs.items():
+            try:
+                pickled[cid] = pickle.dumps(defs)
+            except Exception as e:
+                LOGGER.debug(
+                    "Cell %s will run in each worker; its definitions "
+                    "can't be pickled: %s",
+                    cid,
+                    e,
+                )
+        return pickled
+
+    def run(self, index: int, params: dict[str, Any]) -> SweepResult:
+        result = SweepResult(index=index, params=params)
+        try:
+            runner = AppScriptRunner(
+                InternalApp(self.app),
+                filename=self.app._filename,
+                glbls={**self.prefix_defs, **params},
+                targets=self.outputs,
+            )
+            runner.cells_to_run = [
+                cid for cid in runner.cells_to_run if cid in self.dependent
+            ]
+            _, glbls = runner.run()
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            return result
+
+        result.defs = {
+            name: glbls[name] for name in self.collected if name in glbls
+        }
+        return result
+
+
+@dataclass(frozen=True)
+class _SweepSpec:
+    """What a worker process needs to set up a sweep."""
+
+    filename: str
+    parameters: tuple[str, ...]
+    outputs: Optional[tuple[str, ...]]
+
+
+# The sweep of a worker process
+_WORKER_SWEEP: Optional[_Sweep] = None
+
+
+def _init_worker(spec: _SweepSpec, prefix: dict[CellId_t, bytes]) -> None:
+    global _WORKER_SWEEP
+    done: dict[CellId_t, dict[str, Any]] = {}
+    for cid, payload in prefix.items():
+        try:
+            done[cid] = pickle.loads(payload)
+        except Exception as e:
+            # e.g. an instance of a class defined in the notebook
+            LOGGER.debug("Running cell %s in worker: %s", cid, e)
+    _WORKER_SWEEP = _Sweep(
+        load_notebook(spec.filename), spec.parameters, spec.outputs, done
+    )
+
+
+def _run_in_worker(index: int, params: dict[str, Any]) -> bytes:
+    assert _WORKER_SWEEP is not None
+    return _dumps(_WORKER_SWEEP.run(index, params))
+
+
+def _picklable(value: Any) -> Any:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return repr(value)
+    return value
+
+
+def _dumps(result: SweepResult) -> bytes:
+    try:
+        return pickle.dumps(result)
+    except Exception:
+        # e.g. a module or a lambda; send back its repr instead
+        result.defs = {
+            name: _picklable(value) for name, value in result.defs.items()
+        }
+        return pickle.dumps(result)
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    # Forking a process with running threads (e.g. a server's) can
+    # deadlock the child, so workers are started from a clean process
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def run_sweep(
+    app: App,
+    params: Sequence[dict[str, Any]],
+    *,
+    jobs: int = 1,
+    outputs: Optional[Sequence[str]] = None,
+) -> Iterator[SweepResult]:
+    """Run `app` once per set of parameters.
+
+    Args:
+        app: The notebook.
+        params: Definitions to override for each run.
+        jobs: Number of worker processes; runs in this process if 1.
+        outputs: Names of the definitions to collect, as in
+            `app.run(outputs=...)`. Defaults to all definitions of the
+            cells that depend on the parameters.
+
+    Returns:
+        An iterator of results, in the order of `params`. A run that
+        raises is reported with `error` set rather than stopping the
+        sweep; errors in parameter-independent cells are raised.
+    """
+    for p in params:
+        if not isinstance(p, dict):
+            raise TypeError(
+                f"Parameters must be dicts of definitions, got {type(p)}."
+            )
+    parameters = sorted({name for p in params for name in p})
+    parallel = jobs > 1 and len(params) > 1
+    if parallel and app._filename is None:
+        raise ValueError(
+            "Running a sweep in parallel requires the notebook to be "
+            "loaded from a file."
+        )
+    return _results(app, params, parameters, jobs=jobs, outputs=outputs)
+
+
+def _results(
+    app: App,
+    params: Sequence[dict[str, Any]],
+    parameters: list[str],
+    *,
+    jobs: int,
+    outputs: Optional[Sequence[str]],
+) -> Iterator[SweepResult]:
+    sweep = _Sweep(app, parameters, outputs)
+    if jobs <= 1 or len(params) <= 1:
+        for index, p in enumerate(params):
+            yield sweep.run(index, p)
+        return
+
+    assert app._filename is not None
+    LOGGER.debug("Running %d sweep runs on %d workers", len(params), jobs)
+    spec = _SweepSpec(
+        filename=app._filename,
+        parameters=tuple(parameters),
+        outputs=tuple(outputs) if outputs is not None else None,
+    )
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+        initargs=(spec, sweep.pickle_prefix()),
+    ) as executor:
+        for payload in executor.map(
+            _run_in_worker, range(len(params)), params
+        ):
+            yield pickle.loads(payload)
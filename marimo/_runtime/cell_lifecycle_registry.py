@@ -18,9 +18,9 @@ class CellLifecycleRegistry:
 
         Prefer using `add` to add lifecycle items.
         """
-        if cell_id not in self.registry:
-            self.registry[cell_id] = set()
-        self.registry[cell_id].add(item)
+        # setdefault, since matplotlib figures are added from the render
+        # thread while the cell runs
+        self.registry.setdefault(cell_id, set()).add(item)
 
     def add(self, item: CellLifecycleItem) -> None:
         """Add a lifecycle item for the currently running cell.
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
 
     from marimo._ast.app import InternalApp
     from marimo._messaging.types import Stream
+    from marimo._runtime.runner.metadata_worker import MetadataWorker
     from marimo._runtime.runtime import Kernel
     from marimo._runtime.state import State
     from marimo._types.ids import CellId_t
@@ -64,6 +65,10 @@ class KernelRuntimeContext(RuntimeContext):
     def marimo_config(self) -> MarimoConfig:
         return self._kernel.user_config
 
+    @property
+    def metadata_worker(self) -> MetadataWorker:
+        return self._kernel.metadata_worker
+
     @property
     def lazy(self) -> bool:
         return self._kernel.lazy()
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Callable, Optional
 import msgspec
 
 from marimo import _loggers
+from marimo._cli.sandbox_cache import mark_modified
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.notification import AlertNotification
 from marimo._messaging.notification_utils import broadcast_notification
@@ -103,6 +104,9 @@ class PackageManager(abc.ABC):
         Returns True if installation succeeded, else False.
         """
         self._attempted_packages.add(package)
+        # A sandbox environment shared with other notebooks must not be
+        # handed out again once its packages change
+        mark_modified(sys.prefix)
         return await self._install(
             append_version(package, version),
             upgrade=upgrade,
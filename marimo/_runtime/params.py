@@ -35,7 +35,13 @@ if TYPE_CHECKING:
 class QueryParams(State[SerializedQueryParams]):
     """Query parameters for a marimo app."""
 
-    IGNORED_KEYS = {"access_token", "refresh_token", "session_id"}
+    IGNORED_KEYS = {
+        "access_token",
+        "refresh_token",
+        "session_id",
+        "wire_format",
+        "wire_compression",
+    }
 
     def __init__(
         self,
@@ -0,0 +1,68 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from marimo._session.queue import QueueType
+
+LOGGER = _loggers.marimo_logger()
+
+T = TypeVar("T")
+
+
+class QueueReader(threading.Thread, Generic[T]):
+    """Reads a blocking queue on a thread, for an asyncio event loop.
+
+    The kernel's requests arrive on a queue whose `get` blocks (a
+    multiprocessing, threading or ZeroMQ-backed queue). Waiting on it in the
+    event loop would block the loop, starving the asyncio tasks of user code
+    (top-level await, async generators, ...) until a request arrives. This
+    thread does the waiting instead, and hands each item to the loop, which
+    is woken up as soon as the item is available.
+    """
+
+    # Only bounds how long `stop()` takes to end the thread; items are
+    # handed to the loop as soon as they're read
+    POLL_INTERVAL_S = 1.0
+
+    def __init__(
+        self, source: QueueType[T], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        super().__init__(name="marimo-queue-reader", daemon=True)
+        self._source = source
+        self._loop = loop
+        self._items: asyncio.Queue[Optional[T]] = asyncio.Queue()
+        self._stopped = threading.Event()
+
+    async def get(self) -> Optional[T]:
+        """Get the next item; None if the queue can no longer be read."""
+        return await self._items.get()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            item: Optional[T]
+            try:
+                item = self._source.get(timeout=self.POLL_INTERVAL_S)
+            except queue.Empty:
+                continue
+            except Exception as e:
+                # e.g., on Windows, when quit with Ctrl+C
+                LOGGER.debug("queue.get() failed %s", e)
+                item = None
+
+            try:
+                self._loop.call_soon_threadsafe(self._items.put_nowait, item)
+            except RuntimeError:
+                # The event loop is closed
+                return
+            if item is None:
+                return
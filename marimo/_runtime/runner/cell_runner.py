@@ -27,6 +27,12 @@ from marimo._messaging.errors import (
     UnknownError,
 )
 from marimo._messaging.tracebacks import write_traceback
+from marimo._metrics import (
+    CELL_RUN_SECONDS,
+    CELL_RUNS,
+    RUNNER_HOOK_SECONDS,
+    metrics_enabled,
+)
 from marimo._runtime import dataflow
 from marimo._runtime.context.types import safe_get_context
 from marimo._runtime.control_flow import MarimoInterrupt, MarimoStopError
@@ -59,6 +65,7 @@ if TYPE_CHECKING:
     from marimo._runtime.runner.hooks_pre_execution import PreExecutionHookType
     from marimo._runtime.runner.hooks_preparation import PreparationHookType
     from marimo._runtime.state import State
+    from marimo._save.notebook_cache import NotebookCache
 
 
 def cell_filename(cell_id: CellId_t) -> str:
@@ -86,6 +93,16 @@ class RunResult:
         """Whether the cell expected successfully"""
         return self.exception is None
 
+    def status(self) -> str:
+        """The outcome of the run, as reported in metrics"""
+        if self.exception is None:
+            return "success"
+        if isinstance(self.exception, MarimoInterrupt):
+            return "interrupted"
+        if isinstance(self.exception, MarimoStopError):
+            return "stopped"
+        return "error"
+
 
 def should_show_traceback(
     exception: Optional[ExceptionOrError],
@@ -127,6 +144,7 @@ class Runner:
         pre_execution_hooks: Sequence[PreExecutionHookType] | None = None,
         post_execution_hooks: Sequence[PostExecutionHookType] | None = None,
         on_finish_hooks: Sequence[OnFinishHookType] | None = None,
+        notebook_cache: NotebookCache | None = None,
     ):
         self.graph = graph
         self.debugger = debugger
@@ -148,6 +166,8 @@ class Runner:
         self.on_finish_hooks: Sequence[Callable[[Runner], Any]] = (
             on_finish_hooks or []
         )
+        # restores cells instead of running them, when enabled
+        self.notebook_cache = notebook_cache
 
         # runtime globals
         self.glbls = glbls
@@ -470,6 +490,13 @@ class Runner:
                 self.debugger._last_traceback = None
 
         cell = self.graph.cells[cell_id]
+        if self.notebook_cache is not None:
+            cached = self.notebook_cache.restore(cell, self.graph, self.glbls)
+            if cached is not None:
+                return RunResult(
+                    output=cached.meta.get("return"), exception=None
+                )
+
         run_result = None
         try:
             if cell.is_coroutine():
@@ -669,8 +696,7 @@ class Runner:
 
     async def run_all(self) -> None:
         LOGGER.debug("Running preparation hooks")
-        for prep_hook in self.preparation_hooks:
-            prep_hook(self)
+        self._run_hooks("preparation", self.preparation_hooks, self)
 
         while self.pending():
             cell_id = self.pop_cell()
@@ -698,19 +724,26 @@ class Runner:
                 continue
 
             LOGGER.debug("Running pre_execution hooks")
-            for pre_hook in self.pre_execution_hooks:
-                pre_hook(cell, self)
+            self._run_hooks(
+                "pre_execution", self.pre_execution_hooks, cell, self
+            )
             LOGGER.debug("Running cell %s", cell_id)
             if self.execution_context is not None:
                 try:
                     # TODO(akshayka): The execution context should be pushed
                     # down to as close to kernel execution as possible.
                     with self.execution_context(cell_id) as exc_ctx:
-                        run_result = await self.run(cell_id)
+                        run_result = await self._timed_run(cell_id)
                         run_result.accumulated_output = exc_ctx.output
+                        self._save_to_notebook_cache(cell, run_result)
                         LOGGER.debug("Running post_execution hooks in context")
-                        for post_hook in self.post_execution_hooks:
-                            post_hook(cell, self, run_result)
+                        self._run_hooks(
+                            "post_execution",
+                            self.post_execution_hooks,
+                            cell,
+                            self,
+                            run_result,
+                        )
                 except KeyboardInterrupt:
                     LOGGER.error(
                         """
@@ -719,11 +752,42 @@ class Runner:
                     )
 
             else:
-                run_result = await self.run(cell_id)
+                run_result = await self._timed_run(cell_id)
+                self._save_to_notebook_cache(cell, run_result)
                 LOGGER.debug("Running post_execution hooks out of context")
-                for post_hook in self.post_execution_hooks:
-                    post_hook(cell, self, run_result)
+                self._run_hooks(
+                    "post_execution",
+                    self.post_execution_hooks,
+                    cell,
+                    self,
+                    run_result,
+                )
 
         LOGGER.debug("Running on_finish hooks")
-        for finish_hook in self.on_finish_hooks:
-            finish_hook(self)
+        self._run_hooks("on_finish", self.on_finish_hooks, self)
+
+    @staticmethod
+    def _run_hooks(
+        stage: str, hooks: Sequence[Callable[..., Any]], *args: Any
+    ) -> None:
+        if not metrics_enabled():
+            for hook in hooks:
+                hook(*args)
+            return
+        with RUNNER_HOOK_SECONDS.time(stage=stage):
+            for hook in hooks:
+                hook(*args)
+
+    def _save_to_notebook_cache(
+        self, cell: CellImpl, run_result: RunResult
+    ) -> None:
+        if self.notebook_cache is not None:
+            self.notebook_cache.save(cell, self.glbls, run_result)
+
+    async def _timed_run(self, cell_id: CellId_t) -> RunResult:
+        if not metrics_enabled():
+            return await self.run(cell_id)
+        with CELL_RUN_SECONDS.time():
+            run_result = await self.run(cell_id)
+        CELL_RUNS.inc(status=run_result.status())
+        return run_result
@@ -13,6 +13,8 @@ from marimo._messaging.errors import (
     MarimoStrictExecutionError,
 )
 from marimo._messaging.notification_utils import CellNotificationUtils
+from marimo._runtime.context import get_context
+from marimo._runtime.context.kernel_context import KernelRuntimeContext
 from marimo._runtime.control_flow import MarimoStopError
 from marimo._runtime.runner import cell_runner
 from marimo._tracer import kernel_tracer
@@ -89,7 +91,20 @@ def _send_cancellation_errors(runner: cell_runner.Runner) -> None:
             )
 
 
+@kernel_tracer.start_as_current_span("flush_metadata")
+def _flush_metadata(runner: cell_runner.Runner) -> None:
+    del runner
+    ctx = get_context()
+    if not isinstance(ctx, KernelRuntimeContext):
+        return
+    # Give the side panels a chance to catch up before the kernel goes
+    # idle, without letting slow metadata hold up the next run.
+    if not ctx.metadata_worker.flush():
+        LOGGER.debug("Metadata still pending after run; not waiting")
+
+
 ON_FINISH_HOOKS: list[OnFinishHookType] = [
     _send_interrupt_errors,
     _send_cancellation_errors,
+    _flush_metadata,
 ]
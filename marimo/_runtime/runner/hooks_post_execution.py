@@ -1,8 +1,9 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import functools
 import sys
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from marimo import _loggers
 from marimo._ast.cell import CellImpl
@@ -22,12 +23,11 @@ from marimo._messaging.errors import (
 from marimo._messaging.notification import (
     DatasetsNotification,
     DataSourceConnectionsNotification,
+    NotificationMessage,
+    VariableValue,
     VariableValuesNotification,
 )
-from marimo._messaging.notification_utils import (
-    CellNotificationUtils,
-    broadcast_notification,
-)
+from marimo._messaging.notification_utils import CellNotificationUtils
 from marimo._messaging.tracebacks import write_traceback
 from marimo._messaging.variables import create_variable_value
 from marimo._output import formatting
@@ -39,6 +39,11 @@ from marimo._runtime.context.types import (
 )
 from marimo._runtime.control_flow import MarimoInterrupt, MarimoStopError
 from marimo._runtime.runner import cell_runner
+from marimo._runtime.runner.metadata_worker import (
+    MetadataJob,
+    MetadataWorker,
+    is_snapshot_safe,
+)
 from marimo._runtime.side_effect import SideEffect
 from marimo._session.model import SessionMode
 from marimo._sql.engines.duckdb import (
@@ -53,8 +58,14 @@ from marimo._tracer import kernel_tracer
 from marimo._types.ids import VariableName
 from marimo._utils.flatten import contains_instance
 
+if TYPE_CHECKING:
+    from marimo._data.models import DataTable
+
 LOGGER = _loggers.marimo_logger()
 
+T = TypeVar("T")
+
+_NOT_CACHED = object()
 
 PostExecutionHookType = Callable[
     [CellImpl, cell_runner.Runner, cell_runner.RunResult], None
@@ -125,6 +136,61 @@ def _should_broadcast_data() -> bool:
     return is_edit_mode and not ctx.is_embedded()
 
 
+def _cell_values(
+    cell: CellImpl, runner: cell_runner.Runner
+) -> list[tuple[VariableName, object]]:
+    return [
+        (VariableName(variable), runner.glbls[variable])
+        for variable in cell.defs
+        if variable in runner.glbls
+    ]
+
+
+def _metadata_worker() -> MetadataWorker:
+    ctx = get_context()
+    assert isinstance(ctx, KernelRuntimeContext)
+    return ctx.metadata_worker
+
+
+def _extract(
+    worker: MetadataWorker,
+    value: object,
+    tag: str,
+    compute: Callable[[], T],
+    placeholder: T,
+) -> Callable[[], T]:
+    """Return a function that produces the metadata of `value`.
+
+    Immutable values are introspected when the function is called, on the
+    metadata worker. Other values are introspected now, on the kernel
+    thread, unless their metadata isn't cached and the run's extraction
+    budget is spent; then `placeholder` is used.
+    """
+    cached = functools.partial(worker.cache.get, value, tag, compute)
+    if is_snapshot_safe(value):
+        return cached
+
+    result = worker.cache.lookup(value, tag, _NOT_CACHED)
+    if result is _NOT_CACHED:
+        if worker.budget.exhausted:
+            LOGGER.debug("Metadata budget spent; skipping %s", tag)
+            result = placeholder
+        else:
+            with worker.budget.measure():
+                result = cached()
+    return functools.partial(_identity, result)
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _submit_metadata(cell: CellImpl, kind: str, job: MetadataJob) -> None:
+    """Compute and broadcast metadata for the cell's definitions on the
+    metadata worker."""
+    _metadata_worker().submit((cell.cell_id, kind), job)
+
+
 @kernel_tracer.start_as_current_span("broadcast_variables")
 def _broadcast_variables(
     cell: CellImpl,
@@ -135,17 +201,36 @@ def _broadcast_variables(
         return
 
     del run_result
-    values = [
-        create_variable_value(
-            name=variable,
-            value=(
-                runner.glbls[variable] if variable in runner.glbls else None
-            ),
+    worker = _metadata_worker()
+    previews: list[Callable[[], VariableValue]] = []
+    for variable in cell.defs:
+        value = runner.glbls[variable] if variable in runner.glbls else None
+        previews.append(
+            _extract(
+                worker,
+                value,
+                f"preview:{variable}",
+                functools.partial(
+                    create_variable_value, name=variable, value=value
+                ),
+                VariableValue(
+                    name=variable,
+                    value=None,
+                    datatype=type(value).__name__,
+                ),
+            )
         )
-        for variable in cell.defs
-    ]
-    if values:
-        broadcast_notification(VariableValuesNotification(variables=values))
+    if not previews:
+        return
+
+    def job() -> list[NotificationMessage]:
+        return [
+            VariableValuesNotification(
+                variables=[preview() for preview in previews]
+            )
+        ]
+
+    _submit_metadata(cell, "variables", job)
 
 
 @kernel_tracer.start_as_current_span("broadcast_datasets")
@@ -158,16 +243,52 @@ def _broadcast_datasets(
         return
 
     del run_result
-    tables = get_datasets_from_variables(
-        [
-            (VariableName(variable), runner.glbls[variable])
-            for variable in cell.defs
-            if variable in runner.glbls
+    worker = _metadata_worker()
+    extractions: list[Callable[[], list[DataTable]]] = [
+        _extract(
+            worker,
+            value,
+            f"dataset:{variable}",
+            functools.partial(
+                get_datasets_from_variables, [(variable, value)]
+            ),
+            [],
+        )
+        for variable, value in _cell_values(cell, runner)
+    ]
+    if not extractions:
+        return
+
+    def job() -> list[NotificationMessage]:
+        tables = [
+            table for extraction in extractions for table in extraction()
         ]
-    )
-    if tables:
+        if not tables:
+            return []
         LOGGER.debug("Broadcasting data tables")
-        broadcast_notification(DatasetsNotification(tables=tables))
+        return [DatasetsNotification(tables=tables)]
+
+    _submit_metadata(cell, "datasets", job)
+
+
+def _broadcast_connections(
+    cell: CellImpl, kind: str, connections: Callable[[], list[Any]]
+) -> None:
+    """Introspect connections on the kernel thread, within the run's
+    extraction budget, and broadcast them from the worker.
+
+    Connection metadata (databases, schemas, tables) can change without
+    the engine object changing, so it isn't cached.
+    """
+    worker = _metadata_worker()
+    if worker.budget.exhausted:
+        LOGGER.debug("Metadata budget spent; skipping %s", kind)
+        return
+    with worker.budget.measure():
+        notifications: list[NotificationMessage] = [
+            DataSourceConnectionsNotification(connections=connections())
+        ]
+    _submit_metadata(cell, kind, functools.partial(_identity, notifications))
 
 
 @kernel_tracer.start_as_current_span("broadcast_data_source_connection")
@@ -180,25 +301,19 @@ def _broadcast_data_source_connection(
         return
 
     del run_result
-    engines = get_engines_from_variables(
-        [
-            (VariableName(variable), runner.glbls[variable])
-            for variable in cell.defs
-            if variable in runner.glbls
-        ]
-    )
+    engines = get_engines_from_variables(_cell_values(cell, runner))
 
     if not engines:
         return
 
     LOGGER.debug("Broadcasting data source connections")
-    broadcast_notification(
-        DataSourceConnectionsNotification(
-            connections=[
-                engine_to_data_source_connection(variable, engine)
-                for variable, engine in engines
-            ]
-        )
+    _broadcast_connections(
+        cell,
+        "data_source_connections",
+        lambda: [
+            engine_to_data_source_connection(variable, engine)
+            for variable, engine in engines
+        ],
     )
 
 
@@ -227,14 +342,14 @@ def _broadcast_duckdb_datasource(
             return
 
         LOGGER.debug("Broadcasting internal duckdb datasource")
-        broadcast_notification(
-            DataSourceConnectionsNotification(
-                connections=[
-                    engine_to_data_source_connection(
-                        INTERNAL_DUCKDB_ENGINE, DuckDBEngine()
-                    )
-                ]
-            )
+        _broadcast_connections(
+            cell,
+            "duckdb_datasource",
+            lambda: [
+                engine_to_data_source_connection(
+                    INTERNAL_DUCKDB_ENGINE, DuckDBEngine()
+                )
+            ],
         )
     except Exception:
         return
@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import Callable
 
 from marimo._runtime import dataflow
+from marimo._runtime.context.kernel_context import KernelRuntimeContext
+from marimo._runtime.context.types import get_context
 from marimo._runtime.runner import cell_runner
 from marimo._tracer import kernel_tracer
 
@@ -32,4 +34,15 @@ def _update_stale_statuses(runner: cell_runner.Runner) -> None:
                 graph.cells[cid].set_stale(stale=False)
 
 
-PREPARATION_HOOKS: list[PreparationHookType] = [_update_stale_statuses]
+def _reset_metadata_budget(runner: cell_runner.Runner) -> None:
+    del runner
+    ctx = get_context()
+    if isinstance(ctx, KernelRuntimeContext):
+        # Each run gets a fresh budget for introspecting values
+        ctx.metadata_worker.budget.reset()
+
+
+PREPARATION_HOOKS: list[PreparationHookType] = [
+    _update_stale_statuses,
+    _reset_metadata_budget,
+]
@@ -0,0 +1,276 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Compute and broadcast side-panel metadata off the kernel thread.
+
+After a cell runs, the variables, datasets, and data sources panels are
+refreshed with previews of the cell's definitions. Computing these
+(formatting values, extracting DataFrame schemas, listing the tables of a
+connection) touches user objects.
+
+Immutable values, such as scalars and polars or pyarrow tables, are
+introspected on a background worker, so they never hold up the kernel.
+Other objects are not safe to use from another thread: DuckDB connections
+aren't thread-safe, SQLAlchemy engines with a per-thread pool (e.g.
+in-memory SQLite) look empty from another thread, and mutable frames may
+be modified by the next cell. These are introspected on the kernel thread,
+within a time budget per run; once it is spent, uncached values only get
+a placeholder until a later run. Results for unchanged objects are reused.
+
+The worker broadcasts in submission order. Notifications that are
+superseded before they are sent (e.g. the cell ran again) are dropped. At
+the end of a run the kernel waits for outstanding metadata, but only up to
+a small time budget.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._messaging.notification_utils import broadcast_notification
+from marimo._utils.platform import is_pyodide
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Sequence
+
+    from marimo._messaging.notification import NotificationMessage
+    from marimo._messaging.types import Stream
+
+LOGGER = _loggers.marimo_logger()
+
+T = TypeVar("T")
+
+# How long the kernel waits for pending metadata after a run
+FLUSH_BUDGET_SECONDS = 0.5
+# How long the kernel spends introspecting values itself during a run
+EXTRACTION_BUDGET_SECONDS = 0.25
+MAX_CACHED_OBJECTS = 256
+
+MetadataJob = Callable[[], "Sequence[NotificationMessage]"]
+
+_IMMUTABLE_SCALARS = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+)
+_MISSING = object()
+
+
+def is_snapshot_safe(value: object) -> bool:
+    """Whether metadata for `value` can be computed on another thread.
+
+    True for immutable values: scalars, tuples and frozensets of scalars,
+    and polars and pyarrow tables.
+    """
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(isinstance(item, _IMMUTABLE_SCALARS) for item in value)
+    # Only check libraries that are already imported
+    if DependencyManager.polars.imported():
+        pl = sys.modules["polars"]
+        if isinstance(value, (pl.DataFrame, pl.Series)):
+            return True
+    if DependencyManager.pyarrow.imported():
+        pa = sys.modules["pyarrow"]
+        if isinstance(value, (pa.Table, pa.RecordBatch)):
+            return True
+    return False
+
+
+def object_version(value: object) -> Optional[Hashable]:
+    """A cheap structural fingerprint of a table-like object.
+
+    Covers the shape, column names and dtypes, which is what previews
+    and schemas are derived from. Returns None for other objects, which
+    are never cached.
+    """
+    try:
+        shape = getattr(value, "shape", None)
+        columns = getattr(value, "columns", None)
+        if not isinstance(shape, tuple) or columns is None:
+            return None
+        dtypes = getattr(value, "dtypes", None)
+        return (
+            type(value),
+            shape,
+            tuple(str(column) for column in columns),
+            tuple(str(dtype) for dtype in dtypes)
+            if dtypes is not None
+            else None,
+        )
+    except Exception:
+        return None
+
+
+class ObjectCache:
+    """Metadata computed per object, keyed by identity and version.
+
+    Holds weak references only; entries for objects that can't be
+    weakly referenced or versioned aren't cached. Shared by the kernel
+    thread and the worker.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_OBJECTS) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[
+            tuple[int, str], tuple[weakref.ref[Any], Hashable, Any]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, value: object, tag: str, default: Any = None) -> Any:
+        """Return the cached metadata for `value`, or `default`."""
+        version = object_version(value)
+        if version is None:
+            return default
+        key = (id(value), tag)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0]() is not value or entry[1] != version:
+                return default
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def get(self, value: object, tag: str, compute: Callable[[], T]) -> T:
+        cached = self.lookup(value, tag, _MISSING)
+        if cached is not _MISSING:
+            result: T = cached
+            return result
+
+        result = compute()
+        version = object_version(value)
+        if version is None:
+            return result
+        try:
+            ref = weakref.ref(value)
+        except TypeError:
+            return result
+
+        key = (id(value), tag)
+        with self._lock:
+            self._entries[key] = (ref, version, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ExtractionBudget:
+    """Time the kernel thread may spend introspecting values during a run.
+
+    Only used on the kernel thread.
+    """
+
+    def __init__(self, seconds: float = EXTRACTION_BUDGET_SECONDS) -> None:
+        self.seconds = seconds
+        self.spent = 0.0
+
+    def reset(self) -> None:
+        self.spent = 0.0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.spent >= self.seconds
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spent += time.perf_counter() - start
+
+
+class MetadataWorker:
+    """Runs metadata jobs on a background thread, in submission order, and
+    broadcasts the notifications they return."""
+
+    def __init__(self, stream: Stream) -> None:
+        self.stream = stream
+        self.cache = ObjectCache()
+        self.budget = ExtractionBudget()
+        self._jobs: OrderedDict[Hashable, MetadataJob] = OrderedDict()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        # Threads aren't available in the browser
+        self._inline = is_pyodide()
+
+    def submit(self, key: Hashable, job: MetadataJob) -> None:
+        """Schedule a job, whose notifications are then broadcast.
+
+        Replaces a pending job with the same key. The job runs on another
+        thread, so it may only touch objects that are safe to use from
+        there (see `is_snapshot_safe`).
+        """
+        if self._inline:
+            self._run(job)
+            return
+
+        with self._condition:
+            if self._stopped:
+                return
+            self._jobs.pop(key, None)
+            self._jobs[key] = job
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop,
+                    name="marimo-metadata-worker",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = FLUSH_BUDGET_SECONDS) -> bool:
+        """Wait for pending notifications, up to `timeout` seconds.
+
+        Returns whether all of them were broadcast.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._jobs and not self._busy, timeout=timeout
+            )
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._jobs.clear()
+            self._condition.notify_all()
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                self._condition.wait_for(
+                    lambda: bool(self._jobs) or self._stopped
+                )
+                if self._stopped:
+                    return
+                _, job = self._jobs.popitem(last=False)
+                self._busy = True
+            self._run(job)
+
+    def _run(self, job: MetadataJob) -> None:
+        try:
+            notifications = job()
+        except Exception as e:
+            LOGGER.warning("Failed to compute metadata: %s", e)
+            return
+        for notification in notifications:
+            broadcast_notification(notification, self.stream)
@@ -176,6 +176,7 @@ from marimo._runtime.runner.hooks_post_execution import (
 )
 from marimo._runtime.runner.hooks_pre_execution import PreExecutionHookType
 from marimo._runtime.runner.hooks_preparation import PreparationHookType
+from marimo._runtime.runner.metadata_worker import MetadataWorker
 from marimo._runtime.scratch import SCRATCH_CELL_ID
 from marimo._runtime.state import State
 from marimo._runtime.utils.set_ui_element_request_manager import (
@@ -214,6 +215,7 @@ if TYPE_CHECKING:
     from types import ModuleType
 
     from marimo._plugins.ui._core.ui_element import UIElement
+    from marimo._save.notebook_cache import NotebookCache
 
 LOGGER = _loggers.marimo_logger()
 
@@ -529,6 +531,9 @@ class Kernel:
         sys.argv = self.argv
 
         self.stream = stream
+        # Computes variable previews, dataset schemas, etc. off the
+        # kernel thread
+        self.metadata_worker = MetadataWorker(stream)
         self.stdout = stdout
         self.stderr = stderr
         self.stdin = stdin
@@ -634,6 +639,9 @@ class Kernel:
         self.module_reloader: ModuleReloader | None = None
         self.module_watcher: ModuleWatcher | None = None
 
+        # Restores unchanged cells instead of running them, when enabled
+        self.notebook_cache: NotebookCache | None = None
+
         # Load runtime settings from user config
         self.user_config = user_config
         self.reactive_execution_mode: OnCellChangeType = user_config[
@@ -678,11 +686,23 @@ class Kernel:
             self.stderr._stop()
         if self.stdin is not None:
             self.stdin._stop()
+        self.metadata_worker.shutdown()
         self.stream.stop()
 
         if self.module_watcher is not None:
             self.module_watcher.stop()
 
+        # Complete pending writes of write-behind persistent caches. Only
+        # this kernel's (in run mode, other sessions' kernels share the
+        # writer), and not indefinitely, so a slow store can't hold up
+        # shutdown
+        from marimo._save.loaders.write_behind import (
+            SHUTDOWN_TIMEOUT,
+            flush_cache_writes,
+        )
+
+        flush_cache_writes(SHUTDOWN_TIMEOUT, stream=self.stream)
+
         # TODO(akshayka): There's a memory leak in run mode, with memory
         # usage increasing with each session creation. Somehow the kernel
         # globals appear to leak, even though the thread exits. As a hack we
@@ -707,6 +727,14 @@ class Kernel:
 
         self.packages_callbacks.update_package_manager(package_manager)
 
+        if config.get("experimental", {}).get("cache_cells", False):
+            if self.notebook_cache is None:
+                from marimo._save.notebook_cache import NotebookCache
+
+                self.notebook_cache = NotebookCache(self.app_metadata.filename)
+        else:
+            self.notebook_cache = None
+
         if (
             (autoreload_mode == "lazy" or autoreload_mode == "autorun")
             # Pyodide doesn't support hot module reloading
@@ -1468,6 +1496,7 @@ class Kernel:
                     self._propagate_kernel_errors,
                 ]
             ),
+            notebook_cache=self.notebook_cache,
         )
 
         # I/O
@@ -3084,6 +3113,8 @@ class CacheCallbacks:
             if isinstance(obj, CacheContext):
                 if isinstance(obj.loader, BasePersistenceLoader):
                     obj.loader.clear()
+        if self._kernel.notebook_cache is not None:
+            self._kernel.notebook_cache.clear()
 
         broadcast_notification(CacheClearedNotification(bytes_freed=saved))
 
@@ -3159,6 +3190,12 @@ def launch_kernel(
     LOGGER.debug("Launching kernel")
     if is_edit_mode:
         restore_signals()
+        if GLOBAL_SETTINGS.METRICS:
+            from marimo._metrics.multiprocess import start_snapshot_writer
+
+            # Edit-mode kernels run in their own process; report metrics
+            # to the server
+            start_snapshot_writer()
 
     profiler = None
     if profile_path is not None:
@@ -3225,6 +3262,12 @@ def launch_kernel(
         user_config = user_config.copy()
         user_config["runtime"]["on_cell_change"] = "autorun"
         user_config["runtime"]["auto_reload"] = "off"
+        # Cells can depend on the viewer (their query params and request),
+        # which the notebook cache doesn't key on
+        user_config["experimental"] = {
+            **user_config.get("experimental", {}),
+            "cache_cells": False,
+        }
 
     def _enqueue_control_request(req: CommandMessage) -> None:
         control_queue.put_nowait(req)
@@ -3293,34 +3336,30 @@ def launch_kernel(
     ui_element_request_mgr = SetUIElementRequestManager(set_ui_element_queue)
 
     async def control_loop(kernel: Kernel) -> None:
-        from queue import Empty
-
-        while True:
-            try:
-                TIMEOUT_S = 0.1
-                # 100ms timeout to avoid blocking
-                # this does not mean ControlRequest will be blocked for 100ms
-                # but rather background tasks may not start until 100ms have passed
-                request: CommandMessage | None = control_queue.get(
-                    timeout=TIMEOUT_S
-                )
-            except Empty:
-                # Yield control back to the event loop to give
-                # other tasks a chance to run
-                await asyncio.sleep(0)
-                continue
-            except Exception as e:
-                # triggered on Windows when quit with Ctrl+C
-                LOGGER.debug("kernel queue.get() failed %s", e)
-                break
-            LOGGER.debug("Received control request: %s", request)
-            if isinstance(request, StopKernelCommand):
-                break
-            elif isinstance(request, UpdateUIElementCommand):
-                request = ui_element_request_mgr.process_request(request)
-
-            if request is not None:
-                await kernel.handle_message(request)
+        from marimo._runtime.queue_reader import QueueReader
+
+        # Requests are read on a thread and handed to the event loop, so
+        # that background tasks (from top-level await, async generators,
+        # ...) run while the kernel waits for requests, instead of only
+        # between polls of the queue.
+        reader = QueueReader(control_queue, asyncio.get_running_loop())
+        reader.start()
+        try:
+            while True:
+                request = await reader.get()
+                if request is None:
+                    # The queue can no longer be read
+                    break
+                LOGGER.debug("Received control request: %s", request)
+                if isinstance(request, StopKernelCommand):
+                    break
+                elif isinstance(request, UpdateUIElementCommand):
+                    request = ui_element_request_mgr.process_request(request)
+
+                if request is not None:
+                    await kernel.handle_message(request)
+        finally:
+            reader.stop()
 
     # The control loop is asynchronous only because we allow user code to use
     # top-level await; nothing else is awaited. Don't introduce async
@@ -3342,5 +3381,9 @@ def launch_kernel(
     get_context().app_kernel_runner_registry.shutdown()
     teardown_context()
     kernel.teardown()
+    if is_edit_mode and GLOBAL_SETTINGS.METRICS:
+        from marimo._metrics.multiprocess import stop_snapshot_writer
+
+        stop_snapshot_writer()
     if isinstance(pipe, connection.Connection):
         pipe.close()
@@ -22,6 +22,25 @@ from marimo._runtime.context.types import (
 THREADS: set[int] = set()
 
 
+def thread_kernel_context(ctx: KernelRuntimeContext) -> KernelRuntimeContext:
+    """Copy a kernel context for use in a thread other than the kernel's."""
+    thread_ctx = KernelRuntimeContext(**ctx.__dict__)
+    # standard IO is not yet threadsafe
+    thread_ctx.stdout = None
+    thread_ctx.stderr = None
+    if isinstance(ctx.stream, ThreadSafeStream):
+        thread_ctx.stream = type(ctx.stream)(
+            pipe=ctx.stream.pipe,
+            # TODO(akshayka): stdin is not threadsafe
+            input_queue=ctx.stream.input_queue,
+            cell_id=ctx.stream.cell_id,
+            redirect_console=False,
+        )
+    else:
+        raise RuntimeError("Unsupported stream type " + str(type(ctx.stream)))
+    return thread_ctx
+
+
 @mddoc
 class Thread(threading.Thread):
     """A Thread subclass that can communicate with the frontend.
@@ -85,22 +104,7 @@ class Thread(threading.Thread):
         ctx.cell_lifecycle_registry.add(ThreadLifecycle())
 
         if isinstance(ctx, KernelRuntimeContext):
-            self._marimo_ctx = KernelRuntimeContext(**ctx.__dict__)
-            # standard IO is not yet threadsafe
-            self._marimo_ctx.stdout = None
-            self._marimo_ctx.stderr = None
-            if isinstance(ctx.stream, ThreadSafeStream):
-                self._marimo_ctx.stream = type(ctx.stream)(
-                    pipe=ctx.stream.pipe,
-                    # TODO(akshayka): stdin is not threadsafe
-                    input_queue=ctx.stream.input_queue,
-                    cell_id=ctx.stream.cell_id,
-                    redirect_console=False,
-                )
-            else:
-                raise RuntimeError(
-                    "Unsupported stream type " + str(type(ctx.stream))
-                )
+            self._marimo_ctx = thread_kernel_context(ctx)
         elif isinstance(self._marimo_ctx, ScriptRuntimeContext):
             # Standard streams are not rerouted when running as a script, so no
             # need to set to None
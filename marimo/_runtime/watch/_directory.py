@@ -4,9 +4,8 @@ from __future__ import annotations
 import hashlib
 import os
 import sys
-import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, cast
+from typing import TYPE_CHECKING, cast
 
 from marimo._output.rich_help import mddoc
 from marimo._runtime.watch._path import (
@@ -16,9 +15,10 @@ from marimo._runtime.watch._path import (
 )
 
 if TYPE_CHECKING:
-    import threading
     from collections.abc import Iterable
 
+    from marimo._runtime.watch._service import WatchDelta
+
 
 # For testing only - do not use in production
 _TEST_SLEEP_INTERVAL: float | None = None
@@ -43,30 +43,6 @@ def hashable_walk(path: Path) -> set[tuple[Path, tuple[str], tuple[str]]]:
     return _hashable_walk(walk(path))
 
 
-def watch_directory(
-    path: Path, state: DirectoryState, should_exit: threading.Event
-) -> None:
-    """Watch a directory for changes and update the state."""
-    last_structure = hashable_walk(path)
-    current_structure = last_structure
-    sleep_interval = _TEST_SLEEP_INTERVAL or WATCHER_SLEEP_INTERVAL
-    while not should_exit.is_set():
-        time.sleep(sleep_interval)
-        try:
-            current_structure = hashable_walk(path)
-        except FileNotFoundError:
-            # Directory has been deleted, trigger a change
-            current_structure = set()
-        except Exception as e:
-            # Handle other exceptions (e.g., permission denied)
-            sys.stderr.write(f"Error watching directory {path}: {e}\n")
-            continue
-
-        if current_structure != last_structure:
-            last_structure = current_structure
-            state._set_value(path)
-
-
 class DirectoryState(PathState):
     """Wrapper for directory state."""
 
@@ -83,9 +59,14 @@ class DirectoryState(PathState):
         "mkdir",
         "touch",
     }
-    _target: Callable[[Path, DirectoryState, threading.Event], None] = (
-        staticmethod(watch_directory)
-    )
+    _watch_directory = True
+
+    def _poll_interval(self) -> float:
+        return _TEST_SLEEP_INTERVAL or WATCHER_SLEEP_INTERVAL
+
+    def _should_notify(self, delta: WatchDelta) -> bool:
+        # Only structural changes; see `mo.watch.directory`
+        return bool(delta.added or delta.removed)
 
     def walk(self) -> Iterable[tuple[Path, list[str], list[str]]]:
         """Walk the directory."""
@@ -128,7 +109,9 @@ def directory(path: Path | str) -> DirectoryState:
     reactively list the contents of the directory.
 
     This object will trigger dependent cells to re-evaluate when the directory
-    structure is changed (i.e., files are added or removed).
+    structure is changed (i.e., files are added or removed). Call `changes()`
+    to get the paths that were added, removed, or modified since its last
+    call, so that a cell can process only new files.
 
     Note:
         This function does NOT react to file content changes, only to changes in
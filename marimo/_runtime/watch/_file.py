@@ -2,11 +2,9 @@
 from __future__ import annotations
 
 import hashlib
-import sys
 import threading
-import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
 
 from marimo._output.rich_help import mddoc
 from marimo._runtime.watch._path import (
@@ -15,37 +13,13 @@ from marimo._runtime.watch._path import (
     write_side_effect,
 )
 
+if TYPE_CHECKING:
+    from marimo._runtime.watch._service import WatchDelta
+
 # For testing only - do not use in production
 _TEST_SLEEP_INTERVAL: float | None = None
 
 
-def watch_file(
-    path: Path, state: FileState, should_exit: threading.Event
-) -> None:
-    """Watch a file for changes and update the state."""
-    last_mtime: float = 0
-    current_mtime = last_mtime
-    sleep_interval = _TEST_SLEEP_INTERVAL or WATCHER_SLEEP_INTERVAL
-    while not should_exit.is_set():
-        time.sleep(sleep_interval)
-        try:
-            current_mtime = path.stat().st_mtime
-        except FileNotFoundError:
-            # File has been deleted, trigger a change
-            current_mtime = 0
-        except Exception as e:
-            # Handle other exceptions (e.g., permission denied)
-            sys.stderr.write(f"Error watching file {path}: {e}\n")
-            continue
-
-        if current_mtime != last_mtime:
-            last_mtime = current_mtime
-            with state._debounce_lock:
-                if not state._debounced:
-                    state._set_value(path)
-                state._debounced = False
-
-
 class FileState(PathState):
     """Wrapper for file state."""
 
@@ -59,14 +33,21 @@ class FileState(PathState):
         "replace",
         "walk",
     }
-    _target: Callable[[Path, FileState, threading.Event], None] = staticmethod(
-        watch_file
-    )
+    _watch_directory = False
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
         self._debounced = False
         self._debounce_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _poll_interval(self) -> float:
+        return _TEST_SLEEP_INTERVAL or WATCHER_SLEEP_INTERVAL
+
+    def _should_notify(self, delta: WatchDelta) -> bool:
+        # Don't trigger on changes made through this object
+        with self._debounce_lock:
+            debounced, self._debounced = self._debounced, False
+        return bool(delta) and not debounced
 
     def read_text(self) -> str:
         """Read the file as a string."""
@@ -125,7 +106,21 @@ def file(path: Path | str) -> FileState:
     - `replace()`
 
     This object will trigger dependent cells to re-evaluate when the file is
-    changed.
+    changed. Call `changes()` to find out what changed since its last call;
+    when data was only appended to the file, as with a log, the byte range of
+    the new data is reported, so that a cell can read just that:
+
+    ```python
+    log = mo.watch.file("app.log")
+    ```
+
+    ```python
+    log  # re-run when the file changes
+    for start, end in log.changes().appended.values():
+        with open(log(), "rb") as f:
+            f.seek(start)
+            process(f.read(end - start))
+    ```
 
     Warning:
         It is possible to misuse this API in similar ways to `state()`. Consider
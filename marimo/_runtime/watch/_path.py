@@ -1,24 +1,25 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
-import sys
 import threading
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from marimo._runtime.context import (
     ContextNotInitializedError,
     get_context,
     runtime_context_installed,
 )
+from marimo._runtime.context.kernel_context import KernelRuntimeContext
+from marimo._runtime.context.types import ExecutionContext
 from marimo._runtime.side_effect import SideEffect
 from marimo._runtime.state import State
-from marimo._runtime.threads import Thread
+from marimo._runtime.threads import thread_kernel_context
+from marimo._runtime.watch._service import WatchDelta, get_watcher_service
 
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
+if TYPE_CHECKING:
+    from marimo._runtime.context.types import RuntimeContext
+    from marimo._runtime.watch._service import Subscription
 
 
 T = TypeVar("T")
@@ -36,11 +37,30 @@ def write_side_effect(data: str | bytes) -> None:
     ctx.cell_lifecycle_registry.add(SideEffect(data))
 
 
+def _notification_context(
+    ctx: RuntimeContext,
+) -> Optional[KernelRuntimeContext]:
+    """A context for setting state from the watcher thread, as if from
+    the cell that is running."""
+    if (
+        not isinstance(ctx, KernelRuntimeContext)
+        or ctx.execution_context is None
+    ):
+        return None
+    notification_ctx = thread_kernel_context(ctx)
+    notification_ctx.execution_context = ExecutionContext(
+        cell_id=ctx.execution_context.cell_id,
+        setting_element_value=False,
+    )
+    return notification_ctx
+
+
 class PathState(State[Path]):
     """Base class for path state."""
 
     _forbidden_attributes: set[str]
-    _target: Callable[[Path, Self, threading.Event], None]
+    # Whether to watch the tree below the path
+    _watch_directory: bool
 
     def __init__(
         self,
@@ -67,15 +87,56 @@ class PathState(State[Path]):
             _context="file",
             **kwargs,
         )  # type: ignore[misc]
-        self._should_exit = threading.Event()
+        self._changes = WatchDelta()
+        self._changes_lock = threading.Lock()
+        self._subscription: Optional[Subscription] = None
+        self._notification_ctx: Optional[KernelRuntimeContext] = None
         # Only bother with the watcher if the context is installed
         # State is not enabled in script mode
         if runtime_context_installed():
-            Thread(
-                target=self._target,
-                args=(path, self, self._should_exit),
-                daemon=True,
-            ).start()
+            self._notification_ctx = _notification_context(get_context())
+            self._subscription = get_watcher_service().subscribe(
+                path,
+                self._on_change,
+                directory=self._watch_directory,
+                interval=self._poll_interval(),
+            )
+
+    def _poll_interval(self) -> float:
+        return WATCHER_SLEEP_INTERVAL
+
+    def _should_notify(self, delta: WatchDelta) -> bool:
+        """Whether `delta` should trigger dependent cells."""
+        return bool(delta)
+
+    def _on_change(self, delta: WatchDelta) -> None:
+        """Called on the watcher thread when the path changes."""
+        with self._changes_lock:
+            self._changes.update(delta)
+        if not self._should_notify(delta):
+            return
+        if self._notification_ctx is None:
+            self._set_value(self._value)
+            return
+        with self._notification_ctx.install():
+            self._set_value(self._value)
+
+    def changes(self) -> WatchDelta:
+        """Return the changes to the path since the last call.
+
+        The first call returns the changes since the path started being
+        watched. Use this to process only new data, rather than re-reading
+        everything when the path changes.
+
+        Returns:
+            A `WatchDelta` whose `added`, `removed`, and `modified` attributes
+            are sets of paths, and whose `appended` attribute maps files that
+            only grew to the `(start, end)` byte range of the new data.
+        """
+        with self._changes_lock:
+            changes, self._changes = self._changes, WatchDelta()
+        write_side_effect(f"changes:{changes.describe()}")
+        return changes
 
     def __getattr__(self, name: str) -> Any:
         """Get an attribute from the file path."""
@@ -92,7 +153,10 @@ class PathState(State[Path]):
         )
 
     def __del__(self) -> None:
-        self._should_exit.set()
+        # Look in __dict__: __getattr__ falls back to the path.
+        subscription = self.__dict__.get("_subscription")
+        if subscription is not None:
+            subscription.cancel()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._value})"
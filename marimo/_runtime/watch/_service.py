@@ -0,0 +1,586 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""A shared service that watches paths for `mo.watch`.
+
+All watched paths are served by one thread. When watchdog is installed,
+the thread wakes on file system events (inotify, FSEvents, ...) and
+re-stats only the paths named by the events; otherwise, it polls each
+watched path at its interval, or less often for trees so large that
+scanning them would keep the thread busy. Subscribers to the same path share one
+watch, and are told what changed as a `WatchDelta`.
+
+Directories are first scanned, and scheduled for events, on the service's
+thread rather than the subscriber's. A watched directory that is deleted
+is polled until it is recreated, then watched for events again.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import stat
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.threads import Thread
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+LOGGER = _loggers.marimo_logger()
+
+# Time to wait after an event for related events (e.g., an editor's
+# write-and-rename) before re-statting paths
+_EVENT_LATENCY = 0.05
+
+# Maximum fraction of time spent polling a path; large trees are polled
+# less often than their interval
+_MAX_POLL_LOAD = 0.1
+
+
+@dataclass
+class WatchDelta:
+    """Changes to a watched path.
+
+    Attributes:
+        added: Paths that were created.
+        removed: Paths that were deleted.
+        modified: Files whose contents changed.
+        appended: For modified files that only grew, the `(start, end)`
+            byte range of the data appended to them.
+    """
+
+    added: set[Path] = field(default_factory=set)
+    removed: set[Path] = field(default_factory=set)
+    modified: set[Path] = field(default_factory=set)
+    appended: dict[Path, tuple[int, int]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def update(self, other: WatchDelta) -> None:
+        """Add the changes in `other`, which happened after these."""
+        for path in other.added:
+            if path in self.removed:
+                self.removed.discard(path)
+                self.modified.add(path)
+                self.appended.pop(path, None)
+            else:
+                self.added.add(path)
+        for path in other.removed:
+            if path in self.added:
+                self.added.discard(path)
+            else:
+                self.removed.add(path)
+            self.modified.discard(path)
+            self.appended.pop(path, None)
+        for path in other.modified:
+            if path in self.added:
+                continue
+            appended = other.appended.get(path)
+            previous = self.appended.get(path)
+            if appended is None:
+                self.appended.pop(path, None)
+            elif path not in self.modified:
+                self.appended[path] = appended
+            elif previous is not None and previous[1] == appended[0]:
+                self.appended[path] = (previous[0], appended[1])
+            else:
+                self.appended.pop(path, None)
+            self.modified.add(path)
+
+    def describe(self) -> str:
+        """A deterministic description of the changes."""
+        return (
+            f"added={sorted(self.added)}, removed={sorted(self.removed)}, "
+            f"modified={sorted(self.modified)}, "
+            f"appended={sorted(self.appended.items())}"
+        )
+
+
+class _Stat(NamedTuple):
+    mtime_ns: int
+    size: int
+    is_dir: bool
+
+
+# Snapshots are keyed by path strings, which are cheaper than Paths
+_Snapshot = dict[str, _Stat]
+
+
+def _stat(path: str, follow_symlinks: bool) -> Optional[_Stat]:
+    try:
+        st = os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return _Stat(st.st_mtime_ns, st.st_size, stat.S_ISDIR(st.st_mode))
+
+
+def _scan_tree(root: str, snapshot: _Snapshot) -> None:
+    """Add the entries below `root` to `snapshot`, without following
+    symlinks."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                snapshot[entry.path] = _Stat(
+                    st.st_mtime_ns, st.st_size, is_dir
+                )
+                if is_dir:
+                    stack.append(entry.path)
+
+
+def scan(path: str, directory: bool) -> Optional[_Snapshot]:
+    """Snapshot a watched path; None if it can't be read."""
+    snapshot: _Snapshot = {}
+    try:
+        if not directory:
+            st = os.stat(path)
+            snapshot[path] = _Stat(st.st_mtime_ns, st.st_size, False)
+        elif os.path.isdir(path):
+            # Fail on an unreadable root rather than reporting it as empty
+            os.scandir(path).close()
+            _scan_tree(path, snapshot)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        LOGGER.warning("Error watching %s: %s", path, e)
+        return None
+    return snapshot
+
+
+def diff(
+    old: Mapping[str, _Stat],
+    new: Mapping[str, _Stat],
+) -> WatchDelta:
+    """Changes between two snapshots."""
+    delta = WatchDelta()
+    if old == new:
+        return delta
+    delta.added = {Path(key) for key in new.keys() - old.keys()}
+    delta.removed = {Path(key) for key in old.keys() - new.keys()}
+    for key in new.keys() & old.keys():
+        before, after = old[key], new[key]
+        if before == after or (before.is_dir and after.is_dir):
+            # Directories' own mtimes change with their entries
+            continue
+        path = Path(key)
+        delta.modified.add(path)
+        if not before.is_dir and not after.is_dir and after.size > before.size:
+            delta.appended[path] = (before.size, after.size)
+    return delta
+
+
+def apply_events(
+    root: str, directory: bool, snapshot: _Snapshot, paths: Iterable[str]
+) -> WatchDelta:
+    """Update `snapshot` for events on `paths`, and return the changes.
+
+    Only the named paths are re-statted, and new directories are scanned.
+    """
+    old: dict[str, Optional[_Stat]] = {}
+
+    def put(key: str, value: Optional[_Stat]) -> None:
+        if key not in old:
+            old[key] = snapshot.get(key)
+        if value is None:
+            snapshot.pop(key, None)
+        else:
+            snapshot[key] = value
+
+    prefix = os.path.join(root, "")
+    for key in paths:
+        if not directory:
+            if key == root:
+                put(key, _stat(key, follow_symlinks=True))
+            continue
+
+        if key == root:
+            if not os.path.isdir(root):
+                for child in list(snapshot):
+                    put(child, None)
+            continue
+        if not key.startswith(prefix):
+            continue
+
+        previous = snapshot.get(key)
+        current = _stat(key, follow_symlinks=False)
+        put(key, current)
+        if current is None:
+            if previous is not None and previous.is_dir:
+                below = os.path.join(key, "")
+                for child in [k for k in snapshot if k.startswith(below)]:
+                    put(child, None)
+        elif current.is_dir and (previous is None or not previous.is_dir):
+            # A directory that was created or moved in
+            added: _Snapshot = {}
+            _scan_tree(key, added)
+            for child, value in added.items():
+                put(child, value)
+
+    return diff(
+        {k: v for k, v in old.items() if v is not None},
+        {k: snapshot[k] for k in old if k in snapshot},
+    )
+
+
+class Subscription:
+    """A callback subscribed to changes of a watched path."""
+
+    def __init__(
+        self,
+        service: WatcherService,
+        watch: _Watch,
+        callback: Callable[[WatchDelta], None],
+    ) -> None:
+        self._service = service
+        self._watch = watch
+        # Don't keep a subscriber alive just to tell it about changes
+        self._callback: Callable[[], Optional[Callable[[WatchDelta], None]]]
+        if inspect.ismethod(callback):
+            self._callback = weakref.WeakMethod(callback)
+        else:
+            self._callback = lambda: callback
+
+    @property
+    def path(self) -> Path:
+        return Path(self._watch.key)
+
+    def cancel(self) -> None:
+        self._service._unsubscribe(self)
+
+
+@dataclass(eq=False)
+class _Watch:
+    key: str
+    directory: bool
+    interval: float
+    # None until the path is scanned; directories are scanned on the
+    # service's thread
+    snapshot: Optional[_Snapshot]
+    next_poll: float
+    subscriptions: list[Subscription] = field(default_factory=list)
+    # Paths named by events since the last refresh
+    dirty: set[str] = field(default_factory=set)
+    # The watchdog watch, if the path is watched for events
+    handle: Any = None
+    # Whether the service's thread has set up the watch
+    initialized: bool = False
+    # Whether the directory watched for events was missing when last
+    # polled; events are scheduled again once it exists
+    missing: bool = False
+
+    @property
+    def event_directory(self) -> str:
+        """The directory watched for events on this path."""
+        return self.key if self.directory else os.path.dirname(self.key)
+
+
+class _WatcherThread(Thread):
+    """The service's thread.
+
+    A marimo thread, so that state updates made by subscribers are
+    processed right away, but not tied to the cell that started it.
+    """
+
+    def __init__(self, target: Callable[[], None]) -> None:
+        threading.Thread.__init__(
+            self, target=target, name="marimo-watch", daemon=True
+        )
+        self._marimo_ctx = None
+        self._exit_event = threading.Event()
+
+
+class WatcherService:
+    """Watches paths for changes on a single thread."""
+
+    def __init__(self, use_events: Optional[bool] = None) -> None:
+        if use_events is None:
+            use_events = DependencyManager.watchdog.has()
+        self._use_events = use_events
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._watches: dict[tuple[str, bool], _Watch] = {}
+        self._thread: Optional[_WatcherThread] = None
+        self._observer: Any = None
+        # Watchdog watches of cancelled watches, to unschedule
+        self._retired: list[Any] = []
+
+    def subscribe(
+        self,
+        path: Path,
+        callback: Callable[[WatchDelta], None],
+        *,
+        directory: bool,
+        interval: float,
+    ) -> Subscription:
+        """Call `callback` with the changes to `path`.
+
+        Args:
+            path: The file or directory to watch.
+            callback: Called on the service's thread.
+            directory: Whether to watch the tree below `path`.
+            interval: Polling interval, if events are not available.
+        """
+        key = os.path.abspath(path)
+        # Directories can be large, so they are scanned on the service's
+        # thread; a file is snapshotted right away, so that changes made
+        # as soon as this returns are reported
+        snapshot = None
+        if not directory and (key, directory) not in self._watches:
+            snapshot = scan(key, directory)
+
+        with self._lock:
+            now = time.monotonic()
+            watch = self._watches.get((key, directory))
+            if watch is None:
+                watch = _Watch(
+                    key=key,
+                    directory=directory,
+                    interval=interval,
+                    snapshot=snapshot,
+                    # Set up right away
+                    next_poll=now,
+                )
+                self._watches[(key, directory)] = watch
+            elif interval < watch.interval:
+                watch.interval = interval
+                watch.next_poll = min(watch.next_poll, now + interval)
+            subscription = Subscription(self, watch, callback)
+            watch.subscriptions.append(subscription)
+
+            if self._thread is None:
+                self._thread = _WatcherThread(self._run)
+                self._thread.start()
+            else:
+                self._wake.set()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            watch = subscription._watch
+            if subscription in watch.subscriptions:
+                watch.subscriptions.remove(subscription)
+            if watch.subscriptions:
+                return
+            if self._watches.get((watch.key, watch.directory)) is watch:
+                del self._watches[(watch.key, watch.directory)]
+            # Unscheduling joins watchdog's threads, so it's left to the
+            # service's thread rather than done here (e.g., in `__del__`)
+            if watch.handle is not None:
+                self._retired.append(watch.handle)
+                watch.handle = None
+        self._wake.set()
+
+    @property
+    def paths(self) -> list[Path]:
+        with self._lock:
+            return [Path(watch.key) for watch in self._watches.values()]
+
+    def _arm(self, watch: _Watch) -> None:
+        """Watch for events on `watch`, if possible."""
+        handle = self._schedule(watch)
+        with self._lock:
+            if self._watches.get((watch.key, watch.directory)) is watch:
+                watch.handle = handle
+                return
+        # Unsubscribed in the meantime
+        self._unschedule(handle)
+
+    def _disarm(self, watch: _Watch) -> None:
+        """Poll `watch` instead of watching it for events."""
+        with self._lock:
+            handle, watch.handle = watch.handle, None
+        self._unschedule(handle)
+
+    def _unschedule(self, handle: Any) -> None:
+        if handle is None or self._observer is None:
+            return
+        try:
+            self._observer.unschedule(handle)
+        except Exception as e:
+            LOGGER.debug("Failed to unschedule watch: %s", e)
+
+    def _schedule(self, watch: _Watch) -> Any:
+        """Watch for events on `watch`; None to poll it instead.
+
+        Only called on the service's thread.
+        """
+        if not self._use_events:
+            return None
+
+        import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+        import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+
+        service = self
+
+        class Handler(watchdog.events.FileSystemEventHandler):  # type: ignore[misc,unused-ignore]
+            def on_any_event(self, event: Any) -> None:
+                if event.event_type in ("opened", "closed_no_write"):
+                    return
+                service._on_event(
+                    watch,
+                    [
+                        os.fsdecode(path)
+                        for path in (
+                            event.src_path,
+                            getattr(event, "dest_path", ""),
+                        )
+                        if path
+                    ],
+                )
+
+        try:
+            if self._observer is None:
+                observer = watchdog.observers.Observer()
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+            return self._observer.schedule(
+                Handler(),
+                watch.event_directory,
+                recursive=watch.directory,
+            )
+        except Exception as e:
+            # e.g., the path doesn't exist yet
+            LOGGER.debug("Polling %s for changes: %s", watch.key, e)
+            return None
+
+    def _on_event(self, watch: _Watch, paths: list[str]) -> None:
+        with self._lock:
+            watch.dirty.update(paths)
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                retired, self._retired = self._retired, []
+                if not self._watches:
+                    self._thread = None
+                    observer, self._observer = self._observer, None
+                    break
+                polls = [
+                    watch.next_poll
+                    for watch in self._watches.values()
+                    if watch.handle is None
+                ]
+            for handle in retired:
+                self._unschedule(handle)
+
+            timeout = (
+                max(0.0, min(polls) - time.monotonic()) if polls else None
+            )
+            if self._wake.wait(timeout):
+                self._wake.clear()
+                time.sleep(_EVENT_LATENCY)
+            self._refresh_all()
+
+        if observer is not None:
+            observer.stop()
+
+    def _refresh_all(self) -> None:
+        with self._lock:
+            watches = list(self._watches.values())
+        for watch in watches:
+            delta = self._refresh(watch, time.monotonic())
+            if delta:
+                self._dispatch(watch, delta)
+
+    def _refresh(self, watch: _Watch, now: float) -> Optional[WatchDelta]:
+        if not watch.initialized:
+            return self._set_up(watch, now)
+
+        with self._lock:
+            dirty, watch.dirty = watch.dirty, set()
+
+        if watch.handle is not None:
+            if not dirty:
+                return None
+            assert watch.snapshot is not None
+            delta = apply_events(
+                watch.key, watch.directory, watch.snapshot, dirty
+            )
+            if not os.path.isdir(watch.event_directory):
+                # Its watch was removed with it; poll until it's recreated
+                self._disarm(watch)
+                watch.missing = True
+                watch.next_poll = now + watch.interval
+            return delta
+
+        if now < watch.next_poll:
+            return None
+        if (
+            watch.missing
+            and self._use_events
+            and os.path.isdir(watch.event_directory)
+        ):
+            # Recreated: schedule events before scanning, so none are missed
+            watch.missing = False
+            self._arm(watch)
+        snapshot = scan(watch.key, watch.directory)
+        elapsed = time.monotonic() - now
+        watch.next_poll = now + max(watch.interval, elapsed / _MAX_POLL_LOAD)
+        if snapshot is None:
+            return None
+        previous, watch.snapshot = watch.snapshot or {}, snapshot
+        return diff(previous, snapshot)
+
+    def _set_up(self, watch: _Watch, now: float) -> Optional[WatchDelta]:
+        """Schedule events for a new watch, then take its first snapshot."""
+        watch.initialized = True
+        if self._use_events:
+            watch.missing = not os.path.isdir(watch.event_directory)
+            if not watch.missing:
+                self._arm(watch)
+        watch.next_poll = now + watch.interval
+        if watch.snapshot is None:
+            watch.snapshot = scan(watch.key, watch.directory) or {}
+            return None
+        # A file, snapshotted when it was subscribed to: report changes
+        # made before its events were scheduled
+        return apply_events(
+            watch.key, watch.directory, watch.snapshot, [watch.key]
+        )
+
+    def _dispatch(self, watch: _Watch, delta: WatchDelta) -> None:
+        with self._lock:
+            subscriptions = list(watch.subscriptions)
+        for subscription in subscriptions:
+            callback = subscription._callback()
+            if callback is None:
+                subscription.cancel()
+                continue
+            try:
+                callback(delta)
+            except Exception as e:
+                LOGGER.warning(
+                    "Error handling changes to %s: %s", watch.key, e
+                )
+
+
+_SERVICE: Optional[WatcherService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_watcher_service() -> WatcherService:
+    """The watcher service shared by all `mo.watch` paths."""
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = WatcherService()
+        return _SERVICE
@@ -420,6 +420,15 @@ class CacheContext(abc.ABC):
         if self._loader is not None:
             self.loader.clear()
 
+    def cache_flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending writes of a write-behind cache.
+
+        Returns False if they didn't complete within `timeout` seconds.
+        """
+        if self._loader is None:
+            return True
+        return self.loader.flush(timeout)
+
     @property
     def hits(self) -> int:
         if self._loader is None:
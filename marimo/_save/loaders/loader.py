@@ -1,12 +1,14 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import dataclasses
 import re
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+from marimo._metrics import CACHE_LOAD_SECONDS, CACHE_REQUESTS
 from marimo._runtime.context import get_context
 from marimo._runtime.context.types import ContextNotInitializedError
 from marimo._runtime.state import State
@@ -14,6 +16,7 @@ from marimo._save.cache import (
     CACHE_PREFIX,
     Cache,
 )
+from marimo._save.loaders.write_behind import get_cache_writer
 from marimo._save.stores import DEFAULT_STORE, Store
 
 if TYPE_CHECKING:
@@ -125,9 +128,13 @@ class Loader(ABC):
     ) -> Cache:
         start_time = time.time()
         loaded = self.load_cache(key)
+        load_time = time.time() - start_time
+        loader_name = self.__class__.__name__
+        CACHE_LOAD_SECONDS.observe(load_time, loader=loader_name)
         if not loaded:
+            CACHE_REQUESTS.inc(loader=loader_name, result="miss")
             return Cache.empty(defs=defs, key=key, stateful_refs=stateful_refs)
-        load_time = time.time() - start_time
+        CACHE_REQUESTS.inc(loader=loader_name, result="hit")
 
         # TODO: Consider more robust verification
         if loaded.hash != key.hash:
@@ -192,6 +199,12 @@ class Loader(ABC):
         # Default implementation: no-op for loaders that don't support clearing
         return
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending writes, returning False on timeout."""
+        # Default implementation: writes aren't deferred
+        del timeout
+        return True
+
 
 class BasePersistenceLoader(Loader):
     """Abstract base for cache written to disk."""
@@ -201,8 +214,11 @@ class BasePersistenceLoader(Loader):
         name: str,
         suffix: str,
         store: Optional[Store] = None,
+        write_behind: bool = False,
     ) -> None:
         super().__init__(name)
+        # Write caches on a background thread, instead of on save
+        self.write_behind = write_behind
 
         if store is not None:
             self.store = store
@@ -221,17 +237,28 @@ class BasePersistenceLoader(Loader):
         return Path(self.name) / f"{prefix}{key.hash}.{self.suffix}"
 
     def cache_hit(self, key: HashKey) -> bool:
-        return self.store.hit(str(self.build_path(key)))
+        path = str(self.build_path(key))
+        return self._pending(path) is not None or self.store.hit(path)
 
     def save_cache(self, cache: Cache) -> bool:
+        if self.write_behind:
+            get_cache_writer().submit(self, cache)
+            return True
         blob = self.to_blob(cache)
         if blob is None:
             return False
         return self.store.put(str(self.build_path(cache.key)), blob)
 
     def load_cache(self, key: HashKey) -> Optional[Cache]:
+        path = str(self.build_path(key))
+        if (pending := self._pending(path)) is not None:
+            # Restoring replaces stubs in place, which must not reach the
+            # writer
+            return dataclasses.replace(
+                pending, defs=dict(pending.defs), meta=dict(pending.meta)
+            )
         try:
-            blob: Optional[bytes] = self.store.get(str(self.build_path(key)))
+            blob: Optional[bytes] = self.store.get(path)
             if not blob:
                 return None
             return self.restore_cache(key, blob)
@@ -245,6 +272,10 @@ class BasePersistenceLoader(Loader):
 
         from marimo._save.stores.file import FileStore
 
+        # Pending writes would recreate the cleared caches
+        if self.write_behind:
+            self.flush()
+
         # Only FileStore has save_path, so we need to check
         if not isinstance(self.store, FileStore):
             return
@@ -255,6 +286,18 @@ class BasePersistenceLoader(Loader):
             key = str(Path(cache_file).relative_to(self.store.save_path))
             self.store.clear(key)
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # Only this loader's caches; other notebooks share the writer
+        if not self.write_behind:
+            return True
+        return get_cache_writer().flush(timeout, loader=self)
+
+    def _pending(self, path: str) -> Optional[Cache]:
+        # Not yet written by write-behind
+        if not self.write_behind:
+            return None
+        return get_cache_writer().get(self.store, path)
+
     @abstractmethod
     def restore_cache(self, key: HashKey, blob: bytes) -> Cache:
         """May throw FileNotFoundError"""
@@ -0,0 +1,233 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+from marimo import _loggers
+from marimo._runtime.context import safe_get_context
+from marimo._save.stores.file import FileStore
+
+if TYPE_CHECKING:
+    from marimo._messaging.types import Stream
+    from marimo._save.cache import Cache
+    from marimo._save.loaders.loader import BasePersistenceLoader
+    from marimo._save.stores import Store
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# Caches waiting to be written, beyond which saving blocks; bounds the
+# memory held by results that are no longer referenced by the notebook
+DEFAULT_MAX_PENDING = 8
+
+# Seconds to wait for pending writes when a kernel shuts down or the process
+# exits, after which they're abandoned
+SHUTDOWN_TIMEOUT = 30
+
+# Where a cache is written: the store's location, and the cache's path in it
+_Location = tuple[object, str]
+
+
+@dataclasses.dataclass
+class _PendingWrite:
+    cache: Cache
+    loader: BasePersistenceLoader
+    # The stream of the kernel that saved the cache, and the cell it was
+    # saved from, to report a failed write to
+    stream: Optional[Stream]
+    cell_id: Optional[CellId_t]
+
+
+class CacheWriter:
+    """Serializes and writes caches to their stores on a background thread.
+
+    Saving a large result synchronously (pickling it, then writing it to the
+    store) holds up the cells that depend on it, even though nothing needs
+    the stored copy until the next run. With write-behind, the cache is
+    handed to this writer instead; until it's written, it's served from
+    memory.
+
+    Cached values must not be mutated while their write is pending, since
+    they are serialized as they are when written.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self._queue: queue.Queue[tuple[_Location, _PendingWrite]] = (
+            queue.Queue(maxsize=max_pending)
+        )
+        # Writes that haven't completed yet; the latest for each location
+        self._pending: dict[_Location, _PendingWrite] = {}
+        self._written = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, loader: BasePersistenceLoader, cache: Cache) -> None:
+        location = _location(loader.store, str(loader.build_path(cache.key)))
+        ctx = safe_get_context()
+        write = _PendingWrite(
+            cache=cache,
+            loader=loader,
+            stream=ctx.stream if ctx is not None else None,
+            cell_id=ctx.cell_id if ctx is not None else None,
+        )
+        with self._written:
+            self._pending[location] = write
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="marimo-cache-writer", daemon=True
+                )
+                self._thread.start()
+                # Scripts exit without tearing down a kernel
+                atexit.register(self.flush_or_abandon, SHUTDOWN_TIMEOUT)
+        # Blocks while the queue is full
+        self._queue.put((location, write))
+
+    def get(self, store: Store, path: str) -> Optional[Cache]:
+        """A cache that is waiting to be written, if any."""
+        with self._written:
+            write = self._pending.get(_location(store, path))
+            return write.cache if write is not None else None
+
+    def flush(
+        self,
+        timeout: Optional[float] = None,
+        *,
+        loader: Optional[BasePersistenceLoader] = None,
+        stream: Optional[Stream] = None,
+    ) -> bool:
+        """Wait for pending writes; returns False on timeout.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until they complete.
+            loader: Only wait for writes to this loader's caches (in its
+                store and under its name).
+            stream: Only wait for writes from the kernel with this stream.
+        """
+        matches = _matcher(loader, stream)
+        with self._written:
+            return self._written.wait_for(
+                lambda: not any(
+                    matches(location, write)
+                    for location, write in self._pending.items()
+                ),
+                timeout=timeout,
+            )
+
+    def flush_or_abandon(
+        self, timeout: Optional[float], *, stream: Optional[Stream] = None
+    ) -> bool:
+        """Like `flush`, but logs the writes still pending on timeout."""
+        if self.flush(timeout, stream=stream):
+            return True
+        matches = _matcher(None, stream)
+        with self._written:
+            abandoned = [
+                location[1]
+                for location, write in self._pending.items()
+                if matches(location, write)
+            ]
+        if abandoned:
+            LOGGER.warning(
+                "Abandoning %d cache writes still pending after %ss: %s",
+                len(abandoned),
+                timeout,
+                ", ".join(abandoned),
+            )
+        return not abandoned
+
+    def _run(self) -> None:
+        while True:
+            location, write = self._queue.get()
+            path = location[1]
+            try:
+                blob = write.loader.to_blob(write.cache)
+                if blob is not None and not write.loader.store.put(path, blob):
+                    _report_failure(write, path, "the store rejected it")
+            except Exception as e:
+                _report_failure(write, path, str(e))
+            finally:
+                with self._written:
+                    # Unless it was saved again in the meantime
+                    if self._pending.get(location) is write:
+                        del self._pending[location]
+                    self._written.notify_all()
+
+
+def _location(store: Store, path: str) -> _Location:
+    # File stores with the same directory share their caches
+    if isinstance(store, FileStore):
+        return str(store.save_path.resolve()), path
+    return store, path
+
+
+def _matcher(
+    loader: Optional[BasePersistenceLoader], stream: Optional[Stream]
+) -> Callable[[_Location, _PendingWrite], bool]:
+    scope = (
+        (_location(loader.store, loader.name)[0], Path(loader.name))
+        if loader is not None
+        else None
+    )
+
+    def matches(location: _Location, write: _PendingWrite) -> bool:
+        if stream is not None and write.stream is not stream:
+            return False
+        if scope is None:
+            return True
+        # Loaders write their caches to `<name>/<file>` in their store
+        return location[0] == scope[0] and Path(location[1]).parent == scope[1]
+
+    return matches
+
+
+def _report_failure(write: _PendingWrite, path: str, error: str) -> None:
+    """Log a failed write, and show it in the console of the cell that saved
+    the cache."""
+    LOGGER.error("Failed to write cache %s: %s", path, error)
+    if write.stream is None or write.cell_id is None:
+        return
+
+    from marimo._messaging.cell_output import CellChannel
+    from marimo._messaging.notification_utils import CellNotificationUtils
+
+    try:
+        CellNotificationUtils.broadcast_console_output(
+            channel=CellChannel.STDERR,
+            mimetype="text/plain",
+            data=f"Failed to write persistent cache {path}: {error}\n",
+            cell_id=write.cell_id,
+            status=None,
+            stream=write.stream,
+        )
+    except Exception as e:
+        # The kernel may have shut down
+        LOGGER.debug("Failed to report cache write failure: %s", e)
+
+
+_WRITER: Optional[CacheWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_cache_writer() -> CacheWriter:
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = CacheWriter()
+        return _WRITER
+
+
+def flush_cache_writes(
+    timeout: Optional[float] = None, *, stream: Optional[Stream] = None
+) -> bool:
+    """Wait for pending write-behind writes; returns False on timeout.
+
+    Writes still pending on timeout are logged as abandoned. With `stream`,
+    only waits for writes from the kernel with that stream.
+    """
+    if _WRITER is None:
+        return True
+    return _WRITER.flush_or_abandon(timeout, stream=stream)
@@ -0,0 +1,238 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import hashlib
+import pickle
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any, Optional
+
+from marimo import _loggers
+from marimo._output.hypertext import Html
+from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._runtime.context import safe_get_context
+from marimo._runtime.state import SetFunctor, State
+from marimo._save.cache import MARIMO_CACHE_VERSION, Cache, CacheException
+from marimo._save.hash import (
+    DEFAULT_HASH,
+    HashKey,
+    common_container_to_bytes,
+    hash_cell_impl,
+)
+from marimo._save.loaders import PickleLoader
+from marimo._save.loaders.loader import LoaderError
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import CellImpl
+    from marimo._runtime.dataflow import DirectedGraph
+    from marimo._runtime.runner.cell_runner import RunResult
+    from marimo._save.stores import Store
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+
+class NotebookCache:
+    """Restores cells from a persistent cache instead of running them.
+
+    Enabled with the `cache_cells` experimental flag, in edit mode only
+    (in run mode, cells can depend on the viewer's request). Each cell is
+    keyed by its code, the keys of the cells defining its refs (as of their
+    last run), the values of the UI elements and state objects it
+    references, and the notebook's CLI args and query params, so a key
+    changes whenever the cell or anything upstream of it changes. On a hit,
+    the cell's defs and output are restored from the cache store; on a miss,
+    the cell runs and, if it succeeds, its defs and output are saved under
+    its key.
+
+    Cells are assumed to depend only on their code and their refs (not on
+    files, the clock, randomness, ...), and console output is not replayed.
+    Cells that can't be restored faithfully always run: cells that set state,
+    define classes, state or UI elements, display UI elements, append outputs
+    imperatively, or whose defs or output can't be pickled. Since such a
+    cell's results may differ from run to run, its descendants are keyed on
+    the contents of its defs instead of its key, and always run if those
+    can't be hashed (or the cell failed). Cells that define nothing (such as
+    cells that only mutate their refs) always run too.
+    """
+
+    def __init__(
+        self, filename: Optional[str], store: Optional[Store] = None
+    ) -> None:
+        stem = Path(filename).stem if filename else "notebook"
+        self.name = f"{stem}_cells"
+        self._store = store
+        self._loader: Optional[PickleLoader] = None
+        # Key of each cell as of its last run; None if it couldn't be keyed
+        self._keys: dict[CellId_t, Optional[str]] = {}
+        # Cells running on a miss, with the key to save their results under
+        self._misses: dict[CellId_t, str] = {}
+
+    @property
+    def loader(self) -> PickleLoader:
+        # Created on first use, once the runtime context (and so the
+        # configured store) is available
+        if self._loader is None:
+            self._loader = PickleLoader(self.name, store=self._store)
+        return self._loader
+
+    def key(
+        self, cell: CellImpl, graph: DirectedGraph, glbls: dict[str, Any]
+    ) -> Optional[str]:
+        """The cell's key, or None if the cell can't be cached."""
+        if not cell.defs:
+            # Run for its side effects, which restoring would skip
+            return None
+        hasher = hashlib.new(DEFAULT_HASH, usedforsecurity=False)
+        hasher.update(bytes(f"{MARIMO_CACHE_VERSION}", "utf-8"))
+        hasher.update(hash_cell_impl(cell))
+        ctx = safe_get_context()
+        if ctx is not None:
+            # Read with mo.cli_args() and mo.query_params(), not refs
+            try:
+                hasher.update(
+                    common_container_to_bytes(
+                        [ctx.cli_args.to_dict(), ctx.query_params.to_dict()]
+                    )
+                )
+            except Exception:
+                return None
+        for ref in sorted(cell.refs):
+            hasher.update(bytes(ref, "utf-8"))
+            for parent in sorted(graph.get_defining_cells(ref)):
+                if parent == cell.cell_id:
+                    continue
+                parent_key = self._keys.get(parent)
+                if parent_key is None:
+                    return None
+                hasher.update(bytes(parent_key, "utf-8"))
+
+            value = glbls.get(ref)
+            if isinstance(value, SetFunctor):
+                # Setting state is a side effect that restoring would skip
+                return None
+            if isinstance(value, UIElement):
+                value = value.value
+            elif isinstance(value, State):
+                value = value()
+            else:
+                continue
+            try:
+                hasher.update(common_container_to_bytes(value))
+            except Exception:
+                return None
+        return hasher.hexdigest()
+
+    def restore(
+        self, cell: CellImpl, graph: DirectedGraph, glbls: dict[str, Any]
+    ) -> Optional[Cache]:
+        """Restore the cell's defs into `glbls`, returning the cache on a hit.
+
+        On a miss, the cell should run and be passed to `save`.
+        """
+        cell_id = cell.cell_id
+        self._misses.pop(cell_id, None)
+        key = self.key(cell, graph, glbls)
+        self._keys[cell_id] = key
+        if key is None:
+            return None
+
+        try:
+            cache = self.loader.load_cache(_hash_key(key))
+            if cache is not None:
+                cache.restore(glbls)
+                LOGGER.debug("Restored cell %s from the cache", cell_id)
+                return cache
+        except (Exception, CacheException, LoaderError) as e:
+            LOGGER.warning("Failed to restore cell %s: %s", cell_id, e)
+        self._misses[cell_id] = key
+        return None
+
+    def save(
+        self, cell: CellImpl, glbls: dict[str, Any], run_result: RunResult
+    ) -> None:
+        """Save the defs and output of a cell that ran on a miss."""
+        key = self._misses.pop(cell.cell_id, None)
+        if key is None:
+            # Restored, or not cacheable
+            return
+        if not self._save(cell, glbls, run_result, key):
+            # The cell will run again next time, possibly with different
+            # results, so its key doesn't identify them
+            self._keys[cell.cell_id] = (
+                _content_key(cell, glbls, key)
+                if run_result.success()
+                and run_result.accumulated_output is None
+                else None
+            )
+
+    def _save(
+        self,
+        cell: CellImpl,
+        glbls: dict[str, Any],
+        run_result: RunResult,
+        key: str,
+    ) -> bool:
+        if (
+            not run_result.success()
+            or run_result.accumulated_output is not None
+        ):
+            return False
+        output = run_result.output
+        values = [glbls.get(name) for name in cell.defs]
+        if any(
+            # Classes pickle by reference, to the cell that defines them
+            isinstance(value, (type, UIElement, State, SetFunctor))
+            for value in [*values, output]
+        ) or (
+            isinstance(output, Html) and "<marimo-ui-element" in output.text
+        ):
+            return False
+
+        cache = Cache.empty(
+            key=_hash_key(key), defs=set(cell.defs), stateful_refs=set()
+        )
+        try:
+            # Without preserving pointers, so that the notebook's values
+            # aren't replaced by stubs
+            cache.update(glbls, {"return": output}, preserve_pointers=False)
+            return self.loader.save_cache(cache)
+        except (Exception, CacheException) as e:
+            LOGGER.debug("Not caching cell %s: %s", cell.cell_id, e)
+            return False
+
+    def clear(self) -> None:
+        self.loader.clear()
+
+
+def _content_key(
+    cell: CellImpl, glbls: dict[str, Any], key: str
+) -> Optional[str]:
+    """A key for the values of the cell's defs, or None if they can't be hashed."""
+    hasher = hashlib.new(DEFAULT_HASH, usedforsecurity=False)
+    hasher.update(bytes(key, "utf-8"))
+    for name in sorted(cell.defs):
+        value = glbls.get(name)
+        hasher.update(bytes(name, "utf-8"))
+        if isinstance(value, (ModuleType, FunctionType, type)):
+            # Determined by the cell's code, which is part of its key
+            continue
+        if isinstance(value, (UIElement, State)):
+            # Descendants that reference these are keyed on their values
+            continue
+        try:
+            hasher.update(common_container_to_bytes(value))
+            continue
+        except Exception:
+            pass
+        try:
+            hasher.update(
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except Exception:
+            return None
+    return hasher.hexdigest()
+
+
+def _hash_key(key: str) -> HashKey:
+    return HashKey(hash=key, cache_type="ExecutionPath")
@@ -1058,6 +1058,7 @@ def persistent_cache(
     save_path: str | None = None,
     method: LoaderKey = "pickle",
     pin_modules: bool = False,
+    write_behind: bool = False,
 ) -> _cache_context: ...
 
 
@@ -1067,6 +1068,7 @@ def persistent_cache(
     save_path: str | None = None,
     method: LoaderKey = "pickle",
     pin_modules: bool = False,
+    write_behind: bool = False,
 ) -> _cache_call: ...
 
 
@@ -1078,6 +1080,7 @@ def persistent_cache(  # type: ignore[misc]
     fn: Optional[Callable[..., Any]] = None,
     *args: Any,
     pin_modules: bool = False,
+    write_behind: bool = False,
     _internal_interface_not_for_external_use: None = None,
     **kwargs: Any,
 ) -> Union[_cache_call, _cache_context]:
@@ -1150,6 +1153,12 @@ def persistent_cache(  # type: ignore[misc]
         *args: positional arguments passed to `cache()`
         pin_modules: if True, the cache will be invalidated if module versions
             differ between runs, defaults to False.
+        write_behind: if True, values are written to the store on a background
+            thread, so that execution continues without waiting for them to be
+            serialized and written; until then, they're restored from memory.
+            Pending writes are completed when the kernel shuts down or the
+            script exits; to wait for them, call `cache_flush()` on the
+            cache. Defaults to False.
         **kwargs: keyword arguments passed to `cache()`
     """
 
@@ -1176,7 +1185,7 @@ def persistent_cache(  # type: ignore[misc]
     if save_path is not None:
         store = FileStore(save_path)
 
-    partial_args: dict[str, Any] = {}
+    partial_args: dict[str, Any] = {"write_behind": write_behind}
     if store is not None:
         partial_args["store"] = store
 
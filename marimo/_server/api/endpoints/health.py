@@ -5,10 +5,17 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional
 
 from starlette.authentication import requires
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
 from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
+from marimo._metrics import (
+    KERNELS,
+    SESSIONS,
+    WEBSOCKET_BACKLOG,
+    WEBSOCKET_CONNECTIONS,
+    metrics_enabled,
+)
 from marimo._server.api.deps import AppState
 from marimo._server.router import APIRouter
 from marimo._utils.health import (
@@ -39,6 +46,43 @@ router.add_route("/health", health_check, methods=["GET"])
 router.add_route("/healthz", health_check, methods=["GET"])
 
 
+def metrics(request: Request) -> Response:
+    """Prometheus metrics, when enabled with MARIMO_METRICS=true."""
+    if not metrics_enabled():
+        return PlainTextResponse("Metrics are disabled", status_code=404)
+
+    from marimo._metrics import multiprocess, prometheus
+    from marimo._server.api.endpoints.ws.ws_message_loop import (
+        websocket_backlog,
+    )
+    from marimo._session.types import KernelState
+
+    session_manager = AppState(request).session_manager
+    sessions = list(session_manager.sessions.values())
+    SESSIONS.set(len(sessions))
+    KERNELS.set(
+        sum(
+            session.kernel_state() == KernelState.RUNNING
+            for session in sessions
+        ),
+        mode=session_manager.mode.value,
+    )
+    WEBSOCKET_CONNECTIONS.set(
+        sum(len(session.consumers) for session in sessions)
+    )
+    WEBSOCKET_BACKLOG.set(websocket_backlog())
+
+    return Response(
+        prometheus.render(multiprocess.collect()),
+        media_type=prometheus.CONTENT_TYPE,
+    )
+
+
+# Unauthenticated like the health checks, so scrapers don't need a token;
+# only served when explicitly enabled.
+router.add_route("/metrics", metrics, methods=["GET"])
+
+
 @router.get("/api/status")
 @requires("edit")
 async def status(request: Request) -> JSONResponse:
@@ -8,6 +8,7 @@ import tempfile
 from typing import TYPE_CHECKING
 
 from starlette.authentication import requires
+from starlette.exceptions import HTTPException
 from starlette.responses import JSONResponse
 
 from marimo import _loggers
@@ -30,6 +31,7 @@ from marimo._server.models.home import (
 from marimo._server.router import APIRouter
 from marimo._session.model import ConnectionState
 from marimo._tutorials import create_temp_tutorial_file  # type: ignore
+from marimo._utils.http import HTTPStatus
 from marimo._utils.paths import pretty_path
 
 if TYPE_CHECKING:
@@ -100,7 +102,26 @@ async def workspace_files(
         session_manager.file_router = (
             session_manager.file_router.toggle_markdown(body.include_markdown)
         )
-        root = session_manager.file_router.directory
+        router = session_manager.file_router
+        root = router.directory
+
+        # Serve a page of results from the workspace index; run in a
+        # thread pool to avoid blocking the server on the first scan
+        limit = body.limit if body.limit is not None else MAX_FILES
+        try:
+            files, file_count = await asyncio.to_thread(
+                router.search, body.query, body.offset, limit
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST, detail=str(e)
+            ) from e
+        return WorkspaceFilesResponse(
+            files=files,
+            root=root,
+            has_more=body.offset + limit < file_count,
+            file_count=file_count,
+        )
 
     # Run file scanning in thread pool to avoid blocking the server
     files = await asyncio.to_thread(lambda: session_manager.file_router.files)
@@ -19,6 +19,9 @@ LOGGER = _loggers.marimo_logger()
 SESSION_QUERY_PARAM_KEY = "session_id"
 FILE_QUERY_PARAM_KEY = "file"
 KIOSK_QUERY_PARAM_KEY = "kiosk"
+# Opt-in wire format negotiation (see ws_formatter)
+WIRE_FORMAT_QUERY_PARAM_KEY = "wire_format"
+WIRE_COMPRESSION_QUERY_PARAM_KEY = "wire_compression"
 
 
 @dataclass
@@ -30,6 +33,10 @@ class ConnectionParams:
     kiosk: bool
     auto_instantiate: bool
     rtc_enabled: bool
+    # Send batched frames of newline-delimited messages
+    batched: bool = False
+    # Deflate-compress large batched frames
+    compressed: bool = False
 
 
 class WebSocketConnectionValidator:
@@ -85,6 +92,16 @@ class WebSocketConnectionValidator:
         # Extract kiosk mode
         kiosk = self.app_state.query_params(KIOSK_QUERY_PARAM_KEY) == "true"
 
+        # Extract wire format
+        batched = (
+            self.app_state.query_params(WIRE_FORMAT_QUERY_PARAM_KEY) == "batch"
+        )
+        compressed = (
+            batched
+            and self.app_state.query_params(WIRE_COMPRESSION_QUERY_PARAM_KEY)
+            == "deflate"
+        )
+
         # Extract config-based parameters
         config = self.app_state.config_manager_at_file(file_key).get_config()
         rtc_enabled = config.get("experimental", {}).get("rtc_v2", False)
@@ -96,6 +113,8 @@ class WebSocketConnectionValidator:
             kiosk=kiosk,
             auto_instantiate=auto_instantiate,
             rtc_enabled=rtc_enabled,
+            batched=batched,
+            compressed=compressed,
         )
 
     async def extract_file_key_only(self) -> Optional[MarimoFileKey]:
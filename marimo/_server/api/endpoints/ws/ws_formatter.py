@@ -3,17 +3,28 @@
 
 This module handles the wire format for WebSocket transport:
 wrapping serialized notification data with operation metadata.
+
+Clients can opt in to a batched format, in which a single frame carries
+several messages separated by newlines (serialized notifications never
+contain raw newlines), and large frames are sent as deflate-compressed
+binary frames.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import zlib
+from typing import TYPE_CHECKING, Union
 
 from marimo._messaging.serde import serialize_kernel_message
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from marimo._messaging.notification import NotificationMessage
 
+# Frames at least this large are compressed when the client supports it
+COMPRESSION_THRESHOLD_BYTES = 32 * 1024
+
 
 def format_wire_message(op: str, data: bytes) -> str:
     """Format a serialized message for WebSocket transport.
@@ -48,3 +59,30 @@ def serialize_notification_for_websocket(
     serialized = serialize_kernel_message(notification)
     op = notification.name
     return format_wire_message(op, serialized)
+
+
+def format_wire_batch(messages: Sequence[tuple[str, bytes]]) -> bytes:
+    """Format several serialized messages into one batched frame.
+
+    Args:
+        messages: (operation name, serialized notification data) pairs
+
+    Returns:
+        UTF-8 encoded, newline-delimited wire messages
+    """
+    return b"\n".join(
+        b'{"op": "' + op.encode("utf-8") + b'", "data": ' + data + b"}"
+        for op, data in messages
+    )
+
+
+def encode_wire_frame(frame: bytes, *, compress: bool) -> Union[str, bytes]:
+    """Encode a batched frame for sending.
+
+    Returns text for small frames (or when compression is off), and
+    zlib-compressed bytes, to be sent as a binary frame, otherwise.
+    """
+    if compress and len(frame) >= COMPRESSION_THRESHOLD_BYTES:
+        # Favor speed: these frames are sent interactively
+        return zlib.compress(frame, 1)
+    return frame.decode("utf-8")
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Callable
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Union
 
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
@@ -13,7 +14,13 @@ from marimo._messaging.notification import (
 )
 from marimo._messaging.serde import deserialize_kernel_notification_name
 from marimo._messaging.types import KernelMessage
-from marimo._server.api.endpoints.ws.ws_formatter import format_wire_message
+from marimo._metrics import NOTIFICATION_BYTES, NOTIFICATIONS_SENT
+from marimo._server.api.endpoints.ws.ws_formatter import (
+    COMPRESSION_THRESHOLD_BYTES,
+    encode_wire_frame,
+    format_wire_batch,
+    format_wire_message,
+)
 
 if TYPE_CHECKING:
     from starlette.websockets import WebSocket
@@ -30,6 +37,17 @@ KIOSK_EXCLUDED_OPERATIONS = {
     CompletionResultNotification.name,
 }
 
+# Upper bounds on a single batched frame
+MAX_BATCH_MESSAGES = 512
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+_ACTIVE_LOOPS: weakref.WeakSet[WebSocketMessageLoop] = weakref.WeakSet()
+
+
+def websocket_backlog() -> int:
+    """Messages queued for all connected websockets but not yet sent."""
+    return sum(loop.message_queue.qsize() for loop in list(_ACTIVE_LOOPS))
+
 
 class WebSocketMessageLoop:
     """Handles the async message send/receive loops for WebSocket."""
@@ -41,14 +59,19 @@ class WebSocketMessageLoop:
         kiosk: bool,
         on_disconnect: Callable[[Exception, Callable[[], Any]], None],
         on_check_status_update: Callable[[], None],
+        batched: bool = False,
+        compressed: bool = False,
     ):
         self.websocket = websocket
         self.message_queue = message_queue
         self.kiosk = kiosk
+        self.batched = batched
+        self.compressed = compressed
         self.on_disconnect = on_disconnect
         self.on_check_status_update = on_check_status_update
         self._listen_messages_task: asyncio.Task[None] | None = None
         self._listen_disconnect_task: asyncio.Task[None] | None = None
+        _ACTIVE_LOOPS.add(self)
 
     async def start(self) -> None:
         """Start the message loops.
@@ -71,6 +94,10 @@ class WebSocketMessageLoop:
 
     async def _listen_for_messages(self) -> None:
         """Listen for messages from kernel and send to frontend."""
+        if self.batched:
+            await self._listen_for_messages_batched()
+            return
+
         while True:
             data = await self.message_queue.get()
             op: str = deserialize_kernel_notification_name(data)
@@ -78,6 +105,8 @@ class WebSocketMessageLoop:
             if self._should_filter_operation(op):
                 continue
 
+            self._record_sent(op, data)
+
             # Serialize message
             try:
                 text = format_wire_message(op, data)
@@ -86,28 +115,73 @@ class WebSocketMessageLoop:
                 LOGGER.error("Message: %s", data)
                 continue
 
-            # Send to WebSocket
-            try:
-                await self.websocket.send_text(text)
-            except WebSocketDisconnect as e:
-                self.on_disconnect(e, self._cancel_disconnect_task)
-            except RuntimeError as e:
-                # Starlette can raise a runtime error if a message is sent
-                # when the socket is closed. In case the disconnection
-                # error hasn't made its way to listen_for_disconnect, do
-                # the cleanup here.
-                if (
-                    self.websocket.application_state
-                    == WebSocketState.DISCONNECTED
-                ):
-                    self.on_disconnect(e, self._cancel_disconnect_task)
+            await self._send(text)
+
+    async def _listen_for_messages_batched(self) -> None:
+        """Send kernel messages in batches.
+
+        Waits for one message, then drains whatever else is already
+        queued (up to a size limit) into the same frame. This adds no
+        latency for a lone message, while bursts (e.g. running all cells)
+        are sent as a few large frames instead of thousands of small ones.
+        """
+        while True:
+            batch: list[tuple[str, bytes]] = []
+            size = 0
+            data = await self.message_queue.get()
+            while True:
+                try:
+                    op: str = deserialize_kernel_notification_name(data)
+                except Exception as e:
+                    LOGGER.error("Failed to deserialize message: %s", str(e))
+                    LOGGER.error("Message: %s", data)
                 else:
-                    LOGGER.error(
-                        "Error sending message to frontend: %s", str(e)
-                    )
-            except Exception as e:
+                    if not self._should_filter_operation(op):
+                        self._record_sent(op, data)
+                        batch.append((op, data))
+                        size += len(data)
+                if len(batch) >= MAX_BATCH_MESSAGES or size >= MAX_BATCH_BYTES:
+                    break
+                try:
+                    data = self.message_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+            if not batch:
+                continue
+
+            frame = format_wire_batch(batch)
+            payload: Union[str, bytes]
+            if self.compressed and len(frame) >= COMPRESSION_THRESHOLD_BYTES:
+                # Compress off the event loop
+                payload = await asyncio.to_thread(
+                    encode_wire_frame, frame, compress=True
+                )
+            else:
+                payload = encode_wire_frame(frame, compress=False)
+            await self._send(payload)
+
+    async def _send(self, payload: Union[str, bytes]) -> None:
+        """Send a text or binary frame to the frontend."""
+        try:
+            if isinstance(payload, bytes):
+                await self.websocket.send_bytes(payload)
+            else:
+                await self.websocket.send_text(payload)
+        except WebSocketDisconnect as e:
+            self.on_disconnect(e, self._cancel_disconnect_task)
+        except RuntimeError as e:
+            # Starlette can raise a runtime error if a message is sent
+            # when the socket is closed. In case the disconnection
+            # error hasn't made its way to listen_for_disconnect, do
+            # the cleanup here.
+            if self.websocket.application_state == WebSocketState.DISCONNECTED:
+                self.on_disconnect(e, self._cancel_disconnect_task)
+            else:
                 LOGGER.error("Error sending message to frontend: %s", str(e))
-                raise e
+        except Exception as e:
+            LOGGER.error("Error sending message to frontend: %s", str(e))
+            raise e
 
     async def _listen_for_disconnect(self) -> None:
         """Listen for WebSocket disconnect."""
@@ -122,6 +196,11 @@ class WebSocketMessageLoop:
             LOGGER.error("Error listening for disconnect: %s", str(e))
             raise e
 
+    @staticmethod
+    def _record_sent(op: str, data: KernelMessage) -> None:
+        NOTIFICATIONS_SENT.inc(op=op)
+        NOTIFICATION_BYTES.observe(len(data), op=op)
+
     def _should_filter_operation(self, op: str) -> bool:
         """Determine if operation should be filtered based on kiosk mode.
 
@@ -402,6 +402,8 @@ class WebSocketHandler(SessionConsumer):
             websocket=self.websocket,
             message_queue=self.message_queue,
             kiosk=self.params.kiosk,
+            batched=self.params.batched,
+            compressed=self.params.compressed,
             on_disconnect=self._on_disconnect,
             on_check_status_update=self._check_status_update,
         )
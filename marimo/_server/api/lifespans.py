@@ -208,10 +208,11 @@ async def signal_handler(app: Starlette) -> AsyncIterator[None]:
 
 @contextlib.asynccontextmanager
 async def etc(app: Starlette) -> AsyncIterator[None]:
-    del app
     # Mimetypes
     initialize_mimetypes()
     yield
+    # Stop watching the workspace
+    AppState.from_app(app).session_manager.file_router.close()
 
 
 def _startup_url(state: AppStateBase) -> str:
@@ -5,7 +5,6 @@ import asyncio
 import time
 from collections.abc import AsyncIterable
 from dataclasses import dataclass
-from http.client import HTTPResponse, HTTPSConnection
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -39,6 +38,12 @@ from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._server.api.auth import validate_auth
 from marimo._server.api.deps import AppState, AppStateBase
+from marimo._server.api.proxy_client import (
+    ProxyProtocolError,
+    RequestBody,
+    UpstreamResponse,
+    send_request,
+)
 from marimo._server.codes import WebSocketCodes
 from marimo._server.uvicorn_utils import close_uvicorn
 from marimo._session.model import SessionMode
@@ -52,6 +57,10 @@ if TYPE_CHECKING:
 
 LOGGER = _loggers.marimo_logger()
 
+# Proxied request bodies up to this size are buffered (and retryable);
+# larger ones are streamed to the upstream.
+SMALL_BODY_BYTES = 64 * 1024
+
 
 def _handle_proxy_connection_error(
     _error: ConnectionRefusedError,
@@ -228,33 +237,32 @@ class _URLRequest:
 
 
 class _AsyncHTTPResponse:
-    def __init__(self, response: HTTPResponse):
+    def __init__(self, response: UpstreamResponse):
         self.raw_response = response
-        self.status_code = response.status
-        self.headers = {k.lower(): v for k, v in response.getheaders()}
+        self.status_code = response.status_code
+        self.headers = response.headers
 
     async def aiter_raw(self) -> AsyncIterable[bytes]:
-        try:
-            while True:
-                chunk = self.raw_response.read(8192)
-                if not chunk:
-                    break
-                yield chunk
-        except Exception:
-            raise
-        finally:
-            await self.aclose()
+        async for chunk in self.raw_response.aiter_bytes():
+            yield chunk
 
     async def aclose(self) -> None:
-        self.raw_response.close()
+        await self.raw_response.aclose()
 
 
 class _AsyncHTTPClient:
+    """Proxies requests to an upstream over pooled keep-alive connections.
+
+    Request and response bodies are streamed; see `proxy_client`.
+    """
+
     def __init__(self, base_url: str, timeout: float = 30.0):
         self.base_url = base_url.rstrip("/")
         parsed = urlparse(base_url)
         self.host = parsed.netloc
         self.is_https = parsed.scheme == "https"
+        self.hostname = parsed.hostname or "localhost"
+        self.port = parsed.port or (443 if self.is_https else 80)
         self.timeout = timeout
 
     def build_request(
@@ -278,25 +286,29 @@ class _AsyncHTTPClient:
         request.method = method
         return request
 
-    async def _collect_body(self, request: _URLRequest) -> bytes:
+    async def _request_body(self, request: _URLRequest) -> RequestBody:
         if not hasattr(request, "data") or request.data is None:
-            return b""
+            return None
 
         if isinstance(request.data, AsyncIterable):
-            chunks: list[bytes] = []
-            try:
-                async for chunk in request.data:
-                    if isinstance(chunk, str):
-                        chunks.append(chunk.encode())
-                    elif isinstance(chunk, bytes):
-                        chunks.append(chunk)
-                    else:
-                        # Handle unexpected types
-                        chunks.append(str(chunk).encode())
-                return b"".join(chunks)
-            except Exception as e:
-                LOGGER.error(f"Error collecting async request body: {e}")
-                raise
+            content_length = next(
+                (
+                    value
+                    for name, value in request.headers.items()
+                    if name.lower() == "content-length"
+                ),
+                None,
+            )
+            chunks = _iter_bytes(request.data)
+            if (
+                content_length is not None
+                and content_length.isdigit()
+                and int(content_length) <= SMALL_BODY_BYTES
+            ):
+                # Small bodies are read up front so that the request can
+                # be retried on a fresh connection
+                return b"".join([chunk async for chunk in chunks])
+            return chunks
         if isinstance(request.data, str):
             return request.data.encode()
         if isinstance(request.data, bytes):
@@ -308,47 +320,40 @@ class _AsyncHTTPClient:
             f"Unsupported request data type: {type(request.data)}"
         )
 
-    def _send_request(self, request: _URLRequest, body: bytes) -> HTTPResponse:
-        from http.client import HTTPConnection
-
-        parsed_url = urlparse(request.full_url)
-        path_and_query = parsed_url.path
-        if parsed_url.query:
-            path_and_query += f"?{parsed_url.query}"
-
-        conn_class = HTTPSConnection if self.is_https else HTTPConnection
-        conn = conn_class(self.host, timeout=self.timeout)
-
-        method = request.method or "GET"
-
-        try:
-            conn.request(
-                method=method,
-                url=path_and_query,  # Only path and query
-                body=body,
-                headers=request.headers,
-            )
-            resp = conn.getresponse()
-            return resp  # type: ignore[no-any-return]
-        except Exception:
-            raise
-
     async def send(
         self, request: _URLRequest, stream: bool = False, max_retries: int = 2
     ) -> _AsyncHTTPResponse:
         del stream
-        loop = asyncio.get_event_loop()
+        parsed_url = urlparse(request.full_url)
+        path_and_query = parsed_url.path or "/"
+        if parsed_url.query:
+            path_and_query += f"?{parsed_url.query}"
 
-        body = await self._collect_body(request)
+        body = await self._request_body(request)
+        replayable = not isinstance(body, AsyncIterable)
 
         for attempt in range(max_retries + 1):
             try:
-                response = await loop.run_in_executor(
-                    None, lambda: self._send_request(request, body)
+                response = await send_request(
+                    scheme="https" if self.is_https else "http",
+                    host=self.hostname,
+                    port=self.port,
+                    method=request.method or "GET",
+                    target=path_and_query,
+                    headers=request.headers,
+                    body=body,
+                    timeout=self.timeout,
                 )
                 return _AsyncHTTPResponse(response)
-            except (ConnectionError, TimeoutError) as e:
-                if attempt < max_retries:
+            except ProxyProtocolError:
+                raise
+            # asyncio.TimeoutError is only an alias of TimeoutError from
+            # Python 3.11
+            except (ConnectionError, TimeoutError, asyncio.TimeoutError) as e:
+                # A streamed body can't be re-sent, unless we never
+                # connected in the first place
+                can_retry = replayable or isinstance(e, ConnectionRefusedError)
+                if attempt < max_retries and can_retry:
                     # Exponential backoff
                     wait_time = 0.1 * (2**attempt)
                     LOGGER.warning(
@@ -362,6 +367,17 @@ class _AsyncHTTPClient:
         raise ValueError("Failed to send request")
 
 
+async def _iter_bytes(data: AsyncIterable[Any]) -> AsyncIterable[bytes]:
+    async for chunk in data:
+        if isinstance(chunk, bytes):
+            yield chunk
+        elif isinstance(chunk, str):
+            yield chunk.encode()
+        else:
+            # Handle unexpected types
+            yield str(chunk).encode()
+
+
 class ProxyMiddleware:
     def __init__(
         self,
@@ -439,11 +455,16 @@ class ProxyMiddleware:
 
         headers = {k.decode(): v.decode() for k, v in request.headers.raw}
 
+        # A request has a body only if it declares one (RFC 9112)
+        has_body = (
+            "content-length" in request.headers
+            or "transfer-encoding" in request.headers
+        )
         rp_req = client.build_request(
             request.method,
             url,
             headers=headers,
-            content=request.stream(),
+            content=request.stream() if has_body else None,
         )
 
         response: Union[StreamingResponse, Response]
@@ -460,6 +481,13 @@ class ProxyMiddleware:
                 response = self.connection_error_handler(e, request.url.path)
             else:
                 raise
+        except ProxyProtocolError as e:
+            LOGGER.warning(f"Invalid response from upstream: {e}")
+            response = Response(
+                content="Bad Gateway",
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                media_type="text/plain",
+            )
 
         await response(scope, receive, send)
 
@@ -0,0 +1,419 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""A minimal streaming HTTP/1.1 client for the reverse proxy.
+
+Connections to each upstream are kept alive and pooled, request bodies
+are streamed to the upstream as they are received, and response bodies
+are streamed back as the client consumes them. Reads and writes are
+awaited on the event loop, so a slow reader or writer applies
+backpressure to the other side instead of buffering whole bodies in
+memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Optional, Union
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+LOGGER = _loggers.marimo_logger()
+
+# Headers that describe a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+
+CHUNK_SIZE = 64 * 1024
+# Most servers (uvicorn, node) close idle keep-alive connections after
+# 5 seconds; stay below that to avoid reusing a connection being closed.
+IDLE_TIMEOUT = 4.0
+MAX_IDLE_PER_HOST = 16
+MAX_HEADER_LINES = 200
+
+RequestBody = Union[None, bytes, AsyncIterable[bytes]]
+PoolKey = tuple[str, str, int]
+
+
+class ProxyProtocolError(ConnectionError):
+    """The upstream sent a response that could not be parsed."""
+
+
+async def _readline(reader: asyncio.StreamReader, timeout: float) -> bytes:
+    try:
+        return await asyncio.wait_for(reader.readline(), timeout)
+    except (ValueError, asyncio.LimitOverrunError) as e:
+        # The line doesn't fit in the reader's buffer (CHUNK_SIZE)
+        raise ProxyProtocolError(
+            "Upstream sent a line that is too long"
+        ) from e
+
+
+class _Connection:
+    def __init__(
+        self,
+        key: PoolKey,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.idle_since = time.monotonic()
+        # Whether this connection has served a request before
+        self.reused = False
+
+    def is_usable(self) -> bool:
+        return (
+            not self.writer.is_closing()
+            and not self.reader.at_eof()
+            and time.monotonic() - self.idle_since < IDLE_TIMEOUT
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Keep-alive connections, grouped by upstream (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[PoolKey, deque[_Connection]] = {}
+
+    async def acquire(self, key: PoolKey, timeout: float) -> _Connection:
+        idle = self._idle.get(key)
+        while idle:
+            conn = idle.pop()
+            if conn.is_usable():
+                conn.reused = True
+                return conn
+            conn.close()
+
+        scheme, host, port = key
+        ssl_context = (
+            ssl.create_default_context() if scheme == "https" else None
+        )
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=ssl_context,
+                server_hostname=host if ssl_context else None,
+                limit=CHUNK_SIZE,
+            ),
+            timeout,
+        )
+        return _Connection(key, reader, writer)
+
+    def release(self, conn: _Connection) -> None:
+        """Return a connection whose response was fully read."""
+        idle = self._idle.setdefault(conn.key, deque())
+        if len(idle) >= self.max_idle_per_host or not conn.is_usable():
+            conn.close()
+            return
+        conn.idle_since = time.monotonic()
+        idle.append(conn)
+
+    def close(self) -> None:
+        for idle in self._idle.values():
+            for conn in idle:
+                conn.close()
+        self._idle.clear()
+
+    def idle_count(self, key: Optional[PoolKey] = None) -> int:
+        if key is not None:
+            return len(self._idle.get(key, ()))
+        return sum(len(idle) for idle in self._idle.values())
+
+
+# Connections are bound to the event loop that opened them
+_POOLS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, ConnectionPool
+] = weakref.WeakKeyDictionary()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """The connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = ConnectionPool()
+        _POOLS[loop] = pool
+    return pool
+
+
+class UpstreamResponse:
+    """Status and headers of an upstream response, with a streamed body."""
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        conn: _Connection,
+        status_code: int,
+        headers: list[tuple[str, str]],
+        *,
+        has_body: bool,
+        timeout: float,
+    ) -> None:
+        self._pool = pool
+        self._conn: Optional[_Connection] = conn
+        self._timeout = timeout
+        self.status_code = status_code
+        self.raw_headers = headers
+
+        lowered = {name.lower(): value for name, value in headers}
+        self._keep_alive = "close" not in lowered.get("connection", "").lower()
+        self._chunked = False
+        self._remaining: Optional[int] = None
+        if not has_body:
+            self._remaining = 0
+        elif "chunked" in lowered.get("transfer-encoding", "").lower():
+            self._chunked = True
+        elif "content-length" in lowered:
+            try:
+                self._remaining = int(lowered["content-length"])
+            except ValueError as e:
+                raise ProxyProtocolError("Invalid content-length") from e
+        else:
+            # Body is delimited by the upstream closing the connection
+            self._keep_alive = False
+        self._done = self._remaining == 0
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Response headers to forward, without hop-by-hop headers."""
+        return {
+            name.lower(): value
+            for name, value in self.raw_headers
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the (de-chunked) response body."""
+        try:
+            if self._done:
+                return
+            if self._chunked:
+                async for chunk in self._iter_chunked():
+                    yield chunk
+            else:
+                async for chunk in self._iter_plain():
+                    yield chunk
+            self._done = True
+        finally:
+            await self.aclose()
+
+    async def _iter_plain(self) -> AsyncIterator[bytes]:
+        assert self._conn is not None
+        reader = self._conn.reader
+        while self._remaining is None or self._remaining > 0:
+            size = (
+                CHUNK_SIZE
+                if self._remaining is None
+                else min(CHUNK_SIZE, self._remaining)
+            )
+            chunk = await asyncio.wait_for(reader.read(size), self._timeout)
+            if not chunk:
+                if self._remaining is None:
+                    return
+                raise ProxyProtocolError("Upstream closed mid-response")
+            if self._remaining is not None:
+                self._remaining -= len(chunk)
+            yield chunk
+
+    async def _iter_chunked(self) -> AsyncIterator[bytes]:
+        assert self._conn is not None
+        reader = self._conn.reader
+        while True:
+            line = await _readline(reader, self._timeout)
+            try:
+                size = int(line.split(b";", 1)[0].strip(), 16)
+            except ValueError as e:
+                raise ProxyProtocolError("Invalid chunk size") from e
+            if size == 0:
+                # Skip trailers
+                while True:
+                    line = await _readline(reader, self._timeout)
+                    if line in (b"\r\n", b"\n", b""):
+                        return
+            while size > 0:
+                chunk = await asyncio.wait_for(
+                    reader.read(min(size, CHUNK_SIZE)), self._timeout
+                )
+                if not chunk:
+                    raise ProxyProtocolError("Upstream closed mid-chunk")
+                size -= len(chunk)
+                yield chunk
+            await _readline(reader, self._timeout)
+
+    async def aclose(self) -> None:
+        """Release the connection, or close it if the body wasn't read."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._done and self._keep_alive:
+            self._pool.release(conn)
+        else:
+            conn.close()
+
+
+async def _write_body(
+    writer: asyncio.StreamWriter, body: RequestBody, *, chunked: bool
+) -> None:
+    if body is None:
+        return
+    if isinstance(body, bytes):
+        writer.write(body)
+        await writer.drain()
+        return
+    async for chunk in body:
+        if not chunk:
+            continue
+        if chunked:
+            writer.write(b"%x\r\n" % len(chunk))
+            writer.write(chunk)
+            writer.write(b"\r\n")
+        else:
+            writer.write(chunk)
+        # Backpressure: wait for the upstream to accept the data
+        await writer.drain()
+    if chunked:
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+async def _read_head(
+    reader: asyncio.StreamReader, timeout: float
+) -> tuple[int, list[tuple[str, str]]]:
+    while True:
+        status_line = await _readline(reader, timeout)
+        if not status_line:
+            raise ProxyProtocolError("Upstream closed the connection")
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ProxyProtocolError(f"Invalid status line: {status_line!r}")
+        try:
+            status_code = int(parts[1])
+        except ValueError as e:
+            raise ProxyProtocolError("Invalid status code") from e
+
+        headers: list[tuple[str, str]] = []
+        for _ in range(MAX_HEADER_LINES):
+            line = await _readline(reader, timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers.append((name.strip(), value.strip()))
+        else:
+            raise ProxyProtocolError("Too many response headers")
+
+        # Skip interim responses (e.g. 100 Continue)
+        if 100 <= status_code < 200 and status_code != 101:
+            continue
+        return status_code, headers
+
+
+async def send_request(
+    *,
+    scheme: str,
+    host: str,
+    port: int,
+    method: str,
+    target: str,
+    headers: dict[str, str],
+    body: RequestBody,
+    timeout: float = 30.0,
+    pool: Optional[ConnectionPool] = None,
+) -> UpstreamResponse:
+    """Send a request upstream and return once the response head arrives.
+
+    `body` may be bytes or an async iterable of chunks; iterables are
+    streamed with chunked transfer encoding unless `headers` contains a
+    content-length.
+    """
+    pool = pool or get_connection_pool()
+    key = (scheme, host, port)
+    method = method.upper()
+
+    out_headers = {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in HOP_BY_HOP_HEADERS
+    }
+    lowered = {name.lower() for name in out_headers}
+    chunked = False
+    if isinstance(body, bytes):
+        out_headers = {
+            name: value
+            for name, value in out_headers.items()
+            if name.lower() != "content-length"
+        }
+        out_headers["content-length"] = str(len(body))
+    elif body is not None and "content-length" not in lowered:
+        chunked = True
+        out_headers["transfer-encoding"] = "chunked"
+    if "host" not in lowered:
+        default_port = 443 if scheme == "https" else 80
+        out_headers["host"] = (
+            host if port == default_port else f"{host}:{port}"
+        )
+    out_headers["connection"] = "keep-alive"
+
+    head = f"{method} {target} HTTP/1.1\r\n" + "".join(
+        f"{name}: {value}\r\n" for name, value in out_headers.items()
+    )
+    head_bytes = (head + "\r\n").encode("latin-1")
+
+    # A pooled connection may have been closed by the upstream in the
+    # meantime; retry once on a fresh connection if the request can be
+    # replayed.
+    replayable = not isinstance(body, AsyncIterable)
+    while True:
+        conn = await pool.acquire(key, timeout)
+        try:
+            conn.writer.write(head_bytes)
+            await _write_body(conn.writer, body, chunked=chunked)
+            status_code, response_headers = await _read_head(
+                conn.reader, timeout
+            )
+        except ProxyProtocolError:
+            # Retrying wouldn't get a different response
+            conn.close()
+            raise
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            conn.close()
+            if conn.reused and replayable:
+                LOGGER.debug("Retrying on a fresh connection: %s", e)
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+
+        has_body = method != "HEAD" and status_code not in (204, 304)
+        return UpstreamResponse(
+            pool,
+            conn,
+            status_code,
+            response_headers,
+            has_body=has_body,
+            timeout=timeout,
+        )
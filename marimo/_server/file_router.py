@@ -10,6 +10,7 @@ from marimo import _loggers
 from marimo._server.app_defaults import AppDefaults
 from marimo._server.files.directory_scanner import DirectoryScanner
 from marimo._server.files.path_validator import PathValidator
+from marimo._server.files.workspace_index import WorkspaceIndex
 from marimo._server.models.files import FileInfo
 from marimo._server.models.home import MarimoFile
 from marimo._session.notebook import AppFileManager
@@ -96,6 +97,10 @@ class AppFileRouter(abc.ABC):
             detail=f"File {key} not found",
         )
 
+    def close(self) -> None:
+        """Release resources held by the router, such as file watchers."""
+        return None
+
     @abc.abstractmethod
     def get_unique_file_key(self) -> Optional[MarimoFileKey]:
         """
@@ -175,8 +180,9 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
 
         # Use PathValidator for security validation
         self._validator = PathValidator(abs_directory)
-        # Use DirectoryScanner for file discovery (use absolute path)
-        self._scanner = DirectoryScanner(str(abs_directory), include_markdown)
+        # Use a shared, persistent index for file discovery (absolute path)
+        self._index = WorkspaceIndex.for_directory(str(abs_directory))
+        self._index.mark_stale()
 
     @property
     def directory(self) -> str:
@@ -194,6 +200,11 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
 
     def mark_stale(self) -> None:
         self._lazy_files = None
+        self._index.mark_stale()
+
+    def close(self) -> None:
+        # Stops the index's filesystem watcher
+        self._index.close()
 
     def register_temp_dir(self, temp_dir: str) -> None:
         """Register a temp directory as allowed for file access.
@@ -261,20 +272,27 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
     @property
     def files(self) -> list[FileInfo]:
         if self._lazy_files is None:
-            try:
-                # Use DirectoryScanner to load files
-                self._lazy_files = self._scanner.scan()
-            except HTTPException as e:
-                if e.status_code == HTTPStatus.REQUEST_TIMEOUT:
-                    # Return partial results on timeout
-                    LOGGER.warning(
-                        "Timeout during file scan, returning partial results"
-                    )
-                    self._lazy_files = self._scanner.partial_results
-                else:
-                    raise
+            self._lazy_files, _ = self._index.query(
+                include_markdown=self.include_markdown,
+                limit=DirectoryScanner.MAX_FILES,
+            )
         return self._lazy_files
 
+    def search(
+        self,
+        query: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> tuple[list[FileInfo], int]:
+        """Return a page of workspace files matching `query`, as a tree,
+        along with the total number of matching files."""
+        return self._index.query(
+            include_markdown=self.include_markdown,
+            query=query,
+            offset=offset,
+            limit=limit,
+        )
+
     def get_unique_file_key(self) -> str | None:
         return None
 
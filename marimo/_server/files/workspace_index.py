@@ -0,0 +1,503 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Persistent, incrementally updated index of marimo files in a directory.
+
+The index records, for every candidate file under a workspace directory,
+its mtime, size, and whether it is a marimo notebook. Refreshing the index
+only re-reads files whose mtime or size changed, and when `watchdog` is
+installed a filesystem observer marks changed paths so that only those are
+revisited. Without `watchdog`, a full (stat-only) rescan runs at most once
+every few seconds. The index is persisted in the marimo cache directory, so
+a server restart does not need to re-sniff every file.
+
+Like `DirectoryScanner`, a refresh gives up after `MAX_EXECUTION_TIME`
+seconds, leaving the files found so far in the index; the next refresh
+picks up where it left off, re-reading only files it hasn't seen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._server.files.directory_scanner import (
+    DirectoryScanner,
+    is_marimo_app,
+)
+from marimo._server.models.files import FileInfo
+from marimo._utils.files import natural_sort
+from marimo._utils.fuzzy_match import compile_regex, is_fuzzy_match
+from marimo._utils.xdg import marimo_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+LOGGER = _loggers.marimo_logger()
+
+# Bump when the on-disk format changes.
+_INDEX_FORMAT_VERSION = 1
+
+_PYTHON_EXTENSIONS = (".py",)
+_ALL_EXTENSIONS = (".py", ".md", ".qmd")
+
+# Without a watcher, minimum seconds between full rescans
+_RESCAN_INTERVAL = 5.0
+
+
+class _ScanTimeout(Exception):
+    pass
+
+
+class _Entry(NamedTuple):
+    mtime: float
+    size: int
+    is_marimo: bool
+
+
+def _index_cache_path(directory: str) -> Path:
+    digest = hashlib.sha256(directory.encode("utf-8")).hexdigest()[:32]
+    return marimo_cache_dir() / "workspace" / f"{digest}.json"
+
+
+def _sort_key(relative_path: str) -> list[tuple[int, list[Union[int, str]]]]:
+    # Folders sort before files at every level, then by natural sort;
+    # this matches the order produced by DirectoryScanner.
+    *folders, name = relative_path.split(os.sep)
+    return [(0, natural_sort(folder)) for folder in folders] + [
+        (1, natural_sort(name))
+    ]
+
+
+class WorkspaceIndex:
+    """Index of marimo files under a directory.
+
+    Use `WorkspaceIndex.for_directory` to share one index (and one
+    filesystem watcher) per directory.
+    """
+
+    _instances: dict[str, WorkspaceIndex] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        persist_path: Optional[Path] = None,
+        watch: bool = False,
+        scan_timeout: float = DirectoryScanner.MAX_EXECUTION_TIME,
+        rescan_interval: float = _RESCAN_INTERVAL,
+    ) -> None:
+        self.directory = directory
+        self._persist_path = persist_path
+        self._scan_timeout = scan_timeout
+        self._rescan_interval = rescan_interval
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        # None means a full refresh is needed
+        self._dirty: Optional[set[str]] = None
+        # When the last full refresh completed (monotonic)
+        self._last_full_refresh: Optional[float] = None
+        self._observer: Any = None
+
+        self._load()
+        if watch:
+            self._start_watching()
+
+    @staticmethod
+    def for_directory(directory: str) -> WorkspaceIndex:
+        with WorkspaceIndex._instances_lock:
+            index = WorkspaceIndex._instances.get(directory)
+            if index is None:
+                index = WorkspaceIndex(
+                    directory,
+                    persist_path=_index_cache_path(directory),
+                    watch=True,
+                )
+                WorkspaceIndex._instances[directory] = index
+            return index
+
+    @property
+    def is_watching(self) -> bool:
+        return self._observer is not None
+
+    def mark_stale(self) -> None:
+        """Force a full (stat-only) refresh on the next query.
+
+        When a filesystem watcher is running, changes are already tracked
+        and this is a no-op. Otherwise, it's a no-op if the last full
+        refresh completed less than `rescan_interval` seconds ago, so that
+        bursts of queries (e.g. searching as the user types) share a scan.
+        """
+        if self.is_watching:
+            return
+        with self._lock:
+            if (
+                self._last_full_refresh is not None
+                and time.monotonic() - self._last_full_refresh
+                < self._rescan_interval
+            ):
+                return
+            self._dirty = None
+
+    def invalidate(self, path: str) -> None:
+        """Mark an absolute path (file or directory) as changed."""
+        with self._lock:
+            if self._dirty is not None:
+                self._dirty.add(path)
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the filesystem.
+
+        Returns False if the refresh timed out, in which case the index
+        holds partial results and the next refresh continues it.
+        """
+        deadline = time.monotonic() + self._scan_timeout
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            changed = False
+            try:
+                if dirty is None:
+                    changed = self._refresh_subtree(self.directory, deadline)
+                    self._last_full_refresh = time.monotonic()
+                else:
+                    for path in sorted(dirty):
+                        changed = self._refresh_path(path, deadline) or changed
+            except _ScanTimeout:
+                LOGGER.warning(
+                    "Timeout during file scan, returning partial results"
+                )
+                # Paths already refreshed are cheap to revisit
+                self._dirty = dirty
+                self._save()
+                return False
+            if changed:
+                self._save()
+            return True
+
+    def query(
+        self,
+        *,
+        include_markdown: bool,
+        query: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> tuple[list[FileInfo], int]:
+        """Return a page of matching marimo files as a tree.
+
+        Args:
+            include_markdown: Whether to include .md and .qmd notebooks
+            query: Optional search string, matched (as a regex if valid,
+                otherwise as a case-insensitive substring) against the
+                relative path
+            offset: Number of matching files to skip
+            limit: Maximum number of files to return
+
+        Returns:
+            The page as a list of FileInfo with nested children, and the
+            total number of matching files.
+
+        Raises:
+            ValueError: If `offset` or `limit` is negative.
+        """
+        if offset < 0:
+            raise ValueError(f"offset must be non-negative, got {offset}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be non-negative, got {limit}")
+
+        self.refresh()
+        extensions = (
+            _ALL_EXTENSIONS if include_markdown else _PYTHON_EXTENSIONS
+        )
+        with self._lock:
+            matches = [
+                (path, entry)
+                for path, entry in self._entries.items()
+                if entry.is_marimo and path.endswith(extensions)
+            ]
+
+        if query:
+            pattern, is_regex = compile_regex(query)
+            matches = [
+                (path, entry)
+                for path, entry in matches
+                if is_fuzzy_match(query, path, pattern, is_regex)
+            ]
+
+        matches.sort(key=lambda item: _sort_key(item[0]))
+        total = len(matches)
+        end = None if limit is None else offset + limit
+        return _build_tree(matches[offset:end]), total
+
+    def close(self) -> None:
+        """Stop watching the directory.
+
+        A shared index is also released, so that the next
+        `for_directory` creates (and watches with) a new one.
+        """
+        with WorkspaceIndex._instances_lock:
+            if WorkspaceIndex._instances.get(self.directory) is self:
+                del WorkspaceIndex._instances[self.directory]
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=1)
+            except Exception as e:
+                LOGGER.debug("Failed to stop workspace watcher: %s", e)
+            self._observer = None
+
+    # Scanning
+
+    def _relative(self, path: str) -> Optional[str]:
+        try:
+            relative = os.path.relpath(path, self.directory)
+        except ValueError:
+            return None
+        if relative == os.curdir:
+            return ""
+        if relative.startswith(os.pardir):
+            return None
+        return relative
+
+    def _is_candidate(self, relative: str) -> bool:
+        parts = relative.split(os.sep)
+        # Files may live at most MAX_DEPTH folders deep
+        if len(parts) - 1 > DirectoryScanner.MAX_DEPTH:
+            return False
+        for part in parts[:-1]:
+            if part.startswith(".") or part in DirectoryScanner.SKIP_DIRS:
+                return False
+        return not parts[-1].startswith(".") and parts[-1].endswith(
+            _ALL_EXTENSIONS
+        )
+
+    def _walk(self, directory: str, depth: int) -> Iterator[os.DirEntry[str]]:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            if (
+                                entry.name in DirectoryScanner.SKIP_DIRS
+                                or depth == DirectoryScanner.MAX_DEPTH
+                            ):
+                                continue
+                            yield from self._walk(entry.path, depth + 1)
+                        elif entry.name.endswith(_ALL_EXTENSIONS):
+                            yield entry
+                    except OSError as e:
+                        LOGGER.debug("Error scanning %s: %s", entry.path, e)
+        except OSError as e:
+            LOGGER.debug("OSError scanning directory: %s", str(e))
+
+    def _make_entry(
+        self, path: str, stat: os.stat_result, previous: Optional[_Entry]
+    ) -> _Entry:
+        if (
+            previous is not None
+            and previous.mtime == stat.st_mtime
+            and previous.size == stat.st_size
+        ):
+            return previous
+        return _Entry(stat.st_mtime, stat.st_size, is_marimo_app(path))
+
+    def _refresh_subtree(self, directory: str, deadline: float) -> bool:
+        relative_root = self._relative(directory)
+        if relative_root is None:
+            return False
+        prefix = relative_root + os.sep if relative_root else ""
+        depth = relative_root.count(os.sep) + 1 if relative_root else 0
+
+        previous = {
+            path: entry
+            for path, entry in self._entries.items()
+            if path.startswith(prefix)
+        }
+        current: dict[str, _Entry] = {}
+        if relative_root == "" or (
+            self._is_candidate(os.path.join(relative_root, "_.py"))
+            and os.path.isdir(directory)
+        ):
+            for dir_entry in self._walk(directory, depth):
+                relative = os.path.relpath(dir_entry.path, self.directory)
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                entry = self._make_entry(
+                    dir_entry.path, stat, previous.get(relative)
+                )
+                current[relative] = entry
+                # Only reading files counts towards the timeout, so that
+                # each refresh makes progress
+                if (
+                    entry is not previous.get(relative)
+                    and time.monotonic() > deadline
+                ):
+                    # Keep what was found, without dropping unvisited files
+                    self._entries.update(current)
+                    raise _ScanTimeout
+
+        if current == previous:
+            return False
+        for path in previous.keys() - current.keys():
+            del self._entries[path]
+        self._entries.update(current)
+        return True
+
+    def _refresh_path(self, path: str, deadline: float) -> bool:
+        if os.path.isdir(path):
+            return self._refresh_subtree(path, deadline)
+
+        relative = self._relative(path)
+        if relative is None or relative == "":
+            return False
+
+        if not os.path.exists(path):
+            # Either a deleted file or a deleted directory
+            prefix = relative + os.sep
+            removed = [
+                p
+                for p in self._entries
+                if p == relative or p.startswith(prefix)
+            ]
+            for p in removed:
+                del self._entries[p]
+            return bool(removed)
+
+        if not self._is_candidate(relative):
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        previous = self._entries.get(relative)
+        entry = self._make_entry(path, stat, previous)
+        if entry == previous:
+            return False
+        self._entries[relative] = entry
+        return True
+
+    # Persistence
+
+    def _load(self) -> None:
+        if self._persist_path is None:
+            return
+        try:
+            data = json.loads(self._persist_path.read_text("utf-8"))
+            if (
+                data.get("version") != _INDEX_FORMAT_VERSION
+                or data.get("directory") != self.directory
+            ):
+                return
+            self._entries = {
+                path: _Entry(float(mtime), int(size), bool(is_marimo))
+                for path, (mtime, size, is_marimo) in data["entries"].items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            LOGGER.debug("Ignoring corrupt workspace index: %s", e)
+
+    def _save(self) -> None:
+        if self._persist_path is None:
+            return
+        data = {
+            "version": _INDEX_FORMAT_VERSION,
+            "directory": self.directory,
+            "entries": self._entries,
+        }
+        try:
+            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self._persist_path.parent, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._persist_path)
+        except OSError as e:
+            LOGGER.debug("Failed to persist workspace index: %s", e)
+
+    # Watching
+
+    def _start_watching(self) -> None:
+        if not DependencyManager.watchdog.has():
+            LOGGER.debug(
+                "watchdog is not installed; workspace index will rescan "
+                "on refresh"
+            )
+            return
+
+        import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+        import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+
+        index = self
+
+        class Handler(watchdog.events.FileSystemEventHandler):  # type: ignore[misc,unused-ignore]
+            def on_any_event(self, event: Any) -> None:
+                if event.event_type in ("opened", "closed_no_write"):
+                    return
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    if path:
+                        index.invalidate(
+                            path
+                            if isinstance(path, str)
+                            else path.decode("utf-8")
+                        )
+
+        try:
+            observer = watchdog.observers.Observer()
+            observer.schedule(Handler(), self.directory, recursive=True)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            LOGGER.warning(
+                "Failed to watch %s for changes: %s", self.directory, e
+            )
+            return
+        self._observer = observer
+
+
+def _build_tree(files: Iterable[tuple[str, _Entry]]) -> list[FileInfo]:
+    """Build a nested FileInfo tree from sorted relative paths."""
+    roots: list[FileInfo] = []
+    folders: dict[str, FileInfo] = {}
+
+    for relative, entry in files:
+        *parents, name = relative.split(os.sep)
+        siblings = roots
+        folder_path = ""
+        for parent in parents:
+            folder_path = os.path.join(folder_path, parent)
+            folder = folders.get(folder_path)
+            if folder is None:
+                folder = FileInfo(
+                    id=folder_path,
+                    path=folder_path,
+                    name=parent,
+                    is_directory=True,
+                    is_marimo_file=False,
+                )
+                folders[folder_path] = folder
+                siblings.append(folder)
+            siblings = folder.children
+        siblings.append(
+            FileInfo(
+                id=relative,
+                path=relative,
+                name=name,
+                is_directory=False,
+                is_marimo_file=True,
+                last_modified=entry.mtime,
+            )
+        )
+    return roots
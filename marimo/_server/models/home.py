@@ -38,12 +38,18 @@ class OpenTutorialRequest(msgspec.Struct, rename="camel"):
 
 class WorkspaceFilesRequest(msgspec.Struct, rename="camel"):
     include_markdown: bool = False
+    # Optional search string, matched against the relative path
+    query: Optional[str] = None
+    # Pagination over matching files; when `limit` is not set, up to
+    # MAX_FILES files are returned
+    offset: int = 0
+    limit: Optional[int] = None
 
 
 class WorkspaceFilesResponse(msgspec.Struct, rename="camel"):
     root: str
     files: list[FileInfo]
-    # Indicates if limit was reached
+    # Indicates if more files match beyond this page
     has_more: bool = False
     # Total files found
     file_count: int = 0
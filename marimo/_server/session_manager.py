@@ -47,6 +47,8 @@ from marimo._utils.file_watcher import FileWatcherManager
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Coroutine, Mapping
 
+    from marimo._session.managers.pool import KernelPool
+    from marimo._session.managers.process_pool import KernelProcessPool
     from marimo._session.notebook import AppFileManager
 
 LOGGER = _loggers.marimo_logger()
@@ -78,6 +80,8 @@ class SessionManager:
         ttl_seconds: Optional[int],
         watch: bool = False,
         sandbox_mode: SandboxMode | None = None,
+        kernel_pool: KernelPool | None = None,
+        process_pool: KernelProcessPool | None = None,
     ) -> None:
         # Core configuration
         self.file_router = file_router
@@ -91,6 +95,8 @@ class SessionManager:
         self.redirect_console_to_browser = redirect_console_to_browser
         self._config_manager = config_manager
         self.sandbox_mode = sandbox_mode
+        self.kernel_pool = kernel_pool
+        self.process_pool = process_pool
 
         self._repository = SessionRepository()
 
@@ -192,6 +198,8 @@ class SessionManager:
             auto_instantiate=auto_instantiate,
             extensions=extensions,
             sandbox_mode=self.sandbox_mode,
+            kernel_pool=self.kernel_pool,
+            process_pool=self.process_pool,
         )
 
         # Add to repository
@@ -365,6 +373,11 @@ class SessionManager:
         self.close_all_sessions()
         self.lsp_server.stop()
         self._watcher_manager.stop_all()
+        self.file_router.close()
+        if self.kernel_pool is not None:
+            self.kernel_pool.shutdown()
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
 
     def should_send_code_to_frontend(self) -> bool:
         """Returns True if the server can send messages to the frontend."""
@@ -4,8 +4,9 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 import threading
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import uvicorn
 
@@ -36,6 +37,9 @@ from marimo._tracer import LOGGER
 from marimo._utils.lifespans import Lifespans
 from marimo._utils.net import find_free_port
 
+if TYPE_CHECKING:
+    from marimo._session.managers.pool import KernelPoolConfig
+
 DEFAULT_PORT = 2718
 PROXY_REGEX = re.compile(r"^(.*):(\d+)$")
 
@@ -179,6 +183,8 @@ def start(
     asset_url: Optional[str] = None,
     timeout: Optional[float] = None,
     sandbox_mode: SandboxMode | None = None,
+    kernel_pool: KernelPoolConfig | None = None,
+    warm_kernels: int | None = None,
 ) -> None:
     """
     Start the server.
@@ -220,6 +226,12 @@ def start(
     if watch and config_reader.is_auto_save_enabled:
         LOGGER.warning("Enabling watch mode may interfere with auto-save.")
 
+    if GLOBAL_SETTINGS.METRICS:
+        from marimo._metrics.multiprocess import initialize_metrics_dir
+
+        # Before any kernel is spawned, so that kernels inherit it
+        initialize_metrics_dir()
+
     if GLOBAL_SETTINGS.MANAGE_SCRIPT_METADATA:
         config_reader = config_reader.with_overrides(
             {
@@ -232,6 +244,33 @@ def start(
             }
         )
 
+    pool = None
+    if kernel_pool is not None and mode == SessionMode.RUN:
+        from marimo._session.managers.pool import KernelPool
+
+        pool = KernelPool(kernel_pool)
+
+    process_pool = None
+    if warm_kernels is not None and mode == SessionMode.EDIT:
+        from marimo._session.managers.process_pool import (
+            KernelProcessPool,
+            kernels_start_cold,
+        )
+
+        if sandbox_mode is SandboxMode.MULTI:
+            # Each sandbox environment (cached, or configured with
+            # [tool.marimo.venv]) is warmed once a kernel is started in it
+            process_pool = KernelProcessPool(warm_kernels)
+        elif kernels_start_cold():
+            process_pool = KernelProcessPool(warm_kernels)
+            # Kernels run in the server's environment; start them now
+            process_pool.warm(sys.executable)
+        else:
+            LOGGER.warning(
+                "Ignoring --warm-kernels: kernels are forked from the "
+                "server, so they already start without importing marimo."
+            )
+
     session_manager = SessionManager(
         file_router=file_router,
         mode=mode,
@@ -246,6 +285,8 @@ def start(
         redirect_console_to_browser=redirect_console_to_browser,
         watch=watch,
         sandbox_mode=sandbox_mode,
+        kernel_pool=pool,
+        process_pool=process_pool,
     )
 
     log_level = "info" if development_mode else "error"
@@ -11,6 +11,14 @@ Standard implementations (QueueManagerImpl, KernelManagerImpl):
 IPC implementations (IPCQueueManagerImpl, IPCKernelManagerImpl):
     Launch kernel as subprocess with ZeroMQ IPC.
     Each notebook gets its own sandboxed virtual environment.
+
+Pooled implementation (PooledKernelManagerImpl, KernelPool):
+    Places run-mode kernels in a pool of worker processes, using the
+    same ZeroMQ queues as the IPC implementations.
+
+Process pool (KernelProcessPool):
+    Pre-started IPC kernel processes that new sessions claim instead of
+    waiting for a cold start.
 """
 
 from marimo._session.managers.ipc import (
@@ -18,6 +26,12 @@ from marimo._session.managers.ipc import (
     IPCQueueManagerImpl,
 )
 from marimo._session.managers.kernel import KernelManagerImpl
+from marimo._session.managers.pool import (
+    KernelPool,
+    KernelPoolConfig,
+    PooledKernelManagerImpl,
+)
+from marimo._session.managers.process_pool import KernelProcessPool
 from marimo._session.managers.queue import QueueManagerImpl
 
 __all__ = [
@@ -25,4 +39,8 @@ __all__ = [
     "KernelManagerImpl",
     "IPCQueueManagerImpl",
     "IPCKernelManagerImpl",
+    "KernelPool",
+    "KernelPoolConfig",
+    "KernelProcessPool",
+    "PooledKernelManagerImpl",
 ]
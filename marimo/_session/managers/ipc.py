@@ -14,10 +14,7 @@ import sys
 from typing import TYPE_CHECKING, Optional, Union, cast
 
 from marimo import _loggers
-from marimo._cli.sandbox import (
-    build_sandbox_venv,
-    cleanup_sandbox_dir,
-)
+from marimo._cli.sandbox import acquire_sandbox_venv
 from marimo._config.config import VenvConfig
 from marimo._config.manager import MarimoConfigReader
 from marimo._config.settings import GLOBAL_SETTINGS
@@ -31,6 +28,7 @@ from marimo._session._venv import (
     has_marimo_installed,
     install_marimo_into_venv,
 )
+from marimo._session.managers.process_pool import kernel_command
 from marimo._session.model import SessionMode
 from marimo._session.queue import ProcessLike, QueueType
 from marimo._session.types import KernelManager, QueueManager
@@ -38,9 +36,11 @@ from marimo._utils.typed_connection import TypedConnection
 
 if TYPE_CHECKING:
     from marimo._ast.cell import CellConfig
+    from marimo._cli.sandbox_cache import SandboxEnvironment
     from marimo._ipc.queue_manager import QueueManager as IPCQueueManagerType
     from marimo._ipc.types import ConnectionInfo
     from marimo._runtime.commands import AppMetadata
+    from marimo._session.managers.process_pool import KernelProcessPool
     from marimo._types.ids import CellId_t
 
 LOGGER = _loggers.marimo_logger()
@@ -132,7 +132,17 @@ class IPCKernelManagerImpl(KernelManager):
     """IPC-based kernel manager to spawn sandboxed kernels.
 
     Launches the kernel as a subprocess and communicates via ZeroMQ channels.
-    Each notebook gets its own sandboxed virtual environment.
+    Each notebook gets its own sandboxed virtual environment, unless
+    `sandboxed` is False, in which case the kernel runs in the server's
+    Python environment.
+
+    With a `process_pool`, the kernel process is claimed from a pool of
+    pre-started processes (except for ephemeral sandboxes, which may be
+    removed once released).
+
+    Kernels that run in the server's environment serve virtual files from
+    shared memory, like the default edit kernel. Sandboxed kernels embed
+    them as data URLs.
     """
 
     def __init__(
@@ -146,6 +156,8 @@ class IPCKernelManagerImpl(KernelManager):
         config_manager: MarimoConfigReader,
         virtual_files_supported: bool = True,
         redirect_console_to_browser: bool = True,
+        sandboxed: bool = True,
+        process_pool: KernelProcessPool | None = None,
     ) -> None:
         self.queue_manager = queue_manager
         self.connection_info = connection_info
@@ -155,13 +167,14 @@ class IPCKernelManagerImpl(KernelManager):
         self.config_manager = config_manager
         self.virtual_files_supported = virtual_files_supported
         self.redirect_console_to_browser = redirect_console_to_browser
+        self.sandboxed = sandboxed
+        self.process_pool = process_pool
 
         self._process: subprocess.Popen[bytes] | None = None
         self.kernel_task: ProcessLike | None = None
-        self._sandbox_dir: str | None = None
+        self._sandbox_env: SandboxEnvironment | None = None
 
     def start_kernel(self) -> None:
-        from marimo._cli.print import echo, muted
         from marimo._ipc.types import KernelArgs
 
         kernel_args = KernelArgs(
@@ -173,9 +186,79 @@ class IPCKernelManagerImpl(KernelManager):
             connection_info=self.connection_info,
             virtual_files_supported=self.virtual_files_supported,
             redirect_console_to_browser=self.redirect_console_to_browser,
+            shared_virtual_files=not self.sandboxed,
         )
 
-        env = os.environ.copy()
+        # Set on top of the server's environment
+        env: dict[str, str] = {}
+        if self.sandboxed:
+            venv_python, writable = self._resolve_python(env)
+        else:
+            venv_python, writable = sys.executable, False
+
+        cmd = kernel_command(venv_python)
+        if writable:
+            # Setting this attempts to make auto-installations work even if
+            # other normally detected criteria are not true.
+            # IPC by itself does not seem to trigger them.
+            env["MARIMO_MANAGE_SCRIPT_METADATA"] = "true"
+
+        LOGGER.debug(f"Launching kernel: {' '.join(cmd)}")
+
+        try:
+            if self.process_pool is not None and not (
+                self._sandbox_env is not None and self._sandbox_env.ephemeral
+            ):
+                self._process = self.process_pool.launch(venv_python, env)
+            else:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env={**os.environ, **env},
+                )
+
+            # Send connection info via stdin
+            assert self._process.stdin is not None
+            self._process.stdin.write(kernel_args.encode_json())
+            self._process.stdin.flush()
+            self._process.stdin.close()
+
+            # Wait for ready signal
+            assert self._process.stdout is not None
+            ready = self._process.stdout.readline().decode().strip()
+            if ready != "KERNEL_READY":
+                assert self._process.stderr is not None
+                stderr = self._process.stderr.read().decode()
+                raise KernelStartupError(
+                    f"Kernel failed to start.\n\n"
+                    f"Command: {' '.join(cmd)}\n\n"
+                    f"Stderr:\n{stderr}"
+                )
+
+            LOGGER.debug("Kernel ready")
+
+            # Create a ProcessLike wrapper for the subprocess
+            self.kernel_task = _SubprocessWrapper(self._process)
+        except KernelStartupError:
+            # Already a KernelStartupError, just cleanup and re-raise
+            self._release_sandbox()
+            raise
+        except Exception as e:
+            # Wrap other exceptions as KernelStartupError
+            self._release_sandbox()
+            raise KernelStartupError(
+                f"Failed to start kernel subprocess.\n\n{e}"
+            ) from e
+
+    def _resolve_python(self, env: dict[str, str]) -> tuple[str, bool]:
+        """Find the kernel's interpreter, building a sandbox if needed.
+
+        Adds the kernel's environment variables to `env`. Returns the
+        interpreter and whether its environment is writable.
+        """
+        from marimo._cli.print import echo, muted
 
         venv_config = _get_venv_config(self.config_manager)
         try:
@@ -232,24 +315,24 @@ class IPCKernelManagerImpl(KernelManager):
                 # current runtime as a last chance effort to expose marimo
                 # to the kernel.
                 kernel_path = get_kernel_pythonpath()
-                existing = env.get("PYTHONPATH", "")
+                existing = os.environ.get("PYTHONPATH", "")
                 if existing:
                     env["PYTHONPATH"] = f"{kernel_path}{os.pathsep}{existing}"
                 else:
                     env["PYTHONPATH"] = kernel_path
         else:
-            # Fall back to building ephemeral sandbox venv
-            # with IPC dependencies.
-            # NB. "Ephemeral" sandboxes (or rather tmp sandboxes built by uv)
-            # are always writable, and as such install marimo as a default,
-            # making them much easier than a configured venv we cannot manage.
+            # Fall back to a sandbox venv with IPC dependencies, shared
+            # with notebooks that have the same dependencies.
+            # NB. Sandboxes are always writable, and as such install marimo
+            # as a default, making them much easier than a configured venv
+            # we cannot manage.
             try:
-                self._sandbox_dir, venv_python = build_sandbox_venv(
+                self._sandbox_env = acquire_sandbox_venv(
                     self.app_metadata.filename,
                     additional_deps=get_ipc_kernel_deps(),
                 )
+                venv_python = self._sandbox_env.venv_python
             except Exception as e:
-                cleanup_sandbox_dir(self._sandbox_dir)
                 raise KernelStartupError(
                     f"Failed to build sandbox environment.\n\n{e}"
                 ) from e
@@ -259,56 +342,7 @@ class IPCKernelManagerImpl(KernelManager):
                 err=True,
             )
 
-        cmd = [venv_python, "-m", "marimo._ipc.launch_kernel"]
-        if writable:
-            # Setting this attempts to make auto-installations work even if
-            # other normally detected criteria are not true.
-            # IPC by itself does not seem to trigger them.
-            env["MARIMO_MANAGE_SCRIPT_METADATA"] = "true"
-
-        LOGGER.debug(f"Launching kernel: {' '.join(cmd)}")
-
-        try:
-            self._process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=env,
-            )
-
-            # Send connection info via stdin
-            assert self._process.stdin is not None
-            self._process.stdin.write(kernel_args.encode_json())
-            self._process.stdin.flush()
-            self._process.stdin.close()
-
-            # Wait for ready signal
-            assert self._process.stdout is not None
-            ready = self._process.stdout.readline().decode().strip()
-            if ready != "KERNEL_READY":
-                assert self._process.stderr is not None
-                stderr = self._process.stderr.read().decode()
-                raise KernelStartupError(
-                    f"Kernel failed to start.\n\n"
-                    f"Command: {' '.join(cmd)}\n\n"
-                    f"Stderr:\n{stderr}"
-                )
-
-            LOGGER.debug("Kernel ready")
-
-            # Create a ProcessLike wrapper for the subprocess
-            self.kernel_task = _SubprocessWrapper(self._process)
-        except KernelStartupError:
-            # Already a KernelStartupError, just cleanup and re-raise
-            cleanup_sandbox_dir(self._sandbox_dir)
-            raise
-        except Exception as e:
-            # Wrap other exceptions as KernelStartupError
-            cleanup_sandbox_dir(self._sandbox_dir)
-            raise KernelStartupError(
-                f"Failed to start kernel subprocess.\n\n{e}"
-            ) from e
+        return venv_python, writable
 
     @property
     def pid(self) -> int | None:
@@ -355,8 +389,12 @@ class IPCKernelManagerImpl(KernelManager):
                     self._process.kill()
 
         # Always attempt cleanup, even if _process is None
-        cleanup_sandbox_dir(self._sandbox_dir)
-        self._sandbox_dir = None
+        self._release_sandbox()
+
+    def _release_sandbox(self) -> None:
+        if self._sandbox_env is not None:
+            self._sandbox_env.release()
+            self._sandbox_env = None
 
     @property
     def kernel_connection(self) -> TypedConnection[KernelMessage]:
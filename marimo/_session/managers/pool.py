@@ -0,0 +1,418 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Run-mode kernels hosted in a pool of worker processes.
+
+By default, `marimo run` starts each viewer's kernel as a thread of the
+server, so all viewers share one GIL. With a kernel pool, kernels are
+placed in worker processes (see `marimo._ipc.kernel_host`) and talk to
+the server over the same ZeroMQ queues as sandboxed kernels.
+
+Workers are started on background threads, up to the pool size, keeping
+one idle worker ready ahead of demand so that opening a session doesn't
+wait for a process to start. A new kernel goes to a fresh worker while
+the pool has room, and otherwise to the worker with the least recent CPU
+use among those below their kernel limit.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._runtime import commands
+from marimo._session.managers.ipc import KernelStartupError
+from marimo._session.queue import ProcessLike
+from marimo._session.types import KernelManager
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import CellConfig
+    from marimo._config.manager import MarimoConfigReader
+    from marimo._ipc.types import ConnectionInfo, KernelArgs
+    from marimo._messaging.types import KernelMessage
+    from marimo._runtime.commands import AppMetadata
+    from marimo._session.managers.ipc import IPCQueueManagerImpl
+    from marimo._session.model import SessionMode
+    from marimo._types.ids import CellId_t
+    from marimo._utils.typed_connection import TypedConnection
+
+LOGGER = _loggers.marimo_logger()
+
+# How long placing a kernel waits for a worker process to start
+STARTUP_TIMEOUT_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class KernelPoolConfig:
+    """Configuration for a pool of kernel worker processes.
+
+    Attributes:
+        processes: Maximum number of worker processes.
+        kernels_per_process: Maximum number of kernels in one worker; 1
+            gives each session its own process. None for no limit.
+        memory_limit_mb: Virtual address space limit of each worker
+            process, in MB (POSIX only). It is shared by all kernels in
+            the worker, and counts reserved as well as resident memory,
+            so it should be set well above the expected memory use of
+            `kernels_per_process` kernels.
+        cpus_per_process: Number of CPUs each worker is pinned to (Linux
+            and Windows only). Workers are pinned to different CPUs
+            where possible.
+    """
+
+    processes: int
+    kernels_per_process: Optional[int] = None
+    memory_limit_mb: Optional[int] = None
+    cpus_per_process: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.processes < 1:
+            raise ValueError("A kernel pool needs at least one process.")
+        if self.kernels_per_process is not None and (
+            self.kernels_per_process < 1
+        ):
+            raise ValueError("kernels_per_process must be at least 1.")
+
+
+class KernelHost:
+    """A worker process hosting kernels."""
+
+    def __init__(self, index: int, config: KernelPoolConfig) -> None:
+        self.index = index
+        self.kernels: set[str] = set()
+
+        cmd = [sys.executable, "-m", "marimo._ipc.kernel_host"]
+        if config.memory_limit_mb is not None:
+            cmd += ["--memory-limit-mb", str(config.memory_limit_mb)]
+        cpus = self._cpus(index, config.cpus_per_process)
+        if cpus:
+            cmd += ["--cpus", ",".join(str(cpu) for cpu in cpus)]
+
+        LOGGER.debug("Starting kernel host: %s", " ".join(cmd))
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        assert self._process.stdout is not None
+        ready = self._process.stdout.readline().decode().strip()
+        self._process.stdout.close()
+        if ready != "KERNEL_HOST_READY":
+            self._process.kill()
+            raise KernelStartupError(
+                f"Kernel worker process failed to start: {ready!r}"
+            )
+
+        import psutil
+
+        self._ps = psutil.Process(self._process.pid)
+        # The first call only starts the measurement
+        self._ps.cpu_percent(interval=None)
+
+    @staticmethod
+    def _cpus(index: int, count: Optional[int]) -> list[int]:
+        total = os.cpu_count() or 1
+        if not count:
+            return []
+        count = min(count, total)
+        return sorted({(index * count + i) % total for i in range(count)})
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def cpu_percent(self) -> float:
+        """CPU use since the last call."""
+        import psutil
+
+        try:
+            return float(self._ps.cpu_percent(interval=None))
+        except psutil.Error:
+            return 0.0
+
+    def start_kernel(self, kernel_id: str, args: KernelArgs) -> None:
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.write(args.encode_json() + b"\n")
+            self._process.stdin.flush()
+        except OSError as e:
+            raise KernelStartupError(
+                f"Kernel worker process {self.pid} is not running.\n\n{e}"
+            ) from e
+        self.kernels.add(kernel_id)
+
+    def shutdown(self) -> None:
+        if self._process.stdin is not None:
+            try:
+                # The worker exits when its stdin is closed
+                self._process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+
+class KernelPool:
+    """Places kernels in a pool of worker processes."""
+
+    def __init__(self, config: KernelPoolConfig) -> None:
+        self.config = config
+        self._hosts: list[KernelHost] = []
+        # Guards the hosts; notified when a worker has started (or failed)
+        self._changed = threading.Condition()
+        self._starting = 0
+        self._next_index = 0
+        self._error: Optional[KernelStartupError] = None
+        self._closed = False
+        with self._changed:
+            self._warm_up()
+
+    @property
+    def hosts(self) -> list[KernelHost]:
+        return list(self._hosts)
+
+    def place(
+        self,
+        kernel_id: str,
+        args: KernelArgs,
+        timeout: float = STARTUP_TIMEOUT_SECONDS,
+    ) -> KernelHost:
+        """Start a kernel on the least busy worker.
+
+        Waits for a worker to start if none is ready.
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            self._remove_dead_hosts()
+            while (host := self._select_host()) is None:
+                self._warm_up()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._changed.wait(remaining):
+                    raise KernelStartupError(
+                        "Timed out waiting for a kernel worker process to "
+                        "start."
+                    )
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                self._remove_dead_hosts()
+            # Reserve the slot, then get the next worker ready
+            host.kernels.add(kernel_id)
+            self._warm_up()
+
+        try:
+            host.start_kernel(kernel_id, args)
+        except Exception:
+            self.release(host, kernel_id)
+            raise
+        LOGGER.debug(
+            "Placed kernel %s in worker %s (%d kernels)",
+            kernel_id,
+            host.pid,
+            len(host.kernels),
+        )
+        return host
+
+    def release(self, host: KernelHost, kernel_id: str) -> None:
+        with self._changed:
+            host.kernels.discard(kernel_id)
+
+    def _remove_dead_hosts(self) -> None:
+        for host in [h for h in self._hosts if not h.is_alive()]:
+            LOGGER.warning("Kernel worker process %s exited", host.pid)
+            self._hosts.remove(host)
+
+    def _select_host(self) -> Optional[KernelHost]:
+        """A ready worker for a new kernel, or None to wait for one."""
+        for host in self._hosts:
+            if not host.kernels:
+                return host
+        if self._starting or len(self._hosts) < self.config.processes:
+            # A fresh worker is (or will be) on its way
+            return None
+
+        limit = self.config.kernels_per_process
+        candidates = [
+            host
+            for host in self._hosts
+            if limit is None or len(host.kernels) < limit
+        ]
+        if not candidates:
+            raise KernelStartupError(
+                f"All {self.config.processes} kernel processes are full; "
+                "try again once another session has closed."
+            )
+        return min(
+            candidates,
+            key=lambda host: (host.cpu_percent(), len(host.kernels)),
+        )
+
+    def _warm_up(self) -> None:
+        """Start a worker in the background, unless one is idle already.
+
+        Must be called with the lock held.
+        """
+        if (
+            self._closed
+            or self._starting
+            or len(self._hosts) >= self.config.processes
+            or any(not host.kernels for host in self._hosts)
+        ):
+            return
+        index = self._next_index
+        self._next_index += 1
+        self._starting += 1
+        threading.Thread(
+            target=self._start_host,
+            args=(index,),
+            name="marimo-kernel-host-start",
+            daemon=True,
+        ).start()
+
+    def _start_host(self, index: int) -> None:
+        host: Optional[KernelHost] = None
+        error: Optional[KernelStartupError] = None
+        try:
+            host = KernelHost(index, self.config)
+        except KernelStartupError as e:
+            error = e
+        except Exception as e:
+            error = KernelStartupError(
+                f"Kernel worker process failed to start: {e}"
+            )
+
+        with self._changed:
+            self._starting -= 1
+            closed = self._closed
+            if host is not None and not closed:
+                self._hosts.append(host)
+                self._error = None
+            if error is not None:
+                LOGGER.error(str(error))
+                self._error = error
+            self._changed.notify_all()
+        if host is not None and closed:
+            host.shutdown()
+
+    def shutdown(self) -> None:
+        with self._changed:
+            self._closed = True
+            hosts, self._hosts = self._hosts, []
+        for host in hosts:
+            host.shutdown()
+
+
+class _PooledKernel(ProcessLike):
+    """A kernel thread in a worker process."""
+
+    def __init__(self, manager: PooledKernelManagerImpl) -> None:
+        self._manager = manager
+
+    @property
+    def pid(self) -> int | None:
+        return self._manager.pid
+
+    def is_alive(self) -> bool:
+        return self._manager.is_alive()
+
+    def terminate(self) -> None:
+        self._manager.close_kernel()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        del timeout
+
+
+class PooledKernelManagerImpl(KernelManager):
+    """Run-mode kernel manager that places kernels in a KernelPool."""
+
+    def __init__(
+        self,
+        *,
+        pool: KernelPool,
+        queue_manager: IPCQueueManagerImpl,
+        connection_info: ConnectionInfo,
+        mode: SessionMode,
+        configs: dict[CellId_t, CellConfig],
+        app_metadata: AppMetadata,
+        config_manager: MarimoConfigReader,
+        redirect_console_to_browser: bool,
+    ) -> None:
+        self.pool = pool
+        self.queue_manager = queue_manager
+        self.connection_info = connection_info
+        self.mode = mode
+        self.configs = configs
+        self.app_metadata = app_metadata
+        self.config_manager = config_manager
+        self.redirect_console_to_browser = redirect_console_to_browser
+
+        self.kernel_task: ProcessLike | None = None
+        self._kernel_id = str(uuid4())
+        self._host: KernelHost | None = None
+        self._closed = False
+
+    def start_kernel(self) -> None:
+        from marimo._ipc.types import KernelArgs
+
+        args = KernelArgs(
+            configs=self.configs,
+            app_metadata=self.app_metadata,
+            user_config=self.config_manager.get_config(hide_secrets=False),
+            log_level=GLOBAL_SETTINGS.LOG_LEVEL,
+            profile_path=None,
+            connection_info=self.connection_info,
+            virtual_files_supported=False,
+            redirect_console_to_browser=self.redirect_console_to_browser,
+        )
+        self._host = self.pool.place(self._kernel_id, args)
+        self.kernel_task = _PooledKernel(self)
+
+    @property
+    def pid(self) -> int | None:
+        if self._host is None:
+            return None
+        return self._host.pid
+
+    @property
+    def profile_path(self) -> str | None:
+        return None
+
+    def is_alive(self) -> bool:
+        return (
+            self._host is not None
+            and not self._closed
+            and self._host.is_alive()
+        )
+
+    def interrupt_kernel(self) -> None:
+        # Like kernel threads in the server, run-mode kernels in a
+        # worker can't be interrupted.
+        return
+
+    def close_kernel(self) -> None:
+        if self._host is None or self._closed:
+            return
+        self._closed = True
+        if self._host.is_alive():
+            self.queue_manager.put_control_request(
+                commands.StopKernelCommand()
+            )
+        self.queue_manager.close_queues()
+        self.pool.release(self._host, self._kernel_id)
+
+    @property
+    def kernel_connection(self) -> TypedConnection[KernelMessage]:
+        raise NotImplementedError(
+            "Pooled kernels use stream_queue, not kernel_connection"
+        )
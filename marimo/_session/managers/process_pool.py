@@ -0,0 +1,194 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Pre-started kernel processes for IPC kernels.
+
+Starting an IPC kernel means starting a Python interpreter and importing
+marimo's runtime before the kernel can read its arguments. A
+`KernelProcessPool` does this ahead of time: it keeps a few processes of
+`python -m marimo._ipc.launch_kernel` that have already done their imports
+and are waiting for their arguments on stdin, so that a new session claims
+one instead of waiting for a cold start.
+
+Processes are kept per interpreter and per set of environment variables
+that kernels are started with on top of the server's own (such as the
+`PYTHONPATH` of a configured venv), since a process can only serve kernels
+that would have been started the same way. After a process is claimed, the
+pool is replenished in the background.
+
+The pool only helps where kernels would otherwise start from a fresh
+interpreter: sandboxed kernels, and edit kernels on platforms where
+`multiprocessing` doesn't fork (see `kernels_start_cold`). Forked kernels
+start with marimo already imported.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import subprocess
+import threading
+from typing import Optional
+
+from marimo import _loggers
+
+LOGGER = _loggers.marimo_logger()
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def kernel_command(python: str) -> list[str]:
+    """The command that starts an IPC kernel with the given interpreter."""
+    return [python, "-m", "marimo._ipc.launch_kernel"]
+
+
+def kernels_start_cold() -> bool:
+    """Whether edit kernels start from a fresh interpreter.
+
+    Edit kernels are `multiprocessing` processes. Unless they're forked
+    from the server (the default on Linux before Python 3.14), they import
+    marimo's runtime before they can run.
+    """
+    method = multiprocessing.get_start_method(allow_none=True)
+    # The first method is the platform's default
+    return (method or multiprocessing.get_all_start_methods()[0]) != "fork"
+
+
+def _spawn(python: str, env: dict[str, str]) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        kernel_command(python),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env={**os.environ, **env},
+    )
+
+
+class KernelProcessPool:
+    """Idle kernel processes, ready to be claimed by new sessions."""
+
+    def __init__(self, size: int) -> None:
+        """
+        Args:
+            size: Number of idle processes to keep for each interpreter
+                and set of environment variables that kernels are started
+                with.
+        """
+        if size < 1:
+            raise ValueError(
+                "A kernel process pool needs at least one process."
+            )
+        self.size = size
+        self._idle: dict[_Key, list[subprocess.Popen[bytes]]] = {}
+        # Processes being started by replenishing threads
+        self._starting: dict[_Key, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def launch(
+        self, python: str, env: Optional[dict[str, str]] = None
+    ) -> subprocess.Popen[bytes]:
+        """Return a kernel process for the given environment.
+
+        The process is taken from the pool if one is idle, and otherwise
+        started now. Either way, the pool for this environment is then
+        replenished in the background.
+
+        Args:
+            python: The kernel's interpreter.
+            env: Environment variables to set for the kernel, on top of
+                the server's.
+
+        Returns:
+            A process waiting for its `KernelArgs` on stdin.
+        """
+        env = {} if env is None else env
+        key = _key(python, env)
+        process = None
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            while idle:
+                candidate = idle.pop(0)
+                if candidate.poll() is None:
+                    process = candidate
+                    break
+                LOGGER.debug(
+                    "Discarding exited kernel process %s", candidate.pid
+                )
+        if process is None:
+            LOGGER.debug("No idle kernel process, starting one")
+            process = _spawn(python, env)
+        else:
+            LOGGER.debug("Claimed idle kernel process %s", process.pid)
+        self.warm(python, env)
+        return process
+
+    def warm(self, python: str, env: Optional[dict[str, str]] = None) -> None:
+        """Start processes in the background until the pool is full."""
+        env = {} if env is None else env
+        key = _key(python, env)
+        with self._lock:
+            if self._closed:
+                return
+            missing = (
+                self.size
+                - len(self._idle.get(key, []))
+                - self._starting.get(key, 0)
+            )
+            if missing <= 0:
+                return
+            self._starting[key] = self._starting.get(key, 0) + missing
+
+        threading.Thread(
+            target=self._replenish,
+            args=(key, python, env, missing),
+            name="kernel-process-pool",
+            daemon=True,
+        ).start()
+
+    def _replenish(
+        self, key: _Key, python: str, env: dict[str, str], count: int
+    ) -> None:
+        for _ in range(count):
+            try:
+                process: Optional[subprocess.Popen[bytes]] = _spawn(
+                    python, env
+                )
+            except Exception as e:
+                LOGGER.warning("Failed to start kernel process: %s", e)
+                process = None
+            with self._lock:
+                self._starting[key] -= 1
+                if process is not None and not self._closed:
+                    self._idle.setdefault(key, []).append(process)
+                    process = None
+            if process is not None:
+                # The pool was shut down while the process started
+                _kill(process)
+
+    def idle_count(
+        self, python: str, env: Optional[dict[str, str]] = None
+    ) -> int:
+        """Number of idle processes for the given environment."""
+        env = {} if env is None else env
+        with self._lock:
+            return len(self._idle.get(_key(python, env), []))
+
+    def shutdown(self) -> None:
+        """Stop all idle processes; claimed processes are not affected."""
+        with self._lock:
+            self._closed = True
+            processes = [p for idle in self._idle.values() for p in idle]
+            self._idle.clear()
+        for process in processes:
+            _kill(process)
+
+
+def _key(python: str, env: dict[str, str]) -> _Key:
+    return python, tuple(sorted(env.items()))
+
+
+def _kill(process: subprocess.Popen[bytes]) -> None:
+    process.kill()
+    process.wait()
+    for stream in (process.stdin, process.stdout, process.stderr):
+        if stream is not None:
+            stream.close()
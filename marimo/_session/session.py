@@ -59,6 +59,8 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from marimo._server.models.models import InstantiateNotebookRequest
+    from marimo._session.managers.pool import KernelPool
+    from marimo._session.managers.process_pool import KernelProcessPool
 
 LOGGER = _loggers.marimo_logger()
 
@@ -90,6 +92,8 @@ class SessionImpl(Session):
         ttl_seconds: Optional[int],
         extensions: list[SessionExtension] | None = None,
         sandbox_mode: SandboxMode | None = None,
+        kernel_pool: KernelPool | None = None,
+        process_pool: KernelProcessPool | None = None,
     ) -> Session:
         """
         Create a new session.
@@ -103,10 +107,13 @@ class SessionImpl(Session):
         configs = app_file_manager.app.cell_manager.config_map()
 
         # Create kernel manager
-        # SandboxMode.MULTI uses IPC kernels with per-notebook sandboxed venvs
+        # SandboxMode.MULTI uses IPC kernels with per-notebook sandboxed venvs;
+        # with a process pool, edit kernels are IPC kernels claimed from it
         queue_manager: QueueManager
         kernel_manager: KernelManager
-        if sandbox_mode is SandboxMode.MULTI:
+        if sandbox_mode is SandboxMode.MULTI or (
+            process_pool is not None and mode == SessionMode.EDIT
+        ):
             from marimo._ipc import QueueManager as IPCQueueManager
             from marimo._session.managers import (
                 IPCKernelManagerImpl,
@@ -124,6 +131,28 @@ class SessionImpl(Session):
                 config_manager=config_manager,
                 virtual_files_supported=virtual_files_supported,
                 redirect_console_to_browser=redirect_console_to_browser,
+                sandboxed=sandbox_mode is SandboxMode.MULTI,
+                process_pool=process_pool,
+            )
+        elif kernel_pool is not None and mode == SessionMode.RUN:
+            from marimo._ipc import QueueManager as IPCQueueManager
+            from marimo._session.managers import (
+                IPCQueueManagerImpl,
+                PooledKernelManagerImpl,
+            )
+
+            ipc_queue_manager, connection_info = IPCQueueManager.create()
+            ipc_queues = IPCQueueManagerImpl.from_ipc(ipc_queue_manager)
+            queue_manager = ipc_queues
+            kernel_manager = PooledKernelManagerImpl(
+                pool=kernel_pool,
+                queue_manager=ipc_queues,
+                connection_info=connection_info,
+                mode=mode,
+                configs=configs,
+                app_metadata=app_metadata,
+                config_manager=config_manager,
+                redirect_console_to_browser=redirect_console_to_browser,
             )
         else:
             # Original kernel: Process for edit, Thread for run
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
@@ -39,7 +41,6 @@ from marimo._schemas.session import (
 )
 from marimo._session.state.session_view import SessionView
 from marimo._types.ids import CellId_t
-from marimo._utils.async_path import AsyncPath
 from marimo._utils.background_task import AsyncBackgroundTask
 from marimo._utils.code import hash_code
 from marimo._utils.lists import as_list
@@ -76,6 +77,68 @@ def _normalize_error(error: Union[MarimoError, dict[str, Any]]) -> ErrorOutput:
         )
 
 
+def serialize_cell(view: SessionView, cell_id: CellId_t) -> Cell:
+    """Convert the state of a single cell in a SessionView to a Cell schema."""
+    cell_notif = view.cell_notifications.get(cell_id)
+    if cell_notif is None:
+        # We haven't seen any outputs or notifications for this cell.
+        return Cell(id=cell_id, code_hash=None, outputs=[], console=[])
+    outputs: list[OutputType] = []
+    console: list[ConsoleType] = []
+
+    # Convert output
+    if cell_notif.output:
+        if cell_notif.output.channel == CellChannel.MARIMO_ERROR:
+            for error in cast(
+                list[Union[MarimoError, dict[str, Any]]],
+                cell_notif.output.data,
+            ):
+                outputs.append(_normalize_error(error))
+        else:
+            outputs.append(
+                DataOutput(
+                    type="data",
+                    data={
+                        cell_notif.output.mimetype: cell_notif.output.data,
+                    },
+                )
+            )
+
+    # Convert console outputs
+    for console_out in as_list(cell_notif.console):
+        assert isinstance(console_out, CellOutput)
+        if console_out.channel == CellChannel.MEDIA:
+            console.append(
+                StreamMediaOutput(
+                    type="streamMedia",
+                    name="media",
+                    mimetype=console_out.mimetype,
+                    data=str(console_out.data),
+                )
+            )
+        else:
+            # catch all for everything else
+            console.append(
+                StreamOutput(
+                    type="stream",
+                    name="stderr"
+                    if console_out.channel == CellChannel.STDERR
+                    else "stdout",
+                    text=str(console_out.data),
+                    mimetype=console_out.mimetype,
+                )
+            )
+
+    code_hash = _hash_code(view.last_executed_code.get(cell_id))
+
+    return Cell(
+        id=cell_id,
+        code_hash=code_hash,
+        outputs=outputs,
+        console=console,
+    )
+
+
 def serialize_session_view(
     view: SessionView, cell_ids: Iterable[CellId_t] | None = None
 ) -> NotebookSessionV1:
@@ -102,69 +165,7 @@ def serialize_session_view(
             cell_ids = view.cell_notifications.keys()
 
     for cell_id in cell_ids:
-        cell_notif = view.cell_notifications.get(cell_id)
-        if cell_notif is None:
-            # We haven't seen any outputs or notifications for this cell.
-            cells.append(
-                Cell(id=cell_id, code_hash=None, outputs=[], console=[])
-            )
-            continue
-        outputs: list[OutputType] = []
-        console: list[ConsoleType] = []
-
-        # Convert output
-        if cell_notif.output:
-            if cell_notif.output.channel == CellChannel.MARIMO_ERROR:
-                for error in cast(
-                    list[Union[MarimoError, dict[str, Any]]],
-                    cell_notif.output.data,
-                ):
-                    outputs.append(_normalize_error(error))
-            else:
-                outputs.append(
-                    DataOutput(
-                        type="data",
-                        data={
-                            cell_notif.output.mimetype: cell_notif.output.data,
-                        },
-                    )
-                )
-
-        # Convert console outputs
-        for console_out in as_list(cell_notif.console):
-            assert isinstance(console_out, CellOutput)
-            if console_out.channel == CellChannel.MEDIA:
-                console.append(
-                    StreamMediaOutput(
-                        type="streamMedia",
-                        name="media",
-                        mimetype=console_out.mimetype,
-                        data=str(console_out.data),
-                    )
-                )
-            else:
-                # catch all for everything else
-                console.append(
-                    StreamOutput(
-                        type="stream",
-                        name="stderr"
-                        if console_out.channel == CellChannel.STDERR
-                        else "stdout",
-                        text=str(console_out.data),
-                        mimetype=console_out.mimetype,
-                    )
-                )
-
-        code_hash = _hash_code(view.last_executed_code.get(cell_id))
-
-        cells.append(
-            Cell(
-                id=cell_id,
-                code_hash=code_hash,
-                outputs=outputs,
-                console=console,
-            )
-        )
+        cells.append(serialize_cell(view, cell_id))
 
     return NotebookSessionV1(
         version=VERSION,
@@ -365,7 +366,16 @@ def _hash_code(code: Optional[str]) -> Optional[str]:
 
 
 class SessionCacheWriter(AsyncBackgroundTask):
-    """Periodically writes a SessionView to a file."""
+    """Periodically writes a SessionView to a file.
+
+    The encoded JSON of each cell is kept between writes and only cells
+    whose notification or code changed are re-encoded; if no cell changed
+    and the cells weren't reordered, the file isn't written at all. When
+    something did change, the whole file is rewritten, compactly and
+    atomically (via a temporary file and rename), so that it stays a
+    regular NotebookSessionV1 document. Encoding and file I/O run on a
+    worker thread, so large outputs don't stall the event loop.
+    """
 
     def __init__(
         self,
@@ -375,34 +385,119 @@ class SessionCacheWriter(AsyncBackgroundTask):
     ) -> None:
         super().__init__()
         self.session_view = session_view
-        # Windows does not support our async path implementation
-        self.path: AsyncPath | Path = path
-        if os.name != "nt":
-            self.path = AsyncPath(path)
+        self.path = path
         self.interval = interval
+        # Revision of each cell when its record was last written
+        self._revisions: dict[CellId_t, int] = {}
+        # Encoded JSON of each cell's record; only touched by the writer
+        # thread.
+        self._records: dict[CellId_t, str] = {}
+        # Whether the file has been written by this writer
+        self._written = False
 
     async def startup(self) -> None:
         # Create parent directories if they don't exist
         try:
-            if isinstance(self.path, AsyncPath):
-                await self.path.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                self.path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(
+                self.path.parent.mkdir, parents=True, exist_ok=True
+            )
         except Exception as e:
             LOGGER.error(f"Failed to create parent directories: {e}")
             raise
 
+    def _collect_changes(
+        self,
+    ) -> tuple[list[CellId_t], dict[CellId_t, Cell], dict[CellId_t, int]]:
+        """Return the cell order, the records of cells that changed, and the
+        revisions they were built at.
+
+        Runs on the event loop; building records is cheap, since they only
+        reference the (immutable) output data.
+        """
+        view = self.session_view
+        if view.cell_ids is not None:
+            cell_ids = list(view.cell_ids.cell_ids)
+        else:
+            cell_ids = list(view.cell_notifications.keys())
+
+        changed: dict[CellId_t, Cell] = {}
+        revisions: dict[CellId_t, int] = {}
+        for cell_id in cell_ids:
+            revision = view.cell_revisions.get(cell_id, 0)
+            revisions[cell_id] = revision
+            if self._revisions.get(cell_id) != revision:
+                changed[cell_id] = serialize_cell(view, cell_id)
+        return cell_ids, changed, revisions
+
+    def _needs_write(
+        self, cell_ids: list[CellId_t], changed: dict[CellId_t, Cell]
+    ) -> bool:
+        """Whether the file is out of date with the collected changes."""
+        return (
+            not self._written
+            or bool(changed)
+            or cell_ids != list(self._records)
+        )
+
+    def _write(
+        self,
+        cell_ids: list[CellId_t],
+        changed: dict[CellId_t, Cell],
+        revisions: dict[CellId_t, int],
+    ) -> None:
+        """Encode changed cells and atomically rewrite the file.
+
+        The records and revisions are only updated once the file has been
+        replaced.
+        """
+        records = {
+            cell_id: json.dumps(changed[cell_id], separators=(",", ":"))
+            if cell_id in changed
+            else self._records[cell_id]
+            for cell_id in cell_ids
+        }
+
+        header = json.dumps(
+            {
+                "version": VERSION,
+                "metadata": NotebookSessionMetadata(
+                    marimo_version=__version__
+                ),
+            },
+            separators=(",", ":"),
+        )
+        contents = (
+            header[:-1] + ',"cells":[' + ",".join(records.values()) + "]}"
+        )
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(contents)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self._records = records
+        self._revisions = revisions
+        self._written = True
+
     async def run(self) -> None:
         while self.running:
             try:
                 if self.session_view.needs_export("session"):
                     self.session_view.mark_auto_export_session()
-                    LOGGER.debug(f"Writing session view to cache {self.path}")
-                    data = serialize_session_view(self.session_view)
-                    if isinstance(self.path, AsyncPath):
-                        await self.path.write_text(json.dumps(data, indent=2))
-                    else:
-                        self.path.write_text(json.dumps(data, indent=2))
+                    cell_ids, changed, revisions = self._collect_changes()
+                    if self._needs_write(cell_ids, changed):
+                        LOGGER.debug(
+                            f"Writing session view to cache {self.path}"
+                        )
+                        await asyncio.to_thread(
+                            self._write, cell_ids, changed, revisions
+                        )
                 await asyncio.sleep(self.interval)
             except asyncio.CancelledError:
                 raise
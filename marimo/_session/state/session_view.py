@@ -46,6 +46,9 @@ from marimo._utils.lists import as_list
 
 LOGGER = _loggers.marimo_logger()
 
+# Custom widget messages kept per model for replay
+_MAX_CUSTOM_MODEL_MESSAGES = 100
+
 ExportType = Literal["html", "md", "ipynb", "session"]
 MIMEBUNDLE_TYPE: KnownMimeType = "application/vnd.marimo+mimebundle"
 
@@ -105,6 +108,10 @@ class SessionView:
         self.ui_values: dict[str, Any] = {}
         # Map of cell id to the last code that was executed in that cell.
         self.last_executed_code: dict[CellId_t, str] = {}
+        # Map of cell id to a counter that is bumped whenever the cell's
+        # notification or last executed code changes; lets consumers
+        # (e.g. the session cache writer) skip unchanged cells.
+        self.cell_revisions: dict[CellId_t, int] = {}
         # Map of cell id to the last cell execution time
         self.last_execution_time: dict[CellId_t, float] = {}
         # Any stale code that was read from a file-watcher
@@ -130,6 +137,7 @@ class SessionView:
 
     def _add_last_run_code(self, req: ExecuteCellCommand) -> None:
         self.last_executed_code[req.cell_id] = req.code
+        self._touch_cell(req.cell_id)
 
     def add_raw_notification(self, raw_notification: KernelMessage) -> None:
         self._touch()
@@ -165,6 +173,7 @@ class SessionView:
                 if cell_output.channel == CellChannel.STDIN:
                     cell_output.channel = CellChannel.STDOUT
                     cell_output.data = f"{cell_output.data} {stdin}\n"
+                    self._touch_cell(cell_notif.cell_id)
                     return
 
     def add_notification(self, notification: NotificationMessage) -> None:
@@ -177,6 +186,7 @@ class SessionView:
             self.cell_notifications[notification.cell_id] = (
                 merge_cell_notification(previous, notification)
             )
+            self._touch_cell(notification.cell_id)
             if not previous:
                 return
             if (
@@ -301,10 +311,7 @@ class SessionView:
         elif isinstance(notification, UIElementMessageNotification):
             if notification.model_id is None:
                 return
-            messages = self.model_messages.get(notification.model_id, [])
-            messages.append(notification)
-            # TODO: cleanup/merge previous 'update' messages
-            self.model_messages[notification.model_id] = messages
+            self._add_model_message(notification.model_id, notification)
 
         elif isinstance(notification, StartupLogsNotification):
             prev = self.startup_logs.content if self.startup_logs else ""
@@ -335,6 +342,60 @@ class SessionView:
                         # We could clean up completed logs here if desired,
                         # but for now keep them for replay purposes
 
+    def _add_model_message(
+        self,
+        model_id: WidgetModelId,
+        notification: UIElementMessageNotification,
+    ) -> None:
+        """Record a model message for replay, compacting state updates.
+
+        Consecutive state messages ('open' or 'update' followed by
+        'update's) are folded into one, so replay sends each custom message
+        against the state it was originally sent with. Only the most recent
+        `_MAX_CUSTOM_MODEL_MESSAGES` custom messages are kept, so a widget
+        that streams custom messages doesn't grow the history without
+        bound; the state messages around a dropped one are folded together.
+        """
+        method = notification.message.get("method")
+        if method == "close":
+            # The frontend forgets the model; nothing left to replay
+            self.model_messages.pop(model_id, None)
+            return
+        if method == "echo_update":
+            # Echoes are ignored by the frontend on replay
+            return
+
+        messages = self.model_messages.setdefault(model_id, [])
+        if method == "update" and messages and _is_state_message(messages[-1]):
+            messages[-1] = _merge_model_update(messages[-1], notification)
+            return
+        messages.append(notification)
+
+        if method == "custom":
+            custom = [
+                i
+                for i, message in enumerate(messages)
+                if message.message.get("method") == "custom"
+            ]
+            if len(custom) > _MAX_CUSTOM_MODEL_MESSAGES:
+                LOGGER.debug(
+                    "Dropping the oldest custom message of model %s from "
+                    "replay; only the last %d are kept",
+                    model_id,
+                    _MAX_CUSTOM_MODEL_MESSAGES,
+                )
+                i = custom[0]
+                del messages[i]
+                # The state messages around it are now consecutive
+                if (
+                    0 < i < len(messages)
+                    and _is_state_message(messages[i - 1])
+                    and messages[i].message.get("method") == "update"
+                ):
+                    messages[i - 1] = _merge_model_update(
+                        messages[i - 1], messages.pop(i)
+                    )
+
     def get_cell_outputs(
         self, ids: list[CellId_t]
     ) -> dict[CellId_t, CellOutput]:
@@ -368,6 +429,7 @@ class SessionView:
                 LOGGER.warning(f"Cell {cell_id} not found in session view")
                 continue
 
+            self._touch_cell(cell_id)
             mimetype, data = output
             new_mimebundle = {mimetype: data}
 
@@ -475,6 +537,9 @@ class SessionView:
     def _touch(self) -> None:
         self.auto_export_state.mark_all_stale()
 
+    def _touch_cell(self, cell_id: CellId_t) -> None:
+        self.cell_revisions[cell_id] = self.cell_revisions.get(cell_id, 0) + 1
+
 
 def _merge_consecutive_console_outputs(
     console: list[CellOutput],
@@ -508,6 +573,70 @@ def _merge_consecutive_console_outputs(
     return merged
 
 
+def _is_state_message(notification: UIElementMessageNotification) -> bool:
+    return notification.message.get("method") in ("open", "update")
+
+
+def _merge_model_update(
+    previous: UIElementMessageNotification,
+    update: UIElementMessageNotification,
+) -> UIElementMessageNotification:
+    """Fold an 'update' model message into the preceding state message.
+
+    Buffers are matched to state by `buffer_paths`, whose first element is
+    a top-level state key; any key set by the update replaces the previous
+    value, buffers (and their out-of-band URLs) included.
+    """
+    state: dict[str, Any] = previous.message.get("state", {})
+    buffer_paths: list[list[Any]] = previous.message.get("buffer_paths", [])
+    buffers: list[bytes] = as_list(previous.buffers)
+    buffer_urls = _buffer_urls(previous)
+
+    new_state: dict[str, Any] = update.message.get("state", {})
+    new_buffer_paths: list[list[Any]] = update.message.get("buffer_paths", [])
+    new_buffers: list[bytes] = as_list(update.buffers)
+    new_buffer_urls = _buffer_urls(update)
+
+    replaced = set(new_state).union(path[0] for path in new_buffer_paths)
+    merged_state = {
+        key: value for key, value in state.items() if key not in replaced
+    }
+    merged_state.update(new_state)
+
+    merged_paths: list[list[Any]] = []
+    merged_buffers: list[bytes] = []
+    merged_urls: list[Optional[str]] = []
+    for path, buffer, url in zip(buffer_paths, buffers, buffer_urls):
+        if path[0] not in replaced:
+            merged_paths.append(path)
+            merged_buffers.append(buffer)
+            merged_urls.append(url)
+    merged_paths.extend(new_buffer_paths)
+    merged_buffers.extend(new_buffers)
+    merged_urls.extend(new_buffer_urls)
+
+    return UIElementMessageNotification(
+        ui_element=update.ui_element or previous.ui_element,
+        model_id=previous.model_id,
+        message={
+            **previous.message,
+            "state": merged_state,
+            "buffer_paths": merged_paths,
+        },
+        buffers=merged_buffers,
+        buffer_urls=merged_urls if any(merged_urls) else None,
+    )
+
+
+def _buffer_urls(
+    notification: UIElementMessageNotification,
+) -> list[Optional[str]]:
+    """Out-of-band buffer URLs, aligned with the notification's buffers."""
+    buffers: list[bytes] = as_list(notification.buffers)
+    urls = notification.buffer_urls or []
+    return [urls[i] if i < len(urls) else None for i in range(len(buffers))]
+
+
 def merge_cell_notification(
     previous: Optional[CellNotification],
     current: CellNotification,
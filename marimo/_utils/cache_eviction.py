@@ -0,0 +1,97 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Eviction for on-disk caches of small, independently written entries.
+
+Caches such as the lint and compile caches store each entry in its own
+file under `<cache_dir>/<key[:2]>/`. Reading an entry refreshes its mtime,
+so an entry's mtime is when it was last used. Pruning removes entries that
+haven't been used for a while, then the least recently used entries until
+the cache fits its size budget.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = _loggers.marimo_logger()
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Marks when the cache was last pruned
+_PRUNED_MARKER = ".pruned"
+
+
+def touch_entry(path: Path) -> None:
+    """Record that a cache entry was used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_cache_dir(
+    cache_dir: Path,
+    *,
+    max_age: float,
+    max_size: int,
+    interval: float = DAY_SECONDS,
+) -> int:
+    """Evict stale entries from a cache directory.
+
+    Removes entries not used within `max_age` seconds, then the least
+    recently used entries until at most `max_size` bytes remain. Walking the
+    cache is skipped if it was pruned less than `interval` seconds ago.
+
+    Returns:
+        The number of entries removed.
+    """
+    marker = cache_dir / _PRUNED_MARKER
+    now = time.time()
+    try:
+        if now - marker.stat().st_mtime < interval:
+            return 0
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return 0
+    try:
+        # Touch first, so concurrent processes don't also walk the cache
+        marker.touch()
+    except OSError:
+        # No cache yet, or it's not writable
+        return 0
+
+    entries: list[tuple[float, int, Path]] = []
+    try:
+        for path in cache_dir.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError as e:
+        LOGGER.debug("Failed to scan cache %s: %s", cache_dir, e)
+        return 0
+
+    # Oldest first
+    entries.sort(key=lambda entry: entry[0])
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, path in entries:
+        if now - mtime <= max_age and total <= max_size:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        LOGGER.debug("Pruned %d entries from %s", removed, cache_dir)
+    return removed
@@ -6,12 +6,13 @@ Don't want to include the entire package as a dependency.
 
 from __future__ import annotations
 
+import functools
 import re
 
 ip_middle_octet = r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5]))"
 ip_last_octet = r"(?:\.(?:0|[1-9]\d?|1\d\d|2[0-4]\d|25[0-5]))"
 
-regex = re.compile(  # noqa: W605
+regex = (  # noqa: W605
     r"^"
     # protocol identifier
     r"(?:(?:https?|ftp)://)"
@@ -88,11 +89,15 @@ regex = re.compile(  # noqa: W605
     # query string
     r"(?:\?\S*)?"
     # fragment
-    r"(?:#\S*)?$",
-    re.UNICODE | re.IGNORECASE,
+    r"(?:#\S*)?$"
 )
 
-pattern = re.compile(regex)
+
+@functools.cache
+def _pattern() -> re.Pattern[str]:
+    # Compiling this pattern takes tens of milliseconds, so it's deferred
+    # until a URL is first validated rather than paid on import
+    return re.compile(regex, re.UNICODE | re.IGNORECASE)
 
 
 def is_url(value: str, public: bool = False) -> bool:
@@ -131,7 +136,7 @@ def is_url(value: str, public: bool = False) -> bool:
     :param value: URL address string to validate
     :param public: (default=False) Set True to only allow a public IP address
     """
-    result = pattern.match(value)
+    result = _pattern().match(value)
     if not public:
         return result is not None
 
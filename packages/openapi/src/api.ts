@@ -5540,8 +5540,12 @@ export interface components {
      *             model_id: Widget model ID (newer architecture).
      *             message: Message payload as dictionary.
      *             buffers: Optional binary buffers for large data.
+     *             buffer_urls: Optional URLs of buffers sent out of band, aligned
+     *                 with `buffers`; a buffer with a URL is sent empty inline.
      */
     UIElementMessageNotification: {
+      /** @default null */
+      buffer_urls?: (string | null)[] | null;
       /** @default null */
       buffers?: string[] | null;
       message: Record<string, any>;
@@ -5861,6 +5865,12 @@ export interface components {
     WorkspaceFilesRequest: {
       /** @default false */
       includeMarkdown?: boolean;
+      /** @default null */
+      limit?: number | null;
+      /** @default 0 */
+      offset?: number;
+      /** @default null */
+      query?: string | null;
     };
     /** WorkspaceFilesResponse */
     WorkspaceFilesResponse: {
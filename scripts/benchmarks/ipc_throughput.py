@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark the ZeroMQ IPC used by sandboxed and pooled kernels.
+
+Two measurements, for each transport (tcp, ipc):
+
+- framing: a stream of kernel messages pushed through a PUSH/PULL socket
+  pair, comparing the previous protocol (one pickle per message, one recv
+  per poll) with the current one (raw frames, drained in batches).
+- kernel: a kernel started with `python -m marimo._ipc.launch_kernel` runs
+  an output-heavy cell; reports the time until its run completed and the
+  rate at which its messages were received.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/ipc_throughput.py [--messages 20000]
+        [--size 1024] [--outputs 2000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import zmq
+
+from marimo._ast.app_config import _AppConfig
+from marimo._ast.cell import CellConfig
+from marimo._config.config import DEFAULT_CONFIG
+from marimo._ipc import KernelArgs, QueueManager
+from marimo._ipc.codec import Codec
+from marimo._ipc.queue_proxy import PushQueue, start_receiver_thread
+from marimo._runtime.commands import AppMetadata, ExecuteCellsCommand
+from marimo._types.ids import CellId_t
+
+
+def _socket_pair(
+    context: zmq.Context[zmq.Socket[bytes]], transport: str, ipc_dir: str
+) -> tuple[zmq.Socket[bytes], zmq.Socket[bytes]]:
+    pull = context.socket(zmq.PULL)
+    if transport == "ipc":
+        address = f"ipc://{ipc_dir}/bench"
+        pull.bind(address)
+    else:
+        address = f"tcp://127.0.0.1:{pull.bind_to_random_port('tcp://127.0.0.1')}"
+    push = context.socket(zmq.PUSH)
+    push.connect(address)
+    return push, pull
+
+
+def framing_pickle(transport: str, messages: list[bytes]) -> float:
+    """The protocol before raw frames: pickle each message, recv one a poll."""
+    context: zmq.Context[zmq.Socket[bytes]] = zmq.Context()
+    with tempfile.TemporaryDirectory() as ipc_dir:
+        push, pull = _socket_pair(context, transport, ipc_dir)
+        received: queue.Queue[bytes] = queue.Queue()
+
+        def receive() -> None:
+            poller = zmq.Poller()
+            poller.register(pull, zmq.POLLIN)
+            for _ in range(len(messages)):
+                while not poller.poll(100):
+                    pass
+                received.put(pickle.loads(pull.recv(flags=zmq.NOBLOCK)))
+
+        thread = threading.Thread(target=receive, daemon=True)
+        thread.start()
+        start = time.perf_counter()
+        for message in messages:
+            push.send(pickle.dumps(message))
+        for _ in messages:
+            received.get()
+        elapsed = time.perf_counter() - start
+        context.destroy(linger=0)
+    return elapsed
+
+
+def framing_raw(transport: str, messages: list[bytes]) -> float:
+    context: zmq.Context[zmq.Socket[bytes]] = zmq.Context()
+    with tempfile.TemporaryDirectory() as ipc_dir:
+        push, pull = _socket_pair(context, transport, ipc_dir)
+        received: queue.Queue[bytes] = queue.Queue()
+        stop, thread = start_receiver_thread({pull: (received, Codec())})
+        sender: PushQueue[bytes] = PushQueue(push)
+
+        start = time.perf_counter()
+        for message in messages:
+            sender.put(message)
+        for _ in messages:
+            received.get()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        thread.join()
+        context.destroy(linger=0)
+    return elapsed
+
+
+CELL = """\
+import marimo as mo
+for i in range({outputs}):
+    mo.output.replace(mo.Html(f"<b>{{i}}</b>" + "x" * {size}))
+"""
+
+
+def kernel(transport: str, outputs: int, size: int) -> tuple[float, int]:
+    cell_id = CellId_t("bench")
+    request = ExecuteCellsCommand(
+        cell_ids=[cell_id], codes=[CELL.format(outputs=outputs, size=size)]
+    )
+    queue_manager, connection_info = QueueManager.create(transport)  # type: ignore[arg-type]
+    kernel_args = KernelArgs(
+        connection_info=connection_info,
+        profile_path=None,
+        configs={cell_id: CellConfig()},
+        user_config=DEFAULT_CONFIG,
+        log_level=30,
+        app_metadata=AppMetadata(
+            query_params={}, cli_args={}, app_config=_AppConfig()
+        ),
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "marimo._ipc.launch_kernel"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    assert process.stdin is not None and process.stdout is not None
+    process.stdin.write(kernel_args.encode_json())
+    process.stdin.close()
+    assert process.stdout.readline().strip() == b"KERNEL_READY"
+
+    try:
+        start = time.perf_counter()
+        queue_manager.control_queue.put(request)
+        count = 0
+        while True:
+            message = queue_manager.stream_queue.get(timeout=60)
+            count += 1
+            if json.loads(message)["op"] == "completed-run":
+                return time.perf_counter() - start, count
+    finally:
+        process.kill()
+        process.wait()
+        queue_manager.close_queues(linger=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument(
+        "--size", type=int, default=1024, help="bytes per message"
+    )
+    parser.add_argument(
+        "--outputs", type=int, default=2_000, help="outputs of the cell"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    transports = ["tcp"] if sys.platform == "win32" else ["tcp", "ipc"]
+    messages = [
+        b'{"op": "cell-op", "data": "' + b"x" * args.size + b'"}'
+        for _ in range(args.messages)
+    ]
+
+    print(f"framing: {args.messages} messages of {args.size} bytes")
+    print(f"{'transport':>9}  {'pickle msg/s':>13}  {'raw msg/s':>10}")
+    for transport in transports:
+        before = min(
+            framing_pickle(transport, messages) for _ in range(args.repeat)
+        )
+        after = min(
+            framing_raw(transport, messages) for _ in range(args.repeat)
+        )
+        print(
+            f"{transport:>9}  {len(messages) / before:>13,.0f}  "
+            f"{len(messages) / after:>10,.0f}"
+        )
+
+    print(f"\nkernel: a cell with {args.outputs} outputs")
+    print(f"{'transport':>9}  {'run s':>6}  {'messages':>8}  {'msg/s':>8}")
+    for transport in transports:
+        elapsed, count = min(
+            kernel(transport, args.outputs, args.size)
+            for _ in range(args.repeat)
+        )
+        print(
+            f"{transport:>9}  {elapsed:>6.2f}  {count:>8}  "
+            f"{count / elapsed:>8,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
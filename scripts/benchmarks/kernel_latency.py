@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark the latency of the kernel's control loop.
+
+Runs a kernel with `python -m marimo._ipc.launch_kernel` and measures:
+
+- UI update round trip: the time from sending a slider's new value to the
+  kernel until the run of the cells that depend on it has completed.
+- background tasks: the delays of an asyncio task, started by a cell, that
+  wakes up every few milliseconds while the kernel is idle (how late each
+  wake-up is, compared to the requested interval).
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/kernel_latency.py [--updates 200]
+        [--interval-ms 5] [--duration 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+from marimo._ast.app_config import _AppConfig
+from marimo._ast.cell import CellConfig
+from marimo._config.config import DEFAULT_CONFIG
+from marimo._ipc import KernelArgs, QueueManager
+from marimo._runtime.commands import (
+    AppMetadata,
+    ExecuteCellsCommand,
+    UpdateUIElementCommand,
+)
+from marimo._types.ids import CellId_t, UIElementId
+
+SLIDER = CellId_t("slider")
+DEPENDENT = CellId_t("dependent")
+TICKER = CellId_t("ticker")
+REPORT = CellId_t("report")
+
+CODES = {
+    SLIDER: "import marimo as mo\nslider = mo.ui.slider(0, 1000)\nslider",
+    DEPENDENT: "value = slider.value",
+    TICKER: """\
+import asyncio
+import time
+
+delays = []
+
+async def tick():
+    expected = time.perf_counter() + {interval}
+    while len(delays) < {count}:
+        await asyncio.sleep({interval})
+        now = time.perf_counter()
+        delays.append(now - expected)
+        expected = now + {interval}
+
+task = asyncio.get_running_loop().create_task(tick())
+""",
+    REPORT: "list(delays)",
+}
+
+
+class Kernel:
+    def __init__(self) -> None:
+        self.queue_manager, connection_info = QueueManager.create()
+        kernel_args = KernelArgs(
+            connection_info=connection_info,
+            profile_path=None,
+            configs={cell_id: CellConfig() for cell_id in CODES},
+            user_config=DEFAULT_CONFIG,
+            log_level=30,
+            app_metadata=AppMetadata(
+                query_params={}, cli_args={}, app_config=_AppConfig()
+            ),
+        )
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "marimo._ipc.launch_kernel"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        assert self.process.stdin is not None
+        assert self.process.stdout is not None
+        self.process.stdin.write(kernel_args.encode_json())
+        self.process.stdin.close()
+        assert self.process.stdout.readline().strip() == b"KERNEL_READY"
+
+    def run_until_completed(self, request: Any) -> list[dict[str, Any]]:
+        self.queue_manager.control_queue.put(request)
+        if isinstance(request, UpdateUIElementCommand):
+            self.queue_manager.set_ui_element_queue.put(request)
+        messages = []
+        while True:
+            message = json.loads(
+                self.queue_manager.stream_queue.get(timeout=60)
+            )
+            messages.append(message)
+            if message["op"] == "completed-run":
+                return messages
+
+    def execute(self, *cell_ids: CellId_t, **fmt: Any) -> list[dict[str, Any]]:
+        return self.run_until_completed(
+            ExecuteCellsCommand(
+                cell_ids=list(cell_ids),
+                codes=[CODES[cell_id].format(**fmt) for cell_id in cell_ids],
+            )
+        )
+
+    def close(self) -> None:
+        self.process.kill()
+        self.process.wait()
+        self.queue_manager.close_queues(linger=0)
+
+
+def ui_round_trip(kernel: Kernel, updates: int) -> list[float]:
+    messages = kernel.execute(SLIDER, DEPENDENT)
+    outputs = "".join(
+        json.dumps(m.get("output")) for m in messages if m["op"] == "cell-op"
+    )
+    match = re.search(
+        r"object-id=(?:'|\\\"|&quot;)([^'\"&\\]+)", html.unescape(outputs)
+    )
+    assert match is not None, "slider not found in outputs"
+    slider_id = UIElementId(match.group(1))
+
+    times = []
+    for i in range(updates):
+        start = time.perf_counter()
+        kernel.run_until_completed(
+            UpdateUIElementCommand(
+                object_ids=[slider_id], values=[i % 1000], token=str(i)
+            )
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def background_delays(
+    kernel: Kernel, interval: float, duration: float
+) -> list[float]:
+    count = int(duration / interval)
+    kernel.execute(TICKER, interval=interval, count=count)
+    # The kernel is idle while the task runs
+    time.sleep(duration + 0.5)
+    for message in kernel.execute(REPORT):
+        output = message.get("output") if message["op"] == "cell-op" else None
+        if output and output["data"]:
+            # A list of floats, each as "text/plain+float:<value>"
+            return [
+                float(value.split(":", 1)[1])
+                for value in json.loads(output["data"])
+            ]
+    raise RuntimeError("no report from the kernel")
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--interval-ms", type=float, default=5)
+    parser.add_argument(
+        "--duration", type=float, default=2, help="seconds of ticking"
+    )
+    args = parser.parse_args()
+
+    kernel = Kernel()
+    try:
+        times = ui_round_trip(kernel, args.updates)
+        delays = background_delays(
+            kernel, args.interval_ms / 1000, args.duration
+        )
+    finally:
+        kernel.close()
+
+    times.sort()
+    print(f"UI update round trip ({len(times)} updates), ms")
+    print(
+        f"  median {_ms(statistics.median(times))}  "
+        f"p95 {_ms(times[int(len(times) * 0.95)])}  max {_ms(times[-1])}"
+    )
+    delays.sort()
+    print(
+        f"background task wake-up delay ({len(delays)} ticks every "
+        f"{args.interval_ms:g} ms), ms"
+    )
+    print(
+        f"  median {_ms(statistics.median(delays))}  "
+        f"p95 {_ms(delays[int(len(delays) * 0.95)])}  max {_ms(delays[-1])}"
+    )
+
+
+if __name__ == "__main__":
+    main()
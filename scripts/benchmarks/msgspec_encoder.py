@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark encoding representative payloads with marimo's msgspec encoder.
+
+Each payload is encoded with `encode_json_bytes` (type-dispatched hooks,
+columnar pandas encoding) and with an uncached hook that walks every type
+check for every object and encodes pandas frames through row dicts, which
+is how the encoder used to work.
+
+Payloads:
+
+- scalars: a cell's variable values, full of numpy scalars
+- array: a numeric numpy array
+- pandas: a pandas frame with numeric, boolean, string and datetime columns
+- polars: the same frame in polars
+- objects: plain Python objects, encoded through their `__dict__`
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/msgspec_encoder.py [--rows 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import statistics
+import time
+from typing import Any, Callable
+
+import msgspec
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from marimo._messaging.msgspec_encoder import _resolve, encode_json_bytes
+
+
+def uncached_hook(obj: Any) -> Any:
+    encoder, _ = _resolve(obj)
+    return encoder(obj)
+
+
+uncached = msgspec.json.Encoder(enc_hook=uncached_hook, decimal_format="number")
+
+
+@dataclasses.dataclass
+class Point:
+    x: float
+    y: float
+    label: str
+
+
+class Record:
+    def __init__(self, i: int) -> None:
+        self.id = i
+        self.name = f"record {i}"
+        self.point = Point(i / 2, -i / 2, "p")
+
+
+def payloads(rows: int) -> dict[str, Any]:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "x": rng.standard_normal(rows),
+            "y": rng.integers(0, 1000, rows),
+            "flag": rng.integers(0, 2, rows).astype(bool),
+            "name": np.array(["a", "b", "c"])[rng.integers(0, 3, rows)],
+            "when": pd.date_range("2024-01-01", periods=rows, freq="s"),
+        }
+    )
+    return {
+        "scalars": {
+            f"var_{i}": {
+                "value": np.float64(i),
+                "count": np.int64(i),
+                "ok": np.bool_(i % 2),
+            }
+            for i in range(rows // 10)
+        },
+        "array": rng.standard_normal(rows * 10),
+        "pandas": frame,
+        "polars": pl.from_pandas(frame),
+        "objects": [Record(i) for i in range(rows // 10)],
+    }
+
+
+def measure(fn: Callable[[], bytes], repeat: int) -> tuple[float, int]:
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fn())
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'payload':>8}  {'MB':>7}  {'uncached ms':>12}  {'encoder ms':>11}  "
+        f"{'MB/s':>8}  {'speedup':>8}"
+    )
+    for name, payload in payloads(args.rows).items():
+        assert encode_json_bytes(payload) == uncached.encode(payload)
+        before, _ = measure(lambda p=payload: uncached.encode(p), args.repeat)
+        after, size = measure(
+            lambda p=payload: encode_json_bytes(p), args.repeat
+        )
+        mb = size / 1024 / 1024
+        print(
+            f"{name:>8}  {mb:>7.1f}  {before * 1000:>12.1f}  "
+            f"{after * 1000:>11.1f}  {mb / after:>8.0f}  "
+            f"{before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
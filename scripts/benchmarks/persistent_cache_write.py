@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark how long saving a persistent cache holds up execution.
+
+Saves a large value with `mo.persistent_cache`'s loader, synchronously and
+with write-behind, and reports how long `save_cache` blocks the caller and
+how long until the value is on disk.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/persistent_cache_write.py [--size-mb 500]
+        [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from marimo._save.cache import Cache
+from marimo._save.loaders import PickleLoader
+from marimo._save.stores.file import FileStore
+
+
+def _cache(value: bytes, i: int) -> Cache:
+    return Cache(
+        defs={"value": value},
+        hash=f"bench{i}",
+        cache_type="Pure",
+        stateful_refs=set(),
+        hit=False,
+        meta={},
+    )
+
+
+def run(size_mb: int, repeat: int, write_behind: bool) -> tuple[float, float]:
+    value = os.urandom(size_mb * 1024 * 1024)
+    blocked, written = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = PickleLoader(
+            "bench", store=FileStore(tmp), write_behind=write_behind
+        )
+        for i in range(repeat):
+            start = time.perf_counter()
+            loader.save_cache(_cache(value, i))
+            blocked.append(time.perf_counter() - start)
+            loader.flush()
+            written.append(time.perf_counter() - start)
+    return statistics.median(blocked), statistics.median(written)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'mode':>12}  {'blocked s':>9}  {'written s':>9}")
+    for label, write_behind in (
+        ("synchronous", False),
+        ("write-behind", True),
+    ):
+        blocked, written = run(args.size_mb, args.repeat, write_behind)
+        print(f"{label:>12}  {blocked:>9.3f}  {written:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
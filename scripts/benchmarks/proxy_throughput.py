@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark the reverse proxy's upstream HTTP client.
+
+Compares the pooled, streaming client used by `ProxyMiddleware` against
+the previous implementation (a new `http.client` connection per request,
+with the request body buffered in memory), using a local uvicorn
+upstream.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/proxy_throughput.py [--requests 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.client
+import socket
+import threading
+import time
+import tracemalloc
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, Callable
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from marimo._server.api.middleware import _AsyncHTTPClient, _URLRequest
+from marimo._server.api.proxy_client import get_connection_pool
+
+LARGE_BODY = b"x" * (16 * 1024 * 1024)
+
+
+async def small(request: Request) -> Response:
+    del request
+    return Response(b'{"ok": true}', media_type="application/json")
+
+
+async def large(request: Request) -> Response:
+    del request
+    return Response(LARGE_BODY, media_type="application/octet-stream")
+
+
+async def upload(request: Request) -> Response:
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+    return Response(str(size), media_type="text/plain")
+
+
+def start_upstream() -> int:
+    app = Starlette(
+        routes=[
+            Route("/small", small),
+            Route("/large", large),
+            Route("/upload", upload, methods=["POST"]),
+        ]
+    )
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return int(port)
+
+
+class LegacyClient:
+    """The proxy client as it was before connection pooling."""
+
+    def __init__(self, base_url: str) -> None:
+        self.client = _AsyncHTTPClient(base_url)
+
+    async def send(self, request: _URLRequest) -> Any:
+        body = b""
+        if isinstance(request.data, AsyncIterable):
+            body = b"".join([chunk async for chunk in request.data])
+        elif isinstance(request.data, bytes):
+            body = request.data
+
+        def send_request() -> http.client.HTTPResponse:
+            conn = http.client.HTTPConnection(self.client.host, timeout=30)
+            conn.request(
+                request.method,
+                request.full_url.split(self.client.host, 1)[1],
+                body=body,
+                headers=request.headers,
+            )
+            return conn.getresponse()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, send_request)
+
+    async def read(self, response: Any) -> int:
+        size = 0
+        while True:
+            # Reads block the event loop, as before
+            chunk = response.read(8192)
+            if not chunk:
+                break
+            size += len(chunk)
+        response.close()
+        return size
+
+
+class PooledClient:
+    def __init__(self, base_url: str) -> None:
+        self.client = _AsyncHTTPClient(base_url)
+
+    async def send(self, request: _URLRequest) -> Any:
+        return await self.client.send(request)
+
+    async def read(self, response: Any) -> int:
+        size = 0
+        async for chunk in response.aiter_raw():
+            size += len(chunk)
+        return size
+
+
+async def _upload_body() -> AsyncIterator[bytes]:
+    view = memoryview(LARGE_BODY)
+    for start in range(0, len(view), 64 * 1024):
+        yield bytes(view[start : start + 64 * 1024])
+
+
+def _request(
+    base_url: str, path: str, method: str = "GET", data: Any = None
+) -> _URLRequest:
+    headers = {"host": base_url.split("//", 1)[1]}
+    if method == "POST":
+        headers["content-length"] = str(len(LARGE_BODY))
+    return _URLRequest(
+        f"{base_url}{path}", method=method, headers=headers, data=data
+    )
+
+
+async def run_case(
+    client: Any,
+    make_request: Callable[[], _URLRequest],
+    count: int,
+    concurrency: int,
+) -> tuple[float, int, int]:
+    """Returns (seconds, bytes received, peak traced memory)."""
+    semaphore = asyncio.Semaphore(concurrency)
+    received = 0
+
+    async def one() -> None:
+        nonlocal received
+        async with semaphore:
+            response = await client.send(make_request())
+            size = await client.read(response)
+            received += size
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, received, peak
+
+
+async def main(requests: int, concurrency: int) -> None:
+    base_url = f"http://127.0.0.1:{start_upstream()}"
+    large_count = max(requests // 50, 4)
+    cases: list[tuple[str, Callable[[], _URLRequest], int]] = [
+        ("small GET", lambda: _request(base_url, "/small"), requests),
+        ("16MB GET", lambda: _request(base_url, "/large"), large_count),
+        (
+            "16MB POST",
+            lambda: _request(base_url, "/upload", "POST", _upload_body()),
+            large_count,
+        ),
+    ]
+
+    print(
+        f"{'case':<12}{'client':<9}{'req/s':>10}{'MB/s':>10}{'peak MB':>10}"
+    )
+    for name, make_request, count in cases:
+        for label, client in (
+            ("legacy", LegacyClient(base_url)),
+            ("pooled", PooledClient(base_url)),
+        ):
+            elapsed, received, peak = await run_case(
+                client, make_request, count, concurrency
+            )
+            mb = (
+                received
+                if name != "16MB POST"
+                else count * len(LARGE_BODY)
+            ) / 1e6
+            print(
+                f"{name:<12}{label:<9}{count / elapsed:>10.1f}"
+                f"{mb / elapsed:>10.1f}{peak / 1e6:>10.1f}"
+            )
+    get_connection_pool().close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
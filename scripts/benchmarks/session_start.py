@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark how long a new edit session takes to get a running kernel.
+
+Starts `marimo edit` on a directory, then opens sessions one after another,
+each measured from opening the websocket to the first run of the notebook
+completing. Compares the default kernels (a new process per session) with
+kernels claimed from a pool of warm processes (`--warm-kernels`). Where
+kernels are forked from the server (Linux before Python 3.14), the pool is
+not used and both runs measure the default kernels.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/session_start.py [--sessions 5]
+        [--warm-kernels 2] [--interval 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import websockets
+
+NOTEBOOK = """\
+import marimo
+
+__generated_with = "0.0.0"
+app = marimo.App()
+
+
+@app.cell
+def _():
+    x = 1
+    return (x,)
+
+
+if __name__ == "__main__":
+    app.run()
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _wait_for_server(port: int) -> None:
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise TimeoutError("server did not start")
+
+
+async def _session(port: int, path: Path, session_id: str) -> float:
+    url = (
+        f"ws://127.0.0.1:{port}/ws?session_id={session_id}"
+        f"&file={path}&access_token="
+    )
+    start = time.perf_counter()
+    async with websockets.connect(url, max_size=None) as ws:
+        instantiated = False
+        while True:
+            message = json.loads(await ws.recv())
+            op = message["op"]
+            if op == "kernel-ready" and not instantiated:
+                instantiated = True
+                async with httpx.AsyncClient() as client:
+                    await client.post(
+                        f"http://127.0.0.1:{port}/api/kernel/instantiate",
+                        headers={"Marimo-Session-Id": session_id},
+                        json={"objectIds": [], "values": [], "autoRun": True},
+                    )
+            elif op == "completed-run":
+                return time.perf_counter() - start
+
+
+def run(
+    directory: Path, sessions: int, interval: float, warm_kernels: int | None
+) -> list[float]:
+    port = _free_port()
+    cmd = [
+        sys.executable,
+        "-m",
+        "marimo",
+        "edit",
+        str(directory),
+        "--headless",
+        "--no-token",
+        "--skip-update-check",
+        "--no-skew-protection",
+        "--port",
+        str(port),
+    ]
+    if warm_kernels is not None:
+        cmd += ["--warm-kernels", str(warm_kernels)]
+    server = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    try:
+        _wait_for_server(port)
+        times = []
+        for i in range(sessions):
+            # Leave time for the pool to be replenished, as between users
+            # opening notebooks
+            time.sleep(interval)
+            # A notebook per session: a second session on the same notebook
+            # would resume the first one's kernel
+            path = directory / f"notebook_{i}.py"
+            times.append(asyncio.run(_session(port, path, f"s{i}")))
+        return times
+    finally:
+        # Like Ctrl-C, which shuts down sessions and the pool
+        server.send_signal(signal.SIGINT)
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--warm-kernels", type=int, default=2)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="seconds between sessions",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for i in range(args.sessions):
+            (directory / f"notebook_{i}.py").write_text(
+                NOTEBOOK, encoding="utf-8"
+            )
+        print(f"{'kernels':>8}  {'first s':>8}  {'median s':>8}")
+        for label, warm in (("default", None), ("warm", args.warm_kernels)):
+            times = run(directory, args.sessions, args.interval, warm)
+            median = sorted(times)[len(times) // 2]
+            print(f"{label:>8}  {times[0]:>8.3f}  {median:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# Copyright 2026 Marimo. All rights reserved.
+"""Benchmark sending widget buffers from the kernel to the frontend.
+
+Compares a round trip of a widget state message carrying multi-MB buffers:
+
+- inline: buffers are base64-encoded into the notification, which is
+  serialized, wrapped for the websocket, parsed and base64-decoded again
+  (`json` and `base64` stand in for the browser).
+- out of band: buffers are written to virtual file storage (shared
+  memory, as in edit mode), the notification only carries their URLs, and
+  the server reads them back as it does when serving `/@file/`.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/widget_buffers.py [--sizes 1 8 32] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import statistics
+import time
+from typing import Callable
+
+from marimo._messaging.notification import UIElementMessageNotification
+from marimo._messaging.serde import serialize_kernel_message
+from marimo._runtime.virtual_file import (
+    VirtualFile,
+    random_filename,
+    read_virtual_file,
+)
+from marimo._runtime.virtual_file.storage import (
+    SharedMemoryStorage,
+    VirtualFileStorageManager,
+)
+from marimo._server.api.endpoints.ws.ws_formatter import format_wire_message
+from marimo._types.ids import WidgetModelId
+
+MODEL_ID = WidgetModelId("benchmark")
+MESSAGE = {
+    "method": "update",
+    "state": {},
+    "buffer_paths": [["table"], ["tiles"]],
+}
+
+
+def inline(buffers: list[bytes]) -> tuple[int, list[bytes]]:
+    notification = UIElementMessageNotification(
+        ui_element=None, model_id=MODEL_ID, message=MESSAGE, buffers=buffers
+    )
+    wire = format_wire_message(
+        notification.name, serialize_kernel_message(notification)
+    )
+
+    # Frontend
+    data = json.loads(wire)["data"]
+    return len(wire), [base64.b64decode(b) for b in data["buffers"]]
+
+
+def out_of_band(
+    storage: SharedMemoryStorage, buffers: list[bytes]
+) -> tuple[int, list[bytes]]:
+    # Kernel
+    files = [VirtualFile(random_filename("bin"), b) for b in buffers]
+    for file in files:
+        storage.store(file.filename, file.buffer)
+    notification = UIElementMessageNotification(
+        ui_element=None,
+        model_id=MODEL_ID,
+        message=MESSAGE,
+        buffers=[b"" for _ in buffers],
+        buffer_urls=[file.url for file in files],
+    )
+    wire = format_wire_message(
+        notification.name, serialize_kernel_message(notification)
+    )
+
+    # Frontend, then server
+    data = json.loads(wire)["data"]
+    received = []
+    for url in data["buffer_urls"]:
+        length, filename = url.split("/@file/")[1].split("-", 1)
+        received.append(read_virtual_file(filename, int(length)))
+
+    for file in files:
+        storage.remove(file.filename)
+    return len(wire), received
+
+
+def measure(
+    fn: Callable[[], tuple[int, list[bytes]]],
+    expected: list[bytes],
+    repeat: int,
+) -> tuple[float, int]:
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size, received = fn()
+        times.append(time.perf_counter() - start)
+        assert received == expected
+    return statistics.median(times), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="total buffer size per message, in MB",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    storage = SharedMemoryStorage()
+    VirtualFileStorageManager().storage = storage
+
+    print(
+        f"{'MB':>4}  {'inline ms':>10}  {'out-of-band ms':>15}  "
+        f"{'inline wire':>12}  {'out-of-band wire':>17}"
+    )
+    try:
+        for size in args.sizes:
+            half = size * 1024 * 1024 // 2
+            buffers = [os.urandom(half), os.urandom(half)]
+            inline_s, inline_bytes = measure(
+                lambda b=buffers: inline(b), buffers, args.repeat
+            )
+            oob_s, oob_bytes = measure(
+                lambda b=buffers: out_of_band(storage, b),
+                buffers,
+                args.repeat,
+            )
+            print(
+                f"{size:>4}  {inline_s * 1000:>10.1f}  {oob_s * 1000:>15.1f}  "
+                f"{inline_bytes:>12,}  {oob_bytes + size * 1024 * 1024:>17,}"
+            )
+    finally:
+        storage.shutdown()
+
+
+if __name__ == "__main__":
+    main()
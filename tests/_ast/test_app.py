@@ -198,6 +198,72 @@ class TestApp:
         assert defs["normal_var"] == 100
         assert "setup_var" in defs  # setup still ran
 
+    @staticmethod
+    def test_run_outputs_runs_only_ancestors() -> None:
+        app = App()
+
+        @app.cell
+        def config() -> tuple[int]:
+            batch_size = 32
+            return (batch_size,)
+
+        @app.cell
+        def model(batch_size: int) -> tuple[int]:
+            trained = batch_size * 2
+            return (trained,)
+
+        @app.cell
+        def report(trained: int) -> tuple[str]:
+            summary = f"trained {trained}"
+            return (summary,)
+
+        @app.cell
+        def unrelated() -> tuple[str]:
+            message = "independent"
+            return (message,)
+
+        _, defs = app.run(outputs=["trained"])
+        assert defs["trained"] == 64
+        assert "batch_size" in defs
+        assert "summary" not in defs
+        assert "message" not in defs
+
+        # Overridden definitions cut the ancestors off
+        _, defs = app.run(defs={"batch_size": 1}, outputs=["summary"])
+        assert defs["summary"] == "trained 2"
+        assert "message" not in defs
+
+        # Requesting an overridden name runs nothing
+        outputs, defs = app.run(defs={"batch_size": 1}, outputs=["batch_size"])
+        assert outputs == ()
+        assert defs["batch_size"] == 1
+
+    @staticmethod
+    def test_run_outputs_missing() -> None:
+        app = App()
+
+        @app.cell
+        def stopped() -> tuple[int]:
+            import marimo as mo
+
+            mo.stop(True)
+            y = 1
+            return (y,)
+
+        @app.cell(disabled=True)
+        def disabled() -> tuple[int]:
+            z = 1
+            return (z,)
+
+        with pytest.raises(TypeError):
+            app.run(outputs="y")
+        with pytest.raises(NameError, match="not defined by any cell"):
+            app.run(outputs=["nope"])
+        with pytest.raises(NameError, match="disabled"):
+            app.run(outputs=["z"])
+        with pytest.raises(NameError, match="without defining 'y'"):
+            app.run(outputs=["y"])
+
     @staticmethod
     def test_run_with_undefined_refs_in_setup_cell() -> None:
         """Test that overriding setup cell definitions raises IncompleteRefsError."""
@@ -0,0 +1,168 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Tests for the persistent compiled-cell cache."""
+
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._ast import compile_cache
+from marimo._ast.cell import SourcePosition
+from marimo._ast.compile_cache import CompileCache, with_filename
+from marimo._ast.compiler import compile_cell, get_filename
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CODE = """\
+import math
+_private = [i * i for i in range(3)]
+radius = math.sqrt(sum(_private))
+def area():
+    return math.pi * radius**2
+area()
+"""
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> CompileCache:
+    cache = CompileCache(tmp_path)
+    monkeypatch.setattr(GLOBAL_SETTINGS, "COMPILE_CACHE", True)
+    monkeypatch.setattr(compile_cache, "_COMPILE_CACHE", cache)
+    return cache
+
+
+def _entries(cache: CompileCache) -> int:
+    return len(list(cache.cache_dir.glob("*/*.pickle")))
+
+
+def test_cached_cell_matches_compiled(cache: CompileCache) -> None:
+    cell_id = CellId_t("Hbol")
+    fresh = compile_cell(CODE, cell_id=cell_id, use_cache=True)
+    assert _entries(cache) == 1
+    cached = compile_cell(CODE, cell_id=cell_id, use_cache=True)
+
+    for attr in (
+        "defs",
+        "refs",
+        "temporaries",
+        "variable_data",
+        "deleted_refs",
+        "language",
+        "markdown",
+        "key",
+    ):
+        assert getattr(cached, attr) == getattr(fresh, attr), attr
+    assert cached.defs == {"math", "radius", "area"}
+    assert cached.import_workspace.is_import_block is False
+
+    # The module is only parsed when it's needed
+    assert cached._mod is None
+    assert ast.dump(cached.mod) == ast.dump(fresh.mod)
+
+    # Code objects point at this process's temporary file
+    assert cached.body is not None
+    assert cached.body.co_filename == get_filename(cell_id)
+    glbls: dict[str, object] = {}
+    exec(cached.body, glbls)
+    assert cached.last_expr is not None
+    assert eval(cached.last_expr, glbls) == pytest.approx(3.14159 * 5)
+
+
+def test_key_covers_compile_inputs(cache: CompileCache) -> None:
+    position = SourcePosition(filename="nb.py", lineno=3, col_offset=4)
+    keys = {
+        cache.key(CODE, CellId_t("a"), None),
+        cache.key(CODE, CellId_t("b"), None),
+        cache.key(CODE + "\n", CellId_t("a"), None),
+        cache.key(CODE, CellId_t("a"), position),
+        cache.key(
+            CODE,
+            CellId_t("a"),
+            SourcePosition(filename="nb.py", lineno=4, col_offset=4),
+        ),
+    }
+    assert len(keys) == 5
+    assert cache.key(CODE, CellId_t("a"), position) == CompileCache(
+        cache.cache_dir
+    ).key(CODE, CellId_t("a"), position)
+
+
+def test_uncacheable_cells(
+    cache: CompileCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compile_cell("x = 1", cell_id=CellId_t("a"))
+    compile_cell(
+        'df = mo.sql("SELECT 1")', cell_id=CellId_t("b"), use_cache=True
+    )
+    compile_cell(
+        "def test_one():\n    assert 1 == 1",
+        cell_id=CellId_t("c"),
+        use_cache=True,
+    )
+    assert _entries(cache) == 0
+
+    monkeypatch.setattr(GLOBAL_SETTINGS, "COMPILE_CACHE", False)
+    compile_cell("x = 1", cell_id=CellId_t("d"), use_cache=True)
+    assert _entries(cache) == 0
+
+
+def test_test_rewrite_skips_the_cache(cache: CompileCache) -> None:
+    code = "x = 1\nassert x == 1"
+    compile_cell(code, cell_id=CellId_t("a"), use_cache=True)
+    assert _entries(cache) == 1
+
+    # Not served the entry compiled without assertion rewriting
+    cell = compile_cell(
+        code, cell_id=CellId_t("a"), use_cache=True, test_rewrite=True
+    )
+    assert cell._mod is not None
+    assert _entries(cache) == 1
+
+
+def test_unused_entries_are_pruned(cache: CompileCache) -> None:
+    import os
+    import time
+
+    compile_cell("x = 1", cell_id=CellId_t("a"), use_cache=True)
+    compile_cell("y = 1", cell_id=CellId_t("b"), use_cache=True)
+    # Both were last used long ago
+    old = time.time() - 60 * 24 * 60 * 60
+    for entry in cache.cache_dir.glob("*/*.pickle"):
+        os.utime(entry, (old, old))
+
+    # Reading an entry marks it as used
+    cell = compile_cell("x = 1", cell_id=CellId_t("a"), use_cache=True)
+    assert cell._mod is None
+    assert cache.prune() == 1
+    assert _entries(cache) == 1
+    assert (
+        compile_cell("x = 1", cell_id=CellId_t("a"), use_cache=True)._mod
+        is None
+    )
+
+
+def test_corrupt_entries_are_recompiled(cache: CompileCache) -> None:
+    cell_id = CellId_t("a")
+    compile_cell("x = 1", cell_id=cell_id, use_cache=True)
+    (entry,) = cache.cache_dir.glob("*/*.pickle")
+    entry.write_bytes(b"not a pickle")
+
+    cell = compile_cell("x = 1", cell_id=cell_id, use_cache=True)
+    assert cell.defs == {"x"}
+    assert cell._mod is not None
+
+
+def test_with_filename() -> None:
+    code = compile("def f():\n    return lambda: 1\n", "old.py", mode="exec")
+    renamed = with_filename(code, "new.py")
+    f_code = next(c for c in renamed.co_consts if hasattr(c, "co_consts"))
+    lambda_code = next(c for c in f_code.co_consts if hasattr(c, "co_consts"))
+    assert renamed.co_filename == "new.py"
+    assert f_code.co_filename == "new.py"
+    assert lambda_code.co_filename == "new.py"
+    assert with_filename(renamed, "new.py") is renamed
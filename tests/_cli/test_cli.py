@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import json
 import os
 import signal
 import socket
@@ -647,6 +648,51 @@ def test_cli_run_with_additional_args(temp_marimo_file: str) -> None:
     _check_contents(p, f'"version": "{get_version()}"'.encode(), contents)
 
 
+def test_cli_run_batch(tmp_path: Path) -> None:
+    notebook = _write_temp_notebook(
+        """
+        import marimo
+        app = marimo.App()
+
+        @app.cell
+        def __():
+            base = 10
+            return base,
+
+        @app.cell
+        def __(base, scale):
+            total = base * scale
+            return total,
+        """,
+        tmp_path,
+    )
+    params = tmp_path / "grid.jsonl"
+    params.write_text("\n".join(f'{{"scale": {i}}}' for i in range(4)))
+
+    p = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "marimo",
+            "run-batch",
+            str(notebook),
+            "--params",
+            str(params),
+            "--jobs",
+            "2",
+        ],
+        capture_output=True,
+        timeout=120,
+    )
+    assert p.returncode == 0, p.stderr.decode()
+    lines = [json.loads(line) for line in p.stdout.decode().splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2, 3]
+    assert [line["defs"] for line in lines] == [
+        {"total": 10 * i} for i in range(4)
+    ]
+    assert all(line["error"] is None for line in lines)
+
+
 def test_cli_tutorial() -> None:
     port = _get_port()
     p = subprocess.Popen(
@@ -0,0 +1,256 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._cli.sandbox_cache import (
+    SandboxEnvCache,
+    environment_key,
+    is_local_requirement,
+    mark_modified,
+    normalize_requirements,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PYTHON = "cpython-3.12.0-linux-x86_64"
+
+
+class FakeBuilder:
+    def __init__(self) -> None:
+        self.builds: list[Path] = []
+
+    def __call__(self, venv_path: Path) -> None:
+        self.builds.append(venv_path)
+        site_packages = venv_path / "lib" / "python3.12" / "site-packages"
+        site_packages.mkdir(parents=True)
+        (site_packages / "fakemod.py").write_text("x = 1\n")
+        (site_packages / "fakemod-1.0.dist-info").mkdir()
+
+
+def _site_packages(env_path: Path) -> Path:
+    return env_path / "venv" / "lib" / "python3.12" / "site-packages"
+
+
+def test_environment_key_is_normalized() -> None:
+    assert normalize_requirements(
+        ["polars", "", "# comment", "marimo==0.1  # pinned", "polars"]
+    ) == ["marimo==0.1", "polars"]
+    assert environment_key(["a", "b"], PYTHON) == environment_key(
+        ["b", "a", "a"], PYTHON
+    )
+    assert environment_key(["a"], PYTHON) != environment_key(
+        ["a"], "cpython-3.13.0-linux-x86_64"
+    )
+    assert environment_key(["a"], PYTHON) != environment_key(["a==1"], PYTHON)
+
+
+def test_identical_requirements_share_environment(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path)
+    build = FakeBuilder()
+
+    first = cache.acquire(["polars", "marimo"], PYTHON, build)
+    second = cache.acquire(["marimo", "polars"], PYTHON, build)
+    assert first is not None
+    assert second is not None
+    assert len(build.builds) == 1
+    assert first.path == second.path
+    assert first.venv_python == second.venv_python
+    assert len(list((first.path / "refs").iterdir())) == 2
+    # No staging directories are left behind
+    assert [p.name for p in tmp_path.iterdir()] == [first.path.name]
+
+    first.release()
+    first.release()
+    second.release()
+    assert list((first.path / "refs").iterdir()) == []
+    # Released environments stay on disk for reuse
+    assert cache.acquire(["polars", "marimo"], PYTHON, build) is not None
+    assert len(build.builds) == 1
+
+
+def test_failed_build_is_not_cached(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path)
+
+    def fail(venv_path: Path) -> None:
+        venv_path.mkdir()
+        raise RuntimeError("install failed")
+
+    with pytest.raises(RuntimeError):
+        cache.acquire(["broken"], PYTHON, fail)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path, max_environments=2)
+    build = FakeBuilder()
+
+    in_use = cache.acquire(["a"], PYTHON, build)
+    assert in_use is not None
+    environments = [in_use]
+    for i, requirement in enumerate(["b", "c", "d"]):
+        env = cache.acquire([requirement], PYTHON, build)
+        assert env is not None
+        env.release()
+        environments.append(env)
+        # Distinct, increasing last-used times
+        last_used = time.time() - 100 + i
+        os.utime(env.path / "meta.json", (last_used, last_used))
+    oldest = time.time() - 1000
+    os.utime(in_use.path / "meta.json", (oldest, oldest))
+    cache.evict()
+
+    remaining = {p.name for p in tmp_path.iterdir()}
+    # "a" is still referenced, so it's kept even though it's the oldest
+    assert remaining == {environments[0].path.name, environments[3].path.name}
+
+
+def test_stale_references_are_ignored(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path, max_environments=0)
+    build = FakeBuilder()
+
+    env = cache.acquire(["a"], PYTHON, build)
+    assert env is not None
+    # Simulate a reference left behind by a process that crashed
+    env.release()
+    (env.path / "refs" / "99999999-dead").touch()
+
+    with patch("marimo._cli.sandbox_cache._pid_exists", return_value=False):
+        cache.evict()
+    assert not env.path.exists()
+
+
+def test_modified_environment_is_not_shared(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path)
+    build = FakeBuilder()
+
+    env = cache.acquire(["a"], PYTHON, build)
+    assert env is not None
+    # A kernel installed a package into the environment at runtime
+    (_site_packages(env.path) / "extra").mkdir()
+    (_site_packages(env.path) / "extra-2.0.dist-info").mkdir()
+
+    # Still in use: the caller must build a private environment
+    assert cache.acquire(["a"], PYTHON, build) is None
+
+    # Once released, it is rebuilt
+    env.release()
+    rebuilt = cache.acquire(["a"], PYTHON, build)
+    assert rebuilt is not None
+    assert len(build.builds) == 2
+    assert not (_site_packages(rebuilt.path) / "extra").exists()
+
+
+def test_environment_marked_modified_is_not_shared(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path)
+    build = FakeBuilder()
+
+    env = cache.acquire(["a"], PYTHON, build)
+    assert env is not None
+    # A kernel is about to install a package at runtime
+    assert mark_modified(str(env.path / "venv"))
+
+    assert cache.acquire(["a"], PYTHON, build) is None
+    env.release()
+    rebuilt = cache.acquire(["a"], PYTHON, build)
+    assert rebuilt is not None
+    assert len(build.builds) == 2
+    assert not (rebuilt.path / "modified").exists()
+
+
+def test_mark_modified_ignores_other_environments(tmp_path: Path) -> None:
+    venv = tmp_path / "venv"
+    venv.mkdir()
+    assert not mark_modified(str(venv))
+    assert not mark_modified(sys.prefix)
+    assert list(tmp_path.iterdir()) == [venv]
+
+
+@pytest.mark.parametrize(
+    ("requirement", "local"),
+    [
+        ("-e /src/pkg", True),
+        ("--editable=./pkg", True),
+        ("./packages/pkg", True),
+        ("/abs/pkg", True),
+        ("~/pkg", True),
+        ("C:/pkg", True),
+        ("pkg @ file:///src/pkg", True),
+        ("polars", False),
+        ("polars>=1.0", False),
+        ("pkg @ https://example.com/pkg.whl", False),
+    ],
+)
+def test_is_local_requirement(requirement: str, local: bool) -> None:
+    assert is_local_requirement(requirement) is local
+
+
+def test_local_requirements_are_not_cached(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path)
+    build = FakeBuilder()
+
+    assert cache.acquire(["a", "-e /src/pkg"], PYTHON, build) is None
+    assert build.builds == []
+
+
+def test_importing_packages_does_not_modify_environment(
+    tmp_path: Path,
+) -> None:
+    cache = SandboxEnvCache(tmp_path)
+    build = FakeBuilder()
+
+    env = cache.acquire(["a"], PYTHON, build)
+    assert env is not None
+    site_packages = _site_packages(env.path)
+    mtime = site_packages.stat().st_mtime_ns
+    # Writes site-packages/__pycache__
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; sys.path.insert(0, {str(site_packages)!r}); "
+            "import fakemod",
+        ],
+        check=True,
+        env={
+            k: v
+            for k, v in os.environ.items()
+            if k != "PYTHONDONTWRITEBYTECODE"
+        },
+    )
+    assert (site_packages / "__pycache__").is_dir()
+    assert site_packages.stat().st_mtime_ns != mtime
+    env.release()
+
+    reused = cache.acquire(["a"], PYTHON, build)
+    assert reused is not None
+    assert reused.path == env.path
+    assert len(build.builds) == 1
+
+
+def test_refs_from_other_processes_are_live(tmp_path: Path) -> None:
+    cache = SandboxEnvCache(tmp_path, max_environments=0)
+    build = FakeBuilder()
+
+    env = cache.acquire(["a"], PYTHON, build)
+    assert env is not None
+    env.release()
+
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"]
+    )
+    try:
+        (env.path / "refs" / f"{process.pid}-other").touch()
+        cache.evict()
+        assert env.path.exists()
+    finally:
+        process.kill()
+        process.wait()
@@ -0,0 +1,190 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._ipc.codec import MSGPACK, PICKLE, RAW, ZERO_COPY_THRESHOLD, Codec
+from marimo._ipc.types import ConnectionInfo
+from marimo._messaging.types import KernelMessage
+from marimo._runtime.commands import (
+    CommandMessage,
+    ExecuteCellsCommand,
+    HTTPRequest,
+    UpdateUIElementCommand,
+)
+from marimo._types.ids import CellId_t, UIElementId
+
+HAS_ZMQ = DependencyManager.zmq.has()
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+    y: int
+
+
+class User:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.display_name = name.title()
+
+
+def _request(user: Any) -> HTTPRequest:
+    return HTTPRequest(
+        url={"path": "/"},
+        base_url={"path": "/"},
+        headers={"accept": "text/html"},
+        query_params={"a": ["1"]},
+        path_params={},
+        cookies={},
+        meta={},
+        user=user,
+    )
+
+
+def test_kernel_messages_are_sent_raw() -> None:
+    codec: Codec[bytes] = Codec()
+    message = b'{"op": "cell-op"}'
+    assert codec.encode(message) == (RAW, message)
+    assert codec.decode(*codec.encode(message)) == message
+
+
+@pytest.mark.parametrize(
+    "value", ["text", True, None, ("op", b"data"), Point(1, 2)]
+)
+def test_untyped_values_round_trip(value: Any) -> None:
+    codec: Codec[Any] = Codec()
+    kind, payload = codec.encode(value)
+    assert kind == (RAW if isinstance(value, bytes) else PICKLE)
+    decoded = codec.decode(kind, payload)
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_commands_are_decoded_as_their_type() -> None:
+    codec: Codec[CommandMessage] = Codec(CommandMessage)
+    commands: list[CommandMessage] = [
+        ExecuteCellsCommand(
+            cell_ids=[CellId_t("a")],
+            codes=["x = 1"],
+            request=_request({"is_authenticated": True}),
+        ),
+        UpdateUIElementCommand(
+            object_ids=[UIElementId("slider")], values=[{"value": 3}]
+        ),
+    ]
+    for command in commands:
+        kind, payload = codec.encode(command)
+        assert kind == MSGPACK
+        assert codec.decode(kind, payload) == command
+
+
+def test_unencodable_values_are_pickled() -> None:
+    codec: Codec[CommandMessage] = Codec(CommandMessage)
+    command = ExecuteCellsCommand(
+        cell_ids=[CellId_t("a")], codes=["x = 1"], request=_request(User("u"))
+    )
+    kind, payload = codec.encode(command)
+    assert kind == PICKLE
+    decoded = codec.decode(kind, payload)
+    assert isinstance(decoded, ExecuteCellsCommand)
+    assert decoded.request is not None
+    assert decoded.request.user.name == "u"
+
+
+@pytest.mark.parametrize(
+    ("meta", "user"),
+    [
+        ({"roles": ("admin", "dev")}, {"is_authenticated": True}),
+        ({}, ("u", 1)),
+        ({}, Point(1, 2)),
+        ({"ids": {1, 2}}, None),
+    ],
+)
+def test_untyped_request_fields_round_trip(meta: Any, user: Any) -> None:
+    codec: Codec[CommandMessage] = Codec(CommandMessage)
+    request = _request(user)
+    request.meta.update(meta)
+    command = ExecuteCellsCommand(
+        cell_ids=[CellId_t("a")], codes=["x = 1"], request=request
+    )
+    kind, payload = codec.encode(command)
+    # msgpack would decode these as lists and dicts
+    assert kind == PICKLE
+    decoded = codec.decode(kind, payload)
+    assert decoded == command
+    assert isinstance(decoded, ExecuteCellsCommand)
+    assert decoded.request is not None
+    assert type(decoded.request.user) is type(user)
+    for key, value in meta.items():
+        assert type(decoded.request.meta[key]) is type(value)
+
+
+def test_connection_info_address() -> None:
+    info = ConnectionInfo(
+        control=1,
+        ui_element=2,
+        completion=3,
+        win32_interrupt=None,
+        input=4,
+        stream=5,
+    )
+    assert info.address(5) == "tcp://127.0.0.1:5"
+    info.ipc_dir = "/tmp/marimo-ipc"
+    assert info.address(5) == "ipc:///tmp/marimo-ipc/5"
+
+
+@pytest.mark.skipif(not HAS_ZMQ, reason="pyzmq not installed")
+@pytest.mark.parametrize(
+    "transport",
+    [
+        "tcp",
+        pytest.param(
+            "ipc",
+            marks=pytest.mark.skipif(
+                sys.platform == "win32", reason="Unix domain sockets"
+            ),
+        ),
+    ],
+)
+def test_queue_manager_round_trip(transport: Any) -> None:
+    import os
+
+    from marimo._ipc import QueueManager
+
+    host, info = QueueManager.create(transport)
+    kernel = QueueManager.connect(info)
+    try:
+        command = ExecuteCellsCommand(cell_ids=[CellId_t("a")], codes=["x"])
+        host.control_queue.put(command)
+        assert kernel.control_queue.get(timeout=5) == command
+
+        host.input_queue.put("answer")
+        assert kernel.input_queue.get(timeout=5) == "answer"
+
+        # Small messages are sent in one frame, large ones in two; all
+        # arrive in order
+        messages = [
+            KernelMessage(message)
+            for message in (
+                b"",
+                b"small",
+                b"x" * ZERO_COPY_THRESHOLD,
+                *(bytes([i % 256]) * 100 for i in range(500)),
+            )
+        ]
+        for message in messages:
+            kernel.stream_queue.put(message)
+        assert [host.stream_queue.get(timeout=5) for _ in messages] == messages
+    finally:
+        kernel.close_queues(linger=0)
+        host.close_queues(linger=0)
+
+    if transport == "ipc":
+        assert info.ipc_dir is not None
+        assert not os.path.exists(info.ipc_dir)
@@ -0,0 +1,155 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Tests for the lint result cache and process-pool execution."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from marimo._lint import Linter, run_check
+from marimo._lint.cache import LintCache
+from marimo._lint.diagnostic import Severity
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NOTEBOOK_WITH_ISSUES = """import marimo
+
+__generated_with = "0.15.0"
+app = marimo.App()
+
+@app.cell
+def _():
+    x = 1
+    return (x,)
+
+@app.cell
+def _():
+    x = 2
+    return (x,)
+"""
+
+
+def _write_notebooks(tmp_path: Path, count: int) -> list[Path]:
+    files = []
+    for i in range(count):
+        file = tmp_path / f"notebook_{i}.py"
+        file.write_text(NOTEBOOK_WITH_ISSUES)
+        files.append(file)
+    return files
+
+
+def _linter_with_cache(cache_dir: Path, **kwargs: Any) -> Linter:
+    linter = Linter(**kwargs)
+    linter.cache = LintCache(
+        [rule.code for rule in linter.rule_engine.rules],
+        cache_dir=cache_dir,
+    )
+    return linter
+
+
+class TestLintCache:
+    def test_cache_roundtrip(self, tmp_path: Path) -> None:
+        (file,) = _write_notebooks(tmp_path, 1)
+        cache_dir = tmp_path / "cache"
+
+        first = _linter_with_cache(cache_dir)
+        first.run_streaming(iter([file]))
+        assert first.files[0].diagnostics
+
+        second = _linter_with_cache(cache_dir)
+
+        async def fail(_file: Path):
+            raise AssertionError("should have been served from cache")
+
+        second._process_single_file = fail  # type: ignore[method-assign]
+        second.run_streaming(iter([file]))
+
+        assert second.files[0].file == str(file)
+        assert second.files[0].diagnostics == first.files[0].diagnostics
+        assert any(
+            d.severity == Severity.BREAKING
+            for d in second.files[0].diagnostics
+        )
+        assert second.errored
+
+    def test_cache_invalidated_by_contents(self, tmp_path: Path) -> None:
+        (file,) = _write_notebooks(tmp_path, 1)
+        cache_dir = tmp_path / "cache"
+        cache = LintCache(["MB001"], cache_dir=cache_dir)
+
+        key = cache.key(file)
+        file.write_text(NOTEBOOK_WITH_ISSUES + "\n# changed\n")
+        assert cache.key(file) != key
+
+    def test_cache_keyed_on_rules(self, tmp_path: Path) -> None:
+        (file,) = _write_notebooks(tmp_path, 1)
+        cache_dir = tmp_path / "cache"
+        assert LintCache(["MB001"], cache_dir=cache_dir).key(
+            file
+        ) != LintCache(["MB001", "MF001"], cache_dir=cache_dir).key(file)
+
+    def test_missing_file_not_cached(self, tmp_path: Path) -> None:
+        cache = LintCache(["MB001"], cache_dir=tmp_path / "cache")
+        assert cache.key(tmp_path / "missing.py") is None
+
+    def test_corrupt_entry_is_ignored(self, tmp_path: Path) -> None:
+        (file,) = _write_notebooks(tmp_path, 1)
+        cache = LintCache(["MB001"], cache_dir=tmp_path / "cache")
+        key = cache.key(file)
+        assert key is not None
+        entry = cache._entry_path(key)
+        entry.parent.mkdir(parents=True)
+        entry.write_text("{not json")
+        assert cache.get(key, file) is None
+
+    def test_unused_entries_are_pruned(self, tmp_path: Path) -> None:
+        used, unused = _write_notebooks(tmp_path, 2)
+        cache_dir = tmp_path / "cache"
+        linter = _linter_with_cache(cache_dir)
+        linter.run_streaming(iter([used, unused]))
+        cache = linter.cache
+        assert cache is not None
+
+        used_key, unused_key = cache.key(used), cache.key(unused)
+        assert used_key is not None
+        assert unused_key is not None
+        for key in (used_key, unused_key):
+            os.utime(cache._entry_path(key), (0, 0))
+        # Reading an entry marks it as used
+        assert cache.get(used_key, used) is not None
+
+        assert cache.prune() == 1
+        assert cache._entry_path(used_key).exists()
+        assert not cache._entry_path(unused_key).exists()
+
+    def test_cache_disabled_when_fixing(self, tmp_path: Path) -> None:
+        linter = Linter(
+            fix_files=True, cache=LintCache([], cache_dir=tmp_path)
+        )
+        assert linter.cache is None
+
+
+class TestParallelCheck:
+    @pytest.mark.timeout(120)
+    def test_jobs_match_serial_results(self, tmp_path: Path) -> None:
+        files = _write_notebooks(tmp_path, 6)
+        (tmp_path / "notes.txt").write_text("not a notebook")
+        patterns = tuple(str(f) for f in files) + (
+            str(tmp_path / "notes.txt"),
+        )
+
+        serial = run_check(patterns)
+        parallel = run_check(patterns, jobs=2)
+
+        assert [f.file for f in parallel.files] == [
+            f.file for f in serial.files
+        ]
+        assert [f.diagnostics for f in parallel.files] == [
+            f.diagnostics for f in serial.files
+        ]
+        assert parallel.files[-1].skipped
+        assert parallel.issues_count == serial.issues_count
+        assert parallel.errored == serial.errored
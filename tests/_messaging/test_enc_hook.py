@@ -2,11 +2,18 @@
 
 import decimal
 import json
+from typing import Any
 
+import msgspec
 import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._messaging.msgspec_encoder import enc_hook
+from marimo._messaging.msgspec_encoder import (
+    _ENCODERS,
+    enc_hook,
+    encode_json_bytes,
+    encode_json_str,
+)
 
 
 def test_enc_hook() -> None:
@@ -81,3 +88,75 @@ def test_serialize_decimal() -> None:
     decimal_obj = decimal.Decimal("-0")
     result = enc_hook(decimal_obj)
     assert result == "-0"
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(),
+    reason="Pandas not installed",
+)
+@pytest.mark.filterwarnings("ignore:DataFrame columns are not unique")
+def test_encode_pandas_frame_as_records() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, float("nan"), -0.25],
+            "bool": [True, False, True],
+            "str": ["a,b", '"quoted"', None],
+            "date": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+            "100%": [1, 2, 3],
+        },
+        index=[10, 20, 30],
+    )
+    records = msgspec.json.encode(df.to_dict("records"), enc_hook=enc_hook)
+    assert encode_json_bytes(df) == records
+    assert encode_json_bytes({"nested": [df]}) == (
+        b'{"nested":[' + records + b"]}"
+    )
+
+    # Non-string, duplicate and missing columns use the records as-is
+    for other in (
+        pd.DataFrame({0: [1, 2], 1: [3, 4]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": []}),
+        pd.DataFrame(index=[1, 2]),
+    ):
+        assert encode_json_bytes(other) == msgspec.json.encode(
+            other.to_dict("records"), enc_hook=enc_hook
+        )
+
+    # Builtins stay builtins
+    assert enc_hook(df.head(1))[0]["int"] == 1
+
+
+def test_enc_hook_caches_encoders_by_type() -> None:
+    class Point:
+        def __init__(self, x: int) -> None:
+            self.x = x
+            self.label = f"({x})"
+
+    class Dynamic:
+        def __getattr__(self, name: str) -> Any:
+            if name == "_marimo_serialize_":
+                return lambda: "dynamic"
+            raise AttributeError(name)
+
+    assert enc_hook(Point(1)) == {"x": 1, "label": "(1)"}
+    assert _ENCODERS.get(Point) is not None
+    assert enc_hook(Point(2)) == {"x": 2, "label": "(2)"}
+
+    assert enc_hook(Dynamic()) == "dynamic"
+    assert _ENCODERS.get(Dynamic) is None
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(),
+    reason="Polars not installed",
+)
+def test_encode_polars_frames() -> None:
+    import polars as pl
+
+    df = pl.DataFrame({"a": [1, 2], "b": ["x", None]})
+    assert encode_json_str(df) == '{"a":[1,2],"b":["x",null]}'
+    assert encode_json_str(df.lazy()) == '{"a":[1,2],"b":["x",null]}'
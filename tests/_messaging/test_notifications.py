@@ -136,6 +136,7 @@ def test_send_ui_element_message_broadcast() -> None:
             "YnVmZmVyMQ==",
             "YnVmZmVyMg==",
         ],
+        "buffer_urls": None,
     }
 
     assert stream.parsed_operations[0] == msg
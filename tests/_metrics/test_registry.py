@@ -0,0 +1,198 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._metrics import multiprocess, prometheus
+from marimo._metrics.registry import MetricsRegistry, merge_snapshots
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._runtime.runtime import Kernel
+    from tests.conftest import ExecReqProvider
+
+
+@pytest.fixture
+def enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(GLOBAL_SETTINGS, "METRICS", True)
+
+
+def test_disabled_is_noop() -> None:
+    assert GLOBAL_SETTINGS.METRICS is False
+    registry = MetricsRegistry()
+    counter = registry.counter("c_total", "A counter.")
+    histogram = registry.histogram("h_seconds", "A histogram.")
+    counter.inc()
+    histogram.observe(1.0)
+    with histogram.time():
+        pass
+    assert counter.get() == 0
+    assert histogram.get() is None
+
+
+@pytest.mark.usefixtures("enabled")
+def test_counter_and_histogram() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("c_total", "A counter.", ("status",))
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    counter.inc(status="error")
+    assert counter.get(status="ok") == 3
+    assert counter.get(status="error") == 1
+
+    histogram = registry.histogram("h_seconds", "A histogram.", buckets=(1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+    value = histogram.get()
+    assert value is not None
+    assert value["counts"] == [2, 1, 1]
+    assert value["sum"] == 14.5
+    assert value["count"] == 4
+
+    # Registration is idempotent
+    assert registry.counter("c_total", "A counter.", ("status",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("c_total", "Not a counter.")
+
+
+@pytest.mark.usefixtures("enabled")
+def test_render_prometheus() -> None:
+    registry = MetricsRegistry()
+    registry.counter("runs_total", "Runs.", ("op",)).inc(op='a"b')
+    registry.gauge("sessions", "Sessions.").set(2)
+    registry.histogram("size_bytes", "Sizes.", buckets=(10, 100)).observe(50)
+
+    text = prometheus.render(registry.snapshot())
+    assert text == (
+        "# HELP runs_total Runs.\n"
+        "# TYPE runs_total counter\n"
+        'runs_total{op="a\\"b"} 1\n'
+        "# HELP sessions Sessions.\n"
+        "# TYPE sessions gauge\n"
+        "sessions 2\n"
+        "# HELP size_bytes Sizes.\n"
+        "# TYPE size_bytes histogram\n"
+        'size_bytes_bucket{le="10"} 0\n'
+        'size_bytes_bucket{le="100"} 1\n'
+        'size_bytes_bucket{le="+Inf"} 1\n'
+        "size_bytes_sum 50\n"
+        "size_bytes_count 1\n"
+    )
+
+
+@pytest.mark.usefixtures("enabled")
+def test_merge_snapshots() -> None:
+    first = MetricsRegistry()
+    second = MetricsRegistry()
+    for registry, values in ((first, (1, 2)), (second, (3,))):
+        counter = registry.counter("c_total", "A counter.", ("status",))
+        histogram = registry.histogram("h", "A histogram.", buckets=(2,))
+        for value in values:
+            counter.inc(status="ok")
+            histogram.observe(value)
+    second.counter("c_total", "A counter.", ("status",)).inc(status="error")
+
+    merged = merge_snapshots([first.snapshot(), second.snapshot()])
+    assert sorted(merged["c_total"]["samples"]) == [
+        (["error"], 1.0),
+        (["ok"], 3.0),
+    ]
+    assert merged["h"]["samples"] == [
+        ([], {"counts": [2, 1], "sum": 6.0, "count": 3})
+    ]
+    # Inputs are left untouched
+    assert first.snapshot()["h"]["samples"][0][1]["count"] == 2
+
+
+@pytest.mark.usefixtures("enabled")
+def test_collect_kernel_snapshots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from marimo._metrics import CELL_RUNS, REGISTRY
+
+    monkeypatch.setenv(multiprocess.METRICS_DIR_ENV, str(tmp_path))
+    REGISTRY.clear()
+    CELL_RUNS.inc(status="success")
+
+    kernel = MetricsRegistry()
+    kernel.counter(CELL_RUNS.name, CELL_RUNS.documentation, ("status",)).inc(
+        4, status="success"
+    )
+    # Named after a live process
+    (tmp_path / f"{os.getppid()}.json").write_text(
+        json.dumps(kernel.snapshot())
+    )
+    (tmp_path / "broken.json").write_text("{")
+
+    # This process's own snapshot file is not counted twice
+    multiprocess.write_snapshot(tmp_path)
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+
+    collected = multiprocess.collect()
+    assert collected[CELL_RUNS.name]["samples"] == [(["success"], 5.0)]
+    REGISTRY.clear()
+
+
+@pytest.mark.usefixtures("enabled")
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="liveness is checked by age on Windows"
+)
+def test_orphaned_snapshots_are_pruned(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(multiprocess.METRICS_DIR_ENV, str(tmp_path))
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    orphan = tmp_path / f"{process.pid}.json"
+    orphan.write_text(json.dumps(MetricsRegistry().snapshot()))
+
+    multiprocess.collect()
+    assert not orphan.exists()
+
+
+@pytest.mark.usefixtures("enabled")
+def test_snapshot_removed_on_shutdown(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(multiprocess.METRICS_DIR_ENV, str(tmp_path))
+    multiprocess.start_snapshot_writer(interval=0.01)
+    snapshot = tmp_path / f"{os.getpid()}.json"
+    try:
+        deadline = time.time() + 10
+        while not snapshot.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert snapshot.exists()
+    finally:
+        multiprocess.stop_snapshot_writer()
+    assert not snapshot.exists()
+
+
+@pytest.mark.usefixtures("enabled")
+async def test_kernel_records_cell_runs(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    from marimo._metrics import CELL_RUN_SECONDS, CELL_RUNS, REGISTRY
+
+    REGISTRY.clear()
+    await k.run(
+        [
+            exec_req.get("x = 1"),
+            exec_req.get("y = x + 1"),
+            exec_req.get("raise ValueError"),
+        ]
+    )
+    assert CELL_RUNS.get(status="success") == 2
+    assert CELL_RUNS.get(status="error") == 1
+    timings = CELL_RUN_SECONDS.get()
+    assert timings is not None
+    assert timings["count"] == 3
+    REGISTRY.clear()
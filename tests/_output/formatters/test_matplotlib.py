@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import json
+import re
 
 import pytest
 
@@ -70,16 +71,20 @@ async def test_matplotlib_rc_dark(
     assert rcParams["figure.facecolor"] == "black"
 
 
-def _extract_png_dimensions(data_url: str) -> tuple[int, int]:
-    """Extract width and height from a PNG data URL."""
+def _extract_png_dimensions(url: str) -> tuple[int, int]:
+    """Extract width and height from a PNG data URL or virtual file URL."""
     from marimo._output.mpl import _extract_png_dimensions as extract_dims
-
-    if data_url.startswith("data:image/png;base64,"):
-        base64_data = data_url[len("data:image/png;base64,") :]
+    from marimo._runtime.virtual_file import read_virtual_file
+
+    virtual_file = re.fullmatch(r"\./@file/(\d+)-([\w.-]+\.png)", url)
+    if url.startswith("data:image/png;base64,"):
+        base64_data = url[len("data:image/png;base64,") :]
+        png_bytes = base64.b64decode(base64_data)
+    elif virtual_file is not None:
+        png_bytes = read_virtual_file(virtual_file[2], int(virtual_file[1]))
     else:
-        raise ValueError("Not a PNG data URL")
+        raise ValueError("Not a PNG URL")
 
-    png_bytes = base64.b64decode(base64_data)
     return extract_dims(png_bytes)
 
 
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+
+HAS_MPL = DependencyManager.matplotlib.has()
+
+pytestmark = pytest.mark.skipif(
+    not HAS_MPL, reason="optional dependencies not installed"
+)
+
+
+@pytest.fixture
+def cache():
+    from marimo._output.mpl_render import get_render_cache
+
+    cache = get_render_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def _figure():
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(2, 2))
+    ax = fig.add_subplot()
+    ax.plot([1, 2, 3], [3, 1, 2])
+    return fig, ax
+
+
+def test_render_png_caches_unchanged_figure(cache) -> None:
+    from marimo._output.mpl_render import render_png
+
+    fig, _ = _figure()
+    first = render_png(fig)
+    assert first.startswith(b"\x89PNG")
+    assert cache.misses == 1
+
+    assert render_png(fig) is first
+    assert cache.hits == 1
+
+
+def test_render_png_invalidated_by_changes(cache) -> None:
+    from marimo._output.mpl_render import render_png
+
+    fig, ax = _figure()
+    first = render_png(fig)
+
+    ax.set_title("changed")
+    second = render_png(fig)
+    assert second != first
+    assert cache.misses == 2
+
+    fig.set_size_inches(3, 3)
+    render_png(fig)
+    assert cache.misses == 3
+
+
+def test_render_png_keyed_on_dpi(cache) -> None:
+    from marimo._output.mpl_render import render_png
+
+    fig, _ = _figure()
+    low = render_png(fig, dpi=50)
+    high = render_png(fig, dpi=100)
+    assert len(high) > len(low)
+    assert cache.hits == 0
+
+
+def test_render_png_on_render_thread(cache) -> None:
+    import threading
+
+    from marimo._output.mpl_render import render_png
+
+    fig, _ = _figure()
+    threads: list[str] = []
+    savefig = fig.savefig
+
+    def record_thread(*args: Any, **kwargs: Any) -> None:
+        threads.append(threading.current_thread().name)
+        savefig(*args, **kwargs)
+
+    fig.savefig = record_thread
+    render_png(fig)
+    assert len(threads) == 1
+    assert threads[0].startswith("marimo-mpl-render")
+    assert cache.misses == 1
+
+
+@pytest.mark.usefixtures("cache")
+def test_background_renders_complete_in_order() -> None:
+    from marimo._output.mpl_render import (
+        render_in_background,
+        render_png,
+        wait_for_background_renders,
+    )
+
+    figures = []
+    for i in range(4):
+        fig, ax = _figure()
+        ax.set_title(str(i))
+        figures.append(fig)
+
+    renders: list[bytes] = []
+    for fig in figures:
+        render_in_background(
+            lambda fig=fig: renders.append(render_png(fig))  # type: ignore[misc]
+        )
+    wait_for_background_renders()
+    assert len(renders) == 4
+    for fig, data in zip(figures, renders):
+        assert render_png(fig) is data
+
+
+def test_failed_background_renders_are_not_raised() -> None:
+    from marimo._output.mpl_render import (
+        render_in_background,
+        wait_for_background_renders,
+    )
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    render_in_background(fail)
+    wait_for_background_renders()
+
+
+def test_png_url_without_context() -> None:
+    from marimo._output.mpl_render import png_url
+
+    url = png_url(b"\x89PNG")
+    assert url == "data:image/png;base64," + base64.b64encode(
+        b"\x89PNG"
+    ).decode("utf-8")
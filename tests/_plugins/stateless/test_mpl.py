@@ -120,6 +120,39 @@ async def test_mpl_show(k: Kernel, exec_req: ExecReqProvider) -> None:
     )
 
 
+@pytest.mark.requires("matplotlib")
+async def test_mpl_show_renders_in_background(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    from marimo._messaging.cell_output import CellChannel, CellOutput
+    from tests._messaging.mocks import MockStream
+
+    cell = exec_req.get(
+        """
+        import matplotlib.pyplot as plt
+        from marimo._output.mpl import show
+        for i in range(3):
+            plt.figure()
+            plt.plot([1, i])
+            # What plt.show() calls with marimo's backend
+            show()
+        """
+    )
+    await k.run([cell])
+    # All figures are in the console once the cell has run, served as
+    # virtual files
+    figures = [
+        op.console
+        for op in MockStream(k.stream).cell_notifications
+        if op.cell_id == cell.cell_id
+        and isinstance(op.console, CellOutput)
+        and op.console.channel == CellChannel.MEDIA
+    ]
+    assert len(figures) == 3
+    assert all("@file/" in str(figure.data) for figure in figures)
+    assert not k.stderr.messages
+
+
 @pytest.mark.requires("matplotlib")
 def test_patch_javascript() -> None:
     from matplotlib.backends.backend_webagg_core import FigureManagerWebAgg
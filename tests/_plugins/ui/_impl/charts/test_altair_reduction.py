@@ -0,0 +1,197 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.charts.altair_reduction import (
+    COUNT_FIELD,
+    LINE_POINTS,
+    bin_params,
+    lttb,
+    reduce_chart,
+)
+
+HAS_DEPS = (
+    DependencyManager.pandas.has()
+    and DependencyManager.polars.has()
+    and DependencyManager.altair.has()
+    and DependencyManager.numpy.has()
+)
+
+N = 20_000
+MAX_POINTS = 1_000
+
+
+def _data(backend: str = "pandas"):
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "t": pd.date_range("2024-01-01", periods=N, freq="min"),
+            "x": rng.standard_normal(N),
+            "y": rng.standard_normal(N).cumsum(),
+            "series": np.where(np.arange(N) % 3 == 0, "a", "b"),
+        }
+    )
+    return df if backend == "pandas" else pl.from_pandas(df)
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_lttb_keeps_extremes() -> None:
+    import numpy as np
+
+    x = np.arange(1_000, dtype=float)
+    y = np.zeros(1_000)
+    y[500] = 10
+    y[700] = -10
+
+    indices = lttb(x, y, 50)
+    assert len(indices) == 50
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert {500, 700} <= set(indices.tolist())
+    assert list(lttb(x[:10], y[:10], 50)) == list(range(10))
+
+
+def test_bin_params_match_vega() -> None:
+    assert bin_params((-4.9, 5.2)) == (-6, 6, 2)
+    assert bin_params((0, 100), maxbins=30) == (0, 100, 5)
+    assert bin_params((0, 100), step=25) == (0, 100, 25)
+    assert bin_params((3, 3)) == (3, 3.5, 0.5)
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_reduce_line_chart(backend: str) -> None:
+    import altair as alt
+    import narwhals.stable.v2 as nw
+
+    df = _data(backend)
+    chart = alt.Chart(df).mark_line().encode(x="t", y="y", color="series")
+    reduced = reduce_chart(chart, MAX_POINTS)
+    assert reduced is not None
+    assert reduced.method == "lttb"
+    assert reduced.rows == N
+
+    data = nw.from_native(reduced.data, eager_only=True)
+    assert len(data) <= LINE_POINTS + 2
+    # Both series keep their endpoints
+    for name in ("a", "b"):
+        series = nw.from_native(df, eager_only=True).filter(
+            nw.col("series") == name
+        )
+        kept = data.filter(nw.col("series") == name)["t"].to_list()
+        assert series["t"][0] in kept
+        assert series["t"][-1] in kept
+
+    # Each reduced row stands for the original row it was taken from
+    original = nw.from_native(df, eager_only=True)
+    rows = reduced.original_rows([0, 1])
+    assert len(rows) == 2
+    assert original[rows]["t"].to_list() == data[[0, 1]]["t"].to_list()
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_reduce_line_chart_follows_order_channel() -> None:
+    import altair as alt
+    import numpy as np
+    import pandas as pd
+
+    # A spiral, drawn in the order of `step` rather than by x
+    step = np.arange(N)
+    angle = step / 500
+    df = pd.DataFrame(
+        {"x": angle * np.cos(angle), "y": angle * np.sin(angle), "step": step}
+    )
+    chart = alt.Chart(df).mark_line().encode(x="x", y="y", order="step")
+    reduced = reduce_chart(chart, MAX_POINTS)
+    assert reduced is not None
+    # The start and end of the path are kept
+    assert {0, N - 1} <= set(reduced.data["step"].tolist())
+
+    descending = chart.encode(order=alt.Order("step", sort="descending"))
+    reduced = reduce_chart(descending, MAX_POINTS)
+    assert reduced is not None
+    assert {0, N - 1} <= set(reduced.data["step"].tolist())
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_reduce_scatter_plot() -> None:
+    import altair as alt
+
+    df = _data()
+    chart = alt.Chart(df).mark_point().encode(x="x", y="y", tooltip=["t"])
+    reduced = reduce_chart(chart, MAX_POINTS)
+    assert reduced is not None
+    assert reduced.method == "grid"
+    assert len(reduced.data) <= MAX_POINTS
+    # Every occupied cell keeps a point, so the extent is about the same
+    for field in ("x", "y"):
+        cell = (df[field].max() - df[field].min()) / math.isqrt(MAX_POINTS)
+        assert reduced.data[field].min() - df[field].min() <= cell
+        assert df[field].max() - reduced.data[field].max() <= cell
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_reduce_histogram() -> None:
+    import altair as alt
+
+    df = _data("polars")
+    chart = (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(
+            alt.X("x", bin=alt.Bin(maxbins=20)), y="count()", color="series"
+        )
+    )
+    reduced = reduce_chart(chart, MAX_POINTS)
+    assert reduced is not None
+    assert reduced.method == "bin"
+    assert reduced.data[COUNT_FIELD].sum() == N
+    assert set(reduced.data["series"].to_list()) == {"a", "b"}
+
+    # Each bar stands for the rows counted in it
+    rows = reduced.original_rows([0])
+    assert len(rows) == reduced.data[COUNT_FIELD][0]
+    selected = df[rows]
+    assert set(selected["series"].to_list()) == {reduced.data["series"][0]}
+    assert selected["x"].min() >= reduced.data["x"][0]
+    assert selected["x"].max() < reduced.data["x_end"][0]
+
+    encoding = reduced.chart.encoding.to_dict(validate=False)
+    assert encoding["x"]["bin"] == {"binned": True, "step": 0.5}
+    assert encoding["x2"] == {"field": "x_end"}
+    assert encoding["y"]["field"] == COUNT_FIELD
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_charts_that_are_not_reduced() -> None:
+    import altair as alt
+
+    df = _data()
+    line = alt.Chart(df).mark_line().encode(x="t", y="y")
+
+    assert reduce_chart(line, N) is None
+    assert reduce_chart(line + line, MAX_POINTS) is None
+    assert (
+        reduce_chart(line.transform_filter("datum.y > 0"), MAX_POINTS) is None
+    )
+    assert (
+        reduce_chart(
+            alt.Chart(df).mark_line().encode(x="t", y="mean(y)"), MAX_POINTS
+        )
+        is None
+    )
+    assert (
+        reduce_chart(
+            alt.Chart(df).mark_bar().encode(x="series", y="count()"),
+            MAX_POINTS,
+        )
+        is None
+    )
@@ -1965,3 +1965,97 @@ def test_filter_dataframe_preserves_df_type(df: ChartDataType) -> None:
 
     # Type should be preserved
     assert type(result) is original_type
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_large_chart_is_reduced_but_selects_full_data() -> None:
+    import altair as alt
+
+    n = 10_000
+    df = pd.DataFrame({"x": range(n), "y": [i % 100 for i in range(n)]})
+    chart = alt.Chart(df).mark_line().encode(x="x", y="y")
+
+    reduced = altair_chart(chart, max_points=1_000)
+    assert reduced._reduced is not None
+    assert len(reduced._reduced.data) < n
+    assert reduced.dataframe is df
+
+    # Interval selections resolve against the full data
+    value = reduced._convert_value({"select_interval": {"x": [100, 299]}})
+    assert get_len(value) == 200
+
+    # Points selected by their index in the data that was sent are mapped
+    # to the rows of the full data
+    point = reduced._reduced.data.iloc[[100]]
+    assert point.index.tolist() != [100]
+    value = reduced._convert_value(
+        {"select_point": {"vlPoint": [1], "_vgsid_": [101]}}
+    )
+    assert value["x"].tolist() == point["x"].tolist()
+    assert get_len(reduced.apply_selection(df)) == 1
+
+    assert altair_chart(chart, max_points=None)._reduced is None
+    assert altair_chart(chart)._reduced is None
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_reduced_chart_notice_is_shown_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import altair as alt
+
+    from marimo._plugins.ui._impl import altair_chart as altair_chart_module
+
+    monkeypatch.setattr(altair_chart_module, "_REDUCTION_NOTICE_SHOWN", False)
+    n = 10_000
+    df = pd.DataFrame({"x": range(n), "y": [i % 100 for i in range(n)]})
+    chart = alt.Chart(df).mark_line().encode(x="x", y="y")
+
+    with io.StringIO() as buf, redirect_stderr(buf):
+        altair_chart(chart, max_points=1_000)
+        altair_chart(chart, max_points=1_000)
+        stderr_output = buf.getvalue()
+    assert stderr_output.count("chart data was reduced from 10,000") == 1
+    assert "max_points=None" in stderr_output
+
+    # Charts that are not reduced don't show it
+    monkeypatch.setattr(altair_chart_module, "_REDUCTION_NOTICE_SHOWN", False)
+    with io.StringIO() as buf, redirect_stderr(buf):
+        altair_chart(chart, max_points=None)
+        assert buf.getvalue() == ""
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_reduced_histogram_point_selection_filters_full_data() -> None:
+    import altair as alt
+
+    n = 10_000
+    df = pd.DataFrame({"x": [i % 1_000 for i in range(n)]})
+    chart = (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(alt.X("x", bin=alt.Bin(maxbins=20)), y="count()")
+    )
+
+    reduced = altair_chart(chart, max_points=1_000)
+    assert reduced._reduced is not None
+    assert reduced._reduced.method == "bin"
+    assert "x" in reduced._binned_fields
+
+    # Clicking a bar selects the rows of the full data in its bin
+    bars = reduced._reduced.data
+    start, end = bars["x"][2], bars["x_end"][2]
+    value = reduced._convert_value(
+        {"select_point": {"vlPoint": [3], "x": [start, end]}}
+    )
+    assert get_len(value) == bars["__count"][2]
+    assert value["x"].min() >= start
+    assert value["x"].max() < end
+
+    # The last bin includes its right edge
+    start, end = bars["x"].iloc[-1], bars["x_end"].iloc[-1]
+    value = reduced._convert_value(
+        {"select_point": {"vlPoint": [len(bars)], "x": [start, end]}}
+    )
+    assert get_len(value) == bars["__count"].iloc[-1]
+    assert value["x"].max() == 999
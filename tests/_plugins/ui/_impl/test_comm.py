@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,12 +9,19 @@ from marimo._plugins.ui._impl.comm import (
     COMM_CLOSE_NAME,
     COMM_MESSAGE_NAME,
     COMM_OPEN_NAME,
+    OUT_OF_BAND_BUFFER_BYTES,
     MarimoComm,
     MarimoCommManager,
     MessageBufferData,
 )
+from marimo._runtime.context import get_context
+from marimo._runtime.virtual_file import read_virtual_file
 from marimo._types.ids import WidgetModelId
 
+if TYPE_CHECKING:
+    from marimo._messaging.notification import UIElementMessageNotification
+    from tests.conftest import MockedKernel
+
 
 @pytest.fixture
 def comm_manager():
@@ -174,3 +182,60 @@ def test_comm_flush(comm: MarimoComm):
         assert call_args["model_id"] == comm.comm_id
         assert call_args["message"] == test_data
         assert call_args["buffers"] == [b"test_buffer"]
+
+
+def test_comm_sends_large_state_buffers_out_of_band(
+    mocked_kernel: MockedKernel,
+) -> None:
+    del mocked_kernel
+    registry = get_context().virtual_file_registry
+    with patch("marimo._messaging.notification_utils.broadcast_notification"):
+        comm = MarimoComm(
+            comm_id=WidgetModelId("out-of-band"),
+            comm_manager=MarimoCommManager(),
+            target_name="test_target",
+        )
+
+    def send(
+        method: str, keys: list[str], buffers: list[bytes]
+    ) -> UIElementMessageNotification:
+        with patch(
+            "marimo._messaging.notification_utils.broadcast_notification"
+        ) as broadcast:
+            comm.send(
+                data={
+                    "method": method,
+                    "state": {},
+                    "buffer_paths": [[key] for key in keys],
+                },
+                buffers=buffers,
+            )
+        return broadcast.call_args[0][0]
+
+    def read(url: str) -> bytes:
+        length, filename = url.split("/@file/")[1].split("-", 1)
+        return read_virtual_file(filename, int(length))
+
+    large = b"x" * OUT_OF_BAND_BUFFER_BYTES
+    first = send("update", ["data", "small"], [large, b"small"])
+    assert first.buffers == [b"", b"small"]
+    assert first.buffer_urls is not None
+    assert first.buffer_urls[1] is None
+    assert read(first.buffer_urls[0]) == large
+
+    # Replaced files are kept for one more update
+    second = send("update", ["data"], [b"y" * OUT_OF_BAND_BUFFER_BYTES])
+    assert second.buffer_urls is not None
+    assert len(registry.registry) == 2
+    send("update", ["data"], [b"z"])
+    assert len(registry.registry) == 1
+    assert read(second.buffer_urls[0]) == b"y" * OUT_OF_BAND_BUFFER_BYTES
+
+    # Custom messages are replayed as-is, so they are sent inline
+    custom = send("custom", ["data"], [large])
+    assert custom.buffers == [large]
+    assert custom.buffer_urls is None
+
+    with patch("marimo._messaging.notification_utils.broadcast_notification"):
+        comm.close()
+    assert not registry.registry
@@ -0,0 +1,140 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("plotly.graph_objects")
+pytest.importorskip("numpy")
+
+import plotly.graph_objects as go
+
+from marimo._plugins.ui._impl.plotly import (
+    _extract_bars_numpy,
+    _extract_heatmap_cells_numpy,
+    _extract_scatter_points_numpy,
+    plotly,
+)
+from marimo._plugins.ui._impl.plotly_index import (
+    AxisIndex,
+    SelectionIndex,
+    points_in_polygon,
+)
+
+
+def test_axis_index_matches_mask() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 50, 1_000).astype(float)
+    values[::97] = np.nan
+    axis = AxisIndex(values)
+
+    for lo, hi in [(10, 20), (-5, 0), (49, 100), (20, 10), (12.5, 12.5)]:
+        expected = np.where((values >= lo) & (values <= hi))[0]
+        np.testing.assert_array_equal(axis.between(lo, hi), expected)
+
+    dates = np.array(
+        ["2024-01-03", "2024-01-01", "2024-01-02"], dtype="datetime64[ns]"
+    )
+    found = AxisIndex(dates).between(
+        np.datetime64("2024-01-01"), np.datetime64("2024-01-02")
+    )
+    assert found is not None
+    assert found.tolist() == [1, 2]
+
+
+def test_selection_index_is_cached_and_skips_categorical() -> None:
+    figure = go.Figure(
+        [
+            go.Scatter(x=[3, 1, 2], y=[1, 2, 3]),
+            go.Bar(x=["a", "b"], y=[1, 2]),
+        ]
+    )
+    index = SelectionIndex(figure)
+    assert index.array(0, "x") is index.array(0, "x")
+    axis = index.axis(0, "x")
+    assert axis is not None
+    assert index.axis(0, "x") is axis
+    assert index.axis(1, "x") is None
+
+
+def test_indexed_extraction_matches_scan() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal(5_000)
+    figure = go.Figure(
+        [
+            go.Scattergl(x=x, y=rng.standard_normal(5_000), name="gl"),
+            go.Scatter(x=x[::-1], y=x),
+            go.Bar(x=np.arange(20), y=np.arange(20) ** 2),
+            go.Heatmap(x=[5, 1, 3], y=[20, 10], z=[[1, 2, 3], [4, 5, 6]]),
+        ]
+    )
+    index = SelectionIndex(figure)
+
+    for _ in range(2):
+        scatter = _extract_scatter_points_numpy(figure, -0.5, 0.25, index)
+        assert scatter == _extract_scatter_points_numpy(figure, -0.5, 0.25)
+        assert {p["curveNumber"] for p in scatter} == {0, 1}
+        assert all(-0.5 <= p["x"] <= 0.25 for p in scatter)
+
+    args = (2.5, 8, 0, 15)
+    assert _extract_bars_numpy(figure, *args, index) == _extract_bars_numpy(
+        figure, *args
+    )
+    cells = _extract_heatmap_cells_numpy(figure, *args, index)
+    assert cells == _extract_heatmap_cells_numpy(figure, *args)
+    assert [(c["x"], c["y"]) for c in cells] == [(5, 10), (3, 10)]
+
+
+def test_points_in_polygon() -> None:
+    import numpy as np
+
+    # A square with a notch cut into its top edge
+    polygon_x = np.array([0, 4, 4, 3, 2, 1, 0], dtype=float)
+    polygon_y = np.array([0, 0, 4, 4, 1, 4, 4], dtype=float)
+    x = np.array([1, 2, 2, 3.5, 5])
+    y = np.array([1, 0.5, 3, 3.5, 1])
+    assert points_in_polygon(x, y, polygon_x, polygon_y).tolist() == [
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_lasso_selection() -> None:
+    figure = go.Figure(
+        [
+            go.Scattergl(x=[0, 1, 2, 3], y=[0, 1, 2, 3]),
+            go.Scatter(x=[1, 1, 3], y=[2, 0, 1], name="other"),
+            go.Scatter(x=["a", "b"], y=[1, 1]),
+        ]
+    )
+    plot = plotly(figure)
+    points = plot._convert_value(
+        {"lasso": {"x": [0.5, 2.5, 2.5, 0.5], "y": [0.5, 0.5, 2.5, 2.5]}}
+    )
+    assert [(p["curveNumber"], p["pointIndex"]) for p in points] == [
+        (0, 1),
+        (0, 2),
+        (1, 0),
+    ]
+    assert points[2] == {
+        "x": 1,
+        "y": 2,
+        "curveNumber": 1,
+        "pointIndex": 0,
+        "name": "other",
+    }
+    assert plot.indices == [1, 2, 0]
+
+    # Lassos on datetime axes are not resolved on the backend
+    assert (
+        plot._convert_value(
+            {"lasso": {"x": ["2024-01-01"] * 3, "y": [0, 1, 2]}}
+        )
+        == []
+    )
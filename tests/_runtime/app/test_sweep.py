@@ -0,0 +1,170 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+from click.testing import CliRunner
+
+from marimo._ast.app import InternalApp
+from marimo._cli.cli import run_batch
+from marimo._runtime.app.sweep import (
+    load_notebook,
+    parameter_dependent_cells,
+    run_sweep,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._types.ids import CellId_t
+
+
+def _notebook(tmp_path: Path) -> Path:
+    counter = tmp_path / "prefix_runs"
+    helper_counter = tmp_path / "helper_runs"
+    path = tmp_path / "notebook.py"
+    path.write_text(
+        textwrap.dedent(
+            f"""
+            import marimo
+
+            app = marimo.App()
+
+            with app.setup:
+                import math
+
+
+            @app.cell
+            def load():
+                with open({str(counter)!r}, "a") as _f:
+                    _f.write("x")
+                data = [math.sqrt(i) for i in range(10)]
+                return (data,)
+
+
+            @app.cell
+            def helpers():
+                with open({str(helper_counter)!r}, "a") as _f:
+                    _f.write("x")
+                # Can't be pickled
+                shift = lambda x: x + 1
+                return (shift,)
+
+
+            @app.cell
+            def config():
+                scale = 1
+                return (scale,)
+
+
+            @app.cell
+            def compute(data, scale, shift):
+                total = sum(data) * scale
+                shifted = shift(scale)
+                transform = lambda x: x * scale
+                return total, transform, shifted
+            """
+        )
+    )
+    return path
+
+
+def _prefix_runs(tmp_path: Path, name: str = "prefix_runs") -> int:
+    return len((tmp_path / name).read_text())
+
+
+def test_parameter_dependent_cells(tmp_path: Path) -> None:
+    app = load_notebook(_notebook(tmp_path))
+    app._maybe_initialize()
+    graph = InternalApp(app).graph
+
+    def names(cell_ids: set[CellId_t]) -> set[str]:
+        return {name for cid in cell_ids for name in graph.cells[cid].defs}
+
+    assert names(parameter_dependent_cells(graph, ["scale"])) == {
+        "scale",
+        "total",
+        "transform",
+        "shifted",
+    }
+    assert parameter_dependent_cells(graph, []) == set()
+
+
+def test_run_sweep_in_process(tmp_path: Path) -> None:
+    app = load_notebook(_notebook(tmp_path))
+    results = list(
+        run_sweep(app, [{"scale": 1}, {"scale": "x"}, {"scale": 3}])
+    )
+
+    assert _prefix_runs(tmp_path) == 1
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[2].defs["total"] == pytest.approx(3 * 19.306, rel=1e-3)
+    assert results[2].defs["transform"](2) == 6
+    assert results[1].defs == {}
+    assert results[1].error is not None
+    assert results[1].error.startswith("TypeError")
+
+    (result,) = run_sweep(app, [{"scale": 2}], outputs=["total", "data"])
+    assert set(result.defs) == {"total", "data"}
+
+    with pytest.raises(TypeError):
+        run_sweep(app, [["scale", 1]])  # type: ignore[list-item]
+
+
+def test_run_sweep_parallel(tmp_path: Path) -> None:
+    app = load_notebook(_notebook(tmp_path))
+    results = list(
+        run_sweep(app, [{"scale": scale} for scale in range(6)], jobs=3)
+    )
+
+    # Parameter-independent cells run once, and their definitions are sent
+    # to the workers; except those that can't be pickled, which run in
+    # each worker
+    assert _prefix_runs(tmp_path) == 1
+    assert 2 <= _prefix_runs(tmp_path, "helper_runs") <= 4
+    assert [r.params["scale"] for r in results] == list(range(6))
+    assert all(r.error is None for r in results)
+    assert results[0].defs["total"] == 0
+    assert [r.defs["shifted"] for r in results] == list(range(1, 7))
+    # Values that can't be sent back are replaced with their repr
+    assert isinstance(results[1].defs["transform"], str)
+
+
+def test_cli_run_batch(tmp_path: Path) -> None:
+    params = tmp_path / "grid.jsonl"
+    params.write_text('{"scale": 1}\n\n{"scale": "x"}\n')
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner().invoke(
+        run_batch,
+        [
+            str(_notebook(tmp_path)),
+            "--params",
+            str(params),
+            "--outputs",
+            "total",
+            "-o",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "1 of 2 runs failed" in result.output
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["params"] for line in lines] == [{"scale": 1}, {"scale": "x"}]
+    assert lines[0]["defs"]["total"] == pytest.approx(19.306, rel=1e-3)
+    assert lines[1]["error"].startswith("TypeError")
+
+
+def test_cli_run_batch_invalid_params(tmp_path: Path) -> None:
+    params = tmp_path / "grid.jsonl"
+    params.write_text('{"scale": 1}\n[1]\n')
+
+    result = CliRunner().invoke(
+        run_batch, [str(_notebook(tmp_path)), "--params", str(params)]
+    )
+    assert result.exit_code == 1
+    assert "grid.jsonl:2: expected a JSON object" in result.output
@@ -332,6 +332,18 @@ async def test_uv_pip_install() -> None:
         ]
 
 
+async def test_install_marks_shared_sandbox_modified() -> None:
+    pm = PipPackageManager()
+    with (
+        patch(
+            "marimo._runtime.packages.package_manager.mark_modified"
+        ) as mark_modified,
+        patch.object(pm, "_install", AsyncMock(return_value=True)),
+    ):
+        assert await pm.install("foo", version=None)
+    mark_modified.assert_called_once_with(sys.prefix)
+
+
 def test_log_callback_type() -> None:
     """Test that LogCallback type works correctly."""
     captured_logs = []
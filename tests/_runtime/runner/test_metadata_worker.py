@@ -0,0 +1,234 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._messaging.notification import (
+    VariableValue,
+    VariableValuesNotification,
+)
+from marimo._runtime.runner.hooks_post_execution import _extract
+from marimo._runtime.runner.metadata_worker import (
+    ExtractionBudget,
+    MetadataJob,
+    MetadataWorker,
+    ObjectCache,
+    is_snapshot_safe,
+    object_version,
+)
+from tests._messaging.mocks import MockStream
+
+if TYPE_CHECKING:
+    from marimo._messaging.types import KernelMessage
+
+
+def _notification(name: str) -> VariableValuesNotification:
+    return VariableValuesNotification(
+        variables=[VariableValue(name=name, value="1", datatype="int")]
+    )
+
+
+def _job(name: str) -> MetadataJob:
+    return lambda: [_notification(name)]
+
+
+def _names(stream: MockStream) -> list[str]:
+    return [
+        op["variables"][0]["name"]
+        for op in stream.operations
+        if op["op"] == "variable-values"
+    ]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_object_cache_invalidates_on_structural_change() -> None:
+    import pandas as pd
+
+    cache = ObjectCache()
+    df = pd.DataFrame({"a": [1, 2]})
+    calls: list[int] = []
+
+    def compute() -> int:
+        calls.append(len(df))
+        return len(df)
+
+    assert cache.get(df, "preview", compute) == 2
+    assert cache.get(df, "preview", compute) == 2
+    assert calls == [2]
+    # Tags are cached separately
+    cache.get(df, "schema", compute)
+    assert calls == [2, 2]
+
+    # Mutated in place: a new shape is a new version
+    df.loc[2] = [3]
+    assert cache.get(df, "preview", compute) == 3
+    assert calls == [2, 2, 3]
+
+
+def test_object_cache_skips_unversioned_objects() -> None:
+    cache = ObjectCache()
+    calls: list[int] = []
+    value = [1, 2, 3]
+    assert object_version(value) is None
+    for _ in range(2):
+        cache.get(value, "preview", lambda: calls.append(1))
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_worker_broadcasts_in_order() -> None:
+    stream = MockStream()
+    worker = MetadataWorker(stream)
+    try:
+        worker.submit("a", _job("a"))
+        worker.submit("b", _job("b"))
+        assert worker.flush(timeout=5)
+        assert _names(stream) == ["a", "b"]
+    finally:
+        worker.shutdown()
+
+
+class BlockingStream(MockStream):
+    """A stream whose first write waits until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data: KernelMessage) -> None:
+        if not self.started.is_set():
+            self.started.set()
+            self.release.wait(5)
+        super().write(data)
+
+
+def test_worker_coalesces_pending_notifications() -> None:
+    stream = BlockingStream()
+    worker = MetadataWorker(stream)
+    try:
+        worker.submit("blocking", _job("blocking"))
+        assert stream.started.wait(5)
+        # Both are queued behind the blocked write; the second replaces
+        # the first
+        worker.submit("cell", _job("stale"))
+        worker.submit("cell", _job("fresh"))
+        # Still busy: the budget runs out
+        assert not worker.flush(timeout=0.01)
+        stream.release.set()
+        assert worker.flush(timeout=5)
+        assert _names(stream) == ["blocking", "fresh"]
+    finally:
+        stream.release.set()
+        worker.shutdown()
+
+
+class FailingStream(MockStream):
+    def write(self, data: KernelMessage) -> None:
+        if b"failing" in data:
+            raise ValueError("boom")
+        super().write(data)
+
+
+def test_worker_survives_failing_broadcasts() -> None:
+    stream = FailingStream()
+    worker = MetadataWorker(stream)
+    try:
+        worker.submit("failing", _job("failing"))
+        worker.submit("ok", _job("ok"))
+        assert worker.flush(timeout=5)
+        assert _names(stream) == ["ok"]
+    finally:
+        worker.shutdown()
+
+
+def test_worker_survives_failing_jobs() -> None:
+    stream = MockStream()
+    worker = MetadataWorker(stream)
+
+    def failing() -> list[VariableValuesNotification]:
+        raise ValueError("boom")
+
+    try:
+        worker.submit("failing", failing)
+        worker.submit("ok", _job("ok"))
+        assert worker.flush(timeout=5)
+        assert _names(stream) == ["ok"]
+    finally:
+        worker.shutdown()
+
+
+def test_is_snapshot_safe() -> None:
+    assert is_snapshot_safe(1)
+    assert is_snapshot_safe("text")
+    assert is_snapshot_safe((1, "a", None))
+    assert not is_snapshot_safe((1, [2]))
+    assert not is_snapshot_safe([1, 2])
+    assert not is_snapshot_safe({"a": 1})
+    assert not is_snapshot_safe(object())
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_polars_frames_are_snapshot_safe() -> None:
+    import polars as pl
+
+    assert is_snapshot_safe(pl.DataFrame({"a": [1]}))
+    assert is_snapshot_safe(pl.Series([1]))
+
+
+def test_extract_defers_snapshot_safe_values() -> None:
+    worker = MetadataWorker(MockStream())
+    worker.budget = ExtractionBudget(seconds=0)
+    calls: list[int] = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "computed"
+
+    # Computed when called (on the worker), even though the budget is spent
+    extraction = _extract(worker, "value", "preview", compute, "placeholder")
+    assert calls == []
+    assert extraction() == "computed"
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_extract_respects_budget_for_other_values() -> None:
+    import pandas as pd
+
+    worker = MetadataWorker(MockStream())
+    df = pd.DataFrame({"a": [1, 2]})
+    calls: list[int] = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "computed"
+
+    # Computed right away, on the calling thread, and charged to the budget
+    extraction = _extract(worker, df, "preview", compute, "placeholder")
+    assert calls == [1]
+    assert worker.budget.spent > 0
+    assert extraction() == "computed"
+    assert calls == [1]
+
+    # Once the budget is spent, cached results are still used ...
+    worker.budget = ExtractionBudget(seconds=0)
+    assert _extract(worker, df, "preview", compute, "placeholder")() == (
+        "computed"
+    )
+    # ... but nothing new is computed
+    other = pd.DataFrame({"b": [1]})
+    assert (
+        _extract(worker, other, "preview", compute, "placeholder")()
+        == "placeholder"
+    )
+    assert calls == [1]
@@ -0,0 +1,145 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+import time
+from typing import Any
+
+from marimo._runtime.queue_reader import QueueReader
+
+
+async def test_reads_items_in_order() -> None:
+    source: queue.Queue[int] = queue.Queue()
+    reader = QueueReader(source, asyncio.get_running_loop())
+    reader.start()
+    try:
+        for i in range(100):
+            source.put(i)
+        assert [await reader.get() for _ in range(100)] == list(range(100))
+    finally:
+        reader.stop()
+        reader.join(timeout=5)
+    assert not reader.is_alive()
+
+
+async def test_loop_runs_while_waiting() -> None:
+    source: queue.Queue[str] = queue.Queue()
+    reader = QueueReader(source, asyncio.get_running_loop())
+    reader.start()
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(tick())
+    threading.Timer(0.2, source.put, args=("request",)).start()
+    try:
+        assert await reader.get() == "request"
+        # Not blocked for the 200ms the reader waited
+        assert ticks > 20
+    finally:
+        task.cancel()
+        reader.stop()
+        reader.join(timeout=5)
+    assert not reader.is_alive()
+
+
+async def test_get_returns_none_when_queue_fails() -> None:
+    class BrokenQueue(queue.Queue[Any]):
+        def get(self, block: bool = True, timeout: Any = None) -> Any:
+            del block, timeout
+            raise OSError("closed")
+
+    reader = QueueReader(BrokenQueue(), asyncio.get_running_loop())
+    reader.start()
+    assert await reader.get() is None
+    reader.join(timeout=5)
+    assert not reader.is_alive()
+
+
+def test_background_tasks_run_while_kernel_is_idle() -> None:
+    import multiprocessing
+
+    from marimo._ast.app_config import _AppConfig
+    from marimo._ast.cell import CellConfig
+    from marimo._config.config import DEFAULT_CONFIG
+    from marimo._runtime import runtime
+    from marimo._runtime.commands import (
+        AppMetadata,
+        ExecuteCellsCommand,
+        StopKernelCommand,
+    )
+    from marimo._types.ids import CellId_t
+
+    # In its own process, since the kernel replaces `__main__` and patches
+    # globals of the process it runs in
+    context = multiprocessing.get_context("spawn")
+    # Kept referenced until the kernel exits, since the process doesn't
+    # keep its arguments
+    control_queue = context.Queue()
+    stream_queue = context.Queue()
+    other_queues = [context.Queue() for _ in range(3)]
+    ticker, report = CellId_t("ticker"), CellId_t("report")
+    process = context.Process(
+        target=runtime.launch_kernel,
+        kwargs={
+            "control_queue": control_queue,
+            "set_ui_element_queue": other_queues[0],
+            "completion_queue": other_queues[1],
+            "input_queue": other_queues[2],
+            "stream_queue": stream_queue,
+            "socket_addr": None,
+            "is_edit_mode": False,
+            "configs": {ticker: CellConfig(), report: CellConfig()},
+            "app_metadata": AppMetadata(
+                query_params={}, cli_args={}, app_config=_AppConfig()
+            ),
+            "user_config": DEFAULT_CONFIG,
+            "virtual_files_supported": False,
+            "redirect_console_to_browser": False,
+        },
+        daemon=True,
+    )
+    process.start()
+
+    def run(cell_id: CellId_t, code: str) -> list[dict[str, Any]]:
+        control_queue.put(
+            ExecuteCellsCommand(cell_ids=[cell_id], codes=[code])
+        )
+        messages: list[dict[str, Any]] = []
+        while not messages or messages[-1]["op"] != "completed-run":
+            messages.append(json.loads(stream_queue.get(timeout=30)))
+        return messages
+
+    try:
+        run(
+            ticker,
+            "import asyncio\n"
+            "ticks = []\n"
+            "async def tick():\n"
+            "    while len(ticks) < 20:\n"
+            "        ticks.append(1)\n"
+            "        await asyncio.sleep(0.005)\n"
+            "task = asyncio.get_running_loop().create_task(tick())",
+        )
+        # With the loop blocked between polls of the queue, 20 ticks took
+        # seconds
+        time.sleep(0.5)
+        messages = run(report, "assert len(ticks) == 20")
+        statuses = [
+            m for m in messages if m["op"] == "cell-op" and m.get("output")
+        ]
+        assert statuses
+        assert all(m["output"]["channel"] != "marimo-error" for m in statuses)
+    finally:
+        control_queue.put(StopKernelCommand())
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
+    assert process.exitcode == 0
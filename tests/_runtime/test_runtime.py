@@ -1647,19 +1647,22 @@ except NameError:
         assert "C" not in k.globals
         stream = MockStream(k.stream)
         stderr = MockStderr(k.stderr)
+        # Variable metadata is sent in the background, so it may
+        # arrive after the cell's outputs
+        cell_ops = [op for op in stream.operations if op["op"] == "cell-op"]
         if k.execution_type == "strict":
             assert (
                 "name `R` is referenced before definition."
-                in stream.operations[-4]["output"]["data"][0]["msg"]
+                in cell_ops[-4]["output"]["data"][0]["msg"]
             )
             assert (
                 "This cell wasn't run"
-                in stream.operations[-1]["output"]["data"][0]["msg"]
+                in cell_ops[-1]["output"]["data"][0]["msg"]
             )
         else:
             assert (
                 "Name `C` is not defined. It was expected to be defined in"
-                in stream.operations[-2]["output"]["data"][0]["msg"]
+                in cell_ops[-2]["output"]["data"][0]["msg"]
             )
             assert "NameError" in stderr.messages[0]
             assert "NameError" in stderr.messages[-1]
@@ -0,0 +1,219 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import gc
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from marimo._runtime.watch._service import (
+    WatchDelta,
+    WatcherService,
+    apply_events,
+    diff,
+    scan,
+)
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _touch_later(path: Path, data: bytes, mode: str = "ab") -> None:
+    # Make sure mtimes differ even on coarse file systems
+    st = path.stat() if path.exists() else None
+    with path.open(mode) as f:
+        f.write(data)
+    if st is not None:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_diff(tmp_path: Path) -> None:
+    (tmp_path / "log").write_bytes(b"abc")
+    (tmp_path / "data").write_bytes(b"xyz")
+    (tmp_path / "old").write_bytes(b"")
+    before = scan(str(tmp_path), directory=True)
+    assert before is not None
+
+    _touch_later(tmp_path / "log", b"def")
+    _touch_later(tmp_path / "data", b"x", mode="wb")
+    (tmp_path / "old").unlink()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "new").write_bytes(b"")
+    after = scan(str(tmp_path), directory=True)
+    assert after is not None
+
+    delta = diff(before, after)
+    assert delta.added == {tmp_path / "sub", tmp_path / "sub" / "new"}
+    assert delta.removed == {tmp_path / "old"}
+    assert delta.modified == {tmp_path / "log", tmp_path / "data"}
+    assert delta.appended == {tmp_path / "log": (3, 6)}
+    assert not diff(after, after)
+
+
+def test_delta_update() -> None:
+    a, b, c = Path("a"), Path("b"), Path("c")
+    delta = WatchDelta(modified={a}, appended={a: (0, 3)}, added={b})
+    delta.update(WatchDelta(modified={a, b}, appended={a: (3, 5)}))
+    assert delta.appended == {a: (0, 5)}
+    assert delta.added == {b}
+    assert delta.modified == {a}
+
+    # A rewrite invalidates the appended range
+    delta.update(WatchDelta(modified={a}))
+    assert delta.appended == {}
+
+    # Created and deleted in between: no change
+    delta.update(WatchDelta(removed={b}))
+    assert delta.added == set()
+    assert delta.removed == set()
+
+    delta.update(WatchDelta(removed={c}))
+    delta.update(WatchDelta(added={c}))
+    assert delta.removed == set()
+    assert c in delta.modified
+
+
+def test_apply_events(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "a").write_bytes(b"1")
+    (root / "log").write_bytes(b"12")
+    snapshot = scan(str(root), directory=True)
+    assert snapshot is not None
+
+    _touch_later(root / "log", b"345")
+    outside = tmp_path / "other"
+    outside.mkdir()
+    (outside / "x").write_bytes(b"")
+    outside.rename(root / "moved")
+    delta = apply_events(
+        str(root),
+        True,
+        snapshot,
+        [str(root / "log"), str(root / "moved"), str(root)],
+    )
+    assert delta.appended == {root / "log": (2, 5)}
+    assert delta.added == {root / "moved", root / "moved" / "x"}
+
+    shutil.rmtree(root / "sub")
+    delta = apply_events(str(root), True, snapshot, [str(root / "sub")])
+    assert delta.removed == {root / "sub", root / "sub" / "a"}
+    assert snapshot == scan(str(root), directory=True)
+
+
+def test_service_shares_watches(tmp_path: Path) -> None:
+    log = tmp_path / "log"
+    log.write_bytes(b"hello")
+    service = WatcherService(use_events=False)
+    file_changes = WatchDelta()
+    directory_changes = WatchDelta()
+
+    subscriptions = [
+        service.subscribe(
+            log, file_changes.update, directory=False, interval=0.01
+        ),
+        service.subscribe(log, lambda _: None, directory=False, interval=0.01),
+        service.subscribe(
+            tmp_path, directory_changes.update, directory=True, interval=0.01
+        ),
+    ]
+    assert sorted(service.paths) == sorted([log, tmp_path])
+    # Directories are scanned on the service's thread
+    assert _wait_for(
+        lambda: all(watch.initialized for watch in service._watches.values())
+    )
+
+    _touch_later(log, b" world")
+    assert _wait_for(lambda: bool(file_changes.appended))
+    assert file_changes.appended == {log: (5, 11)}
+    assert _wait_for(lambda: log in directory_changes.modified)
+
+    for subscription in subscriptions:
+        subscription.cancel()
+    assert service.paths == []
+    assert _wait_for(lambda: service._thread is None)
+
+
+def test_service_drops_collected_subscribers(tmp_path: Path) -> None:
+    class Subscriber:
+        def on_change(self, delta: WatchDelta) -> None:
+            del delta
+
+    service = WatcherService(use_events=False)
+    subscriber = Subscriber()
+    service.subscribe(
+        tmp_path, subscriber.on_change, directory=True, interval=0.01
+    )
+    del subscriber
+    gc.collect()
+
+    (tmp_path / "new").write_bytes(b"")
+    assert _wait_for(lambda: service.paths == [])
+
+
+def test_service_scans_directories_on_its_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    threads: list[str] = []
+
+    def recording_scan(path: str, directory: bool) -> Any:
+        threads.append(threading.current_thread().name)
+        return scan(path, directory)
+
+    monkeypatch.setattr("marimo._runtime.watch._service.scan", recording_scan)
+    (tmp_path / "a").write_bytes(b"")
+    service = WatcherService(use_events=False)
+    changes = WatchDelta()
+    subscription = service.subscribe(
+        tmp_path, changes.update, directory=True, interval=0.01
+    )
+    assert _wait_for(lambda: bool(threads))
+    assert set(threads) == {"marimo-watch"}
+
+    # The initial snapshot isn't reported as changes
+    (tmp_path / "b").write_bytes(b"")
+    assert _wait_for(lambda: bool(changes.added))
+    assert changes.added == {tmp_path / "b"}
+    subscription.cancel()
+
+
+def test_service_rearms_events_for_recreated_directory(
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("watchdog")
+
+    root = tmp_path / "data"
+    root.mkdir()
+    service = WatcherService(use_events=True)
+    changes = WatchDelta()
+    subscription = service.subscribe(
+        root, changes.update, directory=True, interval=0.01
+    )
+    (watch,) = service._watches.values()
+    assert _wait_for(lambda: watch.handle is not None)
+
+    (root / "a").write_bytes(b"")
+    assert _wait_for(lambda: root / "a" in changes.added)
+
+    shutil.rmtree(root)
+    assert _wait_for(lambda: watch.handle is None)
+    assert _wait_for(lambda: root / "a" not in changes.added)
+
+    root.mkdir()
+    # Watched for events again once it exists
+    assert _wait_for(lambda: watch.handle is not None)
+    (root / "b").write_bytes(b"")
+    assert _wait_for(lambda: root / "b" in changes.added)
+    subscription.cancel()
+    assert _wait_for(lambda: service._thread is None)
@@ -157,3 +157,44 @@ async def test_directory_watch(
 
     assert not k.stderr.messages, k.stderr
     assert k.globals["x"] == 1
+
+
+async def test_file_changes_report_appended_data(
+    execution_kernel: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    k = execution_kernel
+    log = tmp_path / "app.log"
+    log.write_text("first\n")
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import marimo as mo
+                mo.watch._file._TEST_SLEEP_INTERVAL = 0.01
+                """
+            ),
+            exec_req.get(f'log = mo.watch.file("{log.as_posix()}")'),
+            exec_req.get(
+                """
+                log
+                new_lines = []
+                for start, end in log.changes().appended.values():
+                    with open(log(), "rb") as f:
+                        f.seek(start)
+                        new_lines = f.read(end - start).decode().splitlines()
+                """
+            ),
+        ]
+    )
+    assert k.globals["new_lines"] == []
+
+    with log.open("a") as f:
+        f.write("second\nthird\n")
+    for _ in range(100):
+        await asyncio.sleep(0.05)
+        if k.graph.get_stale():
+            break
+    await k.run_stale_cells()
+
+    assert not k.stderr.messages, k.stderr
+    assert k.globals["new_lines"] == ["second", "third"]
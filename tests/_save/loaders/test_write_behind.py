@@ -0,0 +1,265 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from marimo._loggers import capture_output
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.types import NoopStream
+from marimo._save.cache import Cache
+from marimo._save.hash import HashKey
+from marimo._save.loaders import PickleLoader
+from marimo._save.loaders.write_behind import (
+    CacheWriter,
+    flush_cache_writes,
+    get_cache_writer,
+)
+from marimo._save.stores.file import FileStore
+from marimo._types.ids import CellId_t
+from tests._messaging.mocks import MockStream
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._runtime.runtime import Kernel
+    from tests.conftest import ExecReqProvider
+
+
+class BlockingStore(FileStore):
+    """A store whose writes wait until released."""
+
+    def __init__(self, save_path: str) -> None:
+        super().__init__(save_path)
+        self.release = threading.Event()
+
+    def put(self, key: str, value: bytes) -> bool:
+        assert self.release.wait(timeout=10)
+        return super().put(key, value)
+
+
+class FailingStore(FileStore):
+    def put(self, key: str, value: bytes) -> bool:
+        del key, value
+        raise OSError("disk full")
+
+
+def _cache(value: int, key: str = "abc") -> Cache:
+    return Cache(
+        defs={"x": value},
+        hash=key,
+        cache_type="Pure",
+        stateful_refs=set(),
+        hit=False,
+        meta={"version": 3},
+    )
+
+
+def test_save_returns_before_write(tmp_path: Path) -> None:
+    store = BlockingStore(str(tmp_path))
+    loader = PickleLoader("test", store=store, write_behind=True)
+    key = HashKey("abc", "Pure")
+    try:
+        start = time.time()
+        assert loader.save_cache(_cache(1))
+        assert time.time() - start < 5
+        assert not store.hit(str(loader.build_path(key)))
+
+        # Served from memory in the meantime
+        assert loader.cache_hit(key)
+        loaded = loader.load_cache(key)
+        assert loaded is not None
+        assert loaded.defs == {"x": 1}
+        assert not loader.flush(timeout=0.1)
+    finally:
+        store.release.set()
+
+    assert loader.flush(timeout=10)
+    assert store.hit(str(loader.build_path(key)))
+    # Read back from the store
+    loaded = loader.load_cache(key)
+    assert loaded is not None
+    assert loaded.defs == {"x": 1}
+
+
+def test_synchronous_by_default(tmp_path: Path) -> None:
+    store = FileStore(str(tmp_path))
+    loader = PickleLoader("test", store=store)
+    loader.save_cache(_cache(1))
+    assert store.hit(str(loader.build_path(HashKey("abc", "Pure"))))
+    assert loader.flush()
+
+
+def test_restoring_a_pending_cache_does_not_change_it(
+    tmp_path: Path,
+) -> None:
+    store = BlockingStore(str(tmp_path))
+    loader = PickleLoader("test", store=store, write_behind=True)
+    cache = _cache(1)
+    try:
+        loader.save_cache(cache)
+        loaded = loader.load_cache(cache.key)
+        assert loaded is not None
+        loaded.defs["x"] = 2
+        assert cache.defs == {"x": 1}
+    finally:
+        store.release.set()
+    assert loader.flush(timeout=10)
+
+
+def test_failed_writes_are_not_pending(tmp_path: Path) -> None:
+    loader = PickleLoader(
+        "test", store=FailingStore(str(tmp_path)), write_behind=True
+    )
+    loader.save_cache(_cache(1))
+    assert loader.flush(timeout=10)
+    assert not loader.cache_hit(HashKey("abc", "Pure"))
+
+
+def test_queue_is_bounded(tmp_path: Path) -> None:
+    store = BlockingStore(str(tmp_path))
+    loader = PickleLoader("test", store=store)
+    writer = CacheWriter(max_pending=1)
+    # One being written, one queued, and the third waits for room
+    writer.submit(loader, _cache(1, "a"))
+    writer.submit(loader, _cache(2, "b"))
+    submitted = threading.Event()
+
+    def submit() -> None:
+        writer.submit(loader, _cache(3, "c"))
+        submitted.set()
+
+    threading.Thread(target=submit, daemon=True).start()
+    try:
+        assert not submitted.wait(timeout=0.2)
+    finally:
+        store.release.set()
+    assert submitted.wait(timeout=10)
+    assert writer.flush(timeout=10)
+    assert all(
+        store.hit(str(loader.build_path(HashKey(key, "Pure"))))
+        for key in "abc"
+    )
+
+
+def test_pending_caches_are_shared_by_location(tmp_path: Path) -> None:
+    store = BlockingStore(str(tmp_path / "cache"))
+    writer = PickleLoader("test", store=store, write_behind=True)
+    # A different store for the same directory
+    reader = PickleLoader(
+        "test",
+        store=FileStore(str(tmp_path / "other" / ".." / "cache")),
+        write_behind=True,
+    )
+    try:
+        writer.save_cache(_cache(1))
+        assert reader.cache_hit(HashKey("abc", "Pure"))
+        assert not reader.flush(timeout=0.1)
+    finally:
+        store.release.set()
+    assert reader.flush(timeout=10)
+
+
+def test_flush_waits_for_own_caches(tmp_path: Path) -> None:
+    store = BlockingStore(str(tmp_path))
+    blocked = PickleLoader("blocked", store=store, write_behind=True)
+    other = PickleLoader(
+        "other", store=FileStore(str(tmp_path)), write_behind=True
+    )
+    try:
+        other.save_cache(_cache(2))
+        blocked.save_cache(_cache(1))
+        assert other.flush(timeout=10)
+        assert not blocked.flush(timeout=0.1)
+        # Nor for other kernels' writes
+        assert get_cache_writer().flush(timeout=0.1, stream=NoopStream())
+    finally:
+        store.release.set()
+    assert blocked.flush(timeout=10)
+
+
+def test_abandoned_writes_are_logged(tmp_path: Path) -> None:
+    store = BlockingStore(str(tmp_path))
+    loader = PickleLoader("test", store=store, write_behind=True)
+    try:
+        loader.save_cache(_cache(1))
+        with capture_output(log_level=logging.WARNING) as (_, _, records):
+            assert not flush_cache_writes(timeout=0.1)
+        message = "\n".join(record.getMessage() for record in records)
+        assert "Abandoning 1 cache writes" in message
+        assert "P_abc.pickle" in message
+    finally:
+        store.release.set()
+    assert flush_cache_writes(timeout=10)
+
+
+async def test_persistent_cache_write_behind(
+    k: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    await k.run(
+        [
+            exec_req.get(
+                f"""
+                import pathlib
+
+                import marimo as mo
+
+                @mo.persistent_cache(save_path=r"{tmp_path}", write_behind=True)
+                def double(x):
+                    return 2 * x
+
+                a = double(2)
+                b = double(2)
+                flushed = double.cache_flush(timeout=10)
+                written = list(pathlib.Path(r"{tmp_path}").rglob("*.pickle"))
+                """
+            ),
+        ]
+    )
+    assert k.globals["a"] == 4
+    assert k.globals["b"] == 4
+    assert k.globals["flushed"]
+    assert k.globals["written"]
+    # The second call was served from memory, or from the store
+    assert k.globals["double"].hits == 1
+    assert flush_cache_writes(timeout=10)
+
+
+async def test_failed_writes_are_shown_in_the_cell(
+    k: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    await k.run(
+        [
+            exec_req.get_with_id(
+                CellId_t("0"),
+                f"""
+                import threading
+
+                import marimo as mo
+
+                # Locks can't be pickled, which fails on the writer thread
+                @mo.persistent_cache(save_path=r"{tmp_path}", write_behind=True)
+                def make_lock():
+                    return threading.Lock()
+
+                lock = make_lock()
+                flushed = make_lock.cache_flush(timeout=10)
+                """,
+            ),
+        ]
+    )
+    assert k.globals["lock"] is not None
+    assert k.globals["flushed"]
+    errors = [
+        op.console
+        for op in MockStream(k.stream).cell_notifications
+        if op.cell_id == "0"
+        and isinstance(op.console, CellOutput)
+        and op.console.channel == CellChannel.STDERR
+    ]
+    assert any(
+        "Failed to write persistent cache" in str(error.data)
+        for error in errors
+    )
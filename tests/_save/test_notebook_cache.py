@@ -0,0 +1,218 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._save.notebook_cache import NotebookCache
+from marimo._save.stores.file import FileStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._runtime.runtime import Kernel
+    from tests.conftest import ExecReqProvider
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FileStore:
+    return FileStore(str(tmp_path / "cache"))
+
+
+def _restart(k: Kernel, store: FileStore) -> None:
+    # A new kernel: nothing defined, no keys from previous runs
+    for name in list(k.globals):
+        if not name.startswith("__"):
+            del k.globals[name]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+
+
+def _expensive(log: Path, body: str) -> str:
+    return f"""
+        with open(r"{log}", "a") as _f:
+            _f.write("ran;")
+        {body}
+        """
+
+
+async def test_unchanged_cells_are_restored(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore, tmp_path: Path
+) -> None:
+    log = tmp_path / "log"
+    cells = [
+        exec_req.get_with_id("0", "x = 1"),
+        exec_req.get_with_id("1", _expensive(log, "y = x + 1; y * 10")),
+    ]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(cells)
+    assert k.globals["y"] == 2
+    assert log.read_text() == "ran;"
+
+    _restart(k, store)
+    k.stream.messages.clear()
+    await k.run(cells)
+    assert k.globals["y"] == 2
+    # Not run again, but the output is still sent
+    assert log.read_text() == "ran;"
+    outputs = [
+        op.output.data
+        for op in k.stream.cell_notifications
+        if op.cell_id == "1" and op.output is not None
+    ]
+    assert any("20" in str(data) for data in outputs)
+
+
+async def test_upstream_changes_rerun_descendants(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore, tmp_path: Path
+) -> None:
+    log = tmp_path / "log"
+    expensive = exec_req.get_with_id("1", _expensive(log, "y = x + 1"))
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run([exec_req.get_with_id("0", "x = 1"), expensive])
+    assert log.read_text() == "ran;"
+
+    _restart(k, store)
+    await k.run([exec_req.get_with_id("0", "x = 5"), expensive])
+    assert k.globals["y"] == 6
+    assert log.read_text() == "ran;ran;"
+
+    # Both versions are cached
+    _restart(k, store)
+    await k.run([exec_req.get_with_id("0", "x = 1"), expensive])
+    assert k.globals["y"] == 2
+    assert log.read_text() == "ran;ran;"
+
+
+async def test_functions_are_restored(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore
+) -> None:
+    cells = [
+        exec_req.get_with_id("0", "def inc(a):\n    return a + 1"),
+        exec_req.get_with_id("1", "z = inc(1)"),
+    ]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(cells)
+
+    _restart(k, store)
+    await k.run(cells)
+    assert k.globals["inc"](2) == 3
+    assert k.globals["z"] == 2
+
+
+async def test_key_includes_ui_values(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore
+) -> None:
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(
+        [
+            exec_req.get_with_id(
+                "0", "import marimo as mo; s = mo.ui.slider(0, 10, value=1)"
+            ),
+            exec_req.get_with_id("1", "v = s.value"),
+        ]
+    )
+    cell = k.graph.cells["1"]
+    key = k.notebook_cache.key(cell, k.graph, k.globals)
+    assert key is not None
+    assert key == k.notebook_cache.key(cell, k.graph, k.globals)
+    k.globals["s"]._update(2)
+    assert k.notebook_cache.key(cell, k.graph, k.globals) != key
+
+
+async def test_uncacheable_cells_always_run(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore, tmp_path: Path
+) -> None:
+    log = tmp_path / "log"
+    cells = [
+        exec_req.get_with_id("0", "import marimo as mo"),
+        # Imperative outputs can't be restored
+        exec_req.get_with_id("1", _expensive(log, "mo.output.append(1)")),
+        # Neither can state
+        exec_req.get_with_id("2", _expensive(log, "get, set = mo.state(1)")),
+    ]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(cells)
+    assert log.read_text() == "ran;ran;"
+
+    _restart(k, store)
+    await k.run(cells)
+    assert log.read_text() == "ran;ran;ran;ran;"
+    assert k.globals["get"]() == 1
+
+
+async def test_descendants_of_uncached_cells_run(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore, tmp_path: Path
+) -> None:
+    log = tmp_path / "log"
+    cells = [
+        # Classes aren't cached, so this cell runs again, with a new value
+        exec_req.get_with_id(
+            "0",
+            "import random\n"
+            "class Box:\n"
+            "    pass\n"
+            "box = Box()\n"
+            "box.v = random.random()",
+        ),
+        exec_req.get_with_id("1", _expensive(log, "v = box.v")),
+    ]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(cells)
+
+    _restart(k, store)
+    await k.run(cells)
+    assert log.read_text() == "ran;ran;"
+    assert k.globals["v"] == k.globals["box"].v
+
+
+async def test_cells_without_defs_always_run(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore, tmp_path: Path
+) -> None:
+    log = tmp_path / "log"
+    cells = [
+        exec_req.get_with_id("0", "items = []"),
+        exec_req.get_with_id("1", _expensive(log, "items.append(1)")),
+    ]
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run(cells)
+
+    _restart(k, store)
+    await k.run(cells)
+    assert log.read_text() == "ran;ran;"
+    assert k.globals["items"] == [1]
+
+
+async def test_key_includes_cli_args_and_query_params(
+    k: Kernel, exec_req: ExecReqProvider, store: FileStore
+) -> None:
+    from marimo._runtime.params import CLIArgs, QueryParams
+
+    k.notebook_cache = NotebookCache("notebook.py", store=store)
+    await k.run([exec_req.get_with_id("0", "x = 1")])
+    cell = k.graph.cells["0"]
+    key = k.notebook_cache.key(cell, k.graph, k.globals)
+    assert key is not None
+
+    k.cli_args = CLIArgs({"n": 1})
+    cli_key = k.notebook_cache.key(cell, k.graph, k.globals)
+    assert cli_key not in (None, key)
+    k.query_params = QueryParams({"user": "a"})
+    assert k.notebook_cache.key(cell, k.graph, k.globals) not in (
+        None,
+        key,
+        cli_key,
+    )
+
+
+async def test_enabled_by_config(k: Kernel) -> None:
+    from marimo._config.config import DEFAULT_CONFIG
+    from marimo._config.utils import deep_copy
+
+    assert k.notebook_cache is None
+    config = deep_copy(DEFAULT_CONFIG)
+    config["experimental"] = {"cache_cells": True}
+    k._update_runtime_from_user_config(config)
+    assert isinstance(k.notebook_cache, NotebookCache)
+    k._update_runtime_from_user_config(DEFAULT_CONFIG)
+    assert k.notebook_cache is None
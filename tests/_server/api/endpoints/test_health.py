@@ -4,9 +4,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from marimo import __version__
+from marimo._config.settings import GLOBAL_SETTINGS
 from tests._server.mocks import token_header, with_session
 
 if TYPE_CHECKING:
+    import pytest
     from starlette.testclient import TestClient
 
 SESSION_ID = "session-123"
@@ -85,3 +87,21 @@ def test_read_code(client: TestClient) -> None:
     response = client.get("/api/status/connections", headers=HEADERS)
     assert response.status_code == 200, response.text
     assert response.json()["active"] == 1
+
+
+def test_metrics_disabled(client: TestClient) -> None:
+    response = client.get("/metrics")
+    assert response.status_code == 404, response.text
+
+
+def test_metrics(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(GLOBAL_SETTINGS, "METRICS", True)
+    monkeypatch.delenv("MARIMO_METRICS_DIR", raising=False)
+
+    # Unauthenticated, like the health checks
+    response = client.get("/metrics")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE marimo_sessions gauge" in response.text
+    assert "marimo_sessions 0" in response.text
+    assert 'marimo_kernels{mode="edit"} 0' in response.text
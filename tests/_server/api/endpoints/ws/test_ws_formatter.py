@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import json
+import zlib
 
 from marimo._messaging.notification import (
     AlertNotification,
     KernelStartupErrorNotification,
 )
 from marimo._server.api.endpoints.ws.ws_formatter import (
+    COMPRESSION_THRESHOLD_BYTES,
+    encode_wire_frame,
+    format_wire_batch,
     format_wire_message,
     serialize_notification_for_websocket,
 )
@@ -146,3 +150,35 @@ class TestIntegration:
         # Verify op matches notification name
         assert parsed["op"] == notification.name
         assert parsed["op"] == "kernel-startup-error"
+
+
+class TestFormatWireBatch:
+    """Tests for the batched wire format."""
+
+    def test_newline_delimited(self) -> None:
+        frame = format_wire_batch(
+            [("a", b'{"text": "line\\nbreak"}'), ("b", b"{}")]
+        )
+        lines = frame.decode("utf-8").split("\n")
+        assert [json.loads(line) for line in lines] == [
+            {"op": "a", "data": {"text": "line\nbreak"}},
+            {"op": "b", "data": {}},
+        ]
+
+    def test_single_message_matches_unbatched(self) -> None:
+        data = b'{"key": "value"}'
+        assert format_wire_batch([("op", data)]).decode(
+            "utf-8"
+        ) == format_wire_message("op", data)
+
+    def test_encode_compresses_large_frames(self) -> None:
+        small = format_wire_batch([("op", b"{}")])
+        assert encode_wire_frame(small, compress=True) == small.decode()
+
+        large = format_wire_batch(
+            [("op", b'"' + b"x" * COMPRESSION_THRESHOLD_BYTES + b'"')]
+        )
+        assert encode_wire_frame(large, compress=False) == large.decode()
+        encoded = encode_wire_frame(large, compress=True)
+        assert isinstance(encoded, bytes)
+        assert zlib.decompress(encoded) == large
@@ -0,0 +1,116 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+import json
+import zlib
+from typing import Any, Union
+
+import pytest
+
+from marimo._messaging.notification import (
+    AlertNotification,
+    FocusCellNotification,
+)
+from marimo._messaging.serde import serialize_kernel_message
+from marimo._server.api.endpoints.ws.ws_formatter import (
+    COMPRESSION_THRESHOLD_BYTES,
+)
+from marimo._server.api.endpoints.ws.ws_message_loop import (
+    WebSocketMessageLoop,
+)
+from marimo._types.ids import CellId_t
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames: list[Union[str, bytes]] = []
+
+    async def send_text(self, text: str) -> None:
+        self.frames.append(text)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.frames.append(data)
+
+
+def _make_loop(
+    websocket: FakeWebSocket, *, batched: bool, compressed: bool = False
+) -> tuple[WebSocketMessageLoop, asyncio.Queue[Any]]:
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    loop = WebSocketMessageLoop(
+        websocket=websocket,  # type: ignore[arg-type]
+        message_queue=queue,
+        kiosk=False,
+        on_disconnect=lambda *_: None,
+        on_check_status_update=lambda: None,
+        batched=batched,
+        compressed=compressed,
+    )
+    return loop, queue
+
+
+def _alert(title: str, description: str = "") -> bytes:
+    return serialize_kernel_message(
+        AlertNotification(title=title, description=description)
+    )
+
+
+def _decode(frame: Union[str, bytes]) -> list[dict[str, Any]]:
+    if isinstance(frame, bytes):
+        frame = zlib.decompress(frame).decode("utf-8")
+    return [json.loads(line) for line in frame.split("\n")]
+
+
+async def _run(loop: WebSocketMessageLoop) -> None:
+    task = asyncio.create_task(loop._listen_for_messages())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_unbatched_sends_one_frame_per_message() -> None:
+    websocket = FakeWebSocket()
+    loop, queue = _make_loop(websocket, batched=False)
+    for i in range(3):
+        queue.put_nowait(_alert(str(i)))
+
+    await _run(loop)
+    assert len(websocket.frames) == 3
+    assert json.loads(websocket.frames[0])["data"]["title"] == "0"
+
+
+async def test_batched_drains_queue_into_one_frame() -> None:
+    websocket = FakeWebSocket()
+    loop, queue = _make_loop(websocket, batched=True)
+    for i in range(3):
+        queue.put_nowait(_alert(str(i)))
+    # Filtered outside of kiosk mode
+    queue.put_nowait(
+        serialize_kernel_message(
+            FocusCellNotification(cell_id=CellId_t("cell"))
+        )
+    )
+
+    await _run(loop)
+    assert len(websocket.frames) == 1
+    messages = _decode(websocket.frames[0])
+    assert [m["op"] for m in messages] == ["alert"] * 3
+    assert [m["data"]["title"] for m in messages] == ["0", "1", "2"]
+
+
+async def test_batched_compresses_large_frames() -> None:
+    websocket = FakeWebSocket()
+    loop, queue = _make_loop(websocket, batched=True, compressed=True)
+    queue.put_nowait(_alert("small"))
+
+    await _run(loop)
+    queue.put_nowait(_alert("large", "x" * COMPRESSION_THRESHOLD_BYTES))
+    queue.put_nowait(_alert("after"))
+    await _run(loop)
+
+    small, large = websocket.frames
+    assert isinstance(small, str)
+    assert isinstance(large, bytes)
+    assert len(large) < COMPRESSION_THRESHOLD_BYTES
+    assert [m["data"]["title"] for m in _decode(large)] == ["large", "after"]
@@ -23,6 +23,7 @@ from marimo._server.api.middleware import (
     _AsyncHTTPClient,
     _URLRequest,
 )
+from marimo._server.api.proxy_client import ProxyProtocolError
 from marimo._server.config import StarletteServerStateInit
 from marimo._server.lsp import BaseLspServer
 from marimo._server.main import (
@@ -599,6 +600,25 @@ class TestProxyMiddleware:
         assert response.status_code == 200, response.text
         assert response.json()["message"] == "response from proxied app"
 
+    def test_invalid_upstream_response_is_bad_gateway(
+        self, edit_app: Starlette, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def send(*args: Any, **kwargs: Any) -> None:
+            del args, kwargs
+            raise ProxyProtocolError("Upstream sent a line that is too long")
+
+        monkeypatch.setattr(_AsyncHTTPClient, "send", send)
+        edit_app.add_middleware(
+            ProxyMiddleware,
+            proxy_path="/proxy",
+            target_url="http://127.0.0.1:8765",
+        )
+        client = TestClient(edit_app)
+        response = client.get(
+            "/proxy/api/test", headers=token_header("fake-token")
+        )
+        assert response.status_code == 502, response.text
+
     def test_original_app_auth_still_works(
         self, app_with_proxy: Starlette
     ) -> None:
@@ -0,0 +1,205 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._server.api.proxy_client import (
+    ConnectionPool,
+    ProxyProtocolError,
+    send_request,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class Upstream:
+    """A tiny keep-alive HTTP/1.1 server that echoes request bodies."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests: list[tuple[str, dict[str, str], bytes]] = []
+        self.server: asyncio.Server | None = None
+        self.port = 0
+
+    async def __aenter__(self) -> Upstream:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        assert self.server is not None
+        self.server.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                _method, target, _ = request_line.decode().split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) != b"\r\n":
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = b""
+                if headers.get("transfer-encoding") == "chunked":
+                    while True:
+                        size = int(await reader.readline(), 16)
+                        if size == 0:
+                            await reader.readline()
+                            break
+                        body += await reader.readexactly(size)
+                        await reader.readline()
+                elif "content-length" in headers:
+                    body = await reader.readexactly(
+                        int(headers["content-length"])
+                    )
+                self.requests.append((target, headers, body))
+
+                if target == "/long-header":
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\n"
+                        b"x-large: %s\r\n"
+                        b"content-length: 0\r\n\r\n" % (b"x" * 100_000)
+                    )
+                elif target == "/chunked":
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\n"
+                        b"transfer-encoding: chunked\r\n\r\n"
+                        b"5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n"
+                    )
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\n"
+                        b"content-type: text/plain\r\n"
+                        b"content-length: %d\r\n\r\n" % len(body) + body
+                    )
+                await writer.drain()
+                if target == "/close":
+                    writer.close()
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+
+
+async def _read(response) -> bytes:
+    return b"".join([chunk async for chunk in response.aiter_bytes()])
+
+
+async def _get(
+    pool: ConnectionPool,
+    upstream: Upstream,
+    target: str,
+    body: bytes | AsyncIterator[bytes] | None = None,
+    method: str = "GET",
+):
+    return await send_request(
+        scheme="http",
+        host="127.0.0.1",
+        port=upstream.port,
+        method=method,
+        target=target,
+        headers={},
+        body=body,
+        pool=pool,
+    )
+
+
+async def test_connections_are_reused() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        for i in range(3):
+            response = await _get(
+                pool, upstream, "/echo", f"body {i}".encode(), "POST"
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "text/plain"
+            assert await _read(response) == f"body {i}".encode()
+        assert upstream.connections == 1
+        assert pool.idle_count() == 1
+        pool.close()
+
+
+async def test_chunked_response() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        response = await _get(pool, upstream, "/chunked")
+        assert "transfer-encoding" not in response.headers
+        assert await _read(response) == b"hello world"
+        # The connection can be reused after a chunked response
+        response = await _get(pool, upstream, "/echo")
+        assert await _read(response) == b""
+        assert upstream.connections == 1
+        pool.close()
+
+
+async def test_streamed_request_body() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for i in range(10):
+            yield b"x" * 1000 + str(i).encode()
+
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        response = await _get(pool, upstream, "/echo", chunks(), "PUT")
+        body = await _read(response)
+        assert len(body) == 10 * 1001
+        _, headers, received = upstream.requests[0]
+        assert headers["transfer-encoding"] == "chunked"
+        assert received == body
+        pool.close()
+
+
+async def test_unread_response_is_not_pooled() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        response = await _get(pool, upstream, "/echo", b"unread", "POST")
+        await response.aclose()
+        assert pool.idle_count() == 0
+        pool.close()
+
+
+async def test_retries_when_pooled_connection_was_closed() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        response = await _get(pool, upstream, "/close")
+        await _read(response)
+        # Whether or not the close has been seen yet, the next request
+        # must succeed on a new connection
+        response = await _get(pool, upstream, "/echo", b"again", "POST")
+        assert await _read(response) == b"again"
+        assert upstream.connections == 2
+        pool.close()
+
+
+async def test_header_line_too_long() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        with pytest.raises(ProxyProtocolError):
+            await _get(pool, upstream, "/long-header")
+        assert pool.idle_count() == 0
+        pool.close()
+
+
+async def test_connection_refused() -> None:
+    pool = ConnectionPool()
+    async with Upstream() as upstream:
+        port = upstream.port
+    with pytest.raises(ConnectionRefusedError):
+        await send_request(
+            scheme="http",
+            host="127.0.0.1",
+            port=port,
+            method="GET",
+            target="/",
+            headers={},
+            body=None,
+            pool=pool,
+        )
@@ -0,0 +1,208 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._server.file_router import LazyListOfFilesAppFileRouter
+from marimo._server.files.workspace_index import WorkspaceIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+APP = "import marimo\napp = marimo.App()\n"
+
+
+def _flatten(files) -> list[str]:
+    paths = []
+    for f in files:
+        if f.is_directory:
+            paths.extend(_flatten(f.children))
+        else:
+            paths.append(f.path)
+    return paths
+
+
+def _make_tree(root: Path) -> None:
+    (root / "b_dir").mkdir()
+    (root / "a_dir").mkdir()
+    (root / "a_dir" / "app10.py").write_text(APP)
+    (root / "a_dir" / "app2.py").write_text(APP)
+    (root / "b_dir" / "app.py").write_text(APP)
+    (root / "root.py").write_text(APP)
+    (root / "script.py").write_text("print('hi')\n")
+    (root / "notes.md").write_text("---\nmarimo-version: 0.1\n---\n")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "skip.py").write_text(APP)
+
+
+def test_query_orders_folders_first(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path))
+
+    files, total = index.query(include_markdown=False)
+    assert total == 4
+    assert [f.name for f in files] == ["a_dir", "b_dir", "root.py"]
+    assert _flatten(files) == [
+        os.path.join("a_dir", "app2.py"),
+        os.path.join("a_dir", "app10.py"),
+        os.path.join("b_dir", "app.py"),
+        "root.py",
+    ]
+
+    files, total = index.query(include_markdown=True)
+    assert total == 5
+    assert "notes.md" in _flatten(files)
+
+
+def test_query_pagination_and_search(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path))
+
+    page, total = index.query(include_markdown=False, offset=1, limit=2)
+    assert total == 4
+    assert _flatten(page) == [
+        os.path.join("a_dir", "app10.py"),
+        os.path.join("b_dir", "app.py"),
+    ]
+
+    page, total = index.query(include_markdown=False, query="b_dir")
+    assert total == 1
+    assert _flatten(page) == [os.path.join("b_dir", "app.py")]
+
+
+def test_query_rejects_negative_pagination(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path))
+
+    with pytest.raises(ValueError, match="offset"):
+        index.query(include_markdown=False, offset=-1)
+    with pytest.raises(ValueError, match="limit"):
+        index.query(include_markdown=False, limit=-1)
+
+
+def test_refresh_only_sniffs_changed_files(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path), rescan_interval=0)
+    index.query(include_markdown=False)
+
+    with patch(
+        "marimo._server.files.workspace_index.is_marimo_app",
+        return_value=True,
+    ) as sniff:
+        index.mark_stale()
+        index.query(include_markdown=False)
+        assert sniff.call_count == 0
+
+        (tmp_path / "script.py").write_text(APP + "# now an app\n")
+        index.mark_stale()
+        index.query(include_markdown=False)
+        assert sniff.call_count == 1
+
+
+def test_rescans_are_debounced(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path))
+    index.query(include_markdown=False)
+
+    (tmp_path / "new.py").write_text(APP)
+    index.mark_stale()
+    _, total = index.query(include_markdown=False)
+    assert total == 4
+
+    index._rescan_interval = 0
+    index.mark_stale()
+    _, total = index.query(include_markdown=False)
+    assert total == 5
+
+
+def test_timeout_returns_partial_results(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    # Time out after reading a single file
+    index = WorkspaceIndex(str(tmp_path), scan_timeout=0)
+
+    _, total = index.query(include_markdown=False)
+    assert total < 4
+    assert not index.refresh()
+
+    # Each refresh picks up where the last one left off
+    for _ in range(10):
+        if index.refresh():
+            break
+    files, total = index.query(include_markdown=False)
+    assert total == 4
+    assert "root.py" in _flatten(files)
+
+
+def test_invalidate_updates_incrementally(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(str(tmp_path))
+    index.query(include_markdown=False)
+
+    new_file = tmp_path / "b_dir" / "new.py"
+    new_file.write_text(APP)
+    index.invalidate(str(new_file))
+    (tmp_path / "root.py").unlink()
+    index.invalidate(str(tmp_path / "root.py"))
+
+    files, total = index.query(include_markdown=False)
+    assert total == 4
+    assert os.path.join("b_dir", "new.py") in _flatten(files)
+    assert "root.py" not in _flatten(files)
+
+    # Removing a directory drops everything beneath it
+    for f in (tmp_path / "a_dir").iterdir():
+        f.unlink()
+    (tmp_path / "a_dir").rmdir()
+    index.invalidate(str(tmp_path / "a_dir"))
+    _, total = index.query(include_markdown=False)
+    assert total == 2
+
+
+def test_index_persists(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    _make_tree(workspace)
+    persist_path = tmp_path / "index.json"
+
+    index = WorkspaceIndex(str(workspace), persist_path=persist_path)
+    index.query(include_markdown=False)
+    assert persist_path.exists()
+
+    reloaded = WorkspaceIndex(str(workspace), persist_path=persist_path)
+    with patch("marimo._server.files.workspace_index.is_marimo_app") as sniff:
+        _, total = reloaded.query(include_markdown=False)
+        assert sniff.call_count == 0
+    assert total == 4
+
+
+def test_router_search(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    router = LazyListOfFilesAppFileRouter(
+        str(tmp_path), include_markdown=False
+    )
+    files, total = router.search("app", offset=0, limit=1)
+    assert total == 3
+    assert _flatten(files) == [os.path.join("a_dir", "app2.py")]
+
+
+def test_close_releases_shared_index(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    with patch(
+        "marimo._server.files.workspace_index._index_cache_path",
+        return_value=tmp_path / "index.json",
+    ):
+        router = LazyListOfFilesAppFileRouter(
+            str(workspace), include_markdown=False
+        )
+        index = WorkspaceIndex.for_directory(str(workspace))
+        assert router._index is index
+
+        router.close()
+        assert not index.is_watching
+        assert WorkspaceIndex.for_directory(str(workspace)) is not index
+        WorkspaceIndex.for_directory(str(workspace)).close()
@@ -0,0 +1,217 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from marimo._session.managers.ipc import KernelStartupError
+from marimo._session.managers.pool import (
+    KernelHost,
+    KernelPool,
+    KernelPoolConfig,
+)
+
+
+class FakeHost:
+    def __init__(self, index: int, config: KernelPoolConfig) -> None:
+        del config
+        self.index = index
+        self.pid = 1000 + index
+        self.kernels: set[str] = set()
+        self.alive = True
+        self.cpu = 0.0
+        self.stopped = False
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def cpu_percent(self) -> float:
+        return self.cpu
+
+    def start_kernel(self, kernel_id: str, args: Any) -> None:
+        del args
+        self.kernels.add(kernel_id)
+
+    def shutdown(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("marimo._session.managers.pool.KernelHost", FakeHost)
+
+
+def _place(pool: KernelPool, kernel_id: str) -> FakeHost:
+    host = pool.place(kernel_id, None)  # type: ignore[arg-type]
+    assert isinstance(host, FakeHost)
+    return host
+
+
+def test_config_validation() -> None:
+    with pytest.raises(ValueError):
+        KernelPoolConfig(processes=0)
+    with pytest.raises(ValueError):
+        KernelPoolConfig(processes=1, kernels_per_process=0)
+
+
+def test_cpus_are_spread_over_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    assert KernelHost._cpus(0, None) == []
+    assert KernelHost._cpus(0, 2) == [0, 1]
+    assert KernelHost._cpus(1, 2) == [2, 3]
+    assert KernelHost._cpus(2, 2) == [0, 1]
+    assert KernelHost._cpus(0, 8) == [0, 1, 2, 3]
+
+
+@pytest.mark.usefixtures("fake_hosts")
+def test_spreads_kernels_before_sharing() -> None:
+    pool = KernelPool(KernelPoolConfig(processes=2))
+    first = _place(pool, "a")
+    second = _place(pool, "b")
+    assert first is not second
+
+    # Both workers are busy: the one with less CPU use is picked
+    first.cpu = 90.0
+    second.cpu = 10.0
+    assert _place(pool, "c") is second
+    assert len(pool.hosts) == 2
+
+    # Released kernels make room; an idle worker is reused
+    pool.release(first, "a")
+    first.cpu = 0.0
+    assert _place(pool, "d") is first
+
+    pool.shutdown()
+    assert first.stopped
+    assert second.stopped
+    assert pool.hosts == []
+
+
+@pytest.mark.usefixtures("fake_hosts")
+def test_kernels_per_process_limit() -> None:
+    pool = KernelPool(KernelPoolConfig(processes=2, kernels_per_process=1))
+    first = _place(pool, "a")
+    second = _place(pool, "b")
+    with pytest.raises(KernelStartupError, match="full"):
+        _place(pool, "c")
+
+    pool.release(second, "b")
+    assert _place(pool, "c") is second
+
+    # A worker that died is replaced
+    first.alive = False
+    replacement = _place(pool, "d")
+    assert replacement is not first
+    assert first not in pool.hosts
+
+
+def test_workers_start_in_the_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowHost(FakeHost):
+        def __init__(self, index: int, config: KernelPoolConfig) -> None:
+            started.set()
+            assert release.wait(10)
+            super().__init__(index, config)
+
+    monkeypatch.setattr("marimo._session.managers.pool.KernelHost", SlowHost)
+    # A worker is warmed up without blocking the caller
+    pool = KernelPool(KernelPoolConfig(processes=2))
+    assert started.wait(10)
+    assert pool.hosts == []
+    # The pool isn't locked while the worker starts
+    pool.release(FakeHost(9, pool.config), "x")  # type: ignore[arg-type]
+    with pytest.raises(KernelStartupError, match="Timed out"):
+        pool.place("a", None, timeout=0.01)  # type: ignore[arg-type]
+
+    release.set()
+    first = _place(pool, "a")
+    assert isinstance(first, SlowHost)
+    # The next worker is warmed up ahead of demand
+    deadline = time.time() + 10
+    while len(pool.hosts) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(pool.hosts) == 2
+    pool.shutdown()
+
+
+def test_worker_startup_errors_are_raised(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class BrokenHost(FakeHost):
+        def __init__(self, index: int, config: KernelPoolConfig) -> None:
+            del index, config
+            raise KernelStartupError("broken")
+
+    monkeypatch.setattr("marimo._session.managers.pool.KernelHost", BrokenHost)
+    pool = KernelPool(KernelPoolConfig(processes=1))
+    with pytest.raises(KernelStartupError, match="broken"):
+        _place(pool, "a")
+    pool.shutdown()
+
+
+@pytest.mark.requires("zmq")
+def test_runs_kernel_in_worker_process() -> None:
+    import os
+
+    from marimo._ast.app_config import _AppConfig
+    from marimo._ast.cell import CellConfig
+    from marimo._config.manager import get_default_config_manager
+    from marimo._ipc import QueueManager as IPCQueueManager
+    from marimo._runtime.commands import AppMetadata, ExecuteCellsCommand
+    from marimo._session.managers import (
+        IPCQueueManagerImpl,
+        PooledKernelManagerImpl,
+    )
+    from marimo._session.model import SessionMode
+    from marimo._types.ids import CellId_t
+
+    pool = KernelPool(KernelPoolConfig(processes=1))
+    ipc_queue_manager, connection_info = IPCQueueManager.create()
+    queue_manager = IPCQueueManagerImpl.from_ipc(ipc_queue_manager)
+    kernel_manager = PooledKernelManagerImpl(
+        pool=pool,
+        queue_manager=queue_manager,
+        connection_info=connection_info,
+        mode=SessionMode.RUN,
+        configs={CellId_t("c"): CellConfig()},
+        app_metadata=AppMetadata(
+            query_params={}, cli_args={}, app_config=_AppConfig()
+        ),
+        config_manager=get_default_config_manager(current_path=None),
+        redirect_console_to_browser=False,
+    )
+    try:
+        kernel_manager.start_kernel()
+        assert kernel_manager.is_alive()
+        assert kernel_manager.pid is not None
+        assert kernel_manager.pid != os.getpid()
+
+        queue_manager.put_control_request(
+            ExecuteCellsCommand(
+                cell_ids=[CellId_t("c")],
+                codes=["import os; print(os.getpid())"],
+            )
+        )
+        ops: list[str] = []
+        deadline = time.time() + 30
+        while "completed-run" not in ops and time.time() < deadline:
+            try:
+                message = queue_manager.stream_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            assert message is not None
+            ops.append(json.loads(message)["op"])
+        assert "completed-run" in ops
+    finally:
+        kernel_manager.close_kernel()
+        pool.shutdown()
+    assert not kernel_manager.is_alive()
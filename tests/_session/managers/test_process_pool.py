@@ -0,0 +1,306 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import queue
+import re
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._session.managers.process_pool import (
+    KernelProcessPool,
+    kernels_start_cold,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._session.managers import IPCKernelManagerImpl
+
+
+@pytest.fixture
+def fake_kernels(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Processes that, like a kernel, wait for their arguments on stdin
+    monkeypatch.setattr(
+        "marimo._session.managers.process_pool.kernel_command",
+        lambda python: [python, "-c", "import sys; sys.stdin.read()"],
+    )
+
+
+def _wait_for_idle(pool: KernelProcessPool, count: int) -> None:
+    deadline = time.time() + 10
+    while pool.idle_count(sys.executable) < count:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_size_validation() -> None:
+    with pytest.raises(ValueError):
+        KernelProcessPool(0)
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_warm_fills_pool() -> None:
+    pool = KernelProcessPool(2)
+    try:
+        pool.warm(sys.executable)
+        pool.warm(sys.executable)
+        _wait_for_idle(pool, 2)
+        time.sleep(0.1)
+        assert pool.idle_count(sys.executable) == 2
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_launch_claims_idle_process_and_replenishes() -> None:
+    pool = KernelProcessPool(1)
+    try:
+        pool.warm(sys.executable)
+        _wait_for_idle(pool, 1)
+        idle = pool._idle[next(iter(pool._idle))][0]
+
+        process = pool.launch(sys.executable)
+        assert process is idle
+        assert process.poll() is None
+        _wait_for_idle(pool, 1)
+        assert pool._idle[next(iter(pool._idle))][0] is not process
+    finally:
+        pool.shutdown()
+    assert process.poll() is None
+    process.kill()
+    process.wait()
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_launch_without_idle_process() -> None:
+    pool = KernelProcessPool(1)
+    try:
+        process = pool.launch(sys.executable)
+        assert process.poll() is None
+        process.kill()
+        process.wait()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_pools_are_per_environment() -> None:
+    pool = KernelProcessPool(1)
+    try:
+        pool.warm(sys.executable, {"A": "1"})
+        deadline = time.time() + 10
+        while pool.idle_count(sys.executable, {"A": "1"}) < 1:
+            assert time.time() < deadline
+            time.sleep(0.01)
+        assert pool.idle_count(sys.executable, {"A": "2"}) == 0
+    finally:
+        pool.shutdown()
+
+
+def test_processes_inherit_the_server_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "marimo._session.managers.process_pool.kernel_command",
+        lambda python: [
+            python,
+            "-c",
+            "import os; print(os.environ['A'], os.environ['B'])",
+        ],
+    )
+    monkeypatch.setenv("A", "server")
+    monkeypatch.setenv("B", "server")
+    pool = KernelProcessPool(1)
+    try:
+        process = pool.launch(sys.executable, {"B": "kernel"})
+        stdout, _ = process.communicate(timeout=10)
+        assert stdout.split() == [b"server", b"kernel"]
+    finally:
+        pool.shutdown()
+
+
+def test_kernels_start_cold(monkeypatch: pytest.MonkeyPatch) -> None:
+    import multiprocessing
+
+    # The start method hasn't been set, so the platform's default is used
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda **_: None)
+    for method, cold in (("fork", False), ("forkserver", True)):
+        monkeypatch.setattr(
+            multiprocessing,
+            "get_all_start_methods",
+            lambda method=method: [method, "spawn"],
+        )
+        assert kernels_start_cold() is cold
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_exited_processes_are_not_claimed() -> None:
+    pool = KernelProcessPool(1)
+    try:
+        pool.warm(sys.executable)
+        _wait_for_idle(pool, 1)
+        idle = pool._idle[next(iter(pool._idle))][0]
+        idle.kill()
+        idle.wait()
+
+        process = pool.launch(sys.executable)
+        assert process is not idle
+        assert process.poll() is None
+        process.kill()
+        process.wait()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.usefixtures("fake_kernels")
+def test_shutdown_stops_idle_processes() -> None:
+    pool = KernelProcessPool(2)
+    pool.warm(sys.executable)
+    _wait_for_idle(pool, 2)
+    processes = list(pool._idle[next(iter(pool._idle))])
+    pool.shutdown()
+    assert all(p.poll() is not None for p in processes)
+    pool.warm(sys.executable)
+    assert pool.idle_count(sys.executable) == 0
+
+
+def _kernel_manager(
+    pool: KernelProcessPool, *, sandboxed: bool
+) -> IPCKernelManagerImpl:
+    from marimo._ast.app_config import _AppConfig
+    from marimo._ast.cell import CellConfig
+    from marimo._config.manager import get_default_config_manager
+    from marimo._ipc import QueueManager as IPCQueueManager
+    from marimo._runtime.commands import AppMetadata
+    from marimo._session.managers import (
+        IPCKernelManagerImpl,
+        IPCQueueManagerImpl,
+    )
+    from marimo._session.model import SessionMode
+    from marimo._types.ids import CellId_t
+
+    ipc_queue_manager, connection_info = IPCQueueManager.create()
+    return IPCKernelManagerImpl(
+        queue_manager=IPCQueueManagerImpl.from_ipc(ipc_queue_manager),
+        connection_info=connection_info,
+        mode=SessionMode.EDIT,
+        configs={CellId_t("c"): CellConfig()},
+        app_metadata=AppMetadata(
+            query_params={}, cli_args={}, app_config=_AppConfig()
+        ),
+        config_manager=get_default_config_manager(current_path=None),
+        sandboxed=sandboxed,
+        process_pool=pool,
+    )
+
+
+@pytest.mark.requires("zmq")
+def test_runs_kernel_in_pooled_process() -> None:
+    import os
+
+    from marimo._runtime.commands import ExecuteCellsCommand
+    from marimo._runtime.virtual_file import read_virtual_file
+    from marimo._types.ids import CellId_t
+
+    pool = KernelProcessPool(1)
+    pool.warm(sys.executable)
+    _wait_for_idle(pool, 1)
+    idle = pool._idle[next(iter(pool._idle))][0]
+
+    kernel_manager = _kernel_manager(pool, sandboxed=False)
+    queue_manager = kernel_manager.queue_manager
+    try:
+        kernel_manager.start_kernel()
+        assert kernel_manager.is_alive()
+        assert kernel_manager.pid == idle.pid
+        assert kernel_manager.pid != os.getpid()
+
+        queue_manager.put_control_request(
+            ExecuteCellsCommand(
+                cell_ids=[CellId_t("c")],
+                codes=[
+                    "import marimo as mo\n"
+                    "mo.download(data=b'hello', filename='a.txt')"
+                ],
+            )
+        )
+        ops: list[str] = []
+        outputs: list[str] = []
+        deadline = time.time() + 30
+        while "completed-run" not in ops and time.time() < deadline:
+            try:
+                message = queue_manager.stream_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            assert message is not None
+            notification = json.loads(message)
+            ops.append(notification["op"])
+            output = notification.get("output")
+            if output and output["mimetype"] == "text/html":
+                outputs.append(output["data"])
+        assert "completed-run" in ops
+
+        # Served as a virtual file, read from the kernel's shared memory
+        match = re.search(r"@file/(\d+)-([\w.-]+)", outputs[-1])
+        assert match is not None
+        assert read_virtual_file(match[2], int(match[1])) == b"hello"
+    finally:
+        kernel_manager.close_kernel()
+        pool.shutdown()
+    assert not kernel_manager.is_alive()
+
+
+@pytest.mark.requires("zmq")
+def test_sandboxed_kernel_uses_pool_for_cached_environments(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from marimo._cli.sandbox import _EphemeralSandboxEnvironment
+    from marimo._cli.sandbox_cache import SandboxEnvironment
+
+    # `--sandbox` without a configured venv: a cached environment
+    environment: SandboxEnvironment = SandboxEnvironment(
+        path=tmp_path, venv_python=sys.executable
+    )
+    monkeypatch.setattr(
+        "marimo._session.managers.ipc.acquire_sandbox_venv",
+        lambda *_, **__: environment,
+    )
+    # Sandboxes are writable
+    env = {"MARIMO_MANAGE_SCRIPT_METADATA": "true"}
+    pool = KernelProcessPool(1)
+    pool.warm(sys.executable, env)
+    deadline = time.time() + 10
+    while pool.idle_count(sys.executable, env) < 1:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    idle = pool._idle[next(iter(pool._idle))][0]
+
+    kernel_manager = _kernel_manager(pool, sandboxed=True)
+    try:
+        kernel_manager.start_kernel()
+        assert kernel_manager.pid == idle.pid
+    finally:
+        kernel_manager.close_kernel()
+
+    # Ephemeral environments are removed on release, so their kernels
+    # aren't pooled
+    environment = _EphemeralSandboxEnvironment(
+        path=tmp_path / "ephemeral", venv_python=sys.executable
+    )
+    deadline = time.time() + 10
+    while pool.idle_count(sys.executable, env) < 1:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    idle = pool._idle[next(iter(pool._idle))][0]
+    kernel_manager = _kernel_manager(pool, sandboxed=True)
+    try:
+        kernel_manager.start_kernel()
+        assert kernel_manager.pid != idle.pid
+        assert pool.idle_count(sys.executable, env) == 1
+    finally:
+        kernel_manager.close_kernel()
+        pool.shutdown()
@@ -564,6 +564,125 @@ async def test_session_cache_writer_no_writes(session_view: SessionView):
         await writer.stop()
 
 
+def _idle_notification(cell_id: str, data: str) -> CellNotification:
+    return CellNotification(
+        cell_id=CellId_t(cell_id),
+        status="idle",
+        output=CellOutput(
+            channel=CellChannel.OUTPUT,
+            mimetype="text/plain",
+            data=data,
+        ),
+        console=[],
+        timestamp=0,
+    )
+
+
+def test_session_cache_writer_incremental(
+    session_view: SessionView, tmp_path: Path
+):
+    """Test only changed cells are re-serialized between writes"""
+    view = session_view
+    view.add_notification(_idle_notification("cell1", "one"))
+    view.add_notification(_idle_notification("cell2", "two"))
+
+    path = tmp_path / "session.json"
+    writer = SessionCacheWriter(view, path, interval=0.1)
+    cell_ids, changed, revisions = writer._collect_changes()
+    assert set(changed) == {"cell1", "cell2"}
+    writer._write(cell_ids, changed, revisions)
+
+    # Compact, and equivalent to a full serialization
+    contents = path.read_text()
+    assert "\n" not in contents
+    assert json.loads(contents) == serialize_session_view(view)
+
+    # Nothing changed, so there is nothing to write
+    cell_ids, changed, revisions = writer._collect_changes()
+    assert changed == {}
+    assert not writer._needs_write(cell_ids, changed)
+
+    view.add_notification(_idle_notification("cell2", "changed"))
+    view.add_stdin("ignored")
+    cell_ids, changed, revisions = writer._collect_changes()
+    assert set(changed) == {"cell2"}
+    writer._write(cell_ids, changed, revisions)
+    assert json.loads(path.read_text()) == serialize_session_view(view)
+
+    # In-place output updates are picked up too
+    view.update_cell_outputs({CellId_t("cell1"): ("text/html", "<b>1</b>")})
+    cell_ids, changed, revisions = writer._collect_changes()
+    assert set(changed) == {"cell1"}
+    writer._write(cell_ids, changed, revisions)
+    assert json.loads(path.read_text()) == serialize_session_view(view)
+
+    # No temporary files are left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["session.json"]
+
+
+async def test_session_cache_writer_skips_unchanged_sessions(
+    session_view: SessionView, tmp_path: Path
+):
+    """Test the file isn't rewritten when no cell changed"""
+    view = session_view
+    view.add_notification(_idle_notification("cell1", "one"))
+
+    path = tmp_path / "session.json"
+    writer = SessionCacheWriter(view, path, interval=0.05)
+    writer.start()
+    await asyncio.sleep(0.15)
+    assert path.exists()
+    path.write_text("sentinel")
+
+    # Marked stale, but no cell revision changed
+    view._touch()
+    await asyncio.sleep(0.15)
+    assert path.read_text() == "sentinel"
+
+    view.add_notification(_idle_notification("cell1", "two"))
+    await asyncio.sleep(0.15)
+    assert json.loads(path.read_text()) == serialize_session_view(view)
+
+    await writer.stop()
+
+
+def test_session_cache_writer_drops_removed_cells(
+    session_view: SessionView, tmp_path: Path
+):
+    view = session_view
+    view.add_notification(_idle_notification("cell1", "one"))
+    view.add_notification(_idle_notification("cell2", "two"))
+
+    path = tmp_path / "session.json"
+    writer = SessionCacheWriter(view, path, interval=0.1)
+    writer._write(*writer._collect_changes())
+
+    del view.cell_notifications[CellId_t("cell1")]
+    writer._write(*writer._collect_changes())
+    data = json.loads(path.read_text())
+    assert [cell["id"] for cell in data["cells"]] == ["cell2"]
+
+
+def test_session_cache_writer_retries_failed_writes(
+    session_view: SessionView, tmp_path: Path
+):
+    view = session_view
+    view.add_notification(_idle_notification("cell1", "one"))
+
+    path = tmp_path / "missing" / "session.json"
+    writer = SessionCacheWriter(view, path, interval=0.1)
+    with pytest.raises(OSError):
+        writer._write(*writer._collect_changes())
+
+    # The failed write left nothing behind, so everything is written again
+    view.add_notification(_idle_notification("cell2", "two"))
+    path.parent.mkdir()
+    cell_ids, changed, revisions = writer._collect_changes()
+    assert set(changed) == {"cell1", "cell2"}
+    writer._write(cell_ids, changed, revisions)
+    assert json.loads(path.read_text()) == serialize_session_view(view)
+
+
 def test_get_session_cache_file():
     is_windows = sys.platform == "win32"
     # Linux path
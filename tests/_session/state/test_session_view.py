@@ -40,7 +40,10 @@ from marimo._runtime.commands import (
     ExecuteCellsCommand,
     UpdateUIElementCommand,
 )
-from marimo._session.state.session_view import SessionView
+from marimo._session.state.session_view import (
+    _MAX_CUSTOM_MODEL_MESSAGES,
+    SessionView,
+)
 from marimo._sql.engines.duckdb import INTERNAL_DUCKDB_ENGINE
 from marimo._types.ids import CellId_t, RequestId, VariableName, WidgetModelId
 from marimo._utils.parse_dataclass import parse_raw
@@ -226,6 +229,188 @@ def test_model_message_values(session_view: SessionView) -> None:
     }
 
 
+def _model_message(
+    model_id: WidgetModelId,
+    method: str,
+    state: dict[str, Any] | None = None,
+    buffer_paths: list[list[Any]] | None = None,
+    buffers: list[bytes] | None = None,
+) -> UIElementMessageNotification:
+    return UIElementMessageNotification(
+        model_id=model_id,
+        message={
+            "method": method,
+            "state": state or {},
+            "buffer_paths": buffer_paths or [],
+        },
+        buffers=buffers,
+        ui_element=None,
+    )
+
+
+def test_model_message_updates_are_compacted(
+    session_view: SessionView,
+) -> None:
+    model_id = WidgetModelId("test_model")
+    session_view.add_notification(
+        _model_message(
+            model_id,
+            "open",
+            {"a": 1, "b": 2},
+            buffer_paths=[["data"]],
+            buffers=[b"old"],
+        )
+    )
+    for i in range(100):
+        session_view.add_notification(
+            _model_message(model_id, "update", {"a": i})
+        )
+    session_view.add_notification(
+        _model_message(
+            model_id, "update", buffer_paths=[["data"]], buffers=[b"new"]
+        )
+    )
+
+    messages = session_view.model_messages[model_id]
+    assert len(messages) == 1
+    assert messages[0].message == {
+        "method": "open",
+        "state": {"a": 99, "b": 2},
+        "buffer_paths": [["data"]],
+    }
+    assert messages[0].buffers == [b"new"]
+
+
+def test_model_message_updates_keep_buffer_urls(
+    session_view: SessionView,
+) -> None:
+    model_id = WidgetModelId("test_model")
+    open_message = _model_message(
+        model_id,
+        "open",
+        buffer_paths=[["tiles"], ["style"]],
+        buffers=[b"", b"inline"],
+    )
+    open_message.buffer_urls = ["./@file/10-old.bin", None]
+    session_view.add_notification(open_message)
+
+    update = _model_message(
+        model_id, "update", buffer_paths=[["tiles"]], buffers=[b""]
+    )
+    update.buffer_urls = ["./@file/10-new.bin"]
+    session_view.add_notification(update)
+
+    [message] = session_view.model_messages[model_id]
+    assert message.message["buffer_paths"] == [["style"], ["tiles"]]
+    assert message.buffers == [b"inline", b""]
+    assert message.buffer_urls == [None, "./@file/10-new.bin"]
+
+    session_view.add_notification(
+        _model_message(
+            model_id, "update", buffer_paths=[["tiles"]], buffers=[b"small"]
+        )
+    )
+    [message] = session_view.model_messages[model_id]
+    assert message.buffers == [b"inline", b"small"]
+    assert message.buffer_urls is None
+
+
+def _custom_message(
+    model_id: WidgetModelId, content: Any
+) -> UIElementMessageNotification:
+    return UIElementMessageNotification(
+        model_id=model_id,
+        message={"method": "custom", "content": content},
+        buffers=[b"custom"],
+        ui_element=None,
+    )
+
+
+def test_model_message_updates_fold_between_custom_messages(
+    session_view: SessionView,
+) -> None:
+    model_id = WidgetModelId("test_model")
+    session_view.add_notification(_model_message(model_id, "open", {"a": 0}))
+    session_view.add_notification(_model_message(model_id, "update", {"a": 1}))
+    for i in range(3):
+        session_view.add_notification(_custom_message(model_id, {"x": i}))
+        session_view.add_notification(
+            _model_message(model_id, "update", {"a": i})
+        )
+    session_view.add_notification(_model_message(model_id, "update", {"b": 2}))
+    session_view.add_notification(
+        _model_message(model_id, "echo_update", {"a": 1})
+    )
+
+    # Each custom message is replayed after the state it was sent with
+    messages = session_view.model_messages[model_id]
+    assert [m.message["method"] for m in messages] == [
+        "open",
+        "custom",
+        "update",
+        "custom",
+        "update",
+        "custom",
+        "update",
+    ]
+    assert messages[0].message["state"] == {"a": 1}
+    assert [m.message["content"] for m in messages[1::2]] == [
+        {"x": i} for i in range(3)
+    ]
+    assert [m.message["state"] for m in messages[2::2]] == [
+        {"a": 0},
+        {"a": 1},
+        {"a": 2, "b": 2},
+    ]
+    assert messages[1].buffers == [b"custom"]
+
+    session_view.add_notification(_model_message(model_id, "close"))
+    assert model_id not in session_view.model_messages
+
+
+def test_model_message_custom_messages_are_capped(
+    session_view: SessionView,
+) -> None:
+    model_id = WidgetModelId("test_model")
+    session_view.add_notification(_model_message(model_id, "open", {"a": 0}))
+    with patch("marimo._session.state.session_view.LOGGER") as logger:
+        for i in range(_MAX_CUSTOM_MODEL_MESSAGES + 10):
+            session_view.add_notification(_custom_message(model_id, i))
+
+    messages = session_view.model_messages[model_id]
+    assert len(messages) == _MAX_CUSTOM_MODEL_MESSAGES + 1
+    assert messages[0].message["method"] == "open"
+    # The oldest custom messages are dropped, and each drop is logged
+    assert messages[1].message["content"] == 10
+    assert messages[-1].message["content"] == _MAX_CUSTOM_MODEL_MESSAGES + 9
+    assert logger.debug.call_count == 10
+
+
+def test_model_message_state_is_folded_around_dropped_custom_messages(
+    session_view: SessionView,
+) -> None:
+    model_id = WidgetModelId("test_model")
+    session_view.add_notification(_model_message(model_id, "open", {"a": 0}))
+    for i in range(_MAX_CUSTOM_MODEL_MESSAGES + 2):
+        session_view.add_notification(_custom_message(model_id, i))
+        session_view.add_notification(
+            _model_message(model_id, "update", {"a": i + 1})
+        )
+
+    messages = session_view.model_messages[model_id]
+    assert len(messages) == 2 * _MAX_CUSTOM_MODEL_MESSAGES + 1
+    # The state the oldest kept custom message was sent with
+    assert messages[0].message == {
+        "method": "open",
+        "state": {"a": 2},
+        "buffer_paths": [],
+    }
+    assert messages[1].message["content"] == 2
+    assert messages[-1].message["state"] == {
+        "a": _MAX_CUSTOM_MODEL_MESSAGES + 2
+    }
+
+
 def test_last_run_code(session_view: SessionView) -> None:
     session_view.add_control_request(
         ExecuteCellsCommand(
@@ -0,0 +1,65 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from marimo._utils.cache_eviction import (
+    DAY_SECONDS,
+    prune_cache_dir,
+    touch_entry,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _entry(cache_dir: Path, name: str, size: int, age: float) -> Path:
+    path = cache_dir / name[:2] / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_prunes_old_entries(tmp_path: Path) -> None:
+    old = _entry(tmp_path, "aa_old", 10, 40 * DAY_SECONDS)
+    recent = _entry(tmp_path, "bb_recent", 10, DAY_SECONDS)
+
+    assert prune_cache_dir(tmp_path, max_age=30 * DAY_SECONDS, max_size=1000)
+    assert not old.exists()
+    assert recent.exists()
+
+
+def test_prunes_least_recently_used_beyond_max_size(tmp_path: Path) -> None:
+    oldest = _entry(tmp_path, "aa", 100, 300)
+    older = _entry(tmp_path, "bb", 100, 200)
+    newest = _entry(tmp_path, "cc", 100, 100)
+    # Using an entry makes it the most recent
+    touch_entry(oldest)
+
+    assert prune_cache_dir(tmp_path, max_age=DAY_SECONDS, max_size=200) == 1
+    assert oldest.exists()
+    assert not older.exists()
+    assert newest.exists()
+
+
+def test_prunes_at_most_once_per_interval(tmp_path: Path) -> None:
+    _entry(tmp_path, "aa", 10, 40 * DAY_SECONDS)
+    assert prune_cache_dir(tmp_path, max_age=DAY_SECONDS, max_size=1000) == 1
+
+    stale = _entry(tmp_path, "bb", 10, 40 * DAY_SECONDS)
+    assert prune_cache_dir(tmp_path, max_age=DAY_SECONDS, max_size=1000) == 0
+    assert stale.exists()
+    assert (
+        prune_cache_dir(
+            tmp_path, max_age=DAY_SECONDS, max_size=1000, interval=0
+        )
+        == 1
+    )
+
+
+def test_missing_cache_dir(tmp_path: Path) -> None:
+    assert prune_cache_dir(tmp_path / "missing", max_age=0, max_size=0) == 0
@@ -0,0 +1,154 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Import-time budgets for `import marimo`, the CLI, and scripts.
+
+Each check runs in a fresh interpreter. The module checks catch an eager
+import of a heavy subsystem as soon as it's added; the time budgets are
+deliberately generous (several times what's measured locally) so they only
+fail on large regressions, not on a slow CI machine.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Microseconds, as reported by `-X importtime`
+IMPORT_MARIMO_BUDGET = 400_000
+CLI_HELP_BUDGET = 600_000
+SCRIPT_BUDGET = 2_000_000
+
+MODULES_MARKER = "--modules--"
+
+SCRIPT = """\
+import marimo
+
+app = marimo.App()
+
+
+@app.cell
+def _():
+    x = 1
+    return (x,)
+
+
+@app.cell
+def _(x):
+    print(x + 1)
+    return
+
+
+if __name__ == "__main__":
+    app.run()
+"""
+
+
+def _run(code: str) -> tuple[set[str], int]:
+    """Run code in a fresh interpreter.
+
+    Returns the modules it imported and its total import time.
+    """
+    code += dedent(
+        f"""
+        import json, sys
+        print({MODULES_MARKER!r})
+        print(json.dumps(sorted(sys.modules)))
+        """
+    )
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = json.loads(p.stdout.split(MODULES_MARKER)[-1])
+    # Lines look like "import time: self [us] | cumulative | imported package",
+    # with nested imports indented; top-level imports sum to the total.
+    total = 0
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return set(modules), total
+
+
+def _imported(modules: set[str], package: str) -> bool:
+    return any(m == package or m.startswith(package + ".") for m in modules)
+
+
+def test_import_marimo() -> None:
+    modules, total = _run("import marimo")
+    for package in (
+        "marimo._ast",
+        "marimo._plugins",
+        "marimo._runtime",
+        "marimo._server",
+        "click",
+        "msgspec",
+        "narwhals",
+        "matplotlib",
+    ):
+        assert not _imported(modules, package), package
+    assert total < IMPORT_MARIMO_BUDGET
+
+
+def test_import_marimo_api_on_access() -> None:
+    modules, _ = _run("import marimo as mo; mo.md; mo.ui.slider")
+    assert "marimo._output.md" in modules
+    assert "marimo._plugins.ui._impl.input" in modules
+    assert "marimo._plugins.ui._impl.table" not in modules
+
+
+def test_cli_help() -> None:
+    modules, total = _run(
+        dedent(
+            """
+            from marimo._cli.cli import main
+            try:
+                main(["--help"])
+            except SystemExit:
+                pass
+            """
+        )
+    )
+    for package in (
+        "marimo._cli.export",
+        "marimo._cli.convert",
+        "marimo._server",
+        "marimo._session",
+        "marimo._runtime",
+        "tomlkit",
+    ):
+        assert not _imported(modules, package), package
+    assert total < CLI_HELP_BUDGET
+
+
+def test_script(tmp_path: Path) -> None:
+    path = tmp_path / "notebook.py"
+    path.write_text(SCRIPT, encoding="utf-8")
+    modules, total = _run(
+        f"import runpy; runpy.run_path({str(path)!r}, run_name='__main__')"
+    )
+    for package in ("matplotlib", "starlette", "uvicorn", "jedi"):
+        assert not _imported(modules, package), package
+    assert total < SCRIPT_BUDGET
+
+
+@pytest.mark.parametrize("name", ["export", "convert", "config"])
+def test_lazy_subcommands(name: str) -> None:
+    from click.testing import CliRunner
+
+    from marimo._cli.cli import main
+
+    result = CliRunner().invoke(main, [name, "--help"])
+    assert result.exit_code == 0, result.output
+    assert f"Usage: main {name}" in result.output